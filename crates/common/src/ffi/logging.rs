@@ -153,6 +153,26 @@ pub unsafe extern "C" fn logger_log(
     logger::log(level, color, component, message);
 }
 
+/// Creates a new log event with the given timestamp.
+///
+/// # Safety
+///
+/// - Assumes `component_ptr` is a valid C string pointer.
+/// - Assumes `message_ptr` is a valid C string pointer.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn logger_log_with_timestamp(
+    ts: u64,
+    level: LogLevel,
+    color: LogColor,
+    component_ptr: *const c_char,
+    message_ptr: *const c_char,
+) {
+    let component = unsafe { cstr_to_ustr(component_ptr) };
+    let message = unsafe { cstr_as_str(message_ptr) };
+
+    logger::log_with_timestamp(ts.into(), level, color, component, message);
+}
+
 /// Logs the Nautilus system header.
 ///
 /// # Safety
@@ -287,13 +287,22 @@ impl Log for Logger {
 
     fn log(&self, record: &log::Record) {
         if self.enabled(record.metadata()) {
-            let timestamp = if LOGGING_REALTIME.load(Ordering::Relaxed) {
-                get_atomic_clock_realtime().get_time_ns()
-            } else {
-                get_atomic_clock_static().get_time_ns()
-            };
             let level = record.level();
             let key_values = record.key_values();
+            // Use the timestamp captured by the caller (if provided), e.g. for buffered records
+            let timestamp = key_values
+                .get("ts".into())
+                .and_then(|v| v.to_u64())
+                .map_or_else(
+                    || {
+                        if LOGGING_REALTIME.load(Ordering::Relaxed) {
+                            get_atomic_clock_realtime().get_time_ns()
+                        } else {
+                            get_atomic_clock_static().get_time_ns()
+                        }
+                    },
+                    UnixNanos::from,
+                );
             let color: LogColor = key_values
                 .get("color".into())
                 .and_then(|v| v.to_u64().map(|v| (v as u8).into()))
@@ -494,6 +503,39 @@ pub fn log<T: AsRef<str>>(level: LogLevel, color: LogColor, component: Ustr, mes
     }
 }
 
+/// Logs the given message with the given timestamp, rather than the current logging clock time.
+///
+/// This allows records which are buffered before being logged to retain the time they were created.
+pub fn log_with_timestamp<T: AsRef<str>>(
+    ts: UnixNanos,
+    level: LogLevel,
+    color: LogColor,
+    component: Ustr,
+    message: T,
+) {
+    let color = Value::from(color as u8);
+    let ts = ts.as_u64();
+
+    match level {
+        LogLevel::Off => {}
+        LogLevel::Trace => {
+            log::trace!(component = component.to_value(), color = color, ts = ts; "{}", message.as_ref());
+        }
+        LogLevel::Debug => {
+            log::debug!(component = component.to_value(), color = color, ts = ts; "{}", message.as_ref());
+        }
+        LogLevel::Info => {
+            log::info!(component = component.to_value(), color = color, ts = ts; "{}", message.as_ref());
+        }
+        LogLevel::Warning => {
+            log::warn!(component = component.to_value(), color = color, ts = ts; "{}", message.as_ref());
+        }
+        LogLevel::Error => {
+            log::error!(component = component.to_value(), color = color, ts = ts; "{}", message.as_ref());
+        }
+    }
+}
+
 #[cfg_attr(
     feature = "python",
     pyo3::pyclass(module = "nautilus_trader.core.nautilus_pyo3.common")
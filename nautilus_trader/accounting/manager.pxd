@@ -24,20 +24,34 @@ from nautilus_trader.common.component cimport Logger
 from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.events.order cimport OrderFilled
+from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Money
+from nautilus_trader.model.orders.base cimport Order
+from nautilus_trader.model.position cimport Position
 
 
 cdef class AccountsManager:
     cdef Clock _clock
     cdef Logger _log
     cdef CacheFacade _cache
+    cdef bint _incremental
+    cdef dict _order_amounts
+    cdef dict _order_totals
+    cdef dict _position_amounts
+    cdef dict _position_totals
 
     cpdef AccountState update_balances(self, Account account, Instrument instrument, OrderFilled fill)
     cpdef AccountState update_orders(self, Account account, Instrument instrument, list orders_open, uint64_t ts_event)
+    cpdef AccountState update_order(self, Account account, Instrument instrument, Order order, uint64_t ts_event)
     cpdef AccountState update_positions(self, MarginAccount account, Instrument instrument, list positions_open, uint64_t ts_event)
-    cdef AccountState _update_balance_locked(self, CashAccount account, Instrument instrument, list orders_open, uint64_t ts_event)
-    cdef AccountState _update_margin_init(self, MarginAccount account, Instrument instrument, list orders_open, uint64_t ts_event)
+    cpdef AccountState update_position(self, MarginAccount account, Instrument instrument, Position position, uint64_t ts_event)
+    cdef void _add_order_amount(self, Account account, Instrument instrument, Order order)
+    cdef void _remove_order_amount(self, InstrumentId instrument_id, Order order)
+    cdef AccountState _apply_order_totals(self, Account account, Instrument instrument, uint64_t ts_event)
+    cdef void _add_position_amount(self, MarginAccount account, Instrument instrument, Position position)
+    cdef AccountState _apply_position_totals(self, MarginAccount account, Instrument instrument, uint64_t ts_event)
+    cdef object _total_to_decimal(self, Account account, Instrument instrument, list totals)
     cdef void _update_balance_single_currency(self, Account account, OrderFilled fill, Money pnl)
     cdef void _update_balance_multi_currency(self, Account account, OrderFilled fill, list pnls)
     cdef AccountState _generate_account_state(self, Account account, uint64_t ts_event)
@@ -15,6 +15,7 @@
 
 from decimal import Decimal
 
+from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.error import AccountBalanceNegative
@@ -25,20 +26,30 @@ from nautilus_trader.accounting.accounts.cash cimport CashAccount
 from nautilus_trader.accounting.accounts.margin cimport MarginAccount
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.common.component cimport Clock
+from nautilus_trader.common.component cimport LogLevel
 from nautilus_trader.common.component cimport Logger
-from nautilus_trader.common.component cimport is_logging_initialized
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.model cimport FIXED_PRECISION
 from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.core.uuid cimport UUID4
+from nautilus_trader.model.identifiers cimport ClientOrderId
+from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport AccountBalance
 from nautilus_trader.model.objects cimport Currency
+from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.orders.base cimport Order
 from nautilus_trader.model.position cimport Position
 
 
+cdef inline object _raw_to_decimal(object raw):
+    # Exact conversion (not subject to the decimal context precision)
+    sign, digits, _ = Decimal(raw).as_tuple()
+    return Decimal((sign, digits, -FIXED_PRECISION))
+
+
 cdef class AccountsManager:
     """
     Provides account management functionality.
@@ -51,6 +62,16 @@ cdef class AccountsManager:
         The logger for the manager.
     clock : Clock
         The clock for the manager.
+    incremental : bool, default True
+        If the locked balances and margins are maintained incrementally for single
+        order and position updates (kept per order and position as fixed-point raw
+        amounts). If False then every update performs a full recompute, which can be
+        used to verify the incremental amounts.
+
+    Notes
+    -----
+    Base currency conversion is applied to the total amount per side for each
+    instrument, rather than to each order or position amount.
     """
 
     def __init__(
@@ -58,10 +79,19 @@ cdef class AccountsManager:
         CacheFacade cache not None,
         Logger logger not None,
         Clock clock not None,
+        bint incremental = True,
     ):
         self._clock = clock
         self._log = logger
         self._cache = cache
+        self._incremental = incremental
+
+        # Raw amounts per order and position (keyed by instrument ID), with the raw totals
+        # per side [BUY, SELL], prior to any base currency conversion
+        self._order_amounts: dict[InstrumentId, dict[ClientOrderId, tuple[OrderSide, int]]] = {}
+        self._order_totals: dict[InstrumentId, list[int]] = {}
+        self._position_amounts: dict[InstrumentId, dict[PositionId, tuple[OrderSide, int]]] = {}
+        self._position_totals: dict[InstrumentId, list[int]] = {}
 
     cpdef AccountState update_balances(
         self,
@@ -113,7 +143,7 @@ cdef class AccountsManager:
         # *** position could still be None here ***
 
         cdef list pnls = account.calculate_pnls(instrument, fill, position)
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Calculated PnLs: {pnls}")
 
         # Calculate final PnL including commissions
@@ -146,9 +176,15 @@ cdef class AccountsManager:
         """
         Update the account states based on the given orders.
 
+        This performs a full recompute of the locked balance (cash accounts) or initial
+        (order) margin (margin accounts) for the instrument, replacing any incrementally
+        maintained amounts.
+
+        Will return ``None`` if operation fails.
+
         Parameters
         ----------
-        account : MarginAccount
+        account : Account
             The account to update.
         instrument : Instrument
             The instrument for the update.
@@ -159,120 +195,47 @@ cdef class AccountsManager:
 
         Returns
         -------
-        AccountState
+        AccountState or ``None``
 
         """
         Condition.not_none(account, "account")
         Condition.not_none(instrument, "instrument")
         Condition.not_none(orders_open, "orders_open")
 
-        if account.is_cash_account:
-            return self._update_balance_locked(
-                account,
-                instrument,
-                orders_open,
-                ts_event,
-            )
-        elif account.is_margin_account:
-            return self._update_margin_init(
-                account,
-                instrument,
-                orders_open,
-                ts_event,
-            )
-        else:
-            raise RuntimeError("invalid `AccountType`")  # pragma: no cover (design-time error)
-
-    cdef AccountState _update_balance_locked(
-        self,
-        CashAccount account,
-        Instrument instrument,
-        list orders_open,
-        uint64_t ts_event,
-    ):
-        if not orders_open:
-            account.clear_balance_locked(instrument.id)
-            return self._generate_account_state(
-                account=account,
-                ts_event=ts_event,
-            )
+        self._order_amounts.pop(instrument.id, None)
+        self._order_totals.pop(instrument.id, None)
 
-        total_locked = Decimal(0)
-        base_xrate  = Decimal(0)
-
-        cdef Currency currency = instrument.get_cost_currency()
-        cdef:
-            Order order
+        cdef Order order
         for order in orders_open:
-            assert order.instrument_id == instrument.id
-
-            if not order.is_open_c() or (not order.has_price_c() and not order.has_trigger_price_c()):
-                # Does not contribute to locked balance
-                continue
-
-            # Calculate balance locked
-            locked = account.calculate_balance_locked(
-                instrument,
-                order.side,
-                order.quantity,
-                order.price if order.has_price_c() else order.trigger_price,
-            ).as_decimal()
-
-            if account.base_currency is not None:
-                if base_xrate == 0:
-                    # Cache base currency and xrate
-                    currency = account.base_currency
-                    base_xrate = self._calculate_xrate_to_base(
-                        instrument=instrument,
-                        account=account,
-                        side=order.side,
-                    )
-
-                    if base_xrate == 0:
-                        self._log.debug(
-                            f"Cannot calculate balance locked: "
-                            f"insufficient data for "
-                            f"{instrument.get_cost_currency()}/{account.base_currency}"
-                        )
-                        return None  # Cannot calculate
-
-                # Apply base xrate
-                locked = round(locked * base_xrate, currency.get_precision())
-
-            # Increment total locked
-            total_locked += locked
-
-        cdef Money locked_money = Money(total_locked, currency)
-        account.update_balance_locked(instrument.id, locked_money)
+            assert order.instrument_id == instrument.id, f"order not for instrument {instrument}"
+            self._add_order_amount(account, instrument, order)
 
-        self._log.info(f"{instrument.id} balance_locked={locked_money.to_formatted_str()}")
+        return self._apply_order_totals(account, instrument, ts_event)
 
-        return self._generate_account_state(
-            account=account,
-            ts_event=ts_event,
-        )
-
-    cdef AccountState _update_margin_init(
+    cpdef AccountState update_order(
         self,
-        MarginAccount account,
+        Account account,
         Instrument instrument,
-        list orders_open,
+        Order order,
         uint64_t ts_event,
     ):
         """
-        Update the initial (order) margin for margin accounts or locked balance
-        for cash accounts.
+        Update the account states based on the given (changed) order.
+
+        When incremental, only the order's own contribution to the instrument's locked
+        balance (cash accounts) or initial (order) margin (margin accounts) is updated,
+        otherwise a full recompute is performed from the open orders in the cache.
 
         Will return ``None`` if operation fails.
 
         Parameters
         ----------
-        account : MarginAccount
+        account : Account
             The account to update.
         instrument : Instrument
             The instrument for the update.
-        orders_open : list[Order]
-            The open orders for the update.
+        order : Order
+            The order which changed.
         ts_event : uint64_t
             UNIX timestamp (nanoseconds) when the account event occurred.
 
@@ -283,59 +246,119 @@ cdef class AccountsManager:
         """
         Condition.not_none(account, "account")
         Condition.not_none(instrument, "instrument")
-        Condition.not_none(orders_open, "orders_open")
+        Condition.not_none(order, "order")
 
-        total_margin_init = Decimal(0)
-        base_xrate = Decimal(0)
+        cdef Order o
+        if not self._incremental:
+            return self.update_orders(
+                account,
+                instrument,
+                [
+                    o for o in self._cache.orders_open(
+                        venue=None,  # Faster query filtering
+                        instrument_id=instrument.id,
+                    ) if o.is_passive_c()
+                ],
+                ts_event,
+            )
 
-        cdef Currency currency = instrument.get_cost_currency()
+        self._remove_order_amount(instrument.id, order)
+        if order.is_passive_c():
+            self._add_order_amount(account, instrument, order)
 
-        cdef Order order
-        for order in orders_open:
-            assert order.instrument_id == instrument.id, f"order not for instrument {instrument}"
+        return self._apply_order_totals(account, instrument, ts_event)
 
-            if not order.is_open_c() or (not order.has_price_c() and not order.has_trigger_price_c()):
-                # Does not contribute to initial margin
-                continue
+    cdef void _add_order_amount(self, Account account, Instrument instrument, Order order):
+        if not order.is_open_c() or (not order.has_price_c() and not order.has_trigger_price_c()):
+            # Does not contribute to locked balance or initial margin
+            return
 
+        cdef Price price = order.price if order.has_price_c() else order.trigger_price
+        cdef Money amount
+        if account.is_cash_account:
+            # Calculate balance locked
+            amount = (<CashAccount>account).calculate_balance_locked(
+                instrument,
+                order.side,
+                order.quantity,
+                price,
+            )
+        else:
             # Calculate initial margin
-            margin_init = account.calculate_margin_init(
+            amount = (<MarginAccount>account).calculate_margin_init(
                 instrument,
                 order.quantity,
-                order.price if order.has_price_c() else order.trigger_price,
-            ).as_decimal()
-
-            if account.base_currency is not None:
-                if base_xrate == 0:
-                    # Cache base currency and xrate
-                    currency = account.base_currency
-                    base_xrate = self._calculate_xrate_to_base(
-                        instrument=instrument,
-                        account=account,
-                        side=order.side,
-                    )
+                price,
+            )
 
-                    if base_xrate == 0:
-                        self._log.debug(
-                            f"Cannot calculate initial (order) margin: "
-                            f"insufficient data for "
-                            f"{instrument.get_cost_currency()}/{account.base_currency}"
-                        )
-                        return None  # Cannot calculate
+        if amount is None:
+            return  # No balance to lock
+
+        raw = amount.raw_int_c()
+        orders = self._order_amounts.get(instrument.id)
+        if orders is None:
+            orders = {}
+            self._order_amounts[instrument.id] = orders
+        orders[order.client_order_id] = (order.side, raw)
+
+        totals = self._order_totals.get(instrument.id)
+        if totals is None:
+            totals = [0, 0]
+            self._order_totals[instrument.id] = totals
+        totals[0 if order.side == OrderSide.BUY else 1] += raw
+
+    cdef void _remove_order_amount(self, InstrumentId instrument_id, Order order):
+        orders = self._order_amounts.get(instrument_id)
+        if orders is None:
+            return
 
-                # Apply base xrate
-                margin_init = round(margin_init * base_xrate, currency.get_precision())
+        entry = orders.pop(order.client_order_id, None)
+        if entry is None:
+            return
 
-            # Increment total initial margin
-            total_margin_init += margin_init
+        side, raw = entry
+        self._order_totals[instrument_id][0 if side == OrderSide.BUY else 1] -= raw
 
-        cdef Money margin_init_money = Money(total_margin_init, currency)
-        if total_margin_init == 0:
-            account.clear_margin_init(instrument.id)
-        else:
-            account.update_margin_init(instrument.id, margin_init_money)
+    cdef AccountState _apply_order_totals(
+        self,
+        Account account,
+        Instrument instrument,
+        uint64_t ts_event,
+    ):
+        if account.is_cash_account and not self._order_amounts.get(instrument.id):
+            (<CashAccount>account).clear_balance_locked(instrument.id)
+            return self._generate_account_state(
+                account=account,
+                ts_event=ts_event,
+            )
 
-        self._log.info(f"{instrument.id} margin_init={margin_init_money.to_formatted_str()}")
+        cdef Currency currency = account.base_currency or instrument.get_cost_currency()
+        total = self._total_to_decimal(
+            account,
+            instrument,
+            self._order_totals.get(instrument.id),
+        )
+        if total is None:
+            self._log.debug(
+                f"Cannot calculate "
+                f"{'balance locked' if account.is_cash_account else 'initial (order) margin'}: "
+                f"insufficient data for "
+                f"{instrument.get_cost_currency()}/{account.base_currency}"
+            )
+            return None  # Cannot calculate
+
+        cdef Money money = Money(total, currency)
+        if account.is_cash_account:
+            (<CashAccount>account).update_balance_locked(instrument.id, money)
+            if self._log.is_enabled(LogLevel.INFO):
+                self._log.info(f"{instrument.id} balance_locked={money.to_formatted_str()}")
+        else:
+            if total == 0:
+                (<MarginAccount>account).clear_margin_init(instrument.id)
+            else:
+                (<MarginAccount>account).update_margin_init(instrument.id, money)
+            if self._log.is_enabled(LogLevel.INFO):
+                self._log.info(f"{instrument.id} margin_init={money.to_formatted_str()}")
 
         return self._generate_account_state(
             account=account,
@@ -352,6 +375,9 @@ cdef class AccountsManager:
         """
         Update the maintenance (position) margin.
 
+        This performs a full recompute of the maintenance margin for the instrument,
+        replacing any incrementally maintained amounts.
+
         Will return ``None`` if operation fails.
 
         Parameters
@@ -374,64 +400,163 @@ cdef class AccountsManager:
         Condition.not_none(instrument, "instrument")
         Condition.not_none(positions_open, "positions_open")
 
-        total_margin_maint = Decimal(0)
-        base_xrate = Decimal(0)
-
-        cdef Currency currency = instrument.get_cost_currency()
+        self._position_amounts.pop(instrument.id, None)
+        self._position_totals.pop(instrument.id, None)
 
         cdef Position position
         for position in positions_open:
             assert position.instrument_id == instrument.id
+            self._add_position_amount(account, instrument, position)
 
-            if not position.is_open_c():
-                # Does not contribute to maintenance margin
-                continue
+        return self._apply_position_totals(account, instrument, ts_event)
+
+    cpdef AccountState update_position(
+        self,
+        MarginAccount account,
+        Instrument instrument,
+        Position position,
+        uint64_t ts_event,
+    ):
+        """
+        Update the maintenance (position) margin based on the given (changed) position.
+
+        When incremental, only the position's own contribution to the instrument's
+        maintenance margin is updated, otherwise a full recompute is performed from the
+        open positions in the cache.
+
+        Will return ``None`` if operation fails.
+
+        Parameters
+        ----------
+        account : MarginAccount
+            The account to update.
+        instrument : Instrument
+            The instrument for the update.
+        position : Position
+            The position which changed.
+        ts_event : uint64_t
+            UNIX timestamp (nanoseconds) when the account event occurred.
+
+        Returns
+        -------
+        AccountState or ``None``
 
-            # Calculate margin
-            margin_maint = account.calculate_margin_maint(
+        """
+        Condition.not_none(account, "account")
+        Condition.not_none(instrument, "instrument")
+        Condition.not_none(position, "position")
+
+        if not self._incremental:
+            return self.update_positions(
+                account,
                 instrument,
-                position.side,
-                position.quantity,
-                instrument.make_price(position.avg_px_open),
-            ).as_decimal()
-
-            if account.base_currency is not None:
-                if base_xrate == 0:
-                    # Cache base currency and xrate
-                    currency = account.base_currency
-                    base_xrate = self._calculate_xrate_to_base(
-                        instrument=instrument,
-                        account=account,
-                        side=position.entry,
-                    )
+                self._cache.positions_open(
+                    venue=None,  # Faster query filtering
+                    instrument_id=instrument.id,
+                ),
+                ts_event,
+            )
+
+        positions = self._position_amounts.get(instrument.id)
+        entry = positions.pop(position.id, None) if positions is not None else None
+        if entry is not None:
+            side, raw = entry
+            self._position_totals[instrument.id][0 if side == OrderSide.BUY else 1] -= raw
+
+        self._add_position_amount(account, instrument, position)
+
+        return self._apply_position_totals(account, instrument, ts_event)
+
+    cdef void _add_position_amount(self, MarginAccount account, Instrument instrument, Position position):
+        if not position.is_open_c():
+            # Does not contribute to maintenance margin
+            return
+
+        # Calculate margin
+        cdef Money margin_maint = account.calculate_margin_maint(
+            instrument,
+            position.side,
+            position.quantity,
+            instrument.make_price(position.avg_px_open),
+        )
 
-                    if base_xrate == 0:
-                        self._log.debug(
-                            f"Cannot calculate maintenance (position) margin: "
-                            f"insufficient data for "
-                            f"{instrument.get_cost_currency()}/{account.base_currency}"
-                        )
-                        return None  # Cannot calculate
+        raw = margin_maint.raw_int_c()
+        positions = self._position_amounts.get(instrument.id)
+        if positions is None:
+            positions = {}
+            self._position_amounts[instrument.id] = positions
+        positions[position.id] = (position.entry, raw)
 
-                # Apply base xrate
-                margin_maint = round(margin_maint * base_xrate, currency.get_precision())
+        totals = self._position_totals.get(instrument.id)
+        if totals is None:
+            totals = [0, 0]
+            self._position_totals[instrument.id] = totals
+        totals[0 if position.entry == OrderSide.BUY else 1] += raw
 
-            # Increment total maintenance margin
-            total_margin_maint += margin_maint
+    cdef AccountState _apply_position_totals(
+        self,
+        MarginAccount account,
+        Instrument instrument,
+        uint64_t ts_event,
+    ):
+        cdef Currency currency = account.base_currency or instrument.get_cost_currency()
+        total = self._total_to_decimal(
+            account,
+            instrument,
+            self._position_totals.get(instrument.id),
+        )
+        if total is None:
+            self._log.debug(
+                f"Cannot calculate maintenance (position) margin: "
+                f"insufficient data for "
+                f"{instrument.get_cost_currency()}/{account.base_currency}"
+            )
+            return None  # Cannot calculate
 
-        cdef Money margin_maint_money = Money(total_margin_maint, currency)
-        if total_margin_maint == 0:
+        cdef Money margin_maint_money = Money(total, currency)
+        if total == 0:
             account.clear_margin_maint(instrument.id)
         else:
             account.update_margin_maint(instrument.id, margin_maint_money)
 
-        self._log.info(f"{instrument.id} margin_maint={margin_maint_money.to_formatted_str()}")
+        if self._log.is_enabled(LogLevel.INFO):
+            self._log.info(f"{instrument.id} margin_maint={margin_maint_money.to_formatted_str()}")
 
         return self._generate_account_state(
             account=account,
             ts_event=ts_event,
         )
 
+    cdef object _total_to_decimal(self, Account account, Instrument instrument, list totals):
+        # Convert the raw totals per side to a decimal amount, in the account base currency
+        # if applicable, returning `None` if there is no exchange rate available
+        if totals is None:
+            return Decimal(0)
+
+        if account.base_currency is None:
+            return _raw_to_decimal(totals[0] + totals[1])
+
+        cdef uint8_t precision = account.base_currency.get_precision()
+        total = Decimal(0)
+        cdef int i
+        for i in range(2):
+            raw = totals[i]
+            if raw == 0:
+                continue
+
+            base_xrate = self._calculate_xrate_to_base(
+                instrument=instrument,
+                account=account,
+                side=OrderSide.BUY if i == 0 else OrderSide.SELL,
+            )
+            if base_xrate == 0:
+                return None  # Cannot calculate
+
+            # Apply base xrate
+            total += round(_raw_to_decimal(raw) * base_xrate, precision)
+
+        return total
+
     cdef void _update_balance_single_currency(
         self,
         Account account,
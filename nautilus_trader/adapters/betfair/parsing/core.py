@@ -14,6 +14,8 @@
 # -------------------------------------------------------------------------------------------------
 
 from collections.abc import Generator
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from os import PathLike
 from typing import BinaryIO
 
@@ -37,15 +39,70 @@ from nautilus_trader.model.objects import Currency
 from nautilus_trader.model.objects import Money
 
 
+def market_definition_fingerprint(market_def: MarketDefinition) -> tuple:
+    """
+    Return a fingerprint of the fields of the given market definition which define
+    its betting instruments.
+
+    Fields which change over the life of a market (status, in-play, runner order and
+    statuses etc.) are excluded, so successive definitions for the same market share
+    a fingerprint unless an instrument would actually be constructed differently.
+
+    Parameters
+    ----------
+    market_def : MarketDefinition
+        The market definition to fingerprint.
+
+    Returns
+    -------
+    tuple
+
+    """
+    return (
+        market_def.market_id,
+        market_def.event_type_id,
+        market_def.event_type_name,
+        market_def.competition_id,
+        market_def.competition_name,
+        market_def.event_id,
+        market_def.event_name,
+        market_def.country_code,
+        market_def.open_date,
+        market_def.betting_type,
+        market_def.market_name,
+        market_def.market_time,
+        market_def.market_type,
+        frozenset((runner.id, runner.name, runner.hc) for runner in market_def.runners),
+    )
+
+
 class BetfairParser:
     """
     Stateful parser that keeps market definition.
+
+    Parameters
+    ----------
+    currency : str
+        The Betfair account currency.
+    cache_instruments : bool, default False
+        If instruments are only rebuilt (and emitted) when the instrument defining fields
+        of a market definition change, rather than for every market definition received.
+        Historical stream files resend the full definition many times per market, so this
+        avoids repeatedly constructing identical instruments.
+
+    Warnings
+    --------
+    When `cache_instruments` is enabled the `info` of an emitted instrument reflects the
+    market definition at the time the instrument was built, not later status changes.
+
     """
 
-    def __init__(self, currency: str) -> None:
+    def __init__(self, currency: str, cache_instruments: bool = False) -> None:
         self.currency = Currency.from_str(currency)
+        self.cache_instruments = cache_instruments
         self.market_definitions: dict[str, MarketDefinition] = {}
         self.traded_volumes: dict[InstrumentId, dict[float, float]] = {}
+        self._instrument_fingerprints: dict[str, tuple] = {}
 
     def parse(
         self,
@@ -64,14 +121,15 @@ class BetfairParser:
             if mc.market_definition is not None:
                 market_def = msgspec.structs.replace(mc.market_definition, market_id=mc.id)
                 self.market_definitions[mc.id] = market_def
-                instruments = make_instruments(
-                    market_def,
-                    currency=self.currency.code,
-                    ts_event=ts_event,
-                    ts_init=ts_init,
-                    min_notional=min_notional,
-                )
-                updates.extend(instruments)
+                if self._should_build_instruments(market_def):
+                    instruments = make_instruments(
+                        market_def,
+                        currency=self.currency.code,
+                        ts_event=ts_event,
+                        ts_init=ts_init,
+                        min_notional=min_notional,
+                    )
+                    updates.extend(instruments)
             mc_updates = market_change_to_updates(mc, self.traded_volumes, ts_event, ts_init)
             updates.extend(mc_updates)
 
@@ -79,6 +137,17 @@ class BetfairParser:
 
         return updates
 
+    def _should_build_instruments(self, market_def: MarketDefinition) -> bool:
+        if not self.cache_instruments:
+            return True
+
+        fingerprint = market_definition_fingerprint(market_def)
+        if self._instrument_fingerprints.get(market_def.market_id) == fingerprint:
+            return False  # Instruments unchanged since last built
+
+        self._instrument_fingerprints[market_def.market_id] = fingerprint
+        return True
+
 
 def iter_stream(file_like: BinaryIO):
     for line in file_like:
@@ -89,6 +158,7 @@ def parse_betfair_file(
     uri: PathLike[str] | str,
     currency: str,
     min_notional: Money | None = None,
+    cache_instruments: bool = False,
 ) -> Generator[list[PARSE_TYPES], None, None]:
     """
     Parse a file of streaming data.
@@ -101,14 +171,80 @@ def parse_betfair_file(
         The Betfair account currency.
     min_notional : Money
         The minimum notional value for instrument definitions.
+    cache_instruments : bool, default False
+        If instruments are only emitted when the instrument defining fields of a
+        market definition change (see `BetfairParser`).
 
     """
-    parser = BetfairParser(currency=currency)
+    parser = BetfairParser(currency=currency, cache_instruments=cache_instruments)
     with fsspec.open(uri, compression="infer") as f:
         for mcm in iter_stream(f):
             yield from parser.parse(mcm, min_notional=min_notional)
 
 
+def _parse_betfair_file_to_list(
+    uri: PathLike[str] | str,
+    currency: str,
+    min_notional: Money | None,
+    cache_instruments: bool,
+) -> list[PARSE_TYPES]:
+    return list(
+        parse_betfair_file(
+            uri,
+            currency=currency,
+            min_notional=min_notional,
+            cache_instruments=cache_instruments,
+        ),
+    )
+
+
+def parse_betfair_files(
+    uris: Iterable[PathLike[str] | str],
+    currency: str,
+    min_notional: Money | None = None,
+    cache_instruments: bool = False,
+    max_workers: int | None = None,
+) -> Generator[tuple[PathLike[str] | str, list[PARSE_TYPES]], None, None]:
+    """
+    Parse many files of streaming data in parallel, one file per worker process.
+
+    Each file is parsed independently with its own `BetfairParser`, so this is suited
+    to archives of historical stream files (typically one market per file).
+    Results are yielded per file in the order of the given `uris`, allowing each
+    to be written to a catalog as soon as it is available.
+
+    Parameters
+    ----------
+    uris : Iterable[PathLike[str] | str]
+        The fsspec-compatible URIs.
+    currency : str
+        The Betfair account currency.
+    min_notional : Money
+        The minimum notional value for instrument definitions.
+    cache_instruments : bool, default False
+        If instruments are only emitted when the instrument defining fields of a
+        market definition change (see `BetfairParser`).
+    max_workers : int, optional
+        The maximum number of worker processes (defaults to the number of CPUs).
+
+    Yields
+    ------
+    tuple[PathLike[str] | str, list[PARSE_TYPES]]
+        The URI and parsed data for each file.
+
+    """
+    uris = list(uris)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            _parse_betfair_file_to_list,
+            uris,
+            [currency] * len(uris),
+            [min_notional] * len(uris),
+            [cache_instruments] * len(uris),
+        )
+        yield from zip(uris, results)
+
+
 def betting_instruments_from_file(
     uri: PathLike[str] | str,
     currency: str,
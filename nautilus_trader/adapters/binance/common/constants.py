@@ -37,3 +37,39 @@ BINANCE_RETRY_ERRORS: set[BinanceErrorCode] = {
     BinanceErrorCode.CANCEL_REJECTED,
     BinanceErrorCode.ME_RECVWINDOW_REJECT,
 }
+
+# Request weights per endpoint key (the last URL path segment, with an `:all` suffix
+# for requests made without a `symbol`), endpoints not listed have a weight of 1.
+# https://developers.binance.com/docs/binance-spot-api-docs/rest-api/limits
+BINANCE_SPOT_REQUEST_WEIGHTS: Final[dict[str, int]] = {
+    "account": 20,
+    "allOrders": 20,
+    "depth": 5,
+    "exchangeInfo": 20,
+    "klines": 2,
+    "myTrades": 20,
+    "openOrders": 6,
+    "openOrders:all": 80,
+    "24hr": 2,
+    "24hr:all": 80,
+    "bookTicker": 2,
+    "bookTicker:all": 4,
+    "price": 2,
+    "price:all": 4,
+}
+BINANCE_FUTURES_REQUEST_WEIGHTS: Final[dict[str, int]] = {
+    "account": 5,
+    "allOrders": 5,
+    "depth": 5,
+    "klines": 2,
+    "openOrders": 1,
+    "openOrders:all": 40,
+    "positionRisk": 5,
+    "userTrades": 5,
+    "24hr": 1,
+    "24hr:all": 40,
+    "bookTicker": 2,
+    "bookTicker:all": 5,
+    "price": 1,
+    "price:all": 2,
+}
@@ -338,10 +338,15 @@ class BinanceTickerBook(msgspec.Struct, frozen=True):
 class BinanceDataMsgWrapper(msgspec.Struct):
     """
     Provides a wrapper for data WebSocket messages from Binance.
+
+    The `data` payload is captured as a raw JSON slice so the stream name can be
+    routed on without decoding the payload, which is then decoded exactly once by
+    the handler for the stream.
     """
 
     stream: str | None = None
     id: int | None = None
+    data: msgspec.Raw = msgspec.Raw()
 
 
 class BinanceOrderBookDelta(msgspec.Struct, array_like=True):
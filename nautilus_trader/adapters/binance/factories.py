@@ -16,6 +16,8 @@
 import asyncio
 from functools import lru_cache
 
+from nautilus_trader.adapters.binance.common.constants import BINANCE_FUTURES_REQUEST_WEIGHTS
+from nautilus_trader.adapters.binance.common.constants import BINANCE_SPOT_REQUEST_WEIGHTS
 from nautilus_trader.adapters.binance.common.credentials import get_api_key
 from nautilus_trader.adapters.binance.common.credentials import get_api_secret
 from nautilus_trader.adapters.binance.common.credentials import get_ed25519_private_key
@@ -40,6 +42,7 @@ from nautilus_trader.config import InstrumentProviderConfig
 from nautilus_trader.core.nautilus_pyo3 import Quota
 from nautilus_trader.live.factories import LiveDataClientFactory
 from nautilus_trader.live.factories import LiveExecClientFactory
+from nautilus_trader.live.ratelimit import WeightedRateLimiter
 from nautilus_trader.model.identifiers import Venue
 
 
@@ -109,6 +112,11 @@ def get_cached_binance_http_client(
             ("order", Quota.rate_per_minute(3000)),
             ("allOrders", Quota.rate_per_minute(int(3000 / 20))),
         ]
+        ratelimiter = WeightedRateLimiter(
+            limit=6000,
+            interval_secs=60.0,
+            endpoint_weights=BINANCE_SPOT_REQUEST_WEIGHTS,
+        )
     else:
         # Futures
         ratelimiter_default_quota = Quota.rate_per_minute(2400)
@@ -116,6 +124,11 @@ def get_cached_binance_http_client(
             ("order", Quota.rate_per_minute(1200)),
             ("allOrders", Quota.rate_per_minute(int(1200 / 20))),
         ]
+        ratelimiter = WeightedRateLimiter(
+            limit=2400,
+            interval_secs=60.0,
+            endpoint_weights=BINANCE_FUTURES_REQUEST_WEIGHTS,
+        )
 
     return BinanceHttpClient(
         clock=clock,
@@ -127,6 +140,7 @@ def get_cached_binance_http_client(
         base_url=base_url or default_http_base_url,
         ratelimiter_quotas=ratelimiter_quotas,
         ratelimiter_default_quota=ratelimiter_default_quota,
+        ratelimiter=ratelimiter,
     )
 
 
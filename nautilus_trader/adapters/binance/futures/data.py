@@ -18,12 +18,13 @@ import asyncio
 import msgspec
 
 from nautilus_trader.adapters.binance.common.enums import BinanceAccountType
+from nautilus_trader.adapters.binance.common.schemas.market import BinanceDataMsgWrapper
 from nautilus_trader.adapters.binance.config import BinanceDataClientConfig
 from nautilus_trader.adapters.binance.data import BinanceCommonDataClient
 from nautilus_trader.adapters.binance.futures.enums import BinanceFuturesEnumParser
 from nautilus_trader.adapters.binance.futures.http.market import BinanceFuturesMarketHttpAPI
-from nautilus_trader.adapters.binance.futures.schemas.market import BinanceFuturesMarkPriceMsg
-from nautilus_trader.adapters.binance.futures.schemas.market import BinanceFuturesTradeMsg
+from nautilus_trader.adapters.binance.futures.schemas.market import BinanceFuturesMarkPriceData
+from nautilus_trader.adapters.binance.futures.schemas.market import BinanceFuturesTradeData
 from nautilus_trader.adapters.binance.futures.types import BinanceFuturesMarkPriceUpdate
 from nautilus_trader.adapters.binance.http.client import BinanceHttpClient
 from nautilus_trader.cache.cache import Cache
@@ -109,18 +110,18 @@ class BinanceFuturesDataClient(BinanceCommonDataClient):
         )
 
         # Register additional futures websocket handlers
-        self._ws_handlers["@markPrice"] = self._handle_mark_price
+        self._ws_handlers["markPrice"] = self._handle_mark_price
 
         # Websocket msgspec decoders
-        self._decoder_futures_trade_msg = msgspec.json.Decoder(BinanceFuturesTradeMsg)
-        self._decoder_futures_mark_price_msg = msgspec.json.Decoder(BinanceFuturesMarkPriceMsg)
+        self._decoder_futures_trade_data = msgspec.json.Decoder(BinanceFuturesTradeData)
+        self._decoder_futures_mark_price_data = msgspec.json.Decoder(BinanceFuturesMarkPriceData)
 
     # -- WEBSOCKET HANDLERS ---------------------------------------------------------------------------------
 
-    def _handle_book_partial_update(self, raw: bytes) -> None:
-        msg = self._decoder_order_book_msg.decode(raw)
-        instrument_id: InstrumentId = self._get_cached_instrument_id(msg.data.s)
-        book_snapshot: OrderBookDeltas = msg.data.parse_to_order_book_deltas(
+    def _handle_book_partial_update(self, wrapper: BinanceDataMsgWrapper) -> None:
+        data = self._decoder_order_book_data.decode(wrapper.data)
+        instrument_id: InstrumentId = self._get_cached_instrument_id(data.s)
+        book_snapshot: OrderBookDeltas = data.parse_to_order_book_deltas(
             instrument_id=instrument_id,
             ts_init=self._clock.timestamp_ns(),
             snapshot=True,
@@ -134,20 +135,20 @@ class BinanceFuturesDataClient(BinanceCommonDataClient):
         else:
             self._handle_data(book_snapshot)
 
-    def _handle_trade(self, raw: bytes) -> None:
+    def _handle_trade(self, wrapper: BinanceDataMsgWrapper) -> None:
         # NOTE @trade is an undocumented endpoint for Futures exchanges
-        msg = self._decoder_futures_trade_msg.decode(raw)
-        instrument_id: InstrumentId = self._get_cached_instrument_id(msg.data.s)
-        trade_tick: TradeTick = msg.data.parse_to_trade_tick(
+        data = self._decoder_futures_trade_data.decode(wrapper.data)
+        instrument_id: InstrumentId = self._get_cached_instrument_id(data.s)
+        trade_tick: TradeTick = data.parse_to_trade_tick(
             instrument_id=instrument_id,
             ts_init=self._clock.timestamp_ns(),
         )
         self._handle_data(trade_tick)
 
-    def _handle_mark_price(self, raw: bytes) -> None:
-        msg = self._decoder_futures_mark_price_msg.decode(raw)
-        instrument_id: InstrumentId = self._get_cached_instrument_id(msg.data.s)
-        data = msg.data.parse_to_binance_futures_mark_price_update(
+    def _handle_mark_price(self, wrapper: BinanceDataMsgWrapper) -> None:
+        msg_data = self._decoder_futures_mark_price_data.decode(wrapper.data)
+        instrument_id: InstrumentId = self._get_cached_instrument_id(msg_data.s)
+        data = msg_data.parse_to_binance_futures_mark_price_update(
             instrument_id=instrument_id,
             ts_init=self._clock.timestamp_ns(),
         )
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from decimal import Decimal
+from typing import Any
 
 import msgspec
 
@@ -115,6 +116,13 @@ class BinanceFuturesInstrumentProvider(InstrumentProvider):
             9: BinanceFuturesFeeRates(feeTier=9, maker="0.000000", taker="0.000170"),
         }
 
+    def _snapshot_context(self) -> dict[str, Any]:
+        return {
+            "venue": self._venue,
+            "account_type": self._account_type,
+            "environment": self._client.base_url,
+        }
+
     async def load_all_async(self, filters: dict | None = None) -> None:
         filters_str = "..." if not filters else f" with filters {filters}..."
         self._log.info(f"Loading all instruments{filters_str}")
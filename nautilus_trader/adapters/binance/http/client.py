@@ -32,6 +32,8 @@ from nautilus_trader.core.nautilus_pyo3 import Quota
 from nautilus_trader.core.nautilus_pyo3 import ed25519_signature
 from nautilus_trader.core.nautilus_pyo3 import hmac_signature
 from nautilus_trader.core.nautilus_pyo3 import rsa_signature
+from nautilus_trader.live.ratelimit import RequestPriority
+from nautilus_trader.live.ratelimit import WeightedRateLimiter
 
 
 class BinanceHttpClient:
@@ -58,6 +60,9 @@ class BinanceHttpClient:
         The keyed rate limiter quotas for the client.
     ratelimiter_quota : Quota, optional
         The default rate limiter quota for the client.
+    ratelimiter : WeightedRateLimiter, optional
+        The request weight rate limiter for the client, kept in sync with the
+        used weight reported by Binance (prioritizing order requests).
 
     """
 
@@ -72,6 +77,7 @@ class BinanceHttpClient:
         ed25519_private_key: str | None = None,
         ratelimiter_quotas: list[tuple[str, Quota]] | None = None,
         ratelimiter_default_quota: Quota | None = None,
+        ratelimiter: WeightedRateLimiter | None = None,
     ) -> None:
         self._clock: LiveClock = clock
         self._log: Logger = Logger(type(self).__name__)
@@ -94,6 +100,7 @@ class BinanceHttpClient:
             keyed_quotas=ratelimiter_quotas or [],
             default_quota=ratelimiter_default_quota,
         )
+        self._ratelimiter: WeightedRateLimiter | None = ratelimiter
 
     @property
     def base_url(self) -> str:
@@ -131,6 +138,18 @@ class BinanceHttpClient:
         """
         return self._headers
 
+    @property
+    def ratelimiter(self) -> WeightedRateLimiter | None:
+        """
+        Return the request weight rate limiter for the client (if configured).
+
+        Returns
+        -------
+        WeightedRateLimiter or ``None``
+
+        """
+        return self._ratelimiter
+
     def _prepare_params(self, params: dict[str, Any]) -> str:
         # Encode a dict into a URL query string
         return urllib.parse.urlencode(params)
@@ -157,9 +176,19 @@ class BinanceHttpClient:
         url_path: str,
         payload: dict[str, str] | None = None,
         ratelimiter_keys: list[str] | None = None,
-    ) -> Any:
+        priority: RequestPriority | None = None,
+        acquired: bool = False,
+    ) -> bytes:
         if payload is None:
             payload = {}
+        if self._ratelimiter is not None and not acquired:
+            if priority is None:
+                # Signed requests are either order actions or account/reporting queries
+                priority = RequestPriority.ACCOUNT if http_method == HttpMethod.GET else RequestPriority.ORDER
+            await self._ratelimiter.acquire(self._endpoint_key(url_path, payload), priority)
+            if "timestamp" in payload:
+                # Refresh following any wait, so the request remains within its receive window
+                payload["timestamp"] = str(self._clock.timestamp_ms())
         query_string = self._prepare_params(payload)
         signature = self._get_sign(query_string)
         payload["signature"] = signature
@@ -168,6 +197,7 @@ class BinanceHttpClient:
             url_path,
             payload=payload,
             ratelimiter_keys=ratelimiter_keys,
+            acquired=True,
         )
 
     async def send_request(
@@ -176,7 +206,14 @@ class BinanceHttpClient:
         url_path: str,
         payload: dict[str, str] | None = None,
         ratelimiter_keys: list[str] | None = None,
+        priority: RequestPriority | None = None,
+        acquired: bool = False,
     ) -> bytes:
+        if self._ratelimiter is not None and not acquired:
+            if priority is None:
+                priority = RequestPriority.MARKET_DATA if http_method == HttpMethod.GET else RequestPriority.ORDER
+            await self._ratelimiter.acquire(self._endpoint_key(url_path, payload), priority)
+
         if payload:
             url_path += "?" + urllib.parse.urlencode(payload)
             payload = None  # Don't send payload in the body
@@ -193,6 +230,9 @@ class BinanceHttpClient:
 
         response_body = response.body
 
+        if self._ratelimiter is not None:
+            self._update_ratelimiter(response)
+
         if response.status >= 400:
             try:
                 message = msgspec.json.decode(response_body) if response_body else None
@@ -213,3 +253,25 @@ class BinanceHttpClient:
                 )
 
         return response.body
+
+    def _endpoint_key(self, url_path: str, payload: dict[str, str] | None) -> str:
+        endpoint = url_path.rsplit("/", 1)[-1]
+        if not payload or "symbol" not in payload:
+            # Requests across all symbols are weighted separately (when listed)
+            endpoint_all = f"{endpoint}:all"
+            if self._ratelimiter is not None and endpoint_all in self._ratelimiter.endpoint_weights:
+                return endpoint_all
+        return endpoint
+
+    def _update_ratelimiter(self, response: HttpResponse) -> None:
+        ratelimiter = self._ratelimiter
+        if ratelimiter is None:
+            return
+
+        for key, value in response.headers.items():
+            key = key.lower()
+            if key == "x-mbx-used-weight-1m":
+                ratelimiter.update_used(int(value))
+            elif key == "retry-after" and response.status in (418, 429):
+                self._log.warning(f"Rate limited by Binance (status {response.status}), pausing requests for {value}s")
+                ratelimiter.pause(float(value))
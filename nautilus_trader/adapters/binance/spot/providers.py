@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from decimal import Decimal
+from typing import Any
 
 import msgspec
 
@@ -94,6 +95,13 @@ class BinanceSpotInstrumentProvider(InstrumentProvider):
         self._decoder = msgspec.json.Decoder()
         self._encoder = msgspec.json.Encoder()
 
+    def _snapshot_context(self) -> dict[str, Any]:
+        return {
+            "venue": self._venue,
+            "account_type": self._account_type,
+            "environment": self._client.base_url,
+        }
+
     async def load_all_async(self, filters: dict | None = None) -> None:
         filters_str = "..." if not filters else f" with filters {filters}..."
         self._log.info(f"Loading all instruments{filters_str}")
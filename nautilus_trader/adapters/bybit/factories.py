@@ -33,6 +33,7 @@ from nautilus_trader.adapters.bybit.providers import BybitInstrumentProvider
 from nautilus_trader.core.nautilus_pyo3 import Quota
 from nautilus_trader.live.factories import LiveDataClientFactory
 from nautilus_trader.live.factories import LiveExecClientFactory
+from nautilus_trader.live.ratelimit import WeightedRateLimiter
 
 
 if TYPE_CHECKING:
@@ -93,6 +94,7 @@ def get_bybit_http_client(
     # https://bybit-exchange.github.io/docs/v5/rate-limit
     ratelimiter_default_quota = Quota.rate_per_second(24)
     ratelimiter_quotas: list[tuple[str, Quota]] = []
+    ratelimiter = WeightedRateLimiter(limit=120, interval_secs=5.0)
 
     return BybitHttpClient(
         clock=clock,
@@ -102,6 +104,7 @@ def get_bybit_http_client(
         recv_window_ms=recv_window_ms,
         ratelimiter_quotas=ratelimiter_quotas,
         ratelimiter_default_quota=ratelimiter_default_quota,
+        ratelimiter=ratelimiter,
     )
 
 
@@ -27,6 +27,8 @@ from nautilus_trader.core.nautilus_pyo3 import HttpMethod
 from nautilus_trader.core.nautilus_pyo3 import HttpResponse
 from nautilus_trader.core.nautilus_pyo3 import Quota
 from nautilus_trader.core.nautilus_pyo3 import hmac_signature
+from nautilus_trader.live.ratelimit import RequestPriority
+from nautilus_trader.live.ratelimit import WeightedRateLimiter
 
 
 class BybitResponse(msgspec.Struct, frozen=True):
@@ -57,6 +59,9 @@ class BybitHttpClient:
         The keyed rate limiter quotas for the client.
     ratelimiter_quota : Quota, optional
         The default rate limiter quota for the client.
+    ratelimiter : WeightedRateLimiter, optional
+        The request rate limiter for the client, which prioritizes order requests and
+        blocks endpoints whose remaining limit reported by Bybit is exhausted.
 
     """
 
@@ -69,6 +74,7 @@ class BybitHttpClient:
         recv_window_ms: int = 5_000,
         ratelimiter_quotas: list[tuple[str, Quota]] | None = None,
         ratelimiter_default_quota: Quota | None = None,
+        ratelimiter: WeightedRateLimiter | None = None,
     ) -> None:
         self._clock: LiveClock = clock
         self._log: Logger = Logger(name=type(self).__name__)
@@ -86,6 +92,7 @@ class BybitHttpClient:
             keyed_quotas=ratelimiter_quotas or [],
             default_quota=ratelimiter_default_quota,
         )
+        self._ratelimiter: WeightedRateLimiter | None = ratelimiter
         self._decoder_response = msgspec.json.Decoder(BybitResponse)
 
     @property
@@ -104,7 +111,15 @@ class BybitHttpClient:
         signature: str | None = None,
         timestamp: str | None = None,
         ratelimiter_keys: list[str] | None = None,
+        priority: RequestPriority | None = None,
+        acquired: bool = False,
     ) -> bytes:
+        endpoint = url_path
+        if self._ratelimiter is not None and not acquired:
+            if priority is None:
+                priority = RequestPriority.MARKET_DATA if http_method == HttpMethod.GET else RequestPriority.ORDER
+            await self._ratelimiter.acquire(endpoint, priority)
+
         if payload and http_method == HttpMethod.GET:
             url_path += "?" + parse.urlencode(payload)
             payload = None
@@ -129,6 +144,9 @@ class BybitHttpClient:
 
         response_body = response.body
 
+        if self._ratelimiter is not None:
+            self._update_ratelimiter(endpoint, response)
+
         if response.status >= 400:
             try:
                 message = msgspec.json.decode(response_body) if response_body else None
@@ -152,10 +170,18 @@ class BybitHttpClient:
         url_path: str,
         payload: dict[str, str] | None = None,
         ratelimiter_keys: list[str] | None = None,
+        priority: RequestPriority | None = None,
     ) -> Any:
         if payload is None:
             payload = {}
 
+        if self._ratelimiter is not None:
+            if priority is None:
+                # Signed requests are either order actions or account/reporting queries
+                priority = RequestPriority.ACCOUNT if http_method == HttpMethod.GET else RequestPriority.ORDER
+            # Acquire before signing, so the request remains within its receive window
+            await self._ratelimiter.acquire(url_path, priority)
+
         [timestamp, authed_signature] = (
             self._sign_get_request(payload)
             if http_method == HttpMethod.GET
@@ -168,8 +194,20 @@ class BybitHttpClient:
             signature=authed_signature,
             timestamp=timestamp,
             ratelimiter_keys=ratelimiter_keys,
+            acquired=True,
         )
 
+    def _update_ratelimiter(self, endpoint: str, response: HttpResponse) -> None:
+        # Bybit reports the remaining requests for each endpoint within its window
+        headers = {key.lower(): value for key, value in response.headers.items()}
+        remaining = headers.get("x-bapi-limit-status")
+        reset_ts_ms = headers.get("x-bapi-limit-reset-timestamp")
+        if remaining is None or reset_ts_ms is None:
+            return
+        if int(remaining) <= 0 and self._ratelimiter is not None:
+            self._log.warning(f"Bybit rate limit exhausted for {endpoint}, blocking until {reset_ts_ms}")
+            self._ratelimiter.block_endpoint(endpoint, int(reset_ts_ms) / 1_000)
+
     def _sign_post_request(self, payload: dict[str, Any]) -> list[str]:
         timestamp = str(self._clock.timestamp_ms())
         payload_str = msgspec.json.encode(payload).decode()
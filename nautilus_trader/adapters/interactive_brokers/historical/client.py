@@ -24,6 +24,9 @@ from ibapi.common import MarketDataTypeEnum
 # fmt: off
 from nautilus_trader.adapters.interactive_brokers.client import InteractiveBrokersClient
 from nautilus_trader.adapters.interactive_brokers.common import IBContract
+from nautilus_trader.adapters.interactive_brokers.historical.downloader import HistoricalRequestPacer
+from nautilus_trader.adapters.interactive_brokers.historical.downloader import InteractiveBrokersHistoricalDownloader
+from nautilus_trader.adapters.interactive_brokers.historical.downloader import next_ticks_start
 from nautilus_trader.adapters.interactive_brokers.parsing.instruments import ib_contract_to_instrument_id
 from nautilus_trader.adapters.interactive_brokers.parsing.instruments import instrument_id_to_ib_contract
 from nautilus_trader.adapters.interactive_brokers.providers import InteractiveBrokersInstrumentProvider
@@ -37,7 +40,6 @@ from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.component import init_logging
 from nautilus_trader.common.component import log_level_from_str
 from nautilus_trader.core.datetime import dt_to_unix_nanos
-from nautilus_trader.core.datetime import unix_nanos_to_dt
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarSpecification
 from nautilus_trader.model.data import BarType
@@ -47,6 +49,7 @@ from nautilus_trader.model.enums import AggregationSource
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import TraderId
 from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
 
 
 class HistoricInteractiveBrokersClient:
@@ -398,6 +401,116 @@ class HistoricInteractiveBrokersClient:
 
         return sorted(data, key=lambda x: x.ts_init)
 
+    async def download_to_catalog(
+        self,
+        catalog: ParquetDataCatalog,
+        checkpoint_path: str,
+        start_date_time: datetime.datetime,
+        end_date_time: datetime.datetime,
+        tz_name: str,
+        bar_specifications: list[str] | None = None,
+        tick_type: Literal["TRADES", "BID_ASK"] | None = None,
+        contracts: list[IBContract] | None = None,
+        instrument_ids: list[str] | None = None,
+        use_rth: bool = True,
+        segment: pd.Timedelta = pd.Timedelta(days=30),
+        pacer: HistoricalRequestPacer | None = None,
+        max_concurrent_tasks: int = 8,
+    ) -> int:
+        """
+        Download bars and/or ticks for a list of IBContracts and/or InstrumentId strings
+        directly into the given catalog, with concurrent paced requests across contracts.
+
+        Each segment is written to the catalog as it arrives and the download progress is
+        checkpointed, so calling this again with the same parameters resumes an interrupted
+        download. The instruments are also written to the catalog.
+
+        Parameters
+        ----------
+        catalog : ParquetDataCatalog
+            The catalog to write data to.
+        checkpoint_path : str
+            The path to the download checkpoint file.
+        start_date_time : datetime.datetime
+            The start date time for the data.
+        end_date_time : datetime.datetime
+            The end date time for the data.
+        tz_name : str
+            The timezone to use. (e.g. 'America/New_York', 'UTC')
+        bar_specifications : list[str], optional
+            BarSpecifications represented as strings defining which bars to download.
+            (e.g. '1-HOUR-LAST', '5-MINUTE-MID')
+        tick_type : Literal["TRADES", "BID_ASK"], optional
+            The type of ticks to download.
+        contracts : list[IBContract], default 'None'
+            IBContracts defining which data to download.
+        instrument_ids : list[str], default 'None'
+            Instrument IDs (e.g. AAPL.NASDAQ) defining which data to download.
+        use_rth : bool, default 'True'
+            Whether to use regular trading hours.
+        segment : pd.Timedelta, default 30 days
+            The duration of each bar request segment (and checkpoint).
+        pacer : HistoricalRequestPacer, optional
+            The request pacer. If ``None`` then one with the IB default limits is used.
+        max_concurrent_tasks : int, default 8
+            The maximum number of contracts (and bar specifications) downloading concurrently.
+
+        Returns
+        -------
+        int
+            The number of bars and ticks written to the catalog.
+
+        """
+        if not bar_specifications and not tick_type:
+            raise ValueError("Either bar_specifications or tick_type must be provided")
+
+        contracts, start_date_time, end_date_time = await self._prepare_request_bars_parameters(
+            bar_specifications or [],
+            end_date_time,
+            tz_name,
+            start_date_time,
+            None,
+            contracts,
+            instrument_ids,
+            use_rth,
+        )
+
+        await self._fetch_instruments_if_not_cached(contracts)
+        instruments = [
+            self._client._cache.instrument(ib_contract_to_instrument_id(contract))
+            for contract in contracts
+        ]
+        catalog.write_data([i for i in instruments if i is not None])
+
+        downloader = InteractiveBrokersHistoricalDownloader(
+            client=self._client,
+            catalog=catalog,
+            checkpoint_path=checkpoint_path,
+            pacer=pacer,
+            max_concurrent_tasks=max_concurrent_tasks,
+        )
+
+        count = 0
+        if bar_specifications:
+            count += await downloader.download_bars(
+                contracts,
+                bar_specifications,
+                start_date_time,
+                end_date_time,
+                segment=segment,
+                use_rth=use_rth,
+            )
+        if tick_type:
+            count += await downloader.download_ticks(
+                contracts,
+                tick_type,
+                start_date_time,
+                end_date_time,
+                use_rth=use_rth,
+            )
+
+        return count
+
     def _handle_timestamp_iteration(
         self,
         ticks: list[TradeTick | QuoteTick],
@@ -420,21 +533,7 @@ class HistoricInteractiveBrokersClient:
         tuple[pd.Timestamp | None, bool]
 
         """
-        if not ticks:
-            return None, False
-
-        timestamps = [unix_nanos_to_dt(tick.ts_event) for tick in ticks]
-        min_timestamp = min(timestamps)
-        max_timestamp = max(timestamps)
-
-        if min_timestamp.floor("S") == max_timestamp.floor("S"):
-            max_timestamp = max_timestamp.floor("S") + pd.Timedelta(seconds=1)
-        if len(ticks) <= 50:
-            max_timestamp = max_timestamp.floor("S") + pd.Timedelta(minutes=1)
-        if max_timestamp >= end_date_time:
-            return None, False
-
-        return max_timestamp, True
+        return next_ticks_start(ticks, end_date_time)
 
     async def _fetch_instruments_if_not_cached(self, contracts: list[IBContract]) -> None:
         """
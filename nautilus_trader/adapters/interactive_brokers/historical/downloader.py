@@ -0,0 +1,650 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import json
+import math
+import os
+import time
+from collections import defaultdict
+from collections import deque
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Hashable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Literal, Protocol
+
+import pandas as pd
+
+from nautilus_trader.adapters.interactive_brokers.common import IBContract
+from nautilus_trader.adapters.interactive_brokers.parsing.instruments import ib_contract_to_instrument_id
+from nautilus_trader.common.component import Logger
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.datetime import dt_to_unix_nanos
+from nautilus_trader.core.datetime import unix_nanos_to_dt
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarSpecification
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AggregationSource
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.catalog.types import CatalogWriteMode
+
+
+class HistoricalDataClient(Protocol):
+    """
+    The historical data request interface of `InteractiveBrokersClient` used by the
+    downloader (allowing a local fake to be used for testing).
+    """
+
+    async def get_historical_bars(
+        self,
+        bar_type: BarType,
+        contract: IBContract,
+        use_rth: bool,
+        end_date_time: pd.Timestamp,
+        duration: str,
+        timeout: int = 60,
+    ) -> list[Bar]: ...
+
+    async def get_historical_ticks(
+        self,
+        contract: IBContract,
+        tick_type: str,
+        start_date_time: pd.Timestamp | str = "",
+        end_date_time: pd.Timestamp | str = "",
+        use_rth: bool = True,
+        timeout: int = 60,
+    ) -> list[QuoteTick | TradeTick] | None: ...
+
+
+def bar_segments(
+    start_date_time: pd.Timestamp,
+    end_date_time: pd.Timestamp,
+    segment: pd.Timedelta,
+) -> list[tuple[pd.Timestamp, str]]:
+    """
+    Split the given time range into historical bar request segments, from the most
+    recent segment backwards.
+
+    Parameters
+    ----------
+    start_date_time : pd.Timestamp
+        The start of the range.
+    end_date_time : pd.Timestamp
+        The end of the range.
+    segment : pd.Timedelta
+        The maximum duration of each segment.
+
+    Returns
+    -------
+    list[tuple[pd.Timestamp, str]]
+        The end date time and IB duration string of each segment. Durations of partial
+        days are rounded up, so a segment may extend before `start_date_time`.
+
+    """
+    results: list[tuple[pd.Timestamp, str]] = []
+    segment_end = end_date_time
+    while segment_end > start_date_time:
+        delta = min(segment, segment_end - start_date_time)
+        if delta >= pd.Timedelta(days=1):
+            duration = f"{math.ceil(delta / pd.Timedelta(days=1))} D"
+        else:
+            duration = f"{math.ceil(delta.total_seconds())} S"
+        results.append((segment_end, duration))
+        segment_end -= delta
+
+    return results
+
+
+def next_ticks_start(
+    ticks: list[TradeTick | QuoteTick],
+    end_date_time: pd.Timestamp,
+) -> tuple[pd.Timestamp | None, bool]:
+    """
+    Return the start date time for the next historical ticks request following the
+    given ticks, and whether to continue iterating.
+
+    If all timestamps occur in the same second, the max timestamp will be incremented
+    by 1 second. If the batch is small (not more than 50 ticks), the max timestamp will
+    be incremented by 1 minute.
+
+    Parameters
+    ----------
+    ticks : list[TradeTick | QuoteTick]
+        The ticks received for the last request.
+    end_date_time : pd.Timestamp
+        The end date time for the ticks.
+
+    Returns
+    -------
+    tuple[pd.Timestamp | None, bool]
+
+    """
+    if not ticks:
+        return None, False
+
+    timestamps = [unix_nanos_to_dt(tick.ts_event) for tick in ticks]
+    min_timestamp = min(timestamps)
+    max_timestamp = max(timestamps)
+
+    if min_timestamp.floor("S") == max_timestamp.floor("S"):
+        max_timestamp = max_timestamp.floor("S") + pd.Timedelta(seconds=1)
+    if len(ticks) <= 50:
+        max_timestamp = max_timestamp.floor("S") + pd.Timedelta(minutes=1)
+    if max_timestamp >= end_date_time:
+        return None, False
+
+    return max_timestamp, True
+
+
+class HistoricalRequestPacer:
+    """
+    Provides pacing for historical data requests within the Interactive Brokers limits.
+
+    Requests are delayed so that no more than `max_requests` are made in any
+    `window_secs`, and no more than `max_requests_per_key` for the same key (contract
+    and data type) are made in any `key_window_secs`. At most `max_concurrent`
+    requests are in-flight at once.
+
+    Parameters
+    ----------
+    max_requests : int, default 60
+        The maximum number of requests in any window.
+    window_secs : float, default 600.0
+        The window (seconds) for the request limit.
+    max_requests_per_key : int, default 5
+        The maximum number of requests for the same key in any key window.
+    key_window_secs : float, default 2.0
+        The window (seconds) for the per key request limit.
+    max_concurrent : int, default 50
+        The maximum number of concurrent in-flight requests.
+
+    References
+    ----------
+    https://interactivebrokers.github.io/tws-api/historical_limitations.html
+
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 60,
+        window_secs: float = 600.0,
+        max_requests_per_key: int = 5,
+        key_window_secs: float = 2.0,
+        max_concurrent: int = 50,
+    ) -> None:
+        PyCondition.positive_int(max_requests, "max_requests")
+        PyCondition.positive(window_secs, "window_secs")
+        PyCondition.positive_int(max_requests_per_key, "max_requests_per_key")
+        PyCondition.positive(key_window_secs, "key_window_secs")
+        PyCondition.positive_int(max_concurrent, "max_concurrent")
+
+        self.max_requests = max_requests
+        self.window_secs = window_secs
+        self.max_requests_per_key = max_requests_per_key
+        self.key_window_secs = key_window_secs
+
+        self._requests: deque[float] = deque()
+        self._key_requests: defaultdict[Hashable, deque[float]] = defaultdict(deque)
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    @property
+    def request_count(self) -> int:
+        """
+        Return the number of requests made within the current window.
+
+        Returns
+        -------
+        int
+
+        """
+        self._prune(self._requests, time.monotonic() - self.window_secs)
+        return len(self._requests)
+
+    @staticmethod
+    def _prune(timestamps: deque[float], cutoff: float) -> None:
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
+
+    async def _acquire(self, key: Hashable) -> None:
+        key_requests = self._key_requests[key]
+        while True:
+            now = time.monotonic()
+            self._prune(self._requests, now - self.window_secs)
+            self._prune(key_requests, now - self.key_window_secs)
+
+            delay = 0.0
+            if len(self._requests) >= self.max_requests:
+                delay = self._requests[0] + self.window_secs - now
+            if len(key_requests) >= self.max_requests_per_key:
+                delay = max(delay, key_requests[0] + self.key_window_secs - now)
+
+            if delay <= 0.0:
+                self._requests.append(now)
+                key_requests.append(now)
+                return
+
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def request(self, key: Hashable) -> AsyncIterator[None]:
+        """
+        Wait until a request for the given key can be made within the pacing limits,
+        holding a concurrent request slot until the context exits.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key identifying the requested contract and data type.
+
+        """
+        async with self._semaphore:
+            await self._acquire(key)
+            yield
+
+
+class DownloadCheckpoint:
+    """
+    Provides persisted progress of historical downloads, so that interrupted
+    downloads can resume from where they stopped.
+
+    Progress is held per task key as a JSON object, and written to file atomically on
+    every update.
+
+    Parameters
+    ----------
+    path : str or Path
+        The path to the checkpoint file.
+
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._state: dict[str, Any] = {}
+        if self.path.exists():
+            self._state = json.loads(self.path.read_text())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Return the progress for the given task key.
+
+        Parameters
+        ----------
+        key : str
+            The task key.
+        default : Any, optional
+            The value to return if there is no progress for the key.
+
+        Returns
+        -------
+        Any
+
+        """
+        return self._state.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Set the progress for the given task key and persist the checkpoint.
+
+        Parameters
+        ----------
+        key : str
+            The task key.
+        value : Any
+            The JSON serializable progress.
+
+        """
+        self._state[key] = value
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps(self._state))
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        """
+        Clear all progress.
+        """
+        self._state.clear()
+        self.path.unlink(missing_ok=True)
+
+
+class InteractiveBrokersHistoricalDownloader:
+    """
+    Provides a concurrent and resumable downloader of Interactive Brokers historical
+    data into a `ParquetDataCatalog`.
+
+    Downloads for each contract (and bar specification) run concurrently, with all
+    requests paced within the IB historical data limits. Each segment is written to
+    the catalog as it arrives, and its completion recorded in the checkpoint file.
+    Running the same download again skips completed segments, and re-written segments
+    overwrite their previous files, so interrupted downloads resume where they stopped.
+
+    Parameters
+    ----------
+    client : HistoricalDataClient
+        The client for historical data requests (normally an `InteractiveBrokersClient`).
+    catalog : ParquetDataCatalog
+        The catalog to write data to.
+    checkpoint_path : str or Path
+        The path to the checkpoint file.
+    pacer : HistoricalRequestPacer, optional
+        The request pacer. If ``None`` then one with the IB default limits is used.
+    max_concurrent_tasks : int, default 8
+        The maximum number of contracts (and bar specifications) downloading concurrently.
+    max_retries : int, default 3
+        The maximum number of retries for a failed request before the task stops.
+    retry_delay_secs : float, default 15.0
+        The initial delay (seconds) between retries, doubling on each retry.
+
+    """
+
+    def __init__(
+        self,
+        client: HistoricalDataClient,
+        catalog: ParquetDataCatalog,
+        checkpoint_path: str | Path,
+        pacer: HistoricalRequestPacer | None = None,
+        max_concurrent_tasks: int = 8,
+        max_retries: int = 3,
+        retry_delay_secs: float = 15.0,
+    ) -> None:
+        PyCondition.positive_int(max_concurrent_tasks, "max_concurrent_tasks")
+        PyCondition.not_negative_int(max_retries, "max_retries")
+        PyCondition.not_negative(retry_delay_secs, "retry_delay_secs")
+
+        self._log = Logger(type(self).__name__)
+        self._client = client
+        self._catalog = catalog
+        self._checkpoint = DownloadCheckpoint(checkpoint_path)
+        self._pacer = pacer or HistoricalRequestPacer()
+        self._max_concurrent_tasks = max_concurrent_tasks
+        self._max_retries = max_retries
+        self._retry_delay_secs = retry_delay_secs
+
+    @property
+    def checkpoint(self) -> DownloadCheckpoint:
+        """
+        Return the download checkpoint.
+
+        Returns
+        -------
+        DownloadCheckpoint
+
+        """
+        return self._checkpoint
+
+    async def _gather_bounded(self, coros: list[Awaitable[int]]) -> list[int]:
+        semaphore = asyncio.Semaphore(self._max_concurrent_tasks)
+
+        async def run(coro: Awaitable[int]) -> int:
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*(run(coro) for coro in coros))
+
+    async def _request_with_retries(
+        self,
+        key: Hashable,
+        request: Callable[[], Awaitable[Any]],
+        description: str,
+    ) -> Any:
+        delay = self._retry_delay_secs
+        for attempt in range(self._max_retries + 1):
+            try:
+                async with self._pacer.request(key):
+                    result = await request()
+                if result is not None:
+                    return result
+                self._log.warning(f"No response for {description}")
+            except Exception as e:
+                self._log.exception(f"Error requesting {description}", e)
+
+            if attempt < self._max_retries:
+                await asyncio.sleep(delay)
+                delay *= 2
+
+        return None
+
+    def _write(self, data: list, basename: str) -> None:
+        data.sort(key=lambda x: x.ts_init)
+        self._catalog.write_data(
+            data,
+            basename_template=f"{basename}-{{i}}",
+            mode=CatalogWriteMode.OVERWRITE,
+        )
+
+    async def download_bars(
+        self,
+        contracts: list[IBContract],
+        bar_specifications: list[str],
+        start_date_time: pd.Timestamp,
+        end_date_time: pd.Timestamp,
+        segment: pd.Timedelta = pd.Timedelta(days=30),
+        use_rth: bool = True,
+        timeout: int = 120,
+    ) -> int:
+        """
+        Download bars for each bar specification of the given contracts into the catalog.
+
+        Parameters
+        ----------
+        contracts : list[IBContract]
+            The contracts to download bars for.
+        bar_specifications : list[str]
+            BarSpecifications represented as strings (e.g. '1-HOUR-LAST', '5-MINUTE-MID').
+        start_date_time : pd.Timestamp
+            The start date time (UTC) for the bars.
+        end_date_time : pd.Timestamp
+            The end date time (UTC) for the bars (exclusive).
+        segment : pd.Timedelta, default 30 days
+            The duration of each request segment (and checkpoint). This should be within
+            the IB maximum duration for the bar size being requested.
+        use_rth : bool, default True
+            Whether to use regular trading hours.
+        timeout : int, default 120
+            The timeout (seconds) for each request.
+
+        Returns
+        -------
+        int
+            The number of bars written to the catalog.
+
+        Raises
+        ------
+        ValueError
+            If `start_date_time` is not before `end_date_time`.
+
+        """
+        PyCondition.is_true(start_date_time < end_date_time, "start_date_time was >= end_date_time")
+
+        segments = bar_segments(start_date_time, end_date_time, segment)
+        coros: list[Awaitable[int]] = [
+            self._download_bar_type(
+                contract=contract,
+                bar_type=BarType(
+                    ib_contract_to_instrument_id(contract),
+                    BarSpecification.from_str(bar_spec),
+                    AggregationSource.EXTERNAL,
+                ),
+                segments=segments,
+                start_ns=dt_to_unix_nanos(start_date_time),
+                end_ns=dt_to_unix_nanos(end_date_time),
+                use_rth=use_rth,
+                timeout=timeout,
+            )
+            for contract in contracts
+            for bar_spec in bar_specifications
+        ]
+
+        return sum(await self._gather_bounded(coros))
+
+    async def _download_bar_type(
+        self,
+        contract: IBContract,
+        bar_type: BarType,
+        segments: list[tuple[pd.Timestamp, str]],
+        start_ns: int,
+        end_ns: int,
+        use_rth: bool,
+        timeout: int,
+    ) -> int:
+        task_key = f"bars:{bar_type}:{start_ns}:{end_ns}"
+        completed: list[str] = self._checkpoint.get(task_key, [])
+        count = 0
+
+        for i, (segment_end, duration) in enumerate(segments):
+            segment_key = str(dt_to_unix_nanos(segment_end))
+            if segment_key in completed:
+                continue  # Downloaded before interruption
+
+            description = f"{bar_type} bars ending {segment_end} for {duration}"
+            self._log.info(f"Requesting {description}")
+            bars = await self._request_with_retries(
+                key=(bar_type.instrument_id, bar_type.spec.price_type),
+                request=lambda: self._client.get_historical_bars(
+                    bar_type,
+                    contract,
+                    use_rth,
+                    segment_end,
+                    duration,
+                    timeout=timeout,
+                ),
+                description=description,
+            )
+            if bars is None:
+                self._log.error(f"Stopping {bar_type} download, resume by running again")
+                return count
+
+            # Each segment keeps the half-open range [previous segment end, segment end),
+            # so bars on a boundary (or in a rounded up duration) are only written once
+            segment_start_ns = dt_to_unix_nanos(segments[i + 1][0]) if i + 1 < len(segments) else start_ns
+            segment_end_ns = int(segment_key)
+            bars = [bar for bar in bars if segment_start_ns <= bar.ts_event < segment_end_ns]
+            if bars:
+                self._write(bars, basename=f"part-{segment_key}")
+                count += len(bars)
+
+            completed.append(segment_key)
+            self._checkpoint.set(task_key, completed)
+
+        self._log.info(f"Completed {bar_type} download")
+        return count
+
+    async def download_ticks(
+        self,
+        contracts: list[IBContract],
+        tick_type: Literal["TRADES", "BID_ASK"],
+        start_date_time: pd.Timestamp,
+        end_date_time: pd.Timestamp,
+        use_rth: bool = True,
+        timeout: int = 60,
+    ) -> int:
+        """
+        Download trade or quote ticks for the given contracts into the catalog.
+
+        Parameters
+        ----------
+        contracts : list[IBContract]
+            The contracts to download ticks for.
+        tick_type : Literal["TRADES", "BID_ASK"]
+            The type of ticks to download.
+        start_date_time : pd.Timestamp
+            The start date time (UTC) for the ticks.
+        end_date_time : pd.Timestamp
+            The end date time (UTC) for the ticks (exclusive).
+        use_rth : bool, default True
+            Whether to use regular trading hours.
+        timeout : int, default 60
+            The timeout (seconds) for each request.
+
+        Returns
+        -------
+        int
+            The number of ticks written to the catalog.
+
+        Raises
+        ------
+        ValueError
+            If `tick_type` is not 'TRADES' or 'BID_ASK'.
+        ValueError
+            If `start_date_time` is not before `end_date_time`.
+
+        """
+        PyCondition.is_in(tick_type, ("TRADES", "BID_ASK"), "tick_type", "valid tick types")
+        PyCondition.is_true(start_date_time < end_date_time, "start_date_time was >= end_date_time")
+
+        coros: list[Awaitable[int]] = [
+            self._download_ticks(contract, tick_type, start_date_time, end_date_time, use_rth, timeout)
+            for contract in contracts
+        ]
+
+        return sum(await self._gather_bounded(coros))
+
+    async def _download_ticks(
+        self,
+        contract: IBContract,
+        tick_type: str,
+        start_date_time: pd.Timestamp,
+        end_date_time: pd.Timestamp,
+        use_rth: bool,
+        timeout: int,
+    ) -> int:
+        instrument_id = ib_contract_to_instrument_id(contract)
+        end_ns = dt_to_unix_nanos(end_date_time)
+        task_key = f"ticks:{instrument_id}:{tick_type}:{dt_to_unix_nanos(start_date_time)}:{end_ns}"
+        progress: dict = self._checkpoint.get(task_key, {})
+        if progress.get("done"):
+            return 0
+
+        cursor = unix_nanos_to_dt(progress["cursor"]) if "cursor" in progress else start_date_time
+        count = 0
+
+        while True:
+            description = f"{instrument_id} {tick_type} ticks from {cursor}"
+            self._log.info(f"Requesting {description}")
+            ticks = await self._request_with_retries(
+                key=(instrument_id, tick_type),
+                request=lambda: self._client.get_historical_ticks(
+                    contract=contract,
+                    tick_type=tick_type,
+                    start_date_time=cursor,
+                    use_rth=use_rth,
+                    timeout=timeout,
+                ),
+                description=description,
+            )
+            if ticks is None:
+                self._log.error(f"Stopping {instrument_id} download, resume by running again")
+                return count
+
+            next_cursor, should_continue = next_ticks_start(ticks, end_date_time)
+            ticks = [tick for tick in ticks if tick.ts_event < end_ns]
+            if ticks:
+                self._write(ticks, basename=f"part-{dt_to_unix_nanos(cursor)}")
+                count += len(ticks)
+
+            if not should_continue:
+                self._checkpoint.set(task_key, {"done": True})
+                break
+
+            cursor = next_cursor
+            self._checkpoint.set(task_key, {"cursor": dt_to_unix_nanos(cursor)})
+
+        self._log.info(f"Completed {instrument_id} {tick_type} download")
+        return count
@@ -35,6 +35,7 @@ from nautilus_trader.config import InstrumentProviderConfig
 from nautilus_trader.core.nautilus_pyo3 import Quota
 from nautilus_trader.live.factories import LiveDataClientFactory
 from nautilus_trader.live.factories import LiveExecClientFactory
+from nautilus_trader.live.ratelimit import WeightedRateLimiter
 
 
 @lru_cache(1)
@@ -99,6 +100,10 @@ def get_cached_okx_http_client(
     # ]
     ratelimiter_quotas = None
 
+    # OKX does not report usage in response headers, so the limiter only prioritizes
+    # order requests within the default budget (and pauses on rate limit responses)
+    ratelimiter = WeightedRateLimiter(limit=20, interval_secs=2.0)
+
     return OKXHttpClient(
         clock=clock,
         api_key=key,
@@ -109,6 +114,7 @@ def get_cached_okx_http_client(
         default_timeout_secs=5,
         ratelimiter_quotas=ratelimiter_quotas,
         ratelimiter_default_quota=ratelimiter_default_quota,
+        ratelimiter=ratelimiter,
     )
 
 
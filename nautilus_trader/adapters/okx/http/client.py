@@ -29,6 +29,8 @@ from nautilus_trader.core.nautilus_pyo3 import HttpMethod
 from nautilus_trader.core.nautilus_pyo3 import HttpResponse
 from nautilus_trader.core.nautilus_pyo3 import Quota
 from nautilus_trader.core.nautilus_pyo3 import hmac_signature
+from nautilus_trader.live.ratelimit import RequestPriority
+from nautilus_trader.live.ratelimit import WeightedRateLimiter
 from nautilus_trader.okx.common.error import raise_okx_error
 from nautilus_trader.okx.http.errors import OKXHttpError
 
@@ -68,6 +70,8 @@ class OKXHttpClient:
         The keyed rate limiter quotas for the client.
     ratelimiter_quota : Quota, optional
         The default rate limiter quota for the client.
+    ratelimiter : WeightedRateLimiter, optional
+        The request rate limiter for the client, which prioritizes order requests.
 
     """
 
@@ -82,6 +86,7 @@ class OKXHttpClient:
         default_timeout_secs: int | None = None,
         ratelimiter_quotas: list[tuple[str, Quota]] | None = None,
         ratelimiter_default_quota: Quota | None = None,
+        ratelimiter: WeightedRateLimiter | None = None,
     ) -> None:
         self._clock: LiveClock = clock
         self._log: Logger = Logger(name=type(self).__name__)
@@ -100,6 +105,7 @@ class OKXHttpClient:
             keyed_quotas=ratelimiter_quotas or [],
             default_quota=ratelimiter_default_quota,
         )
+        self._ratelimiter: WeightedRateLimiter | None = ratelimiter
         self._decoder_response_code = msgspec.json.Decoder(OKXResponseCode)
 
     @property
@@ -142,7 +148,16 @@ class OKXHttpClient:
         ratelimiter_keys: list[str] | None = None,
         timeout_secs: int | None = None,
         sign: bool = False,
+        priority: RequestPriority | None = None,
     ) -> bytes | None:
+        if self._ratelimiter is not None:
+            if priority is None:
+                if http_method != HttpMethod.GET:
+                    priority = RequestPriority.ORDER
+                else:
+                    priority = RequestPriority.ACCOUNT if sign else RequestPriority.MARKET_DATA
+            await self._ratelimiter.acquire(url_path, priority)
+
         if payload and http_method == HttpMethod.GET:
             url_path += "?" + parse.urlencode(payload)
             payload = None
@@ -175,6 +190,10 @@ class OKXHttpClient:
             keys=ratelimiter_keys,
             timeout_secs=timeout_secs or self._default_timeout_secs,
         )
+        if response.status == 429 and self._ratelimiter is not None:
+            # Back off for a full window before sending further requests
+            self._ratelimiter.pause(self._ratelimiter.interval_secs)
+
         # First check for server error
         if 400 <= response.status < 500:
             message = msgspec.json.decode(response.body) if response.body else None
@@ -203,6 +222,7 @@ class OKXHttpClient:
         payload: dict[str, str] | None = None,
         ratelimiter_keys: list[str] | None = None,
         timeout_secs: int | None = None,
+        priority: RequestPriority | None = None,
     ) -> Any:
         if payload is None:
             payload = {}
@@ -214,4 +234,5 @@ class OKXHttpClient:
             ratelimiter_keys=ratelimiter_keys,
             timeout_secs=timeout_secs,
             sign=True,
+            priority=priority,
         )
@@ -0,0 +1,304 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import os
+import pickle
+import traceback
+from collections.abc import Callable
+from collections.abc import Sequence
+from datetime import datetime
+
+import pandas as pd
+
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.results import BacktestResult
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.trading.strategy import Strategy
+
+
+BacktestVariant = Callable[[BacktestEngine], None]
+
+
+class BacktestCheckpoint:
+    """
+    Represents a checkpoint of a warmed-up `BacktestEngine`, from which many variant runs
+    can continue.
+
+    The engine is run once up to the checkpoint timestamp (in streaming mode, so the run
+    is not ended) and each strategy's state is saved via `on_save`. Variant runs then
+    continue from the checkpoint, each in a forked worker process holding a copy-on-write
+    image of the warmed engine (cache, portfolio, exchange order books, clocks, actors and
+    strategies), so instrument loading and warm-up are paid for only once per sweep.
+
+    Parameters
+    ----------
+    engine : BacktestEngine
+        The engine which has been run up to the checkpoint.
+    ts_checkpoint : int
+        UNIX timestamp (nanoseconds) of the checkpoint.
+
+    Warnings
+    --------
+    Forking a process with running threads (such as the Rust logging thread) can leave
+    locks in the child in an acquired state, so use `LoggingConfig(bypass_logging=True)`
+    or Python logging for engines which are forked.
+
+    """
+
+    def __init__(self, engine: BacktestEngine, ts_checkpoint: int) -> None:
+        PyCondition.not_none(engine, "engine")
+        PyCondition.not_negative_int(ts_checkpoint, "ts_checkpoint")
+
+        self._engine = engine
+        self._ts_checkpoint = ts_checkpoint
+        self._strategy_states: dict[str, dict[str, bytes]] = {
+            strategy.id.value: strategy.save() or {} for strategy in engine.trader.strategies()
+        }
+        self._consumed = False
+
+    @classmethod
+    def create(
+        cls,
+        engine: BacktestEngine,
+        checkpoint: datetime | str | int,
+        start: datetime | str | int | None = None,
+    ) -> "BacktestCheckpoint":
+        """
+        Run the given engine up to the `checkpoint` time and return the checkpoint.
+
+        Parameters
+        ----------
+        engine : BacktestEngine
+            The engine to warm up (with all venues, instruments, data, actors and strategies added).
+        checkpoint : datetime or str or int
+            The checkpoint datetime (UTC), data up to and including this time is processed.
+        start : datetime or str or int, optional
+            The start datetime (UTC) for the backtest run.
+            If ``None`` engine runs from the start of the data.
+
+        Returns
+        -------
+        BacktestCheckpoint
+
+        """
+        ts_checkpoint = pd.to_datetime(checkpoint, utc=True).value
+        engine.run(start=start, end=ts_checkpoint, streaming=True)
+        return cls(engine, ts_checkpoint)
+
+    @property
+    def engine(self) -> BacktestEngine:
+        """
+        Return the warmed-up engine for the checkpoint.
+
+        Returns
+        -------
+        BacktestEngine
+
+        """
+        return self._engine
+
+    @property
+    def ts_checkpoint(self) -> int:
+        """
+        Return the UNIX timestamp (nanoseconds) of the checkpoint.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._ts_checkpoint
+
+    @property
+    def strategy_states(self) -> dict[str, dict[str, bytes]]:
+        """
+        Return the strategy states saved at the checkpoint (via `on_save`), keyed by strategy ID.
+
+        Returns
+        -------
+        dict[str, dict[str, bytes]]
+
+        """
+        return self._strategy_states
+
+    def load_strategy_state(self, strategy: Strategy, strategy_id: str | None = None) -> None:
+        """
+        Load the state saved at the checkpoint into the given strategy (via `on_load`).
+
+        This allows a variant to replace a warmed strategy with a differently configured
+        instance, which continues from the warmed strategy's state.
+
+        Parameters
+        ----------
+        strategy : Strategy
+            The strategy to load the state into.
+        strategy_id : str, optional
+            The ID of the strategy the state was saved from. If ``None`` then uses the ID
+            of `strategy`.
+
+        Raises
+        ------
+        KeyError
+            If no state was saved for the strategy ID.
+
+        """
+        strategy.load(self._strategy_states[strategy_id or strategy.id.value])
+
+    def run(
+        self,
+        variant: BacktestVariant | None = None,
+        end: datetime | str | int | None = None,
+    ) -> BacktestResult:
+        """
+        Continue the backtest from the checkpoint in-process, and return the result.
+
+        This consumes the checkpoint (the engine state is advanced), so is intended for a
+        single run such as the final variant of a sweep, or platforms without `fork`.
+
+        Parameters
+        ----------
+        variant : Callable[[BacktestEngine], None], optional
+            The function to apply the variant (e.g. parameters or strategies) to the engine
+            prior to continuing.
+        end : datetime or str or int, optional
+            The end datetime (UTC) for the backtest run.
+            If ``None`` engine runs to the end of the data.
+
+        Returns
+        -------
+        BacktestResult
+
+        Raises
+        ------
+        RuntimeError
+            If the checkpoint has already been consumed.
+
+        """
+        if self._consumed:
+            raise RuntimeError("Checkpoint has already been consumed by an in-process run")
+
+        self._consumed = True
+        return self._continue(variant, end)
+
+    def fork_runs(
+        self,
+        variants: Sequence[BacktestVariant],
+        end: datetime | str | int | None = None,
+        max_workers: int | None = None,
+    ) -> list[BacktestResult]:
+        """
+        Continue a backtest from the checkpoint for each variant in forked worker processes.
+
+        Each worker starts from a copy-on-write image of the warmed engine, applies its
+        variant, runs to `end` and returns its result. The checkpoint itself is not
+        modified, so further forks can be made afterwards.
+
+        Parameters
+        ----------
+        variants : Sequence[Callable[[BacktestEngine], None]]
+            The functions to apply each variant (e.g. parameters or strategies) to the engine.
+        end : datetime or str or int, optional
+            The end datetime (UTC) for the backtest runs.
+            If ``None`` engine runs to the end of the data.
+        max_workers : int, optional
+            The maximum number of concurrent worker processes.
+            If ``None`` then uses the count of CPUs.
+
+        Returns
+        -------
+        list[BacktestResult]
+            The results in the order of the `variants`.
+
+        Raises
+        ------
+        RuntimeError
+            If the checkpoint has already been consumed.
+        RuntimeError
+            If the platform does not support `fork`.
+        RuntimeError
+            If any variant run fails (after all runs have completed).
+
+        """
+        PyCondition.not_none(variants, "variants")
+        if max_workers is not None:
+            PyCondition.positive_int(max_workers, "max_workers")
+
+        if self._consumed:
+            raise RuntimeError("Checkpoint has already been consumed by an in-process run")
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Forked runs require a platform which supports `os.fork`")
+
+        max_workers = max_workers or os.cpu_count() or 1
+        outcomes: list[tuple[bool, BacktestResult | str]] = []
+
+        for batch_start in range(0, len(variants), max_workers):
+            batch = variants[batch_start : batch_start + max_workers]
+            workers = [self._fork_worker(variant, end) for variant in batch]
+            for pid, read_fd in workers:
+                with os.fdopen(read_fd, "rb") as reader:
+                    payload = reader.read()
+                os.waitpid(pid, 0)
+                if not payload:
+                    outcomes.append((False, "worker exited without a result"))
+                    continue
+                # Trusted: the payload is only ever written by our own forked child over a private pipe
+                outcomes.append(pickle.loads(payload))  # noqa: S301
+
+        results: list[BacktestResult] = []
+        for i, (success, value) in enumerate(outcomes):
+            if not success or not isinstance(value, BacktestResult):
+                raise RuntimeError(f"Variant {i} failed: {value}")
+            results.append(value)
+
+        return results
+
+    def _fork_worker(
+        self,
+        variant: BacktestVariant,
+        end: datetime | str | int | None,
+    ) -> tuple[int, int]:
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid != 0:
+            # Parent
+            os.close(write_fd)
+            return pid, read_fd
+
+        # Child: never return into the parent's call stack
+        exit_code = 0
+        outcome: tuple[bool, BacktestResult | str]
+        try:
+            os.close(read_fd)
+            try:
+                outcome = (True, self._continue(variant, end))
+            except Exception:
+                outcome = (False, traceback.format_exc())
+                exit_code = 1
+            with os.fdopen(write_fd, "wb") as writer:
+                writer.write(pickle.dumps(outcome))
+        finally:
+            os._exit(exit_code)
+
+    def _continue(
+        self,
+        variant: BacktestVariant | None,
+        end: datetime | str | int | None,
+    ) -> BacktestResult:
+        if variant is not None:
+            variant(self._engine)
+
+        # Continue strictly after the checkpoint (data at the checkpoint time was processed)
+        self._engine.run(start=self._ts_checkpoint + 1, end=end)
+        return self._engine.get_result()
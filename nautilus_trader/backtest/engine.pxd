@@ -46,11 +46,15 @@ cdef class BacktestEngine:
     cdef set[InstrumentId] _has_data
     cdef set[InstrumentId] _has_book_data
     cdef list[Data] _data
+    cdef dict _data_iterators
+    cdef object _stream
+    cdef Data _stream_next
     cdef uint64_t _data_len
     cdef uint64_t _index
     cdef uint64_t _iteration
 
     cdef Data _next(self)
+    cdef Data _next_stream(self)
     cdef CVec _advance_time(self, uint64_t ts_now)
     cdef void _process_raw_time_event_handlers(
         self,
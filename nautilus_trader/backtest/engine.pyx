@@ -13,8 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import heapq
+import itertools
 import pickle
 from decimal import Decimal
+from operator import attrgetter
 
 import pandas as pd
 
@@ -30,11 +33,13 @@ from nautilus_trader.data.config import DataEngineConfig
 from nautilus_trader.execution.config import ExecEngineConfig
 from nautilus_trader.model import BOOK_DATA_TYPES
 from nautilus_trader.model import NAUTILUS_PYO3_DATA_TYPES
+from nautilus_trader.model.data import capsule_to_iter
 from nautilus_trader.risk.config import RiskEngineConfig
 from nautilus_trader.system.kernel import NautilusKernel
 from nautilus_trader.trading.trader import Trader
 
 from cpython.object cimport PyObject
+from libc.stdint cimport UINT64_MAX
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.backtest.data_client cimport BacktestDataClient
@@ -139,6 +144,9 @@ cdef class BacktestEngine:
         self._has_data: set[InstrumentId] = set()
         self._has_book_data: set[InstrumentId] = set()
         self._data: list[Data] = []
+        self._data_iterators: dict[str, object] = {}
+        self._stream = None
+        self._stream_next: Data | None = None
         self._data_len: uint64_t = 0
         self._index: uint64_t = 0
         self._iteration: uint64_t = 0
@@ -647,6 +655,8 @@ cdef class BacktestEngine:
             If `instrument_id` for the data is not found in the cache.
         ValueError
             If `data` elements do not have an `instrument_id` and `client_id` is ``None``.
+        ValueError
+            If a data iterator stream has already started (call `clear_data()` first).
         TypeError
             If `data` is a Rust PyO3 data type (cannot add directly to engine yet).
 
@@ -661,6 +671,7 @@ cdef class BacktestEngine:
         """
         Condition.not_empty(data, "data")
         Condition.list_type(data, Data, "data")
+        Condition.is_true(self._stream is None, "Cannot add data once the stream has started")
 
         if isinstance(data[0], NAUTILUS_PYO3_DATA_TYPES):
             raise TypeError(
@@ -671,42 +682,7 @@ cdef class BacktestEngine:
         cdef str data_added_str = "data"
 
         if validate:
-            first = data[0]
-
-            if hasattr(first, "instrument_id"):
-                Condition.is_true(
-                    first.instrument_id in self.kernel.cache.instrument_ids(),
-                    f"`Instrument` {first.instrument_id} for the given data not found in the cache. "
-                    "Add the instrument through `add_instrument()` prior to adding related data.",
-                )
-                # Check client has been registered
-                self._add_market_data_client_if_not_exists(first.instrument_id.venue)
-                self._has_data.add(first.instrument_id)
-                data_added_str = f"{first.instrument_id} {type(first).__name__}"
-            elif isinstance(first, Bar):
-                Condition.is_true(
-                    first.bar_type.instrument_id in self.kernel.cache.instrument_ids(),
-                    f"`Instrument` {first.bar_type.instrument_id} for the given data not found in the cache. "
-                    "Add the instrument through `add_instrument()` prior to adding related data.",
-                )
-                Condition.equal(
-                    first.bar_type.aggregation_source,
-                    AggregationSource.EXTERNAL,
-                    "bar_type.aggregation_source",
-                    "required source",
-                )
-                self._has_data.add(first.bar_type.instrument_id)
-                data_added_str = f"{first.bar_type} {type(first).__name__}"
-            else:
-                Condition.not_none(client_id, "client_id")
-                # Check client has been registered
-                self._add_data_client_if_not_exists(client_id)
-
-                if isinstance(first, CustomData):
-                    data_added_str = f"{type(first.data).__name__} "
-
-            if type(first) in BOOK_DATA_TYPES:
-                self._has_book_data.add(first.instrument_id)
+            data_added_str = self._validate_data(data[0], client_id)
 
         # Add data
         self._data.extend(data)
@@ -718,6 +694,80 @@ cdef class BacktestEngine:
             f"Added {len(data):_} {data_added_str} element{'' if len(data) == 1 else 's'}",
         )
 
+    def add_data_iterator(
+        self,
+        str data_name,
+        data_iterator,
+        ClientId client_id = None,
+        bint validate = True,
+    ) -> None:
+        """
+        Add the given `data_iterator` as a lazily consumed stream of data for the backtest engine.
+
+        The iterator yields chunks (iterables) of data which are pulled only as the backtest
+        run progresses, and merged by `ts_init` with the data from all other added
+        iterators and the data added through `add_data`. This allows running backtests
+        over datasets larger than available memory with the low-level API.
+
+        A `DataBackendSession` is consumed directly from its query result, decoding each
+        element only as it is reached, without an intermediate list or re-sort per chunk.
+
+        Parameters
+        ----------
+        data_name : str
+            The unique name for the data stream.
+        data_iterator : Iterable[Iterable[Data]] or DataBackendSession
+            The iterator of data chunks, each chunk and the chunks in sequence sorted by
+            `ts_init` (e.g. a generator reading from files, or a catalog session from
+            `ParquetDataCatalog.backend_session`).
+        client_id : ClientId, optional
+            The client ID to associate with the data.
+        validate : bool, default True
+            If the first element of the stream should be validated (applies to the whole
+            stream, so each stream must contain a single data type when validating).
+
+        Raises
+        ------
+        ValueError
+            If `data_name` is not a valid string.
+        KeyError
+            If `data_name` has already been added.
+        ValueError
+            If `data_iterator` contains no data (when validating).
+        TypeError
+            If `data_iterator` yields a Rust PyO3 data type (cannot add directly to engine yet).
+
+        Warnings
+        --------
+        Iterators are consumed by running the backtest, so call `clear_data()` and add them
+        again before running the same backtest again.
+
+        """
+        Condition.valid_string(data_name, "data_name")
+        Condition.not_in(data_name, self._data_iterators, "data_name", "_data_iterators")
+        Condition.not_none(data_iterator, "data_iterator")
+        Condition.is_true(self._stream is None, "Cannot add a data iterator once the stream has started")
+
+        if isinstance(data_iterator, nautilus_pyo3.DataBackendSession):
+            # Decode each query result chunk element by element straight into the
+            # stream, without building an intermediate list (chunks are already sorted)
+            session = data_iterator
+            data_iterator = (capsule_to_iter(chunk) for chunk in session.to_query_result())
+
+        cdef str data_added_str = data_name
+        stream = itertools.chain.from_iterable(data_iterator)
+
+        if validate:
+            # Peek the first element to validate the stream
+            first = next(stream, None)
+            Condition.is_true(first is not None, f"No data in data iterator '{data_name}'")
+            data_added_str = f"{data_name} ({self._validate_data(first, client_id)})"
+            stream = itertools.chain((first,), stream)
+
+        self._data_iterators[data_name] = stream
+
+        self._log.info(f"Added data iterator {data_added_str}")
+
     def dump_pickled_data(self) -> bytes:
         """
         Return the internal data stream pickled.
@@ -900,6 +950,9 @@ cdef class BacktestEngine:
         self._has_data.clear()
         self._has_book_data.clear()
         self._data.clear()
+        self._data_iterators.clear()
+        self._stream = None
+        self._stream_next = None
         self._data_len = 0
         self._index = 0
 
@@ -956,6 +1009,9 @@ cdef class BacktestEngine:
         - 4. Add next batch of data stream
         - 5. Call `run(streaming=False)` or `end()` when processing the final batch
 
+        Alternatively, add lazily consumed data streams with `add_data_iterator`, which are
+        merged and pulled in chunks within a single run.
+
         Parameters
         ----------
         start : datetime or str or int, optional
@@ -1087,17 +1143,39 @@ cdef class BacktestEngine:
 
         cdef uint64_t start_ns
         cdef uint64_t end_ns
+        cdef Data first = None
+
+        if self._data_iterators:
+            # Lazily merge the added data with all data iterators
+            if self._stream is None:
+                self._stream = heapq.merge(
+                    self._data,
+                    *self._data_iterators.values(),
+                    key=attrgetter("ts_init"),
+                )
+
+            first = self._next_stream()
+            if start is not None:
+                start = pd.to_datetime(start, utc=True)
+                while first is not None and first.ts_init < start.value:
+                    first = self._next_stream()
+
+            Condition.is_true(first is not None, "No data in stream")
+            self._stream_next = first  # Push back for the main loop
 
         # Time range check and set
         if start is None:
             # Set `start` to start of data
-            start_ns = self._data[0].ts_init
+            start_ns = first.ts_init if first is not None else self._data[0].ts_init
             start = unix_nanos_to_dt(start_ns)
         else:
             start = pd.to_datetime(start, utc=True)
             start_ns = start.value
 
-        if end is None:
+        if end is None and self._stream is not None:
+            # Run to the end of the data stream
+            end_ns = UINT64_MAX
+        elif end is None:
             # Set `end` to end of data
             end_ns = self._data[-1].ts_init
             end = unix_nanos_to_dt(end_ns)
@@ -1106,7 +1184,8 @@ cdef class BacktestEngine:
             end_ns = end.value
 
         Condition.is_true(start_ns <= end_ns, "start was > end")
-        Condition.not_empty(self._data, "data")
+        if self._stream is None:
+            Condition.not_empty(self._data, "data")
 
         # Set clocks
         cdef TestClock clock
@@ -1166,10 +1245,11 @@ cdef class BacktestEngine:
 
         # Set starting index
         cdef uint64_t i
-        for i in range(self._data_len):
-            if start_ns <= self._data[i].ts_init:
-                self._index = i
-                break
+        if self._stream is None:
+            for i in range(self._data_len):
+                if start_ns <= self._data[i].ts_init:
+                    self._index = i
+                    break
 
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
         cdef uint64_t last_ns = 0
@@ -1180,6 +1260,8 @@ cdef class BacktestEngine:
             while data is not None:
                 if data.ts_init > end_ns:
                     # End of backtest
+                    if self._stream is not None:
+                        self._stream_next = data  # Retain for the next streaming run
                     break
 
                 if data.ts_init > last_ns:
@@ -1261,9 +1343,20 @@ cdef class BacktestEngine:
         cdef uint64_t cursor = self._index
         self._index += 1
 
+        if self._stream is not None:
+            return self._next_stream()
+
         if cursor < self._data_len:
             return self._data[cursor]
 
+    cdef Data _next_stream(self):
+        cdef Data data = self._stream_next
+        if data is not None:
+            self._stream_next = None
+            return data
+
+        return next(self._stream, None)
+
     cdef CVec _advance_time(self, uint64_t ts_now):
         cdef list[TestClock] clocks = get_component_clocks(self._instance_id)
         cdef TestClock clock
@@ -1376,7 +1469,7 @@ cdef class BacktestEngine:
                 for b in account.starting_balances().values():
                     self._log.info(b.to_formatted_str())
 
-    def _log_run(self, start: pd.Timestamp, end: pd.Timestamp):
+    def _log_run(self, start: pd.Timestamp, end: pd.Timestamp | None):
         cdef str color = self._get_log_color_code()
 
         self._log.info(f"{color}=================================================================")
@@ -1387,7 +1480,7 @@ cdef class BacktestEngine:
         self._log.info(f"Run started:    {format_iso8601(self._run_started)}")
         self._log.info(f"Backtest start: {format_iso8601(self._backtest_start)}")
         self._log.info(f"Batch start:    {format_iso8601(start)}")
-        self._log.info(f"Batch end:      {format_iso8601(end)}")
+        self._log.info(f"Batch end:      {format_iso8601(end) if end is not None else 'end of data stream'}")
         self._log.info(f"{color}-----------------------------------------------------------------")
 
     def _log_post_run(self):
@@ -1524,6 +1617,52 @@ cdef class BacktestEngine:
 
             self._log.info(f"{color}-----------------------------------------------------------------")
 
+    def _validate_data(self, first, ClientId client_id) -> str:
+        if isinstance(first, NAUTILUS_PYO3_DATA_TYPES):
+            raise TypeError(
+                f"Cannot add data of type `{type(first).__name__}` from pyo3 directly to engine. "
+                "This will be supported in a future release.",
+            )
+
+        cdef str data_added_str = "data"
+
+        if hasattr(first, "instrument_id"):
+            Condition.is_true(
+                first.instrument_id in self.kernel.cache.instrument_ids(),
+                f"`Instrument` {first.instrument_id} for the given data not found in the cache. "
+                "Add the instrument through `add_instrument()` prior to adding related data.",
+            )
+            # Check client has been registered
+            self._add_market_data_client_if_not_exists(first.instrument_id.venue)
+            self._has_data.add(first.instrument_id)
+            data_added_str = f"{first.instrument_id} {type(first).__name__}"
+        elif isinstance(first, Bar):
+            Condition.is_true(
+                first.bar_type.instrument_id in self.kernel.cache.instrument_ids(),
+                f"`Instrument` {first.bar_type.instrument_id} for the given data not found in the cache. "
+                "Add the instrument through `add_instrument()` prior to adding related data.",
+            )
+            Condition.equal(
+                first.bar_type.aggregation_source,
+                AggregationSource.EXTERNAL,
+                "bar_type.aggregation_source",
+                "required source",
+            )
+            self._has_data.add(first.bar_type.instrument_id)
+            data_added_str = f"{first.bar_type} {type(first).__name__}"
+        else:
+            Condition.not_none(client_id, "client_id")
+            # Check client has been registered
+            self._add_data_client_if_not_exists(client_id)
+
+            if isinstance(first, CustomData):
+                data_added_str = f"{type(first.data).__name__} "
+
+        if type(first) in BOOK_DATA_TYPES:
+            self._has_book_data.add(first.instrument_id)
+
+        return data_added_str
+
     def _add_data_client_if_not_exists(self, ClientId client_id) -> None:
         if client_id not in self._kernel.data_engine.registered_clients:
             client = BacktestDataClient(
@@ -22,10 +22,10 @@ from nautilus_trader.backtest.models cimport FeeModel
 from nautilus_trader.backtest.models cimport FillModel
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.common.component cimport LogColor
+from nautilus_trader.common.component cimport LogLevel
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.common.component cimport TestClock
-from nautilus_trader.common.component cimport is_logging_initialized
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.datetime cimport format_iso8601
@@ -405,7 +405,7 @@ cdef class OrderMatchingEngine:
         """
         Condition.not_none(delta, "delta")
 
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Processing {delta!r}")
 
         self._book.apply_delta(delta)
@@ -434,7 +434,7 @@ cdef class OrderMatchingEngine:
         """
         Condition.not_none(deltas, "deltas")
 
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Processing {deltas!r}")
 
         self._book.apply_deltas(deltas)
@@ -472,7 +472,7 @@ cdef class OrderMatchingEngine:
         """
         Condition.not_none(tick, "tick")
 
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Processing {tick!r}")
 
         # Validate precisions
@@ -519,7 +519,7 @@ cdef class OrderMatchingEngine:
         """
         Condition.not_none(tick, "tick")
 
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Processing {tick!r}")
 
         # Validate precisions
@@ -632,7 +632,7 @@ cdef class OrderMatchingEngine:
             else:
                 return
 
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Processing {bar!r}")
 
         cdef PriceType price_type = bar_type.spec.price_type
@@ -765,7 +765,7 @@ cdef class OrderMatchingEngine:
 
     cdef void _process_trade_bar_open(self, Bar bar, TradeTick tick):
         if not self._core.is_last_initialized or bar._mem.open.raw != self._core.last_raw:
-            if is_logging_initialized():
+            if self._log.is_enabled(LogLevel.DEBUG):
                 self._log.debug(f"Updating with open {bar.open}")
             self._book.update_trade_tick(tick)
             self.iterate(tick.ts_init)
@@ -773,7 +773,7 @@ cdef class OrderMatchingEngine:
 
     cdef void _process_trade_bar_high(self, Bar bar, TradeTick tick):
         if bar._mem.high.raw > self._core.last_raw:
-            if is_logging_initialized():
+            if self._log.is_enabled(LogLevel.DEBUG):
                 self._log.debug(f"Updating with high {bar.high}")
             tick._mem.price = bar._mem.high
             tick._mem.aggressor_side = AggressorSide.BUYER
@@ -784,7 +784,7 @@ cdef class OrderMatchingEngine:
 
     cdef void _process_trade_bar_low(self, Bar bar, TradeTick tick):
         if bar._mem.low.raw < self._core.last_raw:
-            if is_logging_initialized():
+            if self._log.is_enabled(LogLevel.DEBUG):
                 self._log.debug(f"Updating with low {bar.low}")
             tick._mem.price = bar._mem.low
             tick._mem.aggressor_side = AggressorSide.SELLER
@@ -795,7 +795,7 @@ cdef class OrderMatchingEngine:
 
     cdef void _process_trade_bar_close(self, Bar bar, TradeTick tick):
         if bar._mem.close.raw != self._core.last_raw:
-            if is_logging_initialized():
+            if self._log.is_enabled(LogLevel.DEBUG):
                 self._log.debug(f"Updating with close {bar.close}")
             tick._mem.price = bar._mem.close
             tick._mem.aggressor_side = AggressorSide.BUYER if bar._mem.close.raw > self._core.last_raw else AggressorSide.SELLER
@@ -1887,7 +1887,7 @@ cdef class OrderMatchingEngine:
         if self.oms_type == OmsType.NETTING:
             venue_position_id = None  # No position IDs generated by the venue
 
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(
                 "Market: "
                 f"bid={self._book.best_bid_size()} @ {self._book.best_bid_price()}, "
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import itertools
 import json
 from decimal import Decimal
 
@@ -41,7 +42,7 @@ from nautilus_trader.core.nautilus_pyo3 import DataBackendSession
 from nautilus_trader.model import BOOK_DATA_TYPES
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarType
-from nautilus_trader.model.data import capsule_to_list
+from nautilus_trader.model.data import capsule_to_iter
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.enums import OmsType
@@ -403,12 +404,17 @@ class BacktestNode:
                 session=session,
             )
 
-        # Stream data
-        for chunk in session.to_query_result():
-            engine.add_data(
-                data=capsule_to_list(chunk),
+        # Stream data directly from the backend (already sorted), decoding each element
+        # only as the engine reaches it rather than materializing and re-sorting each chunk
+        data = itertools.chain.from_iterable(
+            capsule_to_iter(chunk) for chunk in session.to_query_result()
+        )
+        first = next(data, None)
+        if first is not None:
+            engine.add_data_iterator(
+                data_name="catalog",
+                data_iterator=((first,), data),
                 validate=False,  # Cannot validate mixed type stream
-                sort=True,  # Already sorted from backend
             )
             engine.run(
                 start=start,
@@ -0,0 +1,50 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.model.data cimport Bar
+from nautilus_trader.model.data cimport QuoteTick
+from nautilus_trader.model.data cimport TradeTick
+
+
+cdef class ColumnarRingBuffer:
+    cdef object _array
+    cdef uint64_t[:, ::1] _uints
+    cdef double[:, ::1] _doubles
+    cdef int _next
+
+    cdef readonly int capacity
+    """The maximum number of rows held by the buffer.\n\n:returns: `int`"""
+    cdef readonly int count
+    """The current number of rows held by the buffer.\n\n:returns: `int`"""
+
+    cdef void _set_uint(self, int column, uint64_t value)
+    cdef void _set_double(self, int column, double value)
+    cdef void _advance(self)
+    cpdef object to_array(self)
+    cpdef void clear(self)
+
+
+cdef class QuoteTickArrayBuffer(ColumnarRingBuffer):
+    cpdef void append(self, QuoteTick tick)
+
+
+cdef class TradeTickArrayBuffer(ColumnarRingBuffer):
+    cpdef void append(self, TradeTick tick)
+
+
+cdef class BarArrayBuffer(ColumnarRingBuffer):
+    cpdef void append(self, Bar bar)
@@ -0,0 +1,248 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.model cimport FIXED_SCALAR
+from nautilus_trader.model.data cimport Bar
+from nautilus_trader.model.data cimport QuoteTick
+from nautilus_trader.model.data cimport TradeTick
+
+
+QUOTE_TICK_DTYPE = np.dtype(
+    [
+        ("ts_event", np.uint64),
+        ("ts_init", np.uint64),
+        ("bid_price", np.float64),
+        ("ask_price", np.float64),
+        ("bid_size", np.float64),
+        ("ask_size", np.float64),
+    ],
+)
+
+TRADE_TICK_DTYPE = np.dtype(
+    [
+        ("ts_event", np.uint64),
+        ("ts_init", np.uint64),
+        ("price", np.float64),
+        ("size", np.float64),
+        ("aggressor_side", np.uint64),
+    ],
+)
+
+BAR_DTYPE = np.dtype(
+    [
+        ("ts_event", np.uint64),
+        ("ts_init", np.uint64),
+        ("open", np.float64),
+        ("high", np.float64),
+        ("low", np.float64),
+        ("close", np.float64),
+        ("volume", np.float64),
+    ],
+)
+
+
+cdef class ColumnarRingBuffer:
+    """
+    Provides a fixed-capacity columnar ring buffer backed by a NumPy structured array.
+
+    Every row is written twice, at its ring position and again `capacity` rows
+    later, so the most recent rows are always contiguous in memory. This allows
+    a chronologically ordered view to be returned without copying.
+
+    All columns of `dtype` must be 8 byte unsigned integers or floats.
+
+    Parameters
+    ----------
+    dtype : np.dtype
+        The structured data type for each row.
+    capacity : int
+        The maximum number of rows to hold.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(self, dtype, int capacity) -> None:
+        Condition.positive_int(capacity, "capacity")
+
+        self._array = np.zeros(capacity * 2, dtype=dtype)
+        cdef int columns = len(dtype.names)
+        self._uints = self._array.view(np.uint64).reshape(capacity * 2, columns)
+        self._doubles = self._array.view(np.float64).reshape(capacity * 2, columns)
+        self._next = 0
+
+        self.capacity = capacity
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(capacity={self.capacity}, count={self.count})"
+
+    cdef void _set_uint(self, int column, uint64_t value):
+        self._uints[self._next, column] = value
+        self._uints[self._next + self.capacity, column] = value
+
+    cdef void _set_double(self, int column, double value):
+        self._doubles[self._next, column] = value
+        self._doubles[self._next + self.capacity, column] = value
+
+    cdef void _advance(self):
+        self._next += 1
+        if self._next == self.capacity:
+            self._next = 0
+        if self.count < self.capacity:
+            self.count += 1
+
+    cpdef object to_array(self):
+        """
+        Return a read-only view of the buffered rows in chronological order (oldest first).
+
+        The view is zero-copy and shares memory with the buffer, so it reflects
+        subsequent appends; copy the view if it must remain stable.
+
+        Returns
+        -------
+        np.ndarray
+
+        """
+        cdef int end = self._next + self.capacity
+        view = self._array[end - self.count:end]
+        view.flags.writeable = False
+        return view
+
+    cpdef void clear(self):
+        """
+        Clear all buffered rows.
+        """
+        self._next = 0
+        self.count = 0
+
+
+cdef class QuoteTickArrayBuffer(ColumnarRingBuffer):
+    """
+    Provides a columnar ring buffer of quotes.
+
+    Prices and sizes are stored as `float64` and timestamps as `uint64`
+    (see `QUOTE_TICK_DTYPE`).
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of quotes to hold.
+
+    """
+
+    def __init__(self, int capacity) -> None:
+        super().__init__(QUOTE_TICK_DTYPE, capacity)
+
+    cpdef void append(self, QuoteTick tick):
+        """
+        Append the given quote to the buffer.
+
+        Parameters
+        ----------
+        tick : QuoteTick
+            The quote to append.
+
+        """
+        self._set_uint(0, tick._mem.ts_event)
+        self._set_uint(1, tick._mem.ts_init)
+        self._set_double(2, tick._mem.bid_price.raw / FIXED_SCALAR)
+        self._set_double(3, tick._mem.ask_price.raw / FIXED_SCALAR)
+        self._set_double(4, tick._mem.bid_size.raw / FIXED_SCALAR)
+        self._set_double(5, tick._mem.ask_size.raw / FIXED_SCALAR)
+        self._advance()
+
+
+cdef class TradeTickArrayBuffer(ColumnarRingBuffer):
+    """
+    Provides a columnar ring buffer of trades.
+
+    Prices and sizes are stored as `float64`, timestamps and the aggressor side
+    as `uint64` (see `TRADE_TICK_DTYPE`).
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of trades to hold.
+
+    """
+
+    def __init__(self, int capacity) -> None:
+        super().__init__(TRADE_TICK_DTYPE, capacity)
+
+    cpdef void append(self, TradeTick tick):
+        """
+        Append the given trade to the buffer.
+
+        Parameters
+        ----------
+        tick : TradeTick
+            The trade to append.
+
+        """
+        self._set_uint(0, tick._mem.ts_event)
+        self._set_uint(1, tick._mem.ts_init)
+        self._set_double(2, tick._mem.price.raw / FIXED_SCALAR)
+        self._set_double(3, tick._mem.size.raw / FIXED_SCALAR)
+        self._set_uint(4, <uint64_t>tick._mem.aggressor_side)
+        self._advance()
+
+
+cdef class BarArrayBuffer(ColumnarRingBuffer):
+    """
+    Provides a columnar ring buffer of bars.
+
+    OHLCV values are stored as `float64` and timestamps as `uint64`
+    (see `BAR_DTYPE`).
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of bars to hold.
+
+    """
+
+    def __init__(self, int capacity) -> None:
+        super().__init__(BAR_DTYPE, capacity)
+
+    cpdef void append(self, Bar bar):
+        """
+        Append the given bar to the buffer.
+
+        Parameters
+        ----------
+        bar : Bar
+            The bar to append.
+
+        """
+        self._set_uint(0, bar._mem.ts_event)
+        self._set_uint(1, bar._mem.ts_init)
+        self._set_double(2, bar._mem.open.raw / FIXED_SCALAR)
+        self._set_double(3, bar._mem.high.raw / FIXED_SCALAR)
+        self._set_double(4, bar._mem.low.raw / FIXED_SCALAR)
+        self._set_double(5, bar._mem.close.raw / FIXED_SCALAR)
+        self._set_double(6, bar._mem.volume.raw / FIXED_SCALAR)
+        self._advance()
@@ -33,6 +33,7 @@ from nautilus_trader.model.identifiers cimport VenueOrderId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.instruments.synthetic cimport SyntheticInstrument
 from nautilus_trader.model.objects cimport Currency
+from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.objects cimport Quantity
 
 
@@ -73,6 +74,18 @@ cdef class CacheFacade:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method `bars` must be implemented in the subclass")  # pragma: no cover
 
+    cpdef object quote_ticks_array(self, InstrumentId instrument_id):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `quote_ticks_array` must be implemented in the subclass")  # pragma: no cover
+
+    cpdef object trade_ticks_array(self, InstrumentId instrument_id):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `trade_ticks_array` must be implemented in the subclass")  # pragma: no cover
+
+    cpdef object bars_array(self, BarType bar_type):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `bars_array` must be implemented in the subclass")  # pragma: no cover
+
     cpdef Price price(self, InstrumentId instrument_id, PriceType price_type):
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method `price` must be implemented in the subclass")  # pragma: no cover
@@ -440,6 +453,10 @@ cdef class CacheFacade:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method `position_snapshots` must be implemented in the subclass")  # pragma: no cover
 
+    cpdef Money position_snapshots_realized_pnl(self, PositionId position_id):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `position_snapshots_realized_pnl` must be implemented in the subclass")  # pragma: no cover
+
     cpdef list positions(self, Venue venue = None, InstrumentId instrument_id = None, StrategyId strategy_id = None, PositionSide side = PositionSide.NO_POSITION_SIDE):
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method `positions` must be implemented in the subclass")  # pragma: no cover
@@ -22,6 +22,7 @@ from libc.stdint cimport uint64_t
 from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
+from nautilus_trader.cache.xrates cimport ExchangeRateGraph
 from nautilus_trader.common.actor cimport Actor
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.core.rust.model cimport OmsType
@@ -66,6 +67,7 @@ cdef class Cache(CacheFacade):
     cdef dict _quote_ticks
     cdef dict _trade_ticks
     cdef dict _xrate_symbols
+    cdef dict _xrate_graphs
     cdef dict _mark_prices
     cdef dict _index_prices
     cdef dict _bars
@@ -78,6 +80,9 @@ cdef class Cache(CacheFacade):
     cdef dict _position_snapshots
     cdef dict _greeks
     cdef dict _yield_curves
+    cdef dict _quote_tick_arrays
+    cdef dict _trade_tick_arrays
+    cdef dict _bar_arrays
     cdef dict[tuple[Currency, Currency], double] _mark_xrates
 
     cdef dict _index_venue_account
@@ -109,7 +114,13 @@ cdef class Cache(CacheFacade):
     cdef set _index_actors
     cdef set _index_strategies
     cdef set _index_exec_algorithms
+    cdef list _closed_orders_heap
+    cdef list _closed_positions_heap
+    cdef dict _retained_closed_orders
+    cdef dict _retained_closed_positions
     cdef bint _drop_instruments_on_reset
+    cdef int _max_closed_orders_per_strategy
+    cdef int _max_closed_positions_per_instrument
 
     cdef readonly bint has_backing
     """If the cache has a database backing.\n\n:returns: `bool`"""
@@ -117,6 +128,8 @@ cdef class Cache(CacheFacade):
     """The caches tick capacity.\n\n:returns: `int`"""
     cdef readonly int bar_capacity
     """The caches bar capacity.\n\n:returns: `int`"""
+    cdef readonly int columnar_capacity
+    """The caches columnar store capacity (zero if disabled).\n\n:returns: `int`"""
 
     cpdef void cache_all(self)
     cpdef void cache_general(self)
@@ -140,7 +153,8 @@ cdef class Cache(CacheFacade):
     cpdef void dispose(self)
     cpdef void flush_db(self)
 
-    cdef tuple _build_quote_table(self, Venue venue)
+    cdef ExchangeRateGraph _get_xrate_graph(self, Venue venue)
+    cdef void _update_xrate_graph(self, InstrumentId instrument_id)
     cdef void _build_index_venue_account(self)
     cdef void _cache_venue_account_id(self, AccountId account_id)
     cdef void _build_indexes_from_orders(self)
@@ -150,6 +164,12 @@ cdef class Cache(CacheFacade):
     cdef list _get_orders_for_ids(self, set client_order_ids, OrderSide side)
     cdef list _get_positions_for_ids(self, set position_ids, PositionSide side)
     cdef void _assign_position_id_to_contingencies(self, Order order)
+    cdef void _index_closed_order(self, Order order)
+    cdef void _index_closed_position(self, Position position)
+    cdef void _compact_closed_orders_heap(self)
+    cdef void _compact_closed_positions_heap(self)
+    cdef void _enforce_closed_orders_retention(self, StrategyId strategy_id)
+    cdef void _enforce_closed_positions_retention(self, InstrumentId instrument_id)
     cpdef Money calculate_unrealized_pnl(self, Position position)
 
     cpdef Instrument load_instrument(self, InstrumentId instrument_id)
@@ -13,10 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import copy
-import pickle
+import heapq
 import time
-import uuid
 from collections import deque
 from decimal import Decimal
 
@@ -30,8 +28,14 @@ from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
+from nautilus_trader.cache.arrays cimport BarArrayBuffer
+from nautilus_trader.cache.arrays cimport QuoteTickArrayBuffer
+from nautilus_trader.cache.arrays cimport TradeTickArrayBuffer
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
+from nautilus_trader.cache.snapshots cimport PositionSnapshots
+from nautilus_trader.cache.xrates cimport ExchangeRateGraph
 from nautilus_trader.common.component cimport LogColor
+from nautilus_trader.common.component cimport LogLevel
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport AggregationSource
@@ -77,6 +81,10 @@ from nautilus_trader.model.orders.list cimport OrderList
 from nautilus_trader.trading.strategy cimport Strategy
 
 
+# The count of stale entries allowed in a closed heap beyond its live entries before compaction
+cdef int _CLOSED_HEAP_SLACK = 1024
+
+
 cdef class Cache(CacheFacade):
     """
     Provides a common object cache for market and execution related data.
@@ -111,6 +119,9 @@ cdef class Cache(CacheFacade):
         self.has_backing = database is not None
         self.tick_capacity = config.tick_capacity
         self.bar_capacity = config.bar_capacity
+        self.columnar_capacity = config.columnar_capacity or 0
+        self._max_closed_orders_per_strategy = config.max_closed_orders_per_strategy or 0
+        self._max_closed_positions_per_instrument = config.max_closed_positions_per_instrument or 0
 
         # Caches
         self._general: dict[str, bytes] = {}
@@ -122,6 +133,7 @@ cdef class Cache(CacheFacade):
         self._quote_ticks: dict[InstrumentId, deque[QuoteTick]] = {}
         self._trade_ticks: dict[InstrumentId, deque[TradeTick]] = {}
         self._xrate_symbols: dict[InstrumentId, str] = {}
+        self._xrate_graphs: dict[Venue, ExchangeRateGraph] = {}
         self._mark_xrates: dict[tuple[Currency, Currency], double] = {}
         self._mark_prices: dict[InstrumentId, MarkPriceUpdate] = {}
         self._index_prices: dict[InstrumentId, IndexPriceUpdate] = {}
@@ -132,9 +144,12 @@ cdef class Cache(CacheFacade):
         self._orders: dict[ClientOrderId, Order] = {}
         self._order_lists: dict[OrderListId, OrderList] = {}
         self._positions: dict[PositionId, Position] = {}
-        self._position_snapshots: dict[PositionId, list[bytes]] = {}
+        self._position_snapshots: dict[PositionId, PositionSnapshots] = {}
         self._greeks: dict[InstrumentId, object] = {}
         self._yield_curves: dict[str, object] = {}
+        self._quote_tick_arrays: dict[InstrumentId, QuoteTickArrayBuffer] = {}
+        self._trade_tick_arrays: dict[InstrumentId, TradeTickArrayBuffer] = {}
+        self._bar_arrays: dict[BarType, BarArrayBuffer] = {}
 
         # Cache index
         self._index_venue_account: dict[Venue, AccountId] = {}
@@ -167,6 +182,14 @@ cdef class Cache(CacheFacade):
         self._index_strategies: set[StrategyId] = set()
         self._index_exec_algorithms: set[ExecAlgorithmId] = set()
 
+        # Closed orders and positions ordered by close time (min-heaps of (ts_closed, ID))
+        self._closed_orders_heap: list[tuple[int, ClientOrderId]] = []
+        self._closed_positions_heap: list[tuple[int, PositionId]] = []
+
+        # Closed orders and positions subject to retention limits (in close order)
+        self._retained_closed_orders: dict[StrategyId, dict[ClientOrderId, None]] = {}
+        self._retained_closed_positions: dict[InstrumentId, dict[PositionId, None]] = {}
+
         self._log.info("READY")
 
 # -- COMMANDS -------------------------------------------------------------------------------------
@@ -765,6 +788,9 @@ cdef class Cache(CacheFacade):
         """
         Purge all closed orders from the cache.
 
+        Closed orders are indexed by close time, so only orders which are due to be
+        purged are visited.
+
         Parameters
         ----------
         ts_now : uint64_t
@@ -781,17 +807,29 @@ cdef class Cache(CacheFacade):
         cdef uint64_t buffer_ns = nautilus_pyo3.secs_to_nanos(buffer_secs)
 
         cdef:
+            uint64_t ts_closed
             ClientOrderId client_order_id
             Order order
-        for client_order_id in self._index_orders_closed.copy():
+        while self._closed_orders_heap and self._closed_orders_heap[0][0] + buffer_ns <= ts_now:
+            ts_closed, client_order_id = heapq.heappop(self._closed_orders_heap)
+            if client_order_id not in self._index_orders_closed:
+                continue  # Purged or reopened
             order = self._orders.get(client_order_id)
-            if order is not None and order.ts_closed + buffer_ns <= ts_now:
-                self.purge_order(client_order_id)
+            if order is None:
+                continue
+            if order.ts_closed != ts_closed:
+                # Closed again since indexed, reindex at the latest close time
+                heapq.heappush(self._closed_orders_heap, (order.ts_closed, client_order_id))
+                continue
+            self.purge_order(client_order_id)
 
     cpdef void purge_closed_positions(self, uint64_t ts_now, uint64_t buffer_secs = 0):
         """
         Purge all closed positions from the cache.
 
+        Closed positions are indexed by close time, so only positions which are due to be
+        purged are visited.
+
         Parameters
         ----------
         ts_now : uint64_t
@@ -808,12 +846,21 @@ cdef class Cache(CacheFacade):
         cdef uint64_t buffer_ns = nautilus_pyo3.secs_to_nanos(buffer_secs)
 
         cdef:
+            uint64_t ts_closed
             PositionId position_id
             Position position
-        for position_id in self._index_positions_closed.copy():
+        while self._closed_positions_heap and self._closed_positions_heap[0][0] + buffer_ns <= ts_now:
+            ts_closed, position_id = heapq.heappop(self._closed_positions_heap)
+            if position_id not in self._index_positions_closed:
+                continue  # Purged or reopened
             position = self._positions.get(position_id)
-            if position is not None and position.ts_closed + buffer_ns <= ts_now:
-                self.purge_position(position_id)
+            if position is None:
+                continue
+            if position.ts_closed != ts_closed:
+                # Closed again since indexed, reindex at the latest close time
+                heapq.heappush(self._closed_positions_heap, (position.ts_closed, position_id))
+                continue
+            self.purge_position(position_id)
 
     cpdef void purge_order(self, ClientOrderId client_order_id):
         """
@@ -829,6 +876,10 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(client_order_id, "client_order_id")
 
+        cdef dict retained = self._retained_closed_orders.get(self._index_order_strategy.get(client_order_id))
+        if retained is not None:
+            retained.pop(client_order_id, None)
+
         cdef Order order = self._orders.pop(client_order_id, None)
 
         if order is None:
@@ -873,6 +924,12 @@ cdef class Cache(CacheFacade):
         Condition.not_none(position_id, "position_id")
 
         cdef Position position = self._positions.pop(position_id, None)
+        cdef dict retained
+        if position is not None:
+            retained = self._retained_closed_positions.get(position.instrument_id)
+            if retained is not None:
+                retained.pop(position_id, None)
+
         if position is None:
             self._log.warning(f"Position {position_id} not found when purging")
         else:
@@ -947,6 +1004,10 @@ cdef class Cache(CacheFacade):
         self._index_actors.clear()
         self._index_strategies.clear()
         self._index_exec_algorithms.clear()
+        self._closed_orders_heap.clear()
+        self._closed_positions_heap.clear()
+        self._retained_closed_orders.clear()
+        self._retained_closed_positions.clear()
 
         self._log.debug(f"Cleared index")
 
@@ -965,11 +1026,15 @@ cdef class Cache(CacheFacade):
         self._own_order_books.clear()
         self._quote_ticks.clear()
         self._trade_ticks.clear()
+        self._quote_tick_arrays.clear()
+        self._trade_tick_arrays.clear()
         self._xrate_symbols.clear()
+        self._xrate_graphs.clear()
         self._mark_xrates.clear()
         self._mark_prices.clear()
         self._index_prices.clear()
         self._bars.clear()
+        self._bar_arrays.clear()
         self._bars_bid.clear()
         self._bars_ask.clear()
         self._accounts.clear()
@@ -1071,6 +1136,7 @@ cdef class Cache(CacheFacade):
             # 11: Build _index_orders_closed -> {ClientOrderId}
             if order.is_closed_c():
                 self._index_orders_closed.add(client_order_id)
+                self._closed_orders_heap.append((order.ts_closed, client_order_id))
 
             # 12: Build _index_orders_emulated -> {ClientOrderId}
             if order.emulation_trigger != TriggerType.NO_TRIGGER and not order.is_closed_c():
@@ -1087,6 +1153,16 @@ cdef class Cache(CacheFacade):
             if order.exec_algorithm_id is not None:
                 self._index_exec_algorithms.add(order.exec_algorithm_id)
 
+        heapq.heapify(self._closed_orders_heap)
+
+        # Build _retained_closed_orders -> {StrategyId, {ClientOrderId}} (in close order)
+        cdef dict retained
+        if self._max_closed_orders_per_strategy > 0:
+            for _, client_order_id in sorted(self._closed_orders_heap):
+                order = self._orders[client_order_id]
+                retained = self._retained_closed_orders.setdefault(order.strategy_id, {})
+                retained[client_order_id] = None
+
     cdef void _build_indexes_from_positions(self):
         cdef ClientOrderId client_order_id
         cdef PositionId position_id
@@ -1127,10 +1203,112 @@ cdef class Cache(CacheFacade):
             # 8: Build _index_positions_closed -> {PositionId}
             elif position.is_closed_c():
                 self._index_positions_closed.add(position_id)
+                self._closed_positions_heap.append((position.ts_closed, position_id))
 
             # 9: Build _index_strategies -> {StrategyId}
             self._index_strategies.add(position.strategy_id)
 
+        heapq.heapify(self._closed_positions_heap)
+
+        # Build _retained_closed_positions -> {InstrumentId, {PositionId}} (in close order)
+        cdef dict retained
+        if self._max_closed_positions_per_instrument > 0:
+            for _, position_id in sorted(self._closed_positions_heap):
+                position = self._positions[position_id]
+                retained = self._retained_closed_positions.setdefault(position.instrument_id, {})
+                retained[position_id] = None
+
+    cdef void _index_closed_order(self, Order order):
+        heapq.heappush(self._closed_orders_heap, (order.ts_closed, order.client_order_id))
+
+        # Stale entries are only dropped when purging, so compact the heap if purges
+        # are not running (or not keeping up) to keep it bounded by the closed orders
+        if len(self._closed_orders_heap) > 2 * len(self._index_orders_closed) + _CLOSED_HEAP_SLACK:
+            self._compact_closed_orders_heap()
+
+        if self._max_closed_orders_per_strategy == 0:
+            return
+
+        cdef dict retained = self._retained_closed_orders.get(order.strategy_id)
+        if retained is None:
+            retained = {}
+            self._retained_closed_orders[order.strategy_id] = retained
+        retained[order.client_order_id] = None
+
+    cdef void _index_closed_position(self, Position position):
+        heapq.heappush(self._closed_positions_heap, (position.ts_closed, position.id))
+
+        # Stale entries are only dropped when purging, so compact the heap if purges
+        # are not running (or not keeping up) to keep it bounded by the closed positions
+        if len(self._closed_positions_heap) > 2 * len(self._index_positions_closed) + _CLOSED_HEAP_SLACK:
+            self._compact_closed_positions_heap()
+
+        if self._max_closed_positions_per_instrument == 0:
+            return
+
+        cdef dict retained = self._retained_closed_positions.get(position.instrument_id)
+        if retained is None:
+            retained = {}
+            self._retained_closed_positions[position.instrument_id] = retained
+        retained[position.id] = None
+
+    cdef void _compact_closed_orders_heap(self):
+        cdef ClientOrderId client_order_id
+        self._closed_orders_heap = [
+            (self._orders[client_order_id].ts_closed, client_order_id)
+            for client_order_id in self._index_orders_closed
+            if client_order_id in self._orders
+        ]
+        heapq.heapify(self._closed_orders_heap)
+
+    cdef void _compact_closed_positions_heap(self):
+        cdef PositionId position_id
+        self._closed_positions_heap = [
+            (self._positions[position_id].ts_closed, position_id)
+            for position_id in self._index_positions_closed
+            if position_id in self._positions
+        ]
+        heapq.heapify(self._closed_positions_heap)
+
+    cdef void _enforce_closed_orders_retention(self, StrategyId strategy_id):
+        cdef dict retained = self._retained_closed_orders.get(strategy_id)
+        if not retained:
+            return
+
+        cdef int excess = len(retained) - self._max_closed_orders_per_strategy
+        if excess <= 0:
+            return
+
+        cdef:
+            ClientOrderId client_order_id
+            PositionId position_id
+            list evicted = []
+        for client_order_id in retained:
+            # Orders for a position which is still open are retained until it closes
+            position_id = self._index_order_position.get(client_order_id)
+            if position_id is not None and position_id in self._index_positions_open:
+                continue
+            evicted.append(client_order_id)
+            if len(evicted) == excess:
+                break
+
+        # Evict the earliest closed orders
+        for client_order_id in evicted:
+            del retained[client_order_id]
+            self.purge_order(client_order_id)
+
+    cdef void _enforce_closed_positions_retention(self, InstrumentId instrument_id):
+        cdef dict retained = self._retained_closed_positions.get(instrument_id)
+        if not retained:
+            return
+
+        cdef PositionId position_id
+        while len(retained) > self._max_closed_positions_per_instrument:
+            # Evict the earliest closed position
+            position_id = next(iter(retained))
+            del retained[position_id]
+            self.purge_position(position_id)
+
     cdef void _assign_position_id_to_contingencies(self, Order order):
         cdef:
             ClientOrderId client_order_id
@@ -1402,6 +1580,17 @@ cdef class Cache(CacheFacade):
 
         ticks.appendleft(tick)
 
+        cdef QuoteTickArrayBuffer array_buffer
+        if self.columnar_capacity > 0:
+            array_buffer = self._quote_tick_arrays.get(instrument_id)
+            if array_buffer is None:
+                array_buffer = QuoteTickArrayBuffer(self.columnar_capacity)
+                self._quote_tick_arrays[instrument_id] = array_buffer
+            array_buffer.append(tick)
+
+        if instrument_id in self._xrate_symbols:
+            self._update_xrate_graph(instrument_id)
+
     cpdef void add_trade_tick(self, TradeTick tick):
         """
         Add the given trade tick to the cache.
@@ -1424,6 +1613,14 @@ cdef class Cache(CacheFacade):
 
         ticks.appendleft(tick)
 
+        cdef TradeTickArrayBuffer array_buffer
+        if self.columnar_capacity > 0:
+            array_buffer = self._trade_tick_arrays.get(instrument_id)
+            if array_buffer is None:
+                array_buffer = TradeTickArrayBuffer(self.columnar_capacity)
+                self._trade_tick_arrays[instrument_id] = array_buffer
+            array_buffer.append(tick)
+
     cpdef void add_mark_price(self, MarkPriceUpdate mark_price):
         """
         Add the given mark price update to the cache.
@@ -1487,11 +1684,24 @@ cdef class Cache(CacheFacade):
 
         bars.appendleft(bar)
 
+        cdef BarArrayBuffer array_buffer
+        if self.columnar_capacity > 0:
+            array_buffer = self._bar_arrays.get(bar.bar_type)
+            if array_buffer is None:
+                array_buffer = BarArrayBuffer(self.columnar_capacity)
+                self._bar_arrays[bar.bar_type] = array_buffer
+            array_buffer.append(bar)
+
         cdef PriceType price_type = bar.bar_type.spec.price_type
         if price_type == PriceType.BID:
             self._bars_bid[bar.bar_type.instrument_id] = bar
         elif price_type == PriceType.ASK:
             self._bars_ask[bar.bar_type.instrument_id] = bar
+        else:
+            return
+
+        if bar.bar_type.instrument_id in self._xrate_symbols:
+            self._update_xrate_graph(bar.bar_type.instrument_id)
 
     cpdef void add_quote_ticks(self, list ticks):
         """
@@ -1521,12 +1731,24 @@ cdef class Cache(CacheFacade):
             cached_ticks = deque(maxlen=self.tick_capacity)
             self._quote_ticks[instrument_id] = cached_ticks
 
+        cdef QuoteTickArrayBuffer array_buffer = None
+        if self.columnar_capacity > 0:
+            array_buffer = self._quote_tick_arrays.get(instrument_id)
+            if array_buffer is None:
+                array_buffer = QuoteTickArrayBuffer(self.columnar_capacity)
+                self._quote_tick_arrays[instrument_id] = array_buffer
+
         cdef QuoteTick tick
         for tick in ticks:
             if cached_ticks and tick.ts_event <= cached_ticks[0].ts_event:
                 # Only add more recent data to cache
                 continue
             cached_ticks.appendleft(tick)
+            if array_buffer is not None:
+                array_buffer.append(tick)
+
+        if instrument_id in self._xrate_symbols:
+            self._update_xrate_graph(instrument_id)
 
     cpdef void add_trade_ticks(self, list ticks):
         """
@@ -1555,12 +1777,21 @@ cdef class Cache(CacheFacade):
             cached_ticks = deque(maxlen=self.tick_capacity)
             self._trade_ticks[instrument_id] = cached_ticks
 
+        cdef TradeTickArrayBuffer array_buffer = None
+        if self.columnar_capacity > 0:
+            array_buffer = self._trade_tick_arrays.get(instrument_id)
+            if array_buffer is None:
+                array_buffer = TradeTickArrayBuffer(self.columnar_capacity)
+                self._trade_tick_arrays[instrument_id] = array_buffer
+
         cdef TradeTick tick
         for tick in ticks:
             if cached_ticks and tick.ts_event <= cached_ticks[0].ts_event:
                 # Only add more recent data to cache
                 continue
             cached_ticks.appendleft(tick)
+            if array_buffer is not None:
+                array_buffer.append(tick)
 
     cpdef void add_bars(self, list bars):
         """
@@ -1589,12 +1820,21 @@ cdef class Cache(CacheFacade):
             cached_bars = deque(maxlen=self.bar_capacity)
             self._bars[bar_type] = cached_bars
 
+        cdef BarArrayBuffer array_buffer = None
+        if self.columnar_capacity > 0:
+            array_buffer = self._bar_arrays.get(bar_type)
+            if array_buffer is None:
+                array_buffer = BarArrayBuffer(self.columnar_capacity)
+                self._bar_arrays[bar_type] = array_buffer
+
         cdef Bar bar
         for bar in bars:
             if cached_bars and bar.ts_event <= cached_bars[0].ts_event:
                 # Only add more recent data to cache
                 continue
             cached_bars.appendleft(bar)
+            if array_buffer is not None:
+                array_buffer.append(bar)
 
         bar = bars[-1]
         cdef PriceType price_type = bar.bar_type.spec.price_type
@@ -1602,6 +1842,11 @@ cdef class Cache(CacheFacade):
             self._bars_bid[bar.bar_type.instrument_id] = bar
         elif price_type == PriceType.ASK:
             self._bars_ask[bar.bar_type.instrument_id] = bar
+        else:
+            return
+
+        if bar.bar_type.instrument_id in self._xrate_symbols:
+            self._update_xrate_graph(bar.bar_type.instrument_id)
 
     cpdef void add_currency(self, Currency currency):
         """
@@ -1640,6 +1885,7 @@ cdef class Cache(CacheFacade):
             self._xrate_symbols[instrument.id] = (
                 f"{instrument.base_currency}/{instrument.quote_currency}"
             )
+            self._update_xrate_graph(instrument.id)
 
         self._log.debug(f"Added instrument {instrument.id}")
 
@@ -2049,6 +2295,9 @@ cdef class Cache(CacheFacade):
 
         The position ID will be appended with a UUID v4 string.
 
+        Snapshots are held in a compact columnar form per position ID, and are only
+        materialized as `Position` objects when requested.
+
         Parameters
         ----------
         position : Position
@@ -2056,19 +2305,15 @@ cdef class Cache(CacheFacade):
 
         """
         cdef PositionId position_id = position.id
-        cdef list snapshots = self._position_snapshots.get(position_id)
-
-        # Reassign position ID
-        cdef Position copied_position = copy.deepcopy(position)
-        copied_position.id = PositionId(f"{position.id.to_str()}-{uuid.uuid4()}")
-        cdef bytes position_pickled = pickle.dumps(copied_position)
+        cdef PositionSnapshots snapshots = self._position_snapshots.get(position_id)
+        if snapshots is None:
+            snapshots = PositionSnapshots(position)
+            self._position_snapshots[position_id] = snapshots
 
-        if snapshots is not None:
-            snapshots.append(position_pickled)
-        else:
-            self._position_snapshots[position_id] = [position_pickled]
+        snapshots.append(position)
 
-        self._log.debug(f"Snapshot {repr(copied_position)}")
+        if self._log.is_enabled(LogLevel.DEBUG):
+            self._log.debug(f"Snapshot {position!r}")
 
     cpdef void snapshot_position_state(
         self,
@@ -2178,7 +2423,13 @@ cdef class Cache(CacheFacade):
             self._index_orders_inflight.discard(order.client_order_id)
 
         # Update open/closed state
+        cdef bint is_newly_closed = False
+        cdef dict retained
         if order.is_open_c():
+            if order.client_order_id in self._index_orders_closed:
+                retained = self._retained_closed_orders.get(order.strategy_id)
+                if retained is not None:
+                    retained.pop(order.client_order_id, None)
             self._index_orders_closed.discard(order.client_order_id)
             self._index_orders_open.add(order.client_order_id)
             if self._own_order_books:
@@ -2186,7 +2437,10 @@ cdef class Cache(CacheFacade):
         elif order.is_closed_c():
             self._index_orders_open.discard(order.client_order_id)
             self._index_orders_pending_cancel.discard(order.client_order_id)
-            self._index_orders_closed.add(order.client_order_id)
+            if order.client_order_id not in self._index_orders_closed:
+                self._index_orders_closed.add(order.client_order_id)
+                self._index_closed_order(order)
+                is_newly_closed = True
             if self._own_order_books:
                 self._index_orders_open_pyo3.discard(nautilus_pyo3.ClientOrderId(order.client_order_id.value))
 
@@ -2200,6 +2454,10 @@ cdef class Cache(CacheFacade):
         if self._own_order_books and should_handle_own_book_order(order):
             self.update_own_order_book(order)
 
+        # Apply retention limit
+        if is_newly_closed and self._max_closed_orders_per_strategy > 0:
+            self._enforce_closed_orders_retention(order.strategy_id)
+
         if self._database is None:
             return
 
@@ -2260,12 +2518,24 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(position, "position")
 
+        cdef dict retained
         if position.is_open_c():
+            if position.id in self._index_positions_closed:
+                retained = self._retained_closed_positions.get(position.instrument_id)
+                if retained is not None:
+                    retained.pop(position.id, None)
             self._index_positions_open.add(position.id)
             self._index_positions_closed.discard(position.id)
         elif position.is_closed_c():
-            self._index_positions_closed.add(position.id)
             self._index_positions_open.discard(position.id)
+            if position.id not in self._index_positions_closed:
+                self._index_positions_closed.add(position.id)
+                self._index_closed_position(position)
+                if self._max_closed_positions_per_instrument > 0:
+                    self._enforce_closed_positions_retention(position.instrument_id)
+                if self._max_closed_orders_per_strategy > 0:
+                    # Closed orders for the position can now be evicted
+                    self._enforce_closed_orders_retention(position.strategy_id)
 
         if self._database is None:
             return
@@ -2476,6 +2746,84 @@ cdef class Cache(CacheFacade):
 
         return list(self._bars.get(bar_type, []))
 
+    cpdef object quote_ticks_array(self, InstrumentId instrument_id):
+        """
+        Return a zero-copy columnar view of the quotes for the given instrument ID.
+
+        The view is a read-only NumPy structured array (see `QUOTE_TICK_DTYPE`) in
+        chronological order (oldest first), sharing memory with the columnar store.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the ticks to get.
+
+        Returns
+        -------
+        np.ndarray or ``None``
+            ``None`` if the columnar store is disabled or no quotes have been added.
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+
+        array_buffer = self._quote_tick_arrays.get(instrument_id)
+        if array_buffer is None:
+            return None
+
+        return array_buffer.to_array()
+
+    cpdef object trade_ticks_array(self, InstrumentId instrument_id):
+        """
+        Return a zero-copy columnar view of the trades for the given instrument ID.
+
+        The view is a read-only NumPy structured array (see `TRADE_TICK_DTYPE`) in
+        chronological order (oldest first), sharing memory with the columnar store.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the ticks to get.
+
+        Returns
+        -------
+        np.ndarray or ``None``
+            ``None`` if the columnar store is disabled or no trades have been added.
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+
+        array_buffer = self._trade_tick_arrays.get(instrument_id)
+        if array_buffer is None:
+            return None
+
+        return array_buffer.to_array()
+
+    cpdef object bars_array(self, BarType bar_type):
+        """
+        Return a zero-copy columnar view of the bars for the given bar type.
+
+        The view is a read-only NumPy structured array (see `BAR_DTYPE`) in
+        chronological order (oldest first), sharing memory with the columnar store.
+
+        Parameters
+        ----------
+        bar_type : BarType
+            The bar type for bars to get.
+
+        Returns
+        -------
+        np.ndarray or ``None``
+            ``None`` if the columnar store is disabled or no bars have been added.
+
+        """
+        Condition.not_none(bar_type, "bar_type")
+
+        array_buffer = self._bar_arrays.get(bar_type)
+        if array_buffer is None:
+            return None
+
+        return array_buffer.to_array()
+
     cpdef Price price(self, InstrumentId instrument_id, PriceType price_type):
         """
         Return the price for the given instrument ID and price type.
@@ -3093,51 +3441,49 @@ cdef class Cache(CacheFacade):
             # no conversion is needed; return an exchange rate of 1.0.
             return 1.0
 
-        cdef tuple quotes = self._build_quote_table(venue)
-
         try:
-            return nautilus_pyo3.get_exchange_rate(
-                from_currency=from_currency.code,
-                to_currency=to_currency.code,
-                price_type=nautilus_pyo3.PriceType.from_int(price_type),
-                quotes_bid=quotes[0],  # Bid
-                quotes_ask=quotes[1],  # Ask
+            return self._get_xrate_graph(venue).get_rate(
+                from_currency.code,
+                to_currency.code,
+                price_type,
             )
         except ValueError as e:
             self._log.error(f"Cannot calculate exchange rate: {e!r}")
 
-    cdef tuple _build_quote_table(self, Venue venue):
-        cdef dict bid_quotes = {}
-        cdef dict ask_quotes = {}
+    cdef ExchangeRateGraph _get_xrate_graph(self, Venue venue):
+        cdef ExchangeRateGraph graph = self._xrate_graphs.get(venue)
+        if graph is None:
+            graph = ExchangeRateGraph()
+            self._xrate_graphs[venue] = graph
+
+        return graph
+
+    cdef void _update_xrate_graph(self, InstrumentId instrument_id):
+        cdef str base_quote = self._xrate_symbols[instrument_id]
 
         cdef:
-            InstrumentId instrument_id
-            str base_quote
             Price bid_price
             Price ask_price
             Bar bid_bar
             Bar ask_bar
-        for instrument_id, base_quote in self._xrate_symbols.items():
-            if instrument_id.venue != venue:
-                continue
-
-            ticks = self._quote_ticks.get(instrument_id)
-            if ticks:
-                bid_price = ticks[0].bid_price
-                ask_price = ticks[0].ask_price
-            else:
-                # No quotes for instrument_id
-                bid_bar = self._bars_bid.get(instrument_id)
-                ask_bar = self._bars_ask.get(instrument_id)
-                if bid_bar is None or ask_bar is None:
-                    continue # No prices for instrument_id
-                bid_price = bid_bar.close
-                ask_price = ask_bar.close
-
-            bid_quotes[base_quote] = bid_price.as_f64_c()
-            ask_quotes[base_quote] = ask_price.as_f64_c()
-
-        return bid_quotes, ask_quotes
+        ticks = self._quote_ticks.get(instrument_id)
+        if ticks:
+            bid_price = ticks[0].bid_price
+            ask_price = ticks[0].ask_price
+        else:
+            # No quotes for instrument_id
+            bid_bar = self._bars_bid.get(instrument_id)
+            ask_bar = self._bars_ask.get(instrument_id)
+            if bid_bar is None or ask_bar is None:
+                return  # No prices for instrument_id
+            bid_price = bid_bar.close
+            ask_price = ask_bar.close
+
+        self._get_xrate_graph(instrument_id.venue).update(
+            base_quote,
+            bid_price.as_f64_c(),
+            ask_price.as_f64_c(),
+        )
 
     cpdef get_mark_xrate(
         self,
@@ -4642,17 +4988,41 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef list snapshot_list
-        cdef list snapshots
+        cdef PositionSnapshots snapshots
         if position_id is not None:
-            snapshots = self._position_snapshots.get(position_id, [])
-        else:
-            snapshots = []
-            for snapshot_list in self._position_snapshots.values():
-                snapshots += snapshot_list
+            snapshots = self._position_snapshots.get(position_id)
+            return snapshots.materialize_all() if snapshots is not None else []
+
+        cdef list positions = []
+        for snapshots in self._position_snapshots.values():
+            positions += snapshots.materialize_all()
+
+        return positions
+
+    cpdef Money position_snapshots_realized_pnl(self, PositionId position_id):
+        """
+        Return the total realized PnL of all snapshots for the given position ID.
+
+        This reads the compact snapshot records, so no positions are materialized.
+
+        Parameters
+        ----------
+        position_id : PositionId
+            The position ID for the snapshots.
+
+        Returns
+        -------
+        Money or ``None``
+            ``None`` if no snapshots have a realized PnL.
+
+        """
+        Condition.not_none(position_id, "position_id")
+
+        cdef PositionSnapshots snapshots = self._position_snapshots.get(position_id)
+        if snapshots is None:
+            return None
 
-        cdef bytes s
-        return [pickle.loads(s) for s in snapshots]
+        return snapshots.total_realized_pnl()
 
     cpdef list positions(
         self,
@@ -49,6 +49,19 @@ class CacheConfig(NautilusConfig, frozen=True):
         The maximum length for internal tick dequeues.
     bar_capacity : PositiveInt, default 10_000
         The maximum length for internal bar dequeues.
+    columnar_capacity : PositiveInt, optional
+        The capacity of the columnar NumPy ring buffers maintained per instrument (quotes, trades)
+        and per bar type (bars), which are exposed as zero-copy arrays. This is independent of the
+        object capacities above. If ``None`` then the columnar store is disabled.
+    max_closed_orders_per_strategy : PositiveInt, optional
+        The maximum number of closed orders retained in memory per strategy. When exceeded
+        the earliest closed orders are purged from the in-memory cache (**not** from the database).
+        Closed orders for a position which is still open are retained until it closes.
+        If ``None`` then closed orders are retained until purged.
+    max_closed_positions_per_instrument : PositiveInt, optional
+        The maximum number of closed positions retained in memory per instrument. When exceeded
+        the earliest closed positions are purged from the in-memory cache (**not** from the database).
+        If ``None`` then closed positions are retained until purged.
 
     """
 
@@ -62,3 +75,6 @@ class CacheConfig(NautilusConfig, frozen=True):
     drop_instruments_on_reset: bool = True
     tick_capacity: PositiveInt = 10_000
     bar_capacity: PositiveInt = 10_000
+    columnar_capacity: PositiveInt | None = None
+    max_closed_orders_per_strategy: PositiveInt | None = None
+    max_closed_positions_per_instrument: PositiveInt | None = None
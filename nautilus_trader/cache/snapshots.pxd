@@ -0,0 +1,57 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint8_t
+
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport PositionId
+from nautilus_trader.model.objects cimport Currency
+from nautilus_trader.model.objects cimport Money
+from nautilus_trader.model.objects cimport Quantity
+from nautilus_trader.model.position cimport Position
+
+
+cdef class PositionSnapshots:
+    cdef uint8_t _price_precision
+    cdef uint8_t _size_precision
+    cdef Quantity _multiplier
+    cdef bint _is_inverse
+    cdef Currency _quote_currency
+    cdef Currency _base_currency
+    cdef Currency _settlement_currency
+    cdef object _realized_pnl_raw_total
+    cdef bint _has_realized_pnl
+
+    cdef list _ids
+    cdef list _ts_opened
+    cdef list _ts_closed
+    cdef list _realized_pnl_raws
+    cdef list _commissions
+    cdef list _fills
+
+    cdef readonly PositionId position_id
+    """The position ID for the snapshots.\n\n:returns: `PositionId`"""
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the snapshots.\n\n:returns: `InstrumentId`"""
+
+    cpdef void append(self, Position position)
+    cpdef int count(self)
+    cpdef Position materialize(self, int index)
+    cpdef list materialize_all(self)
+    cpdef Money realized_pnl(self, int index)
+    cpdef Money total_realized_pnl(self)
+    cpdef list commissions(self, int index)
+    cpdef list ts_opened(self)
+    cpdef list ts_closed(self)
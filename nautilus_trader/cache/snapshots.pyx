@@ -0,0 +1,243 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import uuid
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.model.identifiers cimport PositionId
+from nautilus_trader.model.objects cimport Currency
+from nautilus_trader.model.objects cimport Money
+from nautilus_trader.model.position cimport Position
+
+
+cdef class PositionSnapshots:
+    """
+    Provides compact columnar storage for the snapshots of a position ID.
+
+    Rather than a deep copy of each position, a snapshot is recorded as a row of
+    fixed fields (timestamps, realized PnL and commissions as raw values) together
+    with the fill events it was built from. Fill events are immutable, so they are
+    shared with the live position rather than copied.
+
+    The realized PnL is summed as snapshots are appended, and full `Position`
+    objects are only materialized on request by replaying the fills.
+
+    Parameters
+    ----------
+    position : Position
+        The position the snapshots are for.
+
+    """
+
+    def __init__(self, Position position not None) -> None:
+        # Fixed for the position ID (the instrument does not change)
+        self._price_precision = position.price_precision
+        self._size_precision = position.size_precision
+        self._multiplier = position.multiplier
+        self._is_inverse = position.is_inverse
+        self._quote_currency = position.quote_currency
+        self._base_currency = position.base_currency
+        self._settlement_currency = position.settlement_currency
+        self._realized_pnl_raw_total = 0
+        self._has_realized_pnl = False
+
+        # Columns
+        self._ids = []
+        self._ts_opened = []
+        self._ts_closed = []
+        self._realized_pnl_raws = []
+        self._commissions = []
+        self._fills = []
+
+        self.position_id = position.id
+        self.instrument_id = position.instrument_id
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(position_id={self.position_id}, count={len(self._ids)})"
+
+    cpdef void append(self, Position position):
+        """
+        Append a snapshot of the given position in its current state.
+
+        The snapshot position ID will be the position ID appended with a UUID v4 string.
+
+        Parameters
+        ----------
+        position : Position
+            The position to snapshot.
+
+        Raises
+        ------
+        ValueError
+            If `position.id` is not equal to the snapshots position ID.
+
+        """
+        Condition.not_none(position, "position")
+        Condition.equal(position.id, self.position_id, "position.id", "self.position_id")
+
+        cdef Money realized_pnl = position.realized_pnl
+        cdef object realized_pnl_raw = None
+        if realized_pnl is not None:
+            realized_pnl_raw = realized_pnl.raw_int_c()
+            self._realized_pnl_raw_total += realized_pnl_raw
+            self._has_realized_pnl = True
+
+        cdef Money commission
+        cdef tuple commissions = tuple([(commission.currency, commission.raw_int_c()) for commission in position._commissions.values()])
+
+        self._ids.append(f"{position.id.to_str()}-{uuid.uuid4()}")
+        self._ts_opened.append(position.ts_opened)
+        self._ts_closed.append(position.ts_closed)
+        self._realized_pnl_raws.append(realized_pnl_raw)
+        self._commissions.append(commissions)
+        self._fills.append(tuple(position._events))  # Fills are immutable so are shared
+
+    cpdef int count(self):
+        """
+        Return the count of snapshots.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._ids)
+
+    cpdef Position materialize(self, int index):
+        """
+        Return the snapshot at the given index as a position.
+
+        Parameters
+        ----------
+        index : int
+            The snapshot index.
+
+        Returns
+        -------
+        Position
+
+        Raises
+        ------
+        IndexError
+            If `index` is out of range.
+
+        """
+        cdef Position position = Position.from_fills_c(
+            list(self._fills[index]),
+            self._price_precision,
+            self._size_precision,
+            self._multiplier,
+            self._is_inverse,
+            self._quote_currency,
+            self._base_currency,
+            self._settlement_currency,
+        )
+        position.id = PositionId(self._ids[index])
+        return position
+
+    cpdef list materialize_all(self):
+        """
+        Return all snapshots as positions.
+
+        Returns
+        -------
+        list[Position]
+
+        """
+        return [self.materialize(i) for i in range(len(self._ids))]
+
+    cpdef Money realized_pnl(self, int index):
+        """
+        Return the realized PnL for the snapshot at the given index.
+
+        Parameters
+        ----------
+        index : int
+            The snapshot index.
+
+        Returns
+        -------
+        Money or ``None``
+
+        Raises
+        ------
+        IndexError
+            If `index` is out of range.
+
+        """
+        raw = self._realized_pnl_raws[index]
+        if raw is None:
+            return None
+
+        return Money.from_raw_c(raw, self._settlement_currency)
+
+    cpdef Money total_realized_pnl(self):
+        """
+        Return the total realized PnL for all snapshots.
+
+        Returns
+        -------
+        Money or ``None``
+            ``None`` if no snapshot has a realized PnL.
+
+        """
+        if not self._has_realized_pnl:
+            return None
+
+        return Money.from_raw_c(self._realized_pnl_raw_total, self._settlement_currency)
+
+    cpdef list commissions(self, int index):
+        """
+        Return the commissions for the snapshot at the given index.
+
+        Parameters
+        ----------
+        index : int
+            The snapshot index.
+
+        Returns
+        -------
+        list[Money]
+
+        Raises
+        ------
+        IndexError
+            If `index` is out of range.
+
+        """
+        cdef Currency currency
+        return [Money.from_raw_c(raw, currency) for currency, raw in self._commissions[index]]
+
+    cpdef list ts_opened(self):
+        """
+        Return the UNIX timestamps (nanoseconds) when each snapshot position was opened.
+
+        Returns
+        -------
+        list[uint64_t]
+
+        """
+        return list(self._ts_opened)
+
+    cpdef list ts_closed(self):
+        """
+        Return the UNIX timestamps (nanoseconds) when each snapshot position was closed.
+
+        Returns
+        -------
+        list[uint64_t]
+
+        """
+        return list(self._ts_closed)
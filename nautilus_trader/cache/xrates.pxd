@@ -0,0 +1,33 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.core.rust.model cimport PriceType
+
+
+cdef class ExchangeRateGraph:
+    cdef dict _quotes_bid
+    cdef dict _quotes_ask
+    cdef dict _adjacency
+    cdef dict _rates
+    cdef dict _dependents
+
+    cpdef void update(self, str base_quote, double bid, double ask)
+    cpdef get_rate(self, str from_currency, str to_currency, PriceType price_type)
+    cpdef int pair_count(self)
+    cpdef int rate_count(self)
+    cpdef void clear(self)
+
+    cdef set _component(self, str currency)
+    cdef void _invalidate(self, str currency)
@@ -0,0 +1,179 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.core import nautilus_pyo3
+
+from nautilus_trader.core.rust.model cimport PriceType
+
+
+cdef class ExchangeRateGraph:
+    """
+    Provides a currency pair graph of the latest quotes for a venue, with memoized
+    exchange rates.
+
+    Quotes are updated incrementally as they arrive, rather than the quote tables
+    being rebuilt for every exchange rate request. A calculated rate is memoized until
+    a pair connected to either of its currencies changes price, or a new pair joins the
+    currencies' component of the graph.
+
+    """
+
+    def __init__(self) -> None:
+        self._quotes_bid: dict[str, float] = {}
+        self._quotes_ask: dict[str, float] = {}
+        self._adjacency: dict[str, set[str]] = {}
+        self._rates: dict[tuple[str, str, int], float] = {}
+        self._dependents: dict[str, set[tuple[str, str, int]]] = {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(pairs={len(self._quotes_bid)}, rates={len(self._rates)})"
+
+    cpdef void update(self, str base_quote, double bid, double ask):
+        """
+        Update the graph with the latest prices for the given currency pair.
+
+        Memoized rates are only invalidated if the prices have changed.
+
+        Parameters
+        ----------
+        base_quote : str
+            The currency pair symbol (e.g. 'AUD/USD').
+        bid : double
+            The latest bid price for the pair.
+        ask : double
+            The latest ask price for the pair.
+
+        """
+        prev_bid = self._quotes_bid.get(base_quote)
+        if prev_bid == bid and self._quotes_ask.get(base_quote) == ask:
+            return  # No change
+
+        cdef str base
+        cdef str quote
+        base, quote = base_quote.split("/", 1)
+
+        if prev_bid is None:
+            # New pair joins the graph
+            self._adjacency.setdefault(base, set()).add(quote)
+            self._adjacency.setdefault(quote, set()).add(base)
+
+        self._quotes_bid[base_quote] = bid
+        self._quotes_ask[base_quote] = ask
+
+        self._invalidate(base)
+        self._invalidate(quote)
+
+    cpdef get_rate(self, str from_currency, str to_currency, PriceType price_type):
+        """
+        Return the exchange rate between the given currencies.
+
+        If the exchange rate cannot be calculated then returns ``None``.
+
+        Parameters
+        ----------
+        from_currency : str
+            The currency code to convert from.
+        to_currency : str
+            The currency code to convert to.
+        price_type : PriceType
+            The price type for the exchange rate.
+
+        Returns
+        -------
+        float or ``None``
+
+        Raises
+        ------
+        ValueError
+            If `price_type` is ``LAST`` or ``MARK``.
+
+        """
+        cdef tuple key = (from_currency, to_currency, price_type)
+        rate = self._rates.get(key)
+        if rate is not None:
+            return rate
+
+        rate = nautilus_pyo3.get_exchange_rate(
+            from_currency=from_currency,
+            to_currency=to_currency,
+            price_type=nautilus_pyo3.PriceType.from_int(price_type),
+            quotes_bid=self._quotes_bid,
+            quotes_ask=self._quotes_ask,
+        )
+        if rate is None:
+            return None  # Not memoized, a later pair may connect the currencies
+
+        # Only pairs in the same component can contribute to the rate
+        self._rates[key] = rate
+        cdef str currency
+        for currency in self._component(from_currency):
+            self._dependents.setdefault(currency, set()).add(key)
+
+        return rate
+
+    cpdef int pair_count(self):
+        """
+        Return the count of currency pairs in the graph.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._quotes_bid)
+
+    cpdef int rate_count(self):
+        """
+        Return the count of memoized exchange rates.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._rates)
+
+    cpdef void clear(self):
+        """
+        Clear all pairs and memoized exchange rates from the graph.
+        """
+        self._quotes_bid.clear()
+        self._quotes_ask.clear()
+        self._adjacency.clear()
+        self._rates.clear()
+        self._dependents.clear()
+
+    cdef set _component(self, str currency):
+        cdef set visited = {currency}
+        cdef list stack = [currency]
+        cdef str node
+        cdef str neighbor
+        while stack:
+            node = stack.pop()
+            for neighbor in self._adjacency.get(node, ()):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    stack.append(neighbor)
+
+        return visited
+
+    cdef void _invalidate(self, str currency):
+        cdef set keys = self._dependents.pop(currency, None)
+        if not keys:
+            return
+
+        cdef tuple key
+        for key in keys:
+            self._rates.pop(key, None)
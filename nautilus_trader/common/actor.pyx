@@ -1292,6 +1292,7 @@ cdef class Actor(Component):
         bint managed = True,
         bint pyo3_conversion = False,
         dict[str, object] params = None,
+        int conflate_interval_ms = 0,
     ):
         """
         Subscribe to the order book data stream, being a snapshot then deltas
@@ -1300,6 +1301,11 @@ cdef class Actor(Component):
         Once subscribed, any matching order book data published on the message bus is forwarded
         to the `on_order_book_deltas` handler.
 
+        If `conflate_interval_ms` is positive then the deltas received within each interval
+        are coalesced by the `DataEngine` into the latest state per book level (or order for
+        L3 MBO books), and forwarded as a single `OrderBookDeltas` per interval. The order book
+        managed by the data engine is still updated from every delta.
+
         Parameters
         ----------
         instrument_id : InstrumentId
@@ -1318,20 +1324,37 @@ cdef class Actor(Component):
             prior to being passed to the `on_order_book_deltas` handler.
         params : dict[str, Any], optional
             Additional parameters potentially used by a specific client.
+        conflate_interval_ms : int, default 0
+            The interval (milliseconds) over which deltas are conflated (0 for no conflation).
+
+        Raises
+        ------
+        ValueError
+            If `conflate_interval_ms` is negative (< 0).
 
         """
         Condition.not_none(instrument_id, "instrument_id")
+        Condition.not_negative_int(conflate_interval_ms, "conflate_interval_ms")
         Condition.is_true(self.trader_id is not None, "The actor has not been registered")
 
         if pyo3_conversion:
             self._pyo3_conversion_types.add(OrderBookDeltas)
 
-        self._msgbus.subscribe(
-            topic=f"data.book.deltas"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol.topic()}",
-            handler=self.handle_order_book_deltas,
-        )
+        if conflate_interval_ms > 0:
+            self._msgbus.subscribe(
+                topic=f"data.book.conflated"
+                      f".{instrument_id.venue}"
+                      f".{instrument_id.symbol.topic()}"
+                      f".{conflate_interval_ms}",
+                handler=self.handle_order_book_deltas,
+            )
+        else:
+            self._msgbus.subscribe(
+                topic=f"data.book.deltas"
+                      f".{instrument_id.venue}"
+                      f".{instrument_id.symbol.topic()}",
+                handler=self.handle_order_book_deltas,
+            )
 
         cdef SubscribeOrderBook command = SubscribeOrderBook(
             instrument_id=instrument_id,
@@ -1340,6 +1363,7 @@ cdef class Actor(Component):
             managed=managed,
             interval_ms=1000,
             only_deltas=True,
+            conflate_interval_ms=conflate_interval_ms,
             client_id=client_id,
             venue=instrument_id.venue,
             command_id=UUID4(),
@@ -1869,6 +1893,7 @@ cdef class Actor(Component):
         InstrumentId instrument_id,
         ClientId client_id = None,
         dict[str, object] params = None,
+        int conflate_interval_ms = 0,
     ):
         """
         Unsubscribe the order book deltas stream for the given instrument ID.
@@ -1882,17 +1907,29 @@ cdef class Actor(Component):
             If ``None`` then will be inferred from the venue in the instrument ID.
         params : dict[str, Any], optional
             Additional parameters potentially used by a specific client.
+        conflate_interval_ms : int, default 0
+            The conflation interval (milliseconds) of the subscription (must match
+            the previously subscribed interval).
 
         """
         Condition.not_none(instrument_id, "instrument_id")
         Condition.is_true(self.trader_id is not None, "The actor has not been registered")
 
-        self._msgbus.unsubscribe(
-            topic=f"data.book.deltas"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol.topic()}",
-            handler=self.handle_order_book_deltas,
-        )
+        if conflate_interval_ms > 0:
+            self._msgbus.unsubscribe(
+                topic=f"data.book.conflated"
+                      f".{instrument_id.venue}"
+                      f".{instrument_id.symbol.topic()}"
+                      f".{conflate_interval_ms}",
+                handler=self.handle_order_book_deltas,
+            )
+        else:
+            self._msgbus.unsubscribe(
+                topic=f"data.book.deltas"
+                      f".{instrument_id.venue}"
+                      f".{instrument_id.symbol.topic()}",
+                handler=self.handle_order_book_deltas,
+            )
 
         cdef UnsubscribeOrderBook command = UnsubscribeOrderBook(
             instrument_id=instrument_id,
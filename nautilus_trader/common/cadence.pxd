@@ -0,0 +1,77 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.common.component cimport Clock
+from nautilus_trader.common.component cimport TimeEvent
+
+
+cdef class TradingSessionCalendar:
+    cdef object _tz
+    cdef list _sessions
+    cdef set _holidays
+    cdef uint64_t _day_start_ns
+    cdef uint64_t _day_end_ns
+    cdef list _day_intervals
+
+    cdef readonly str name
+    """The name of the calendar.\n\n:returns: `str`"""
+
+    cpdef bint is_open(self, uint64_t ts_ns)
+    cdef void _load_day(self, uint64_t ts_ns)
+
+
+cdef class Cadence:
+    cdef tuple _callbacks
+    cdef dict _suppressed_callbacks
+
+    cdef readonly str name
+    """The name of the cadence (also the clock timer name).\n\n:returns: `str`"""
+    cdef readonly uint64_t interval_ns
+    """The interval (nanoseconds) between firings.\n\n:returns: `uint64_t`"""
+    cdef readonly TradingSessionCalendar calendar
+    """The trading session calendar which suppresses firings outside sessions.\n\n:returns: `TradingSessionCalendar` or ``None``"""
+    cdef readonly uint64_t fire_count
+    """The count of firings fanned out to subscribers.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t suppressed_count
+    """The count of firings suppressed outside trading sessions.\n\n:returns: `uint64_t`"""
+
+    cpdef list subscribers(self)
+    cdef void _add(self, callback, suppressed_callback)
+    cdef bint _remove(self, callback)
+    cpdef void fire(self, TimeEvent event)
+
+
+cdef class CadenceScheduler:
+    cdef Clock _clock
+    cdef dict _cadences
+    cdef dict _cadence_names
+
+    cpdef str subscribe(
+        self,
+        uint64_t interval_ns,
+        callback,
+        uint64_t start_time_ns=*,
+        TradingSessionCalendar calendar=*,
+        suppressed_callback=*,
+    )
+    cdef str _unique_name(self, uint64_t interval_ns, uint64_t phase_ns, TradingSessionCalendar calendar)
+    cpdef void unsubscribe(self, str name, callback)
+    cpdef Cadence cadence(self, str name)
+    cpdef list cadence_names(self)
+    cpdef uint64_t next_time_ns(self, str name)
+    cpdef void cancel_all(self)
+    cdef void _remove_name(self, str name)
@@ -0,0 +1,434 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from datetime import date
+from datetime import time
+from datetime import timedelta
+
+import pytz
+
+from cpython.datetime cimport datetime
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.common.component cimport Clock
+from nautilus_trader.common.component cimport TimeEvent
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.datetime cimport dt_to_unix_nanos
+
+
+cdef class TradingSessionCalendar:
+    """
+    Represents a weekly trading session calendar in a local timezone.
+
+    A firing at time `t` is within a session if `open < t <= close`, so the close of
+    the final interval in a session (e.g. the last bar) fires, while the close of an
+    interval ending at the session open does not. A session with a close time at or
+    before its open time ends on the following day.
+
+    Parameters
+    ----------
+    name : str
+        The name of the calendar.
+    sessions : list[tuple[int, datetime.time, datetime.time]]
+        The weekly sessions as (weekday, open, close), where weekday is 0 for Monday
+        through to 6 for Sunday, and open and close are local times.
+    tz : str, default 'UTC'
+        The timezone for the session times.
+    holidays : list[datetime.date], optional
+        The local dates on which sessions which open are closed.
+
+    Raises
+    ------
+    ValueError
+        If `name` is not a valid string.
+    ValueError
+        If `sessions` is empty.
+    ValueError
+        If any session weekday is not in the range [0, 6].
+
+    """
+
+    def __init__(
+        self,
+        str name not None,
+        list sessions not None,
+        str tz = "UTC",
+        list holidays = None,
+    ) -> None:
+        Condition.valid_string(name, "name")
+        Condition.not_empty(sessions, "sessions")
+
+        cdef:
+            int weekday
+        for weekday, open_time, close_time in sessions:
+            Condition.in_range_int(weekday, 0, 6, "weekday")
+            Condition.type(open_time, time, "open_time")
+            Condition.type(close_time, time, "close_time")
+
+        self._tz = pytz.timezone(tz)
+        self._sessions = list(sessions)
+        self._holidays = set(holidays or [])
+        self._day_start_ns = 0
+        self._day_end_ns = 0
+        self._day_intervals = []
+
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name}, sessions={len(self._sessions)}, tz={self._tz.zone})"
+
+    cpdef bint is_open(self, uint64_t ts_ns):
+        """
+        Return whether the given time is within a trading session.
+
+        Parameters
+        ----------
+        ts_ns : uint64_t
+            UNIX timestamp (nanoseconds) to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        if ts_ns <= self._day_start_ns or ts_ns > self._day_end_ns:
+            self._load_day(ts_ns)
+
+        cdef:
+            uint64_t open_ns
+            uint64_t close_ns
+        for open_ns, close_ns in self._day_intervals:
+            if open_ns < ts_ns <= close_ns:
+                return True
+
+        return False
+
+    cdef void _load_day(self, uint64_t ts_ns):
+        # Resolve the session intervals relevant to the local day of `ts_ns` (which
+        # includes sessions opening on the prior day), cached until time leaves the day.
+        # Days are treated as (start, end] to match session intervals.
+        cdef uint64_t ts_day_ns = ts_ns - 1 if ts_ns > 0 else 0
+        cdef datetime local = datetime.fromtimestamp(ts_day_ns // 1_000_000_000, self._tz)
+        cdef object day = local.date()
+        cdef list intervals = []
+        cdef object session_day
+        cdef datetime open_dt
+        cdef datetime close_dt
+        cdef int weekday
+        for session_day in (day - timedelta(days=1), day):
+            if session_day in self._holidays:
+                continue
+            for weekday, open_time, close_time in self._sessions:
+                if session_day.weekday() != weekday:
+                    continue
+                open_dt = self._tz.localize(datetime.combine(session_day, open_time))
+                if close_time <= open_time:
+                    close_dt = self._tz.localize(datetime.combine(session_day + timedelta(days=1), close_time))
+                else:
+                    close_dt = self._tz.localize(datetime.combine(session_day, close_time))
+                intervals.append((dt_to_unix_nanos(open_dt), dt_to_unix_nanos(close_dt)))
+
+        self._day_intervals = intervals
+        self._day_start_ns = dt_to_unix_nanos(self._tz.localize(datetime.combine(day, time())))
+        self._day_end_ns = dt_to_unix_nanos(self._tz.localize(datetime.combine(day + timedelta(days=1), time())))
+
+
+cdef class Cadence:
+    """
+    Represents a shared timer cadence which fans out each firing to its subscribers.
+
+    Firings outside a trading session for the calendar are not passed to the
+    subscriber callbacks, instead each subscriber is notified through its optional
+    suppressed callback (so it can discard state and advance to the next firing).
+
+    Parameters
+    ----------
+    name : str
+        The name of the cadence (also the clock timer name).
+    interval_ns : uint64_t
+        The interval (nanoseconds) between firings.
+    calendar : TradingSessionCalendar, optional
+        The trading session calendar which suppresses firings outside sessions.
+
+    """
+
+    def __init__(
+        self,
+        str name not None,
+        uint64_t interval_ns,
+        TradingSessionCalendar calendar = None,
+    ) -> None:
+        self._callbacks = ()
+        self._suppressed_callbacks = {}
+
+        self.name = name
+        self.interval_ns = interval_ns
+        self.calendar = calendar
+        self.fire_count = 0
+        self.suppressed_count = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"name={self.name}, "
+            f"interval_ns={self.interval_ns}, "
+            f"subscribers={len(self._callbacks)})"
+        )
+
+    cpdef list subscribers(self):
+        """
+        Return the subscriber callbacks for the cadence.
+
+        Returns
+        -------
+        list[Callable[[TimeEvent], None]]
+
+        """
+        return list(self._callbacks)
+
+    cdef void _add(self, callback, suppressed_callback):
+        # Callbacks are held in an immutable tuple so that subscribers can be
+        # added or removed from within a callback during a fan out.
+        self._callbacks = self._callbacks + (callback,)
+        if suppressed_callback is not None:
+            self._suppressed_callbacks[callback] = suppressed_callback
+
+    cdef bint _remove(self, callback):
+        cdef list callbacks = list(self._callbacks)
+        if callback not in callbacks:
+            return False
+
+        callbacks.remove(callback)
+        self._callbacks = tuple(callbacks)
+        self._suppressed_callbacks.pop(callback, None)
+        return True
+
+    cpdef void fire(self, TimeEvent event):
+        """
+        Fan out the given time event to all subscribers.
+
+        If the event is outside a trading session for the calendar then it is suppressed,
+        and passed to the suppressed callbacks of the subscribers instead.
+
+        Parameters
+        ----------
+        event : TimeEvent
+            The time event for the firing.
+
+        """
+        if self.calendar is not None and not self.calendar.is_open(event.ts_event):
+            self.suppressed_count += 1
+            for callback in self._callbacks:
+                suppressed_callback = self._suppressed_callbacks.get(callback)
+                if suppressed_callback is not None:
+                    suppressed_callback(event)
+            return
+
+        self.fire_count += 1
+
+        for callback in self._callbacks:
+            callback(event)
+
+
+cdef class CadenceScheduler:
+    """
+    Provides a scheduler for shared timer cadences on a clock.
+
+    Many subscribers can attach to the same cadence (for example every one minute
+    boundary), which is driven by a single clock timer. Each firing produces one
+    `TimeEvent` which is fanned out to all subscribers in subscription order, rather
+    than a timer and event per subscriber. Cadences are keyed by interval, phase
+    (the start time modulo the interval) and calendar instance.
+
+    Parameters
+    ----------
+    clock : Clock
+        The clock for the cadence timers.
+
+    """
+
+    def __init__(self, Clock clock not None) -> None:
+        self._clock = clock
+        self._cadences: dict[str, Cadence] = {}
+        self._cadence_names: dict[tuple, str] = {}
+
+    cpdef str subscribe(
+        self,
+        uint64_t interval_ns,
+        callback,
+        uint64_t start_time_ns = 0,
+        TradingSessionCalendar calendar = None,
+        suppressed_callback = None,
+    ):
+        """
+        Subscribe the given callback to the cadence for the given interval.
+
+        The cadence timer is created on the first subscription.
+
+        Parameters
+        ----------
+        interval_ns : uint64_t
+            The interval (nanoseconds) between firings.
+        callback : Callable[[TimeEvent], None]
+            The callback to receive the time events.
+        start_time_ns : uint64_t, default 0
+            The UNIX timestamp (nanoseconds) which the cadence is aligned to, the first
+            firing is at the next interval boundary after it. If zero then the time now.
+            For an existing cadence this only determines the phase.
+        calendar : TradingSessionCalendar, optional
+            The trading session calendar which suppresses firings outside sessions.
+        suppressed_callback : Callable[[TimeEvent], None], optional
+            The callback to receive the time events suppressed by the calendar.
+
+        Returns
+        -------
+        str
+            The cadence name (also the clock timer name).
+
+        Raises
+        ------
+        ValueError
+            If `interval_ns` is not positive (> 0).
+        TypeError
+            If `callback` is not of type `Callable`.
+        TypeError
+            If `suppressed_callback` is not of type `Callable` or ``None``.
+
+        """
+        Condition.positive_int(interval_ns, "interval_ns")
+        Condition.callable(callback, "callback")
+        Condition.callable_or_none(suppressed_callback, "suppressed_callback")
+
+        if start_time_ns == 0:
+            start_time_ns = self._clock.timestamp_ns()
+
+        # Cadences are keyed on the calendar instance, as distinct calendars may share a name
+        cdef tuple key = (interval_ns, start_time_ns % interval_ns, calendar)
+        cdef str name = self._cadence_names.get(key)
+        cdef Cadence cadence = self._cadences.get(name) if name is not None else None
+        if cadence is None:
+            name = self._unique_name(interval_ns, start_time_ns % interval_ns, calendar)
+            cadence = Cadence(name, interval_ns, calendar)
+            self._clock.set_timer_ns(
+                name=name,
+                interval_ns=interval_ns,
+                start_time_ns=start_time_ns,
+                stop_time_ns=0,
+                callback=cadence.fire,
+            )
+            self._cadences[name] = cadence
+            self._cadence_names[key] = name
+
+        cadence._add(callback, suppressed_callback)
+        return name
+
+    cdef str _unique_name(self, uint64_t interval_ns, uint64_t phase_ns, TradingSessionCalendar calendar):
+        cdef str name = f"CADENCE-{interval_ns}-{phase_ns}"
+        if calendar is None:
+            return name
+
+        name += f"-{calendar.name}"
+        cdef str unique_name = name
+        cdef int count = 1
+        while unique_name in self._cadences:
+            count += 1
+            unique_name = f"{name}-{count}"
+
+        return unique_name
+
+    cpdef void unsubscribe(self, str name, callback):
+        """
+        Unsubscribe the given callback from the cadence with the given name.
+
+        The cadence timer is canceled when the last subscriber is removed.
+
+        Parameters
+        ----------
+        name : str
+            The cadence name.
+        callback : Callable[[TimeEvent], None]
+            The callback to unsubscribe.
+
+        """
+        cdef Cadence cadence = self._cadences.get(name)
+        if cadence is None or not cadence._remove(callback):
+            return
+
+        if not cadence._callbacks:
+            del self._cadences[name]
+            self._remove_name(name)
+            if name in self._clock.timer_names:
+                self._clock.cancel_timer(name)
+
+    cpdef Cadence cadence(self, str name):
+        """
+        Return the cadence with the given name (if found).
+
+        Parameters
+        ----------
+        name : str
+            The cadence name.
+
+        Returns
+        -------
+        Cadence or ``None``
+
+        """
+        return self._cadences.get(name)
+
+    cpdef list cadence_names(self):
+        """
+        Return the names of all active cadences.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        return list(self._cadences.keys())
+
+    cpdef uint64_t next_time_ns(self, str name):
+        """
+        Return the next firing time for the cadence with the given name.
+
+        Parameters
+        ----------
+        name : str
+            The cadence name.
+
+        Returns
+        -------
+        uint64_t
+
+        """
+        return self._clock.next_time_ns(name)
+
+    cpdef void cancel_all(self):
+        """
+        Cancel all cadences and their timers.
+        """
+        cdef str name
+        for name in list(self._cadences.keys()):
+            if name in self._clock.timer_names:
+                self._clock.cancel_timer(name)
+
+        self._cadences.clear()
+        self._cadence_names.clear()
+
+    cdef void _remove_name(self, str name):
+        for key, cadence_name in list(self._cadence_names.items()):
+            if cadence_name == name:
+                del self._cadence_names[key]
+                return
@@ -169,6 +169,8 @@ cpdef LogGuard init_logging(
     bint print_config=*,
     uint64_t max_file_size=*,
     uint32_t max_backup_count=*,
+    dict component_rate_limits=*,
+    uint32_t buffer_size=*,
 )
 
 # Global static to flag if pyo3 based logging is initialized
@@ -180,7 +182,21 @@ cpdef void set_logging_pyo3(bint value)
 cdef class Logger:
     cdef str _name
     cdef const char* _name_ptr
-
+    cdef uint64_t _config_version
+    cdef int _threshold
+    cdef int _rate_limit
+    cdef uint64_t _window_start_ns
+    cdef int _window_count
+    cdef int _window_suppressed
+
+    cdef readonly uint64_t suppressed
+    """The total count of records suppressed by the rate limit.\n\n:returns: `uint64_t`"""
+
+    cdef void _refresh_filters(self)
+    cpdef bint is_enabled(self, LogLevel level)
+    cdef bint _admit(self, LogLevel level)
+    cdef void _write(self, LogLevel level, LogColor color, str message, tuple args)
+    cdef void _log(self, LogLevel level, LogColor color, str message, tuple args)
     cpdef void debug(self, str message, LogColor color=*)
     cpdef void info(self, str message, LogColor color=*)
     cpdef void warning(self, str message, LogColor color=*)
@@ -188,6 +204,36 @@ cdef class Logger:
     cpdef void exception(self, str message, ex)
 
 
+cdef class BufferedLogWriter:
+    cdef object _queue
+    cdef object _wake
+    cdef object _lock
+    cdef object _thread
+    cdef str _name
+    cdef const char* _name_ptr
+    cdef int _dropped_pending
+
+    cdef readonly int capacity
+    """The maximum number of queued records.\n\n:returns: `int`"""
+    cdef readonly int batch_size
+    """The count of queued records which triggers a flush.\n\n:returns: `int`"""
+    cdef readonly int flush_interval_ms
+    """The maximum interval (milliseconds) between flushes.\n\n:returns: `int`"""
+    cdef readonly bint is_running
+    """If the background writer thread is running.\n\n:returns: `bool`"""
+    cdef readonly uint64_t dropped
+    """The total count of records dropped as the queue was full.\n\n:returns: `uint64_t`"""
+
+    cpdef void start(self)
+    cpdef void stop(self)
+    cdef bint enqueue(self, uint64_t ts, Logger logger, LogLevel level, LogColor color, str message)
+    cpdef void flush(self)
+
+
+cpdef void start_log_writer(BufferedLogWriter writer)
+cpdef void stop_log_writer()
+
+
 cpdef void log_header(
     TraderId trader_id,
     str machine_id,
@@ -357,3 +403,57 @@ cdef class Throttler:
     cpdef void _process(self, TimeEvent event)
     cpdef void _resume(self, TimeEvent event)
     cdef void _send_msg(self, msg)
+
+
+cdef class SlidingWindow:
+    cdef object _timestamps
+
+    cdef readonly int limit
+    """The event limit for the window (per interval).\n\n:returns: `int`"""
+    cdef readonly uint64_t interval_ns
+    """The interval (nanoseconds) of the window.\n\n:returns: `uint64_t`"""
+
+    cpdef uint64_t delay_ns(self, uint64_t now_ns)
+    cpdef void consume(self, uint64_t now_ns)
+    cpdef double used(self, uint64_t now_ns)
+    cpdef void reset(self)
+
+
+cdef class MultiThrottler:
+    cdef Clock _clock
+    cdef Logger _log
+    cdef list _windows
+    cdef list _key_limits
+    cdef dict _key_windows
+    cdef dict _buffers
+    cdef object _ready
+    cdef str _timer_name
+    cdef uint64_t _timer_ns
+    cdef int _qsize
+    cdef object _key_func
+    cdef object _output_send
+    cdef object _output_drop
+
+    cdef readonly str name
+    """The name of the throttler.\n\n:returns: `str`"""
+    cdef readonly list limits
+    """The (limit, interval) windows for all messages.\n\n:returns: `list[tuple[int, timedelta]]`"""
+    cdef readonly list key_limits
+    """The (limit, interval) windows applied per key.\n\n:returns: `list[tuple[int, timedelta]]`"""
+    cdef readonly bint is_limiting
+    """If the throttler is currently limiting messages (buffering or dropping).\n\n:returns: `bool`"""
+    cdef readonly int recv_count
+    """The count of messages received by the throttler.\n\n:returns: `int`"""
+    cdef readonly int sent_count
+    """The count of messages sent from the throttler.\n\n:returns: `int`"""
+
+    cpdef void reset(self)
+    cpdef double used(self)
+    cpdef void send(self, msg)
+    cdef list _windows_for_key(self, key)
+    cdef uint64_t _delay(self, list windows, uint64_t now_ns)
+    cdef void _consume(self, list windows, uint64_t now_ns)
+    cdef void _buffer_msg(self, key, msg, uint64_t delay_ns)
+    cdef void _set_timer(self, uint64_t alert_time_ns)
+    cpdef void _process(self, TimeEvent event)
+    cdef void _send_msg(self, msg)
@@ -17,6 +17,8 @@ import asyncio
 import copy
 import socket
 import sys
+import threading
+import time
 import traceback
 from collections import deque
 from typing import Any
@@ -83,6 +85,7 @@ from nautilus_trader.core.rust.common cimport log_level_from_cstr
 from nautilus_trader.core.rust.common cimport log_level_to_cstr
 from nautilus_trader.core.rust.common cimport logger_drop
 from nautilus_trader.core.rust.common cimport logger_log
+from nautilus_trader.core.rust.common cimport logger_log_with_timestamp
 from nautilus_trader.core.rust.common cimport logging_clock_set_realtime_mode
 from nautilus_trader.core.rust.common cimport logging_clock_set_static_mode
 from nautilus_trader.core.rust.common cimport logging_clock_set_static_time
@@ -1064,15 +1067,33 @@ REQ = "[REQ]"
 RES = "[RES]"
 
 
+# The logging clock state mirrored from the core, so buffered records can be stamped
+# with the time they were created rather than the time they are flushed
+cdef bint _log_clock_realtime = True
+cdef uint64_t _log_clock_static_ns = 0
+
+
+cdef uint64_t _log_clock_time_ns():
+    if _log_clock_realtime:
+        return time.time_ns()
+    return _log_clock_static_ns
+
+
 cdef void set_logging_clock_realtime_mode():
+    global _log_clock_realtime
+    _log_clock_realtime = True
     logging_clock_set_realtime_mode()
 
 
 cdef void set_logging_clock_static_mode():
+    global _log_clock_realtime
+    _log_clock_realtime = False
     logging_clock_set_static_mode()
 
 
 cdef void set_logging_clock_static_time(uint64_t time_ns):
+    global _log_clock_static_ns
+    _log_clock_static_ns = time_ns
     logging_clock_set_static_time(time_ns)
 
 
@@ -1100,10 +1121,244 @@ cdef class LogGuard:
     """
 
     def __del__(self) -> None:
+        stop_log_writer()
         if self._mem._0 != NULL:
             logger_drop(self._mem)
 
 
+# The level threshold for loggers when all output is disabled (above ERROR)
+cdef int LOG_THRESHOLD_DISABLED = LogLevel.ERROR + 1
+
+# Logging filter state mirrored from the core logging config, so records which would
+# be filtered are dropped before any formatting or FFI call. Loggers cache their own
+# threshold and rate limit, and refresh them when the config version changes.
+cdef int _log_threshold = LogLevel.OFF
+cdef dict _log_component_thresholds = {}
+cdef dict _log_component_rate_limits = {}
+cdef uint64_t _log_config_version = 0
+cdef BufferedLogWriter _log_writer = None
+
+
+cdef class BufferedLogWriter:
+    """
+    Provides a batched background writer for log records.
+
+    Records are placed on a bounded queue by the logging thread and written to the
+    core logging system in batches by a background thread, so the FFI call is moved
+    off the hot path. Each record is stamped with the logging clock time and its
+    message formatted when it is queued, so it is written as it was at that time.
+
+    Only records below ``WARNING`` level are queued, warnings and errors are always
+    written directly. When the queue is full new records are dropped, and a summary
+    of the dropped count is logged on the next flush.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of queued records.
+    batch_size : int, default 512
+        The count of queued records which triggers a flush.
+    flush_interval_ms : int, default 100
+        The maximum interval (milliseconds) between flushes.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+    ValueError
+        If `batch_size` is not positive (> 0).
+    ValueError
+        If `flush_interval_ms` is not positive (> 0).
+
+    """
+
+    def __init__(
+        self,
+        int capacity,
+        int batch_size = 512,
+        int flush_interval_ms = 100,
+    ) -> None:
+        Condition.positive_int(capacity, "capacity")
+        Condition.positive_int(batch_size, "batch_size")
+        Condition.positive_int(flush_interval_ms, "flush_interval_ms")
+
+        self._queue = deque()
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._name = type(self).__name__
+        self._name_ptr = pystr_to_cstr(self._name)
+        self._dropped_pending = 0
+
+        self.capacity = capacity
+        self.batch_size = min(batch_size, capacity)
+        self.flush_interval_ms = flush_interval_ms
+        self.is_running = False
+        self.dropped = 0
+
+    @property
+    def queued(self) -> int:
+        """
+        Return the count of records currently queued.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._queue)
+
+    cpdef void start(self):
+        """
+        Start the background writer thread.
+        """
+        if self.is_running:
+            return
+
+        self.is_running = True
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    cpdef void stop(self):
+        """
+        Stop the background writer thread, flushing all queued records.
+        """
+        if not self.is_running:
+            return
+
+        self.is_running = False
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        self.flush()
+
+    cdef bint enqueue(self, uint64_t ts, Logger logger, LogLevel level, LogColor color, str message):
+        if len(self._queue) >= self.capacity:
+            self.dropped += 1
+            self._dropped_pending += 1
+            return False
+
+        self._queue.append((ts, logger, level, color, message))
+        if len(self._queue) >= self.batch_size:
+            self._wake.set()
+
+        return True
+
+    cpdef void flush(self):
+        """
+        Write all queued records to the core logging system.
+        """
+        cdef:
+            tuple record
+            uint64_t ts
+            Logger logger
+            LogLevel level
+            LogColor color
+            str message
+            int dropped
+        with self._lock:  # Serialize flushes from the writer thread and `stop`
+            while self._queue:
+                record = self._queue.popleft()
+                ts, logger, level, color, message = record
+                logger_log_with_timestamp(
+                    ts,
+                    level,
+                    color,
+                    logger._name_ptr,
+                    pystr_to_cstr(message) if message is not None else NULL,
+                )
+
+            dropped = self._dropped_pending
+            if dropped > 0:
+                self._dropped_pending = 0
+                logger_log(
+                    LogLevel.WARNING,
+                    LogColor.YELLOW,
+                    self._name_ptr,
+                    pystr_to_cstr(f"Dropped {dropped} log record(s), queue at capacity {self.capacity}"),
+                )
+
+    def _run(self) -> None:
+        cdef double timeout_secs = self.flush_interval_ms / 1000.0
+        while self.is_running:
+            self._wake.wait(timeout_secs)
+            self._wake.clear()
+            self.flush()
+
+
+cpdef void start_log_writer(BufferedLogWriter writer):
+    """
+    Start the given buffered writer and route all log records through it.
+
+    Any previously running writer is stopped (and flushed) first.
+
+    Parameters
+    ----------
+    writer : BufferedLogWriter
+        The writer to start.
+
+    """
+    Condition.not_none(writer, "writer")
+
+    global _log_writer
+    stop_log_writer()
+    writer.start()
+    _log_writer = writer
+
+
+cpdef void stop_log_writer():
+    """
+    Stop any running buffered writer, flushing all queued records.
+    """
+    global _log_writer
+    if _log_writer is None:
+        return
+
+    cdef BufferedLogWriter writer = _log_writer
+    _log_writer = None
+    writer.stop()
+
+
+cdef void _set_log_filters(
+    LogLevel level_stdout,
+    LogLevel level_file,
+    dict component_levels,
+    dict component_rate_limits,
+    bint bypass,
+):
+    global _log_threshold
+    global _log_component_thresholds
+    global _log_component_rate_limits
+    global _log_config_version
+
+    # Mirrors the core logger: ERROR is always written (to stderr), and an `OFF`
+    # level disables that output, then per component levels filter further.
+    cdef int threshold = LogLevel.ERROR
+    if level_stdout != LogLevel.OFF:
+        threshold = min(threshold, level_stdout)
+    if level_file != LogLevel.OFF:
+        threshold = min(threshold, level_file)
+    if bypass:
+        threshold = LOG_THRESHOLD_DISABLED
+
+    cdef dict component_thresholds = {}
+    cdef int component_level
+    for component, level in (component_levels or {}).items():
+        component_level = log_level_from_str(level) if isinstance(level, str) else level
+        if component_level == LogLevel.OFF:
+            component_thresholds[str(component)] = LOG_THRESHOLD_DISABLED
+        else:
+            component_thresholds[str(component)] = max(threshold, component_level)
+
+    _log_threshold = threshold
+    _log_component_thresholds = component_thresholds
+    _log_component_rate_limits = {
+        str(component): limit for component, limit in (component_rate_limits or {}).items()
+    }
+    _log_config_version += 1
+
+
 cpdef LogGuard init_logging(
     TraderId trader_id = None,
     str machine_id = None,
@@ -1119,6 +1374,8 @@ cpdef LogGuard init_logging(
     bint print_config = False,
     uint64_t max_file_size = 0,
     uint32_t max_backup_count = 5,
+    dict component_rate_limits: dict[ComponentId, int] = None,
+    uint32_t buffer_size = 0,
 ):
     """
     Initialize the logging system.
@@ -1164,6 +1421,13 @@ cpdef LogGuard init_logging(
         If set to 0, file rotation is disabled.
     max_backup_count : uint32_t, default 5
         The maximum number of backup log files to keep when rotating.
+    component_rate_limits : dict[ComponentId, int], optional
+        The per component rate limits, where keys are component IDs and values are
+        the maximum number of records per second (below ERROR level) to log, with
+        excess records suppressed and their count summarized.
+    buffer_size : uint32_t, default 0
+        The capacity of the queue for a batched background log writer.
+        If zero then records are written synchronously.
 
     Returns
     -------
@@ -1201,6 +1465,11 @@ cpdef LogGuard init_logging(
         max_backup_count,
     )
 
+    _set_log_filters(level_stdout, level_file, component_levels, component_rate_limits, bypass)
+
+    if buffer_size > 0:
+        start_log_writer(BufferedLogWriter(buffer_size))
+
     cdef LogGuard log_guard = LogGuard.__new__(LogGuard)
     log_guard._mem = log_guard_api
     return log_guard
@@ -1228,6 +1497,11 @@ cdef class Logger:
     """
     Provides a logger adapter into the logging system.
 
+    Records below the effective level for the logger (from the stdout, file and
+    component levels of the logging config) are dropped before any formatting or
+    FFI call. Use `is_enabled` to guard expensive messages, or `log` for lazily
+    formatted messages.
+
     Parameters
     ----------
     name : str
@@ -1240,6 +1514,13 @@ cdef class Logger:
 
         self._name = name  # Reference to `name` needs to be kept alive
         self._name_ptr = pystr_to_cstr(self._name)
+        self._config_version = 0  # Filters are resolved on first use
+        self._threshold = LogLevel.OFF
+        self._rate_limit = 0
+        self._window_start_ns = 0
+        self._window_count = 0
+        self._window_suppressed = 0
+        self.suppressed = 0
 
     @property
     def name(self) -> str:
@@ -1253,41 +1534,146 @@ cdef class Logger:
         """
         return self._name
 
-    cpdef void debug(
-        self,
-        str message,
-        LogColor color = LogColor.NORMAL,
-    ):
+    cdef void _refresh_filters(self):
+        self._threshold = _log_component_thresholds.get(self._name, _log_threshold)
+        self._rate_limit = _log_component_rate_limits.get(self._name, 0)
+        self._config_version = _log_config_version
+
+    cpdef bint is_enabled(self, LogLevel level):
         """
-        Log the given DEBUG level message.
+        Return whether a record at the given level would be logged.
 
         Parameters
         ----------
-        message : str
-            The log message text (valid UTF-8).
-        color : LogColor, optional
-            The log message color.
+        level : LogLevel
+            The log level to check.
+
+        Returns
+        -------
+        bool
 
         """
         if LOGGING_PYO3:
-            nautilus_pyo3.logger_log(
-                nautilus_pyo3.LogLevel.DEBUG,
-                nautilus_pyo3.LogColor(log_color_to_str(color)),
-                self._name,
-                message,
-            )
-            return
+            return True
 
         if not logging_is_initialized():
+            return False
+
+        if self._config_version != _log_config_version:
+            self._refresh_filters()
+
+        return level >= self._threshold
+
+    cdef bint _admit(self, LogLevel level):
+        # Fixed one second windows per logger, ERROR level records are never suppressed
+        if self._rate_limit <= 0 or level >= LogLevel.ERROR:
+            return True
+
+        cdef uint64_t now_ns = time.monotonic_ns()
+        cdef int suppressed
+        if now_ns - self._window_start_ns >= 1_000_000_000:
+            suppressed = self._window_suppressed
+            self._window_start_ns = now_ns
+            self._window_count = 0
+            self._window_suppressed = 0
+            if suppressed > 0 and LogLevel.WARNING >= self._threshold:
+                self._write(
+                    LogLevel.WARNING,
+                    LogColor.YELLOW,
+                    f"Suppressed {suppressed} log record(s) over rate limit of {self._rate_limit}/s",
+                    None,
+                )
+
+        if self._window_count >= self._rate_limit:
+            self._window_suppressed += 1
+            self.suppressed += 1
+            return False
+
+        self._window_count += 1
+        return True
+
+    cdef void _write(self, LogLevel level, LogColor color, str message, tuple args):
+        if args:
+            message = message.format(*args)
+
+        # Warnings and errors are never queued, so they cannot be delayed or dropped
+        if level < LogLevel.WARNING and _log_writer is not None and _log_writer.is_running:
+            _log_writer.enqueue(_log_clock_time_ns(), self, level, color, message)
             return
 
         logger_log(
-            LogLevel.DEBUG,
+            level,
             color,
             self._name_ptr,
             pystr_to_cstr(message) if message is not None else NULL,
         )
 
+    cdef void _log(self, LogLevel level, LogColor color, str message, tuple args):
+        if LOGGING_PYO3:
+            nautilus_pyo3.logger_log(
+                nautilus_pyo3.LogLevel(log_level_to_str(level)),
+                nautilus_pyo3.LogColor(log_color_to_str(color)),
+                self._name,
+                message.format(*args) if args else message,
+            )
+            return
+
+        if not logging_is_initialized():
+            return
+
+        if self._config_version != _log_config_version:
+            self._refresh_filters()
+
+        if level < self._threshold or not self._admit(level):
+            return
+
+        self._write(level, color, message, args)
+
+    def log(
+        self,
+        LogLevel level,
+        str message not None,
+        *args,
+        LogColor color = LogColor.NORMAL,
+    ) -> None:
+        """
+        Log the given lazily formatted message at the given level.
+
+        The `message` is formatted with `args` (via `str.format`) only if the record
+        is logged, at log time (including when buffered logging is enabled).
+
+        Parameters
+        ----------
+        level : LogLevel
+            The log level.
+        message : str
+            The log message format string (valid UTF-8).
+        *args
+            The arguments for the message format string.
+        color : LogColor, optional
+            The log message color.
+
+        """
+        self._log(level, color, message, args)
+
+    cpdef void debug(
+        self,
+        str message,
+        LogColor color = LogColor.NORMAL,
+    ):
+        """
+        Log the given DEBUG level message.
+
+        Parameters
+        ----------
+        message : str
+            The log message text (valid UTF-8).
+        color : LogColor, optional
+            The log message color.
+
+        """
+        self._log(LogLevel.DEBUG, color, message, None)
+
     cpdef void info(
         self, str message,
         LogColor color = LogColor.NORMAL,
@@ -1303,24 +1689,7 @@ cdef class Logger:
             The log message color.
 
         """
-        if LOGGING_PYO3:
-            nautilus_pyo3.logger_log(
-                nautilus_pyo3.LogLevel.INFO,
-                nautilus_pyo3.LogColor(log_color_to_str(color)),
-                self._name,
-                message,
-            )
-            return
-
-        if not logging_is_initialized():
-            return
-
-        logger_log(
-            LogLevel.INFO,
-            color,
-            self._name_ptr,
-            pystr_to_cstr(message) if message is not None else NULL,
-        )
+        self._log(LogLevel.INFO, color, message, None)
 
     cpdef void warning(
         self,
@@ -1338,24 +1707,7 @@ cdef class Logger:
             The log message color.
 
         """
-        if LOGGING_PYO3:
-            nautilus_pyo3.logger_log(
-                nautilus_pyo3.LogLevel.WARNING,
-                nautilus_pyo3.LogColor(log_color_to_str(color)),
-                self._name,
-                message,
-            )
-            return
-
-        if not logging_is_initialized():
-            return
-
-        logger_log(
-            LogLevel.WARNING,
-            color,
-            self._name_ptr,
-            pystr_to_cstr(message) if message is not None else NULL,
-        )
+        self._log(LogLevel.WARNING, color, message, None)
 
     cpdef void error(
         self,
@@ -1373,24 +1725,7 @@ cdef class Logger:
             The log message color.
 
         """
-        if LOGGING_PYO3:
-            nautilus_pyo3.logger_log(
-                nautilus_pyo3.LogLevel.ERROR,
-                nautilus_pyo3.LogColor(log_color_to_str(color)),
-                self._name,
-                message,
-            )
-            return
-
-        if not logging_is_initialized():
-            return
-
-        logger_log(
-            LogLevel.ERROR,
-            color,
-            self._name_ptr,
-            pystr_to_cstr(message) if message is not None else NULL,
-        )
+        self._log(LogLevel.ERROR, color, message, None)
 
     cpdef void exception(
         self,
@@ -3016,6 +3351,411 @@ cdef class Throttler:
         self.sent_count += 1
 
 
+cdef class SlidingWindow:
+    """
+    Provides a sliding window which admits at most `limit` events in any `interval_ns`.
+
+    The timestamps of the last `limit` events are held in a bounded deque, so the
+    window never admits more than `limit` events over any interval (there is no burst
+    allowance), and checking and updating the window is O(1).
+
+    Parameters
+    ----------
+    limit : int
+        The event limit for the window (per interval).
+    interval_ns : uint64_t
+        The interval (nanoseconds) of the window.
+
+    Raises
+    ------
+    ValueError
+        If `limit` is not positive (> 0).
+    ValueError
+        If `interval_ns` is not positive (> 0).
+
+    """
+
+    def __init__(self, int limit, uint64_t interval_ns) -> None:
+        Condition.positive_int(limit, "limit")
+        Condition.positive_int(interval_ns, "interval_ns")
+
+        self._timestamps = deque(maxlen=limit)
+
+        self.limit = limit
+        self.interval_ns = interval_ns
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(limit={self.limit}, interval_ns={self.interval_ns})"
+
+    cpdef uint64_t delay_ns(self, uint64_t now_ns):
+        """
+        Return the delay until another event will be within the window limit.
+
+        Parameters
+        ----------
+        now_ns : uint64_t
+            UNIX timestamp (nanoseconds) now.
+
+        Returns
+        -------
+        uint64_t
+            Zero if an event is within the limit now.
+
+        """
+        if len(self._timestamps) < self.limit:
+            return 0
+
+        # The oldest event must leave the window before another is admitted
+        cdef uint64_t expiry_ns = <uint64_t>self._timestamps[0] + self.interval_ns
+        if now_ns >= expiry_ns:
+            return 0
+
+        return expiry_ns - now_ns
+
+    cpdef void consume(self, uint64_t now_ns):
+        """
+        Record an event in the window.
+
+        Parameters
+        ----------
+        now_ns : uint64_t
+            UNIX timestamp (nanoseconds) now.
+
+        """
+        self._timestamps.append(now_ns)
+
+    cpdef double used(self, uint64_t now_ns):
+        """
+        Return the proportion of the window limit currently used.
+
+        Parameters
+        ----------
+        now_ns : uint64_t
+            UNIX timestamp (nanoseconds) now.
+
+        Returns
+        -------
+        double
+            [0, 1.0].
+
+        """
+        cdef int count = 0
+        cdef uint64_t ts
+        for ts in reversed(self._timestamps):
+            if ts + self.interval_ns <= now_ns:
+                break
+            count += 1
+
+        return <double>count / <double>self.limit
+
+    cpdef void reset(self):
+        """
+        Reset the window, clearing all events.
+
+        """
+        self._timestamps.clear()
+
+
+cdef class MultiThrottler:
+    """
+    Provides a throttler with several concurrent rate windows and keyed sub-limits,
+    which can either buffer or drop messages.
+
+    Every message must be within all of the `limits` windows, and all of the
+    `key_limits` windows for its key (for example per instrument or per strategy),
+    where the key is given by `key_func`. Each window is tracked with a `SlidingWindow`,
+    so checking and updating the rate is O(1) per window.
+
+    If an `output_drop` handler is provided, then will drop messages which would
+    exceed a rate limit. Otherwise will buffer messages per key until within the
+    rate limits, then send. Buffered messages are drained fairly by key (round-robin),
+    and in order for each key, so that a burst for one key does not starve others.
+
+    Parameters
+    ----------
+    name : str
+        The unique name of the throttler.
+    limits : list[tuple[int, timedelta]]
+        The (limit, interval) windows for all messages.
+    clock : Clock
+        The clock for the throttler.
+    output_send : Callable[[Any], None]
+        The output handler to send messages from the throttler.
+    output_drop : Callable[[Any], None], optional
+        The output handler to drop messages from the throttler.
+        If ``None`` then messages will be buffered.
+    key_limits : list[tuple[int, timedelta]], optional
+        The (limit, interval) windows applied to the messages for each key.
+    key_func : Callable[[Any], Hashable], optional
+        The function to return the key for a message.
+        If ``None`` then all messages share a single key.
+
+    Raises
+    ------
+    ValueError
+        If `name` is not a valid string.
+    ValueError
+        If both `limits` and `key_limits` are empty.
+    ValueError
+        If any limit is not positive (> 0).
+    ValueError
+        If any interval is not positive (> 0).
+    TypeError
+        If `output_send` is not of type `Callable`.
+    TypeError
+        If `output_drop` is not of type `Callable` or ``None``.
+    TypeError
+        If `key_limits` are provided and `key_func` is not of type `Callable`.
+
+    Warnings
+    --------
+    This throttler is not thread-safe and must be called from the same thread as
+    the event loop.
+
+    The internal buffers are unbounded and so a bounded queue should be upstream.
+
+    """
+
+    def __init__(
+        self,
+        str name,
+        list limits not None,
+        Clock clock not None,
+        output_send not None: Callable[[Any], None],
+        output_drop: Callable[[Any], None] | None = None,
+        list key_limits = None,
+        key_func: Callable[[Any], Any] | None = None,
+    ) -> None:
+        if key_limits is None:
+            key_limits = []
+        Condition.valid_string(name, "name")
+        Condition.is_true(limits or key_limits, "both `limits` and `key_limits` were empty")
+        Condition.callable(output_send, "output_send")
+        Condition.callable_or_none(output_drop, "output_drop")
+        if key_limits:
+            Condition.callable(key_func, "key_func")
+
+        cdef int limit
+        cdef timedelta interval
+        for limit, interval in limits + key_limits:
+            Condition.positive_int(limit, "limit")
+            Condition.positive(interval.total_seconds(), "interval.total_seconds()")
+
+        self._clock = clock
+        self._log = Logger(name=f"Throttler-{name}")
+        self._windows = [SlidingWindow(limit, secs_to_nanos(interval.total_seconds())) for limit, interval in limits]
+        self._key_limits = [(limit, secs_to_nanos(interval.total_seconds())) for limit, interval in key_limits]
+        self._key_windows = {}
+        self._buffers = {}      # key -> deque of buffered messages (FIFO)
+        self._ready = deque()   # Keys with buffered messages in round-robin order
+        self._timer_name = f"{name}|WINDOWS"
+        self._timer_ns = 0
+        self._qsize = 0
+        self._key_func = key_func
+        self._output_send = output_send
+        self._output_drop = output_drop
+
+        self.name = name
+        self.limits = list(limits)
+        self.key_limits = list(key_limits)
+        self.is_limiting = False
+        self.recv_count = 0
+        self.sent_count = 0
+
+        self._log.info("READY")
+
+    @property
+    def qsize(self) -> int:
+        """
+        Return the total qsize of the internal buffers.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._qsize
+
+    cpdef void reset(self):
+        """
+        Reset the state of the throttler.
+
+        """
+        if self._timer_ns and self._timer_name in self._clock.timer_names:
+            self._clock.cancel_timer(self._timer_name)
+
+        cdef SlidingWindow window
+        for window in self._windows:
+            window.reset()
+
+        self._key_windows.clear()
+        self._buffers.clear()
+        self._ready.clear()
+        self._timer_ns = 0
+        self._qsize = 0
+        self.is_limiting = False
+        self.recv_count = 0
+        self.sent_count = 0
+
+    cpdef double used(self):
+        """
+        Return the maximum proportion currently used of the `limits` windows.
+
+        Returns
+        -------
+        double
+            [0, 1.0].
+
+        """
+        cdef uint64_t now_ns = self._clock.timestamp_ns()
+        cdef double used = 0.0
+        cdef SlidingWindow window
+        for window in self._windows:
+            used = max(used, window.used(now_ns))
+
+        return used
+
+    cpdef void send(self, msg):
+        """
+        Send the given message through the throttler.
+
+        Parameters
+        ----------
+        msg : object
+            The message to send.
+
+        """
+        self.recv_count += 1
+
+        key = self._key_func(msg) if self._key_func is not None else None
+
+        # Messages behind others for the same key are buffered to preserve order
+        if key in self._buffers:
+            self._buffer_msg(key, msg, 0)
+            return
+
+        cdef uint64_t now_ns = self._clock.timestamp_ns()
+        cdef list key_windows = self._windows_for_key(key)
+        cdef uint64_t delay_ns = max(self._delay(self._windows, now_ns), self._delay(key_windows, now_ns))
+        if delay_ns == 0:
+            self._consume(self._windows, now_ns)
+            self._consume(key_windows, now_ns)
+            self._send_msg(msg)
+            if self._output_drop is not None:
+                self.is_limiting = False
+        elif self._output_drop is not None:
+            self._output_drop(msg)
+            self.is_limiting = True
+            self._log.warning(f"Dropped {msg}")
+        else:
+            self._buffer_msg(key, msg, delay_ns)
+
+    cdef list _windows_for_key(self, key):
+        if not self._key_limits:
+            return []
+
+        cdef list windows = self._key_windows.get(key)
+        if windows is None:
+            windows = [SlidingWindow(limit, interval_ns) for limit, interval_ns in self._key_limits]
+            self._key_windows[key] = windows
+
+        return windows
+
+    cdef uint64_t _delay(self, list windows, uint64_t now_ns):
+        cdef uint64_t delay_ns = 0
+        cdef SlidingWindow window
+        for window in windows:
+            delay_ns = max(delay_ns, window.delay_ns(now_ns))
+
+        return delay_ns
+
+    cdef void _consume(self, list windows, uint64_t now_ns):
+        cdef SlidingWindow window
+        for window in windows:
+            window.consume(now_ns)
+
+    cdef void _buffer_msg(self, key, msg, uint64_t delay_ns):
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = deque()
+            self._buffers[key] = buffer
+            self._ready.append(key)
+
+        buffer.append(msg)
+        self._qsize += 1
+        self.is_limiting = True
+        self._log.warning(f"Buffering {msg}")
+
+        if delay_ns > 0:
+            self._set_timer(self._clock.timestamp_ns() + delay_ns)
+
+    cdef void _set_timer(self, uint64_t alert_time_ns):
+        # Only ever bring the next processing time forward
+        if self._timer_ns != 0 and self._timer_ns <= alert_time_ns:
+            return
+
+        if self._timer_name in self._clock.timer_names:
+            self._clock.cancel_timer(self._timer_name)
+
+        self._clock.set_time_alert_ns(
+            name=self._timer_name,
+            alert_time_ns=alert_time_ns,
+            callback=self._process,
+        )
+        self._timer_ns = alert_time_ns
+
+    cpdef void _process(self, TimeEvent event):
+        self._timer_ns = 0
+
+        cdef uint64_t now_ns = self._clock.timestamp_ns()
+        cdef uint64_t delay_ns
+        cdef uint64_t min_delay_ns = 0
+        cdef int blocked = 0
+        cdef list key_windows
+        while self._ready:
+            # The shared windows block every key, so stop at once
+            delay_ns = self._delay(self._windows, now_ns)
+            if delay_ns > 0:
+                min_delay_ns = delay_ns
+                break
+
+            key = self._ready.popleft()
+            key_windows = self._windows_for_key(key)
+            delay_ns = self._delay(key_windows, now_ns)
+            if delay_ns > 0:
+                # Key is limited, rotate it to the back
+                self._ready.append(key)
+                if min_delay_ns == 0 or delay_ns < min_delay_ns:
+                    min_delay_ns = delay_ns
+                blocked += 1
+                if blocked >= len(self._ready):
+                    break  # Every remaining key is limited
+                continue
+
+            buffer = self._buffers[key]
+            msg = buffer.popleft()
+            self._qsize -= 1
+            self._consume(self._windows, now_ns)
+            self._consume(key_windows, now_ns)
+            self._send_msg(msg)
+
+            if buffer:
+                self._ready.append(key)
+            else:
+                del self._buffers[key]
+            blocked = 0
+
+        if self._ready:
+            self._set_timer(now_ns + min_delay_ns)
+        else:
+            # No longer throttling
+            self.is_limiting = False
+
+    cdef void _send_msg(self, msg):
+        self._output_send(msg)
+        self.sent_count += 1
+
+
 cdef inline uint64_t max_uint64(uint64_t a, uint64_t b):
     if a > b:
         return a
@@ -410,6 +410,16 @@ class InstrumentProviderConfig(NautilusConfig, frozen=True):
         whether the instrument should be loaded
     log_warnings : bool, default True
         If parser warnings should be logged.
+    snapshot_path : str, optional
+        The root directory for local snapshots of the loaded instruments, which may be
+        shared by several providers (each snapshot is held in a subdirectory named by its
+        version hash). If set, then on
+        initialization the provider loads instruments from a valid snapshot immediately,
+        and refreshes them from the venue in the background (notifying registered update
+        handlers of changed instruments only). If ``None`` then snapshots are disabled.
+    snapshot_ttl_mins : PositiveInt, default 1440
+        The time-to-live (minutes) for an instrument snapshot, after which instruments
+        are loaded from the venue on initialization.
 
     """
 
@@ -429,6 +439,8 @@ class InstrumentProviderConfig(NautilusConfig, frozen=True):
     filters: dict[str, Any] | None = None
     filter_callable: str | None = None
     log_warnings: bool = True
+    snapshot_path: str | None = None
+    snapshot_ttl_mins: PositiveInt = 1440
 
 
 class OrderEmulatorConfig(NautilusConfig, frozen=True):
@@ -561,6 +573,14 @@ class LoggingConfig(NautilusConfig, frozen=True):
     clear_log_file : bool, default False
         If the log file name should be cleared before being used (e.g. for testing).
         Only applies if `log_file_name` is not ``None``.
+    log_component_rate_limits : dict[str, PositiveInt], optional
+        The per component rate limits, where keys are component IDs (e.g. actor/strategy IDs)
+        and values are the maximum number of log records per second (below ERROR level).
+        Records over the limit are suppressed, with a count of suppressed records logged.
+    log_buffer_size : PositiveInt, optional
+        The queue capacity for batched background log writing, where records are written
+        by a background thread and new records are dropped (and counted) when the queue is full.
+        If ``None`` then records are written synchronously.
 
     """
 
@@ -577,6 +597,8 @@ class LoggingConfig(NautilusConfig, frozen=True):
     print_config: bool = False
     use_pyo3: bool = False
     clear_log_file: bool = False
+    log_component_rate_limits: dict[str, PositiveInt] | None = None
+    log_buffer_size: PositiveInt | None = None
 
 
 class ImportableFactoryConfig(NautilusConfig, frozen=True):
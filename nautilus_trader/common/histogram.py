@@ -0,0 +1,233 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from nautilus_trader.core.correctness import PyCondition
+
+
+class LatencyHistogram:
+    """
+    Provides a compact log-linear histogram for recording latencies (nanoseconds).
+
+    Values are bucketed in the style of an HDR histogram: each power-of-two range
+    is split into ``2 ** precision_bits`` linear sub-buckets, bounding the relative
+    error of any reported percentile by ``2 ** -precision_bits`` while keeping the
+    number of buckets logarithmic in the recorded range.
+
+    Parameters
+    ----------
+    precision_bits : int, default 4
+        The number of sub-bucket bits per power-of-two range (1 to 10).
+
+    Raises
+    ------
+    ValueError
+        If `precision_bits` is not in range [1, 10].
+
+    """
+
+    def __init__(self, precision_bits: int = 4) -> None:
+        PyCondition.in_range_int(precision_bits, 1, 10, "precision_bits")
+
+        self._precision_bits = precision_bits
+        self._counts: dict[int, int] = {}
+        self._count = 0
+        self._total = 0
+        self._min = 0
+        self._max = 0
+
+    @property
+    def count(self) -> int:
+        """
+        Return the number of recorded values.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._count
+
+    @property
+    def min(self) -> int:
+        """
+        Return the minimum recorded value (zero if no values recorded).
+
+        Returns
+        -------
+        int
+
+        """
+        return self._min
+
+    @property
+    def max(self) -> int:
+        """
+        Return the maximum recorded value (zero if no values recorded).
+
+        Returns
+        -------
+        int
+
+        """
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        """
+        Return the mean of the recorded values (zero if no values recorded).
+
+        Returns
+        -------
+        float
+
+        """
+        if self._count == 0:
+            return 0.0
+        return self._total / self._count
+
+    def record(self, value: int) -> None:
+        """
+        Record the given value (negative values are clamped to zero).
+
+        Parameters
+        ----------
+        value : int
+            The value to record.
+
+        """
+        if value < 0:
+            value = 0
+
+        shift = value.bit_length() - self._precision_bits - 1
+        bucket = value if shift <= 0 else (value >> shift) << shift
+        self._counts[bucket] = self._counts.get(bucket, 0) + 1
+
+        if self._count == 0 or value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+        self._count += 1
+        self._total += value
+
+    def percentile(self, quantile: float) -> int:
+        """
+        Return the value at the given quantile (zero if no values recorded).
+
+        Parameters
+        ----------
+        quantile : float
+            The quantile to query in range [0, 1].
+
+        Returns
+        -------
+        int
+
+        Raises
+        ------
+        ValueError
+            If `quantile` is not in range [0, 1].
+
+        """
+        PyCondition.in_range(quantile, 0.0, 1.0, "quantile")
+
+        if self._count == 0:
+            return 0
+
+        target = max(1, int(quantile * self._count + 0.5))
+        cumulative = 0
+        for bucket in sorted(self._counts):
+            cumulative += self._counts[bucket]
+            if cumulative >= target:
+                return min(max(bucket, self._min), self._max)
+
+        return self._max  # Pragma: no cover (unreachable)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """
+        Merge the recorded values of the `other` histogram into this histogram.
+
+        Parameters
+        ----------
+        other : LatencyHistogram
+            The histogram to merge (must have the same precision).
+
+        Raises
+        ------
+        ValueError
+            If `other` has a different precision.
+
+        """
+        PyCondition.equal(
+            other._precision_bits,
+            self._precision_bits,
+            "other.precision_bits",
+            "self.precision_bits",
+        )
+
+        if other._count == 0:
+            return
+
+        for bucket, count in other._counts.items():
+            self._counts[bucket] = self._counts.get(bucket, 0) + count
+
+        if self._count == 0 or other._min < self._min:
+            self._min = other._min
+        if other._max > self._max:
+            self._max = other._max
+        self._count += other._count
+        self._total += other._total
+
+    def summary(self) -> dict[str, float]:
+        """
+        Return a summary of the recorded values.
+
+        Returns
+        -------
+        dict[str, float]
+            Keyed by 'count', 'min', 'mean', 'p50', 'p90', 'p99', 'p999', 'max'.
+
+        """
+        return {
+            "count": self._count,
+            "min": self._min,
+            "mean": self.mean,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+            "p999": self.percentile(0.999),
+            "max": self._max,
+        }
+
+    def reset(self) -> None:
+        """
+        Reset the histogram by clearing all recorded values.
+        """
+        self._counts.clear()
+        self._count = 0
+        self._total = 0
+        self._min = 0
+        self._max = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"count={self._count}, "
+            f"min={self._min}, "
+            f"p50={self.percentile(0.5)}, "
+            f"p99={self.percentile(0.99)}, "
+            f"max={self._max})"
+        )
@@ -14,6 +14,8 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+from collections.abc import Callable
+from typing import Any
 
 from nautilus_trader.common.component import Logger
 from nautilus_trader.config import InstrumentProviderConfig
@@ -21,6 +23,8 @@ from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.model.objects import Currency
+from nautilus_trader.persistence.snapshots import InstrumentSnapshotStore
+from nautilus_trader.persistence.snapshots import snapshot_version
 
 
 class InstrumentProvider:
@@ -57,6 +61,13 @@ class InstrumentProvider:
 
         self._tasks: set[asyncio.Task] = set()
 
+        # Instrument snapshots for warm starts (store created on first use, once the
+        # subclass has set the venue context for the snapshot key)
+        self._snapshot_path = config.snapshot_path
+        self._snapshot_ttl_mins = config.snapshot_ttl_mins
+        self._snapshot: InstrumentSnapshotStore | None = None
+        self._update_handlers: list[Callable[[list[Instrument]], None]] = []
+
         self._log.info("READY")
 
     @property
@@ -163,24 +174,15 @@ class InstrumentProvider:
         if not reload and self._loaded:
             return  # Already loaded
 
+        if not reload and self._initialize_from_snapshot():
+            return
+
         # Set state flag
         self._loading = True
         self._log.info("Initializing instruments...")
 
         try:
-            if self._load_all_on_start:
-                await self.load_all_async(self._filters)
-            elif self._load_ids_on_start:
-                instrument_ids = [
-                    i if isinstance(i, InstrumentId) else InstrumentId.from_str(i)
-                    for i in self._load_ids_on_start
-                ]
-
-                instruments_str = ", ".join([i.value for i in instrument_ids])
-                filters_str = "..." if not self._filters else f" with filters {self._filters}..."
-                self._log.info(f"Loading instruments: {instruments_str}{filters_str}")
-
-                await self.load_ids_async(instrument_ids, self._filters)
+            await self._load_on_start()
         except Exception as e:
             # Catch unexpected exception to ensure that the self._loading flag
             # is reset to False
@@ -188,6 +190,7 @@ class InstrumentProvider:
 
         if self._instruments:
             self._log.info(f"Loaded {self.count} instruments")
+            self._save_snapshot()
         else:
             self._log.warning("No instruments were loaded, verify config if this is unexpected")
 
@@ -197,6 +200,141 @@ class InstrumentProvider:
 
         self._log.info("Initialized instruments")
 
+    def register_update_handler(self, handler: Callable[[list[Instrument]], None]) -> None:
+        """
+        Register the given handler to receive instruments which were added or changed
+        by a background refresh of the instrument snapshot.
+
+        Parameters
+        ----------
+        handler : Callable[[list[Instrument]], None]
+            The handler to register.
+
+        """
+        PyCondition.callable(handler, "handler")
+
+        if handler not in self._update_handlers:
+            self._update_handlers.append(handler)
+
+    async def _load_on_start(self) -> None:
+        if self._load_all_on_start:
+            await self.load_all_async(self._filters)
+        elif self._load_ids_on_start:
+            instrument_ids = [
+                i if isinstance(i, InstrumentId) else InstrumentId.from_str(i)
+                for i in self._load_ids_on_start
+            ]
+
+            instruments_str = ", ".join([i.value for i in instrument_ids])
+            filters_str = "..." if not self._filters else f" with filters {self._filters}..."
+            self._log.info(f"Loading instruments: {instruments_str}{filters_str}")
+
+            await self.load_ids_async(instrument_ids, self._filters)
+
+    def _snapshot_context(self) -> dict[str, Any]:
+        """
+        Return the context identifying the instruments loaded by the provider, which is
+        included in the instrument snapshot version.
+
+        Providers should override this to return their venue, account type and
+        environment (e.g. live or testnet), so that different providers sharing a
+        snapshot path never load each other's snapshots.
+
+        Returns
+        -------
+        dict[str, Any]
+
+        """
+        return {}
+
+    def _get_snapshot_store(self) -> InstrumentSnapshotStore | None:
+        if self._snapshot is None and self._snapshot_path is not None:
+            self._snapshot = InstrumentSnapshotStore(
+                path=self._snapshot_path,
+                version=snapshot_version(
+                    type(self).__qualname__,
+                    sorted(self._snapshot_context().items()),
+                    self._load_all_on_start,
+                    sorted(str(i) for i in self._load_ids_on_start or []),
+                    sorted((self._filters or {}).items()),
+                ),
+                ttl_secs=self._snapshot_ttl_mins * 60,
+            )
+        return self._snapshot
+
+    def _initialize_from_snapshot(self) -> bool:
+        snapshot = self._get_snapshot_store()
+        if snapshot is None or not self._load_snapshot(snapshot):
+            return False
+
+        self._loaded = True
+        self._log.info(f"Loaded {self.count} instruments from snapshot")
+
+        # Refresh from the venue without delaying startup
+        task = asyncio.get_running_loop().create_task(
+            self._refresh_snapshot(),
+            name="refresh_instrument_snapshot",
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    def _load_snapshot(self, snapshot: InstrumentSnapshotStore) -> bool:
+        try:
+            instruments = snapshot.load()
+        except Exception as e:
+            self._log.exception("Failed to load instrument snapshot", e)
+            return False
+
+        if not instruments:
+            return False
+
+        if not self._load_all_on_start:
+            load_ids = {
+                i if isinstance(i, InstrumentId) else InstrumentId.from_str(i)
+                for i in self._load_ids_on_start or []
+            }
+            instruments = [i for i in instruments if i.id in load_ids]
+            if len(instruments) != len(load_ids):
+                return False  # Snapshot does not cover all requested instruments
+
+        for instrument in instruments:
+            self.add_currency(instrument.quote_currency)
+            self.add_currency(instrument.get_settlement_currency())
+            base_currency = instrument.get_base_currency()
+            if base_currency is not None:
+                self.add_currency(base_currency)
+            self.add(instrument)
+
+        return True
+
+    def _save_snapshot(self) -> None:
+        snapshot = self._get_snapshot_store()
+        if snapshot is None:
+            return
+
+        try:
+            snapshot.save(list(self._instruments.values()))
+        except Exception as e:
+            self._log.exception("Failed to save instrument snapshot", e)
+
+    async def _refresh_snapshot(self) -> None:
+        previous = self._instruments.copy()
+        await self.initialize(reload=True)
+
+        updated: list[Instrument] = []
+        for instrument_id, instrument in self._instruments.items():
+            previous_instrument = previous.get(instrument_id)
+            if previous_instrument is None or not _same_definition(previous_instrument, instrument):
+                updated.append(instrument)
+
+        self._log.info(f"Refreshed instrument snapshot with {len(updated)} updated instruments")
+        if not updated:
+            return
+
+        for handler in self._update_handlers:
+            handler(updated)
+
     def load_all(self, filters: dict | None = None) -> None:
         """
         Load the latest instruments into the provider, optionally applying the given
@@ -389,3 +527,17 @@ class InstrumentProvider:
         PyCondition.not_none(instrument_id, "instrument_id")
 
         return self._instruments.get(instrument_id)
+
+
+def _same_definition(a: Instrument, b: Instrument) -> bool:
+    # Compare instrument definitions, ignoring timestamps
+    if type(a) is not type(b):
+        return False
+
+    a_dict = type(a).to_dict(a)
+    b_dict = type(b).to_dict(b)
+    for key in ("ts_event", "ts_init"):
+        a_dict.pop(key, None)
+        b_dict.pop(key, None)
+
+    return a_dict == b_dict
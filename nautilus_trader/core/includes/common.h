@@ -577,6 +577,20 @@ void logger_log(enum LogLevel level,
                 const char *component_ptr,
                 const char *message_ptr);
 
+/**
+ * Creates a new log event with the given timestamp.
+ *
+ * # Safety
+ *
+ * - Assumes `component_ptr` is a valid C string pointer.
+ * - Assumes `message_ptr` is a valid C string pointer.
+ */
+void logger_log_with_timestamp(uint64_t ts,
+                               enum LogLevel level,
+                               enum LogColor color,
+                               const char *component_ptr,
+                               const char *message_ptr);
+
 /**
  * Logs the Nautilus system header.
  *
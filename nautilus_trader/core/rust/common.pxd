@@ -407,6 +407,18 @@ cdef extern from "../includes/common.h":
                     const char *component_ptr,
                     const char *message_ptr);
 
+    # Creates a new log event with the given timestamp.
+    #
+    # # Safety
+    #
+    # - Assumes `component_ptr` is a valid C string pointer.
+    # - Assumes `message_ptr` is a valid C string pointer.
+    void logger_log_with_timestamp(uint64_t ts,
+                                   LogLevel level,
+                                   LogColor color,
+                                   const char *component_ptr,
+                                   const char *message_ptr);
+
     # Logs the Nautilus system header.
     #
     # # Safety
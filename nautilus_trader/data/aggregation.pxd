@@ -17,6 +17,8 @@ from cpython.datetime cimport timedelta
 from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
+from nautilus_trader.common.cadence cimport CadenceScheduler
+from nautilus_trader.common.cadence cimport TradingSessionCalendar
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport TimeEvent
@@ -110,6 +112,8 @@ cdef class TimeBarAggregator(BarAggregator):
     cdef uint64_t _batch_open_ns
     cdef uint64_t _batch_next_close_ns
     cdef object _time_bars_origin
+    cdef CadenceScheduler _scheduler
+    cdef TradingSessionCalendar _calendar
 
     cdef readonly timedelta interval
     """The aggregators time interval.\n\n:returns: `timedelta`"""
@@ -125,3 +129,4 @@ cdef class TimeBarAggregator(BarAggregator):
     cdef void _batch_pre_update(self, uint64_t time_ns)
     cdef void _batch_post_update(self, uint64_t time_ns)
     cpdef void _build_bar(self, TimeEvent event)
+    cpdef void _skip_bar(self, TimeEvent event)
@@ -23,6 +23,8 @@ from cpython.datetime cimport timedelta
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.datetime import unix_nanos_to_dt
+from nautilus_trader.common.cadence cimport CadenceScheduler
+from nautilus_trader.common.cadence cimport TradingSessionCalendar
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport TimeEvent
@@ -697,11 +699,20 @@ cdef class TimeBarAggregator(BarAggregator):
         The origin time offset.
     composite_bar_build_delay : int, default 15
         The time delay (microseconds) before building and emitting a composite bar type.
+    scheduler : CadenceScheduler, optional
+        The scheduler for a shared timer cadence with other aggregators of the same
+        interval. If ``None`` then the aggregator sets its own timer on the clock.
+        Not used for monthly bars.
+    calendar : TradingSessionCalendar, optional
+        The trading session calendar which suppresses bar closes outside sessions
+        (requires a `scheduler`).
 
     Raises
     ------
     ValueError
         If `instrument.id` != `bar_type.instrument_id`.
+    ValueError
+        If `calendar` is not ``None`` and `scheduler` is ``None``.
     """
 
     def __init__(
@@ -716,7 +727,12 @@ cdef class TimeBarAggregator(BarAggregator):
         bint build_with_no_updates = True,
         object time_bars_origin: pd.Timedelta | pd.DateOffset = None,
         int composite_bar_build_delay = 15, # in microsecond
+        CadenceScheduler scheduler = None,
+        TradingSessionCalendar calendar = None,
     ) -> None:
+        if calendar is not None:
+            Condition.not_none(scheduler, "scheduler")
+
         super().__init__(
             instrument=instrument,
             bar_type=bar_type.standard(),
@@ -724,6 +740,8 @@ cdef class TimeBarAggregator(BarAggregator):
         )
 
         self._clock = clock
+        self._scheduler = scheduler
+        self._calendar = calendar
         self.interval = self._get_interval()
         self.interval_ns = self._get_interval_ns()
         self._timer_name = None
@@ -919,7 +937,16 @@ cdef class TimeBarAggregator(BarAggregator):
         if self._add_delay:
             start_time += timedelta(microseconds=self._composite_bar_build_delay)
 
-        if self.bar_type.spec.aggregation != BarAggregation.MONTH:
+        if self.bar_type.spec.aggregation != BarAggregation.MONTH and self._scheduler is not None:
+            # Attach to the shared cadence, which is also the timer name on the clock
+            self._timer_name = self._scheduler.subscribe(
+                interval_ns=self.interval_ns,
+                callback=self._build_bar,
+                start_time_ns=dt_to_unix_nanos(start_time),
+                calendar=self._calendar,
+                suppressed_callback=self._skip_bar,
+            )
+        elif self.bar_type.spec.aggregation != BarAggregation.MONTH:
             self._clock.set_timer(
                 name=self._timer_name,
                 interval=self.interval,
@@ -944,6 +971,10 @@ cdef class TimeBarAggregator(BarAggregator):
         """
         Stop the bar aggregator.
         """
+        if self._scheduler is not None and self.bar_type.spec.aggregation != BarAggregation.MONTH:
+            self._scheduler.unsubscribe(self._timer_name, self._build_bar)
+            return
+
         self._clock.cancel_timer(str(self.bar_type))
 
     cdef void _build_and_send(self, uint64_t ts_event, uint64_t ts_init):
@@ -1111,3 +1142,12 @@ cdef class TimeBarAggregator(BarAggregator):
             )
 
             self.next_close_ns = dt_to_unix_nanos(alert_time)
+
+    cpdef void _skip_bar(self, TimeEvent event):
+        # The close is outside a trading session, so discard the updates since the
+        # last close (rather than carrying them into the next bar) and advance
+        self._builder.reset()
+        self._build_on_next_tick = False
+        self._stored_close_ns = 0
+        self._stored_open_ns = event.ts_event
+        self.next_close_ns = self._clock.next_time_ns(self._timer_name)
@@ -38,6 +38,13 @@ class DataEngineConfig(NautilusConfig, frozen=True):
         If time bar aggregators will build and emit bars with no new market updates.
     time_bars_origins : dict[BarAggregation, pd.Timedelta | pd.DateOffset], optional
         A dictionary mapping time bar aggregations to their origin time offsets.
+    time_bars_shared_timers : bool, default False
+        If time bar aggregators with the same interval (and alignment) will share a single
+        timer cadence, with each bar close fanned out to all aggregators in one batch.
+    time_bars_session_calendars : dict[str, TradingSessionCalendar], optional
+        A dictionary mapping venue names to trading session calendars, which suppress time
+        bar closes outside trading sessions for instruments of the venue.
+        Requires `time_bars_shared_timers`.
     validate_data_sequence : bool, default False
         If data objects timestamp sequencing will be validated and handled.
     buffer_deltas : bool, default False
@@ -55,6 +62,8 @@ class DataEngineConfig(NautilusConfig, frozen=True):
     time_bars_skip_first_non_full_bar: bool = False
     time_bars_build_with_no_updates: bool = True
     time_bars_origins: dict | None = None
+    time_bars_shared_timers: bool = False
+    time_bars_session_calendars: dict | None = None
     validate_data_sequence: bool = False
     buffer_deltas: bool = False
     external_clients: list[ClientId] | None = None
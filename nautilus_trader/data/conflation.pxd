@@ -0,0 +1,42 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.rust.model cimport BookType
+from nautilus_trader.model.data cimport OrderBookDelta
+from nautilus_trader.model.data cimport OrderBookDeltas
+from nautilus_trader.model.identifiers cimport InstrumentId
+
+
+cdef class OrderBookDeltaConflator:
+    cdef OrderBookDelta _clear
+    cdef dict _latest
+
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the conflator.\n\n:returns: `InstrumentId`"""
+    cdef readonly BookType book_type
+    """The order book type for the conflator.\n\n:returns: `BookType`"""
+    cdef readonly uint64_t interval_ms
+    """The conflation interval (milliseconds).\n\n:returns: `uint64_t`"""
+    cdef readonly str topic
+    """The topic conflated deltas are published on.\n\n:returns: `str`"""
+    cdef readonly int count
+    """The count of deltas received since the last flush.\n\n:returns: `int`"""
+
+    cpdef void update(self, OrderBookDeltas deltas)
+    cpdef void update_delta(self, OrderBookDelta delta)
+    cpdef OrderBookDeltas flush(self)
+    cpdef void reset(self)
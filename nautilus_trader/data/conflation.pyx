@@ -0,0 +1,162 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.model cimport BookAction
+from nautilus_trader.core.rust.model cimport BookType
+from nautilus_trader.model.data cimport OrderBookDelta
+from nautilus_trader.model.data cimport OrderBookDeltas
+from nautilus_trader.model.identifiers cimport InstrumentId
+
+
+cdef class OrderBookDeltaConflator:
+    """
+    Provides a "latest-state" conflator for order book deltas over a time window.
+
+    Deltas received within the window are coalesced so that only the last delta for
+    each book level (MBP) or order (MBO) is retained. A `CLEAR` action discards all
+    deltas received before it in the window. On `flush` the coalesced deltas are
+    returned as a single `OrderBookDeltas` which, applied to a book holding the state
+    as of the previous flush, results in the same book state as applying every delta.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the conflator.
+    book_type : BookType
+        The order book type, which determines how deltas are keyed.
+    interval_ms : int
+        The conflation interval (milliseconds).
+    topic : str
+        The topic conflated deltas are published on.
+
+    Raises
+    ------
+    ValueError
+        If `interval_ms` is not positive (> 0).
+
+    """
+
+    def __init__(
+        self,
+        InstrumentId instrument_id not None,
+        BookType book_type,
+        int interval_ms,
+        str topic not None,
+    ) -> None:
+        Condition.positive_int(interval_ms, "interval_ms")
+
+        self.instrument_id = instrument_id
+        self.book_type = book_type
+        self.interval_ms = interval_ms
+        self.topic = topic
+        self.count = 0
+
+        self._clear = None
+        self._latest = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"instrument_id={self.instrument_id}, "
+            f"interval_ms={self.interval_ms}, "
+            f"topic={self.topic})"
+        )
+
+    cpdef void update(self, OrderBookDeltas deltas):
+        """
+        Update the conflator with the given deltas.
+
+        Parameters
+        ----------
+        deltas : OrderBookDeltas
+            The deltas to conflate.
+
+        """
+        Condition.not_none(deltas, "deltas")
+
+        cdef OrderBookDelta delta
+        for delta in deltas.deltas:
+            self.update_delta(delta)
+
+    cpdef void update_delta(self, OrderBookDelta delta):
+        """
+        Update the conflator with the given delta.
+
+        Parameters
+        ----------
+        delta : OrderBookDelta
+            The delta to conflate.
+
+        """
+        Condition.not_none(delta, "delta")
+
+        self.count += 1
+
+        if delta._mem.action == BookAction.CLEAR:
+            self._clear = delta
+            self._latest.clear()
+            return
+
+        cdef object key
+        if self.book_type == BookType.L3_MBO:
+            key = delta._mem.order.order_id
+        else:
+            key = (delta._mem.order.side, delta._mem.order.price.raw)
+
+        cdef OrderBookDelta previous = self._latest.pop(key, None)
+
+        if (
+            previous is not None
+            and self.book_type == BookType.L3_MBO
+            and previous._mem.action == BookAction.ADD
+            and delta._mem.action == BookAction.DELETE
+        ):
+            return  # Order added and deleted within the window
+
+        # Re-inserting moves the key to the end, preserving the order of last updates
+        self._latest[key] = delta
+
+    cpdef OrderBookDeltas flush(self):
+        """
+        Return the coalesced deltas received since the last flush and reset the window.
+
+        Returns
+        -------
+        OrderBookDeltas or ``None``
+            ``None`` if no deltas remain after coalescing.
+
+        """
+        cdef list deltas = list(self._latest.values())
+
+        if self._clear is not None:
+            deltas.insert(0, self._clear)
+
+        self.reset()
+
+        if not deltas:
+            return None
+
+        return OrderBookDeltas(instrument_id=self.instrument_id, deltas=deltas)
+
+    cpdef void reset(self):
+        """
+        Reset the conflator, discarding all deltas in the current window.
+        """
+        self._clear = None
+        self._latest.clear()
+        self.count = 0
@@ -20,6 +20,8 @@ from nautilus_trader.persistence.catalog import ParquetDataCatalog
 from nautilus_trader.persistence.catalog.types import CatalogWriteMode
 
 from nautilus_trader.cache.cache cimport Cache
+from nautilus_trader.common.cadence cimport CadenceScheduler
+from nautilus_trader.common.cadence cimport TradingSessionCalendar
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.component cimport TimeEvent
 from nautilus_trader.core.data cimport Data
@@ -28,6 +30,7 @@ from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.data.aggregation cimport BarAggregator
 from nautilus_trader.data.client cimport DataClient
 from nautilus_trader.data.client cimport MarketDataClient
+from nautilus_trader.data.conflation cimport OrderBookDeltaConflator
 from nautilus_trader.data.messages cimport DataCommand
 from nautilus_trader.data.messages cimport DataResponse
 from nautilus_trader.data.messages cimport RequestBars
@@ -59,6 +62,7 @@ from nautilus_trader.data.messages cimport UnsubscribeMarkPrices
 from nautilus_trader.data.messages cimport UnsubscribeOrderBook
 from nautilus_trader.data.messages cimport UnsubscribeQuoteTicks
 from nautilus_trader.data.messages cimport UnsubscribeTradeTicks
+from nautilus_trader.data.synthetic cimport SyntheticEvaluator
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport BarAggregation
 from nautilus_trader.model.data cimport BarType
@@ -89,12 +93,15 @@ cdef class DataEngine(Component):
     cdef readonly dict[Venue, DataClient] _routing_map
     cdef readonly dict _order_book_intervals
     cdef readonly dict[BarType, BarAggregator] _bar_aggregators
-    cdef readonly dict[InstrumentId, list[SyntheticInstrument]] _synthetic_quote_feeds
-    cdef readonly dict[InstrumentId, list[SyntheticInstrument]] _synthetic_trade_feeds
+    cdef readonly dict[InstrumentId, SyntheticEvaluator] _synthetic_evaluators
+    cdef readonly dict[InstrumentId, list] _synthetic_quote_feeds
+    cdef readonly dict[InstrumentId, list] _synthetic_trade_feeds
     cdef readonly list[InstrumentId] _subscribed_synthetic_quotes
     cdef readonly list[InstrumentId] _subscribed_synthetic_trades
     cdef readonly dict[InstrumentId, list[OrderBookDelta]] _buffered_deltas_map
     cdef readonly dict[str, SnapshotInfo] _snapshot_info
+    cdef readonly dict[InstrumentId, list[OrderBookDeltaConflator]] _book_conflators
+    cdef readonly dict[str, OrderBookDeltaConflator] _book_conflation_info
     cdef readonly dict[UUID4, int] _query_group_n_components
     cdef readonly dict[UUID4, list] _query_group_components
 
@@ -103,6 +110,8 @@ cdef class DataEngine(Component):
     cdef readonly bint _time_bars_skip_first_non_full_bar
     cdef readonly bint _time_bars_build_with_no_updates
     cdef readonly dict[BarAggregation, object] _time_bars_origins # pd.Timedelta or pd.DateOffset
+    cdef readonly dict[str, TradingSessionCalendar] _time_bars_session_calendars
+    cdef readonly CadenceScheduler _cadence_scheduler
     cdef readonly bint _validate_data_sequence
     cdef readonly bint _buffer_deltas
 
@@ -166,6 +175,8 @@ cdef class DataEngine(Component):
     cpdef void _handle_subscribe_order_book_deltas(self, MarketDataClient client, SubscribeOrderBook command)
     cpdef void _handle_subscribe_order_book_snapshots(self, MarketDataClient client, SubscribeOrderBook command)
     cpdef void _setup_order_book(self, MarketDataClient client, SubscribeOrderBook command)
+    cpdef void _setup_order_book_conflation(self, SubscribeOrderBook command)
+    cpdef bint _teardown_order_book_conflation(self, InstrumentId instrument_id)
     cpdef void _create_new_book(self, InstrumentId instrument_id, BookType book_type)
     cpdef void _handle_subscribe_quote_ticks(self, MarketDataClient client, SubscribeQuoteTicks command)
     cpdef void _handle_subscribe_synthetic_quote_ticks(self, InstrumentId instrument_id)
@@ -211,6 +222,7 @@ cdef class DataEngine(Component):
     cpdef void _handle_instrument(self, Instrument instrument, update_catalog_mode: CatalogWriteMode | None = *)
     cpdef void _handle_order_book_delta(self, OrderBookDelta delta)
     cpdef void _handle_order_book_deltas(self, OrderBookDeltas deltas)
+    cdef void _publish_order_book_deltas(self, OrderBookDeltas deltas)
     cpdef void _handle_order_book_depth(self, OrderBookDepth10 depth)
     cpdef void _handle_quote_tick(self, QuoteTick tick)
     cpdef void _handle_trade_tick(self, TradeTick tick)
@@ -240,14 +252,16 @@ cdef class DataEngine(Component):
     cpdef void _internal_update_instruments(self, list instruments)
     cpdef void _update_order_book(self, Data data)
     cpdef void _snapshot_order_book(self, TimeEvent snap_event)
+    cpdef void _publish_conflated_order_book_deltas(self, TimeEvent event)
     cpdef void _publish_order_book(self, InstrumentId instrument_id, str topic)
     cpdef object _create_bar_aggregator(self, Instrument instrument, BarType bar_type)
     cpdef void _start_bar_aggregator(self, MarketDataClient client, SubscribeBars command)
     cpdef void _stop_bar_aggregator(self, MarketDataClient client, UnsubscribeBars command)
+    cpdef SyntheticEvaluator _get_synthetic_evaluator(self, SyntheticInstrument synthetic)
     cpdef void _update_synthetics_with_quote(self, list synthetics, QuoteTick update)
-    cpdef void _update_synthetic_with_quote(self, SyntheticInstrument synthetic, QuoteTick update)
+    cpdef void _update_synthetic_with_quote(self, SyntheticEvaluator evaluator, QuoteTick update)
     cpdef void _update_synthetics_with_trade(self, list synthetics, TradeTick update)
-    cpdef void _update_synthetic_with_trade(self, SyntheticInstrument synthetic, TradeTick update)
+    cpdef void _update_synthetic_with_trade(self, SyntheticEvaluator evaluator, TradeTick update)
 
 
 cdef class SnapshotInfo:
@@ -45,6 +45,7 @@ from nautilus_trader.persistence.catalog.types import CatalogWriteMode
 from cpython.datetime cimport datetime
 from libc.stdint cimport uint64_t
 
+from nautilus_trader.common.cadence cimport CadenceScheduler
 from nautilus_trader.common.component cimport CMD
 from nautilus_trader.common.component cimport RECV
 from nautilus_trader.common.component cimport REQ
@@ -70,6 +71,7 @@ from nautilus_trader.data.aggregation cimport ValueBarAggregator
 from nautilus_trader.data.aggregation cimport VolumeBarAggregator
 from nautilus_trader.data.client cimport DataClient
 from nautilus_trader.data.client cimport MarketDataClient
+from nautilus_trader.data.conflation cimport OrderBookDeltaConflator
 from nautilus_trader.data.messages cimport DataCommand
 from nautilus_trader.data.messages cimport DataResponse
 from nautilus_trader.data.messages cimport RequestBars
@@ -101,6 +103,7 @@ from nautilus_trader.data.messages cimport UnsubscribeMarkPrices
 from nautilus_trader.data.messages cimport UnsubscribeOrderBook
 from nautilus_trader.data.messages cimport UnsubscribeQuoteTicks
 from nautilus_trader.data.messages cimport UnsubscribeTradeTicks
+from nautilus_trader.data.synthetic cimport SyntheticEvaluator
 from nautilus_trader.model.book cimport OrderBook
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport BarAggregation
@@ -168,12 +171,15 @@ cdef class DataEngine(Component):
         self._catalogs: dict[str, ParquetDataCatalog] = {}
         self._order_book_intervals: dict[tuple[InstrumentId, int], list[Callable[[OrderBook], None]]] = {}
         self._bar_aggregators: dict[BarType, BarAggregator] = {}
-        self._synthetic_quote_feeds: dict[InstrumentId, list[SyntheticInstrument]] = {}
-        self._synthetic_trade_feeds: dict[InstrumentId, list[SyntheticInstrument]] = {}
+        self._synthetic_evaluators: dict[InstrumentId, SyntheticEvaluator] = {}
+        self._synthetic_quote_feeds: dict[InstrumentId, list[tuple[SyntheticEvaluator, int]]] = {}
+        self._synthetic_trade_feeds: dict[InstrumentId, list[tuple[SyntheticEvaluator, int]]] = {}
         self._subscribed_synthetic_quotes: list[InstrumentId] = []
         self._subscribed_synthetic_trades: list[InstrumentId] = []
         self._buffered_deltas_map: dict[InstrumentId, list[OrderBookDelta]] = {}
         self._snapshot_info: dict[str, SnapshotInfo] = {}
+        self._book_conflators: dict[InstrumentId, list[OrderBookDeltaConflator]] = {}
+        self._book_conflation_info: dict[str, OrderBookDeltaConflator] = {}
         self._query_group_n_components: dict[UUID4, int] = {}
         self._query_group_components: dict[UUID4, list] = {}
 
@@ -184,6 +190,15 @@ cdef class DataEngine(Component):
         self._time_bars_skip_first_non_full_bar = config.time_bars_skip_first_non_full_bar
         self._time_bars_build_with_no_updates = config.time_bars_build_with_no_updates
         self._time_bars_origins = config.time_bars_origins or {}
+        self._time_bars_session_calendars = config.time_bars_session_calendars or {}
+        self._cadence_scheduler = CadenceScheduler(self._clock) if config.time_bars_shared_timers else None
+
+        if self._time_bars_session_calendars:
+            Condition.is_true(
+                config.time_bars_shared_timers,
+                "`time_bars_session_calendars` requires `time_bars_shared_timers`",
+            )
+
         self._validate_data_sequence = config.validate_data_sequence
         self._buffer_deltas = config.buffer_deltas
 
@@ -627,12 +642,17 @@ cdef class DataEngine(Component):
 
         self._order_book_intervals.clear()
         self._bar_aggregators.clear()
+        if self._cadence_scheduler is not None:
+            self._cadence_scheduler.cancel_all()
+        self._synthetic_evaluators.clear()
         self._synthetic_quote_feeds.clear()
         self._synthetic_trade_feeds.clear()
         self._subscribed_synthetic_quotes.clear()
         self._subscribed_synthetic_trades.clear()
         self._buffered_deltas_map.clear()
         self._snapshot_info.clear()
+        self._book_conflators.clear()
+        self._book_conflation_info.clear()
 
         self._clock.cancel_timers()
         self.command_count = 0
@@ -830,6 +850,9 @@ cdef class DataEngine(Component):
 
         self._setup_order_book(client, command)
 
+        if command.conflate_interval_ms > 0:
+            self._setup_order_book_conflation(command)
+
     cpdef void _handle_subscribe_order_book_snapshots(self, MarketDataClient client, SubscribeOrderBook command):
         Condition.not_none(client, "client")
         Condition.not_none(command.instrument_id, "instrument_id")
@@ -943,6 +966,73 @@ cdef class DataEngine(Component):
                 priority=10,
             )
 
+    cpdef void _setup_order_book_conflation(self, SubscribeOrderBook command):
+        if command.instrument_id.symbol.is_composite():
+            self._log.error(
+                f"Cannot conflate order book deltas for composite instrument {command.instrument_id}",
+            )
+            return
+
+        cdef str timer_name = f"OrderBookConflation|{command.instrument_id}|{command.conflate_interval_ms}"
+        if timer_name in self._book_conflation_info:
+            return  # Already conflating at this interval
+
+        cdef OrderBookDeltaConflator conflator = OrderBookDeltaConflator(
+            instrument_id=command.instrument_id,
+            book_type=command.book_type,
+            interval_ms=command.conflate_interval_ms,
+            topic=f"data.book.conflated"
+                  f".{command.instrument_id.venue}"
+                  f".{command.instrument_id.symbol.topic()}"
+                  f".{command.conflate_interval_ms}",
+        )
+
+        self._book_conflation_info[timer_name] = conflator
+        self._book_conflators.setdefault(command.instrument_id, []).append(conflator)
+
+        cdef uint64_t interval_ns = millis_to_nanos(command.conflate_interval_ms)
+        cdef uint64_t timestamp_ns = self._clock.timestamp_ns()
+        cdef uint64_t start_time_ns = timestamp_ns - (timestamp_ns % interval_ns) + interval_ns
+
+        self._clock.set_timer_ns(
+            name=timer_name,
+            interval_ns=interval_ns,
+            start_time_ns=start_time_ns,
+            stop_time_ns=0,  # No stop
+            callback=self._publish_conflated_order_book_deltas,
+        )
+        self._log.debug(f"Set timer {timer_name}")
+
+    cpdef bint _teardown_order_book_conflation(self, InstrumentId instrument_id):
+        # Returns whether any conflated deltas subscribers remain for the instrument
+        cdef list conflators = self._book_conflators.get(instrument_id)
+        if conflators is None:
+            return False
+
+        cdef bint has_subscribers = False
+        cdef list remaining = []
+        cdef OrderBookDeltaConflator conflator
+        cdef str timer_name
+        for conflator in conflators:
+            if self._msgbus.has_subscribers(conflator.topic):
+                has_subscribers = True
+                remaining.append(conflator)
+                continue
+
+            timer_name = f"OrderBookConflation|{instrument_id}|{conflator.interval_ms}"
+            self._book_conflation_info.pop(timer_name, None)
+
+            if timer_name in self._clock.timer_names:
+                self._clock.cancel_timer(timer_name)
+                self._log.debug(f"Canceled timer {timer_name}")
+
+        if remaining:
+            self._book_conflators[instrument_id] = remaining
+        else:
+            self._book_conflators.pop(instrument_id, None)
+
+        return has_subscribers
+
     cpdef void _create_new_book(self, InstrumentId instrument_id, BookType book_type):
         order_book = OrderBook(
             instrument_id=instrument_id,
@@ -985,20 +1075,25 @@ cdef class DataEngine(Component):
         if instrument_id in self._subscribed_synthetic_quotes:
             return  # Already setup
 
+        cdef SyntheticEvaluator evaluator = self._get_synthetic_evaluator(synthetic)
         cdef:
+            int slot
             InstrumentId component_instrument_id
+            QuoteTick component_quote
             list synthetics_for_feed
-        for component_instrument_id in synthetic.components:
+        for slot, component_instrument_id in enumerate(evaluator.components):
+            # Seed the slot with any quote already received for the component
+            component_quote = self._cache.quote_tick(component_instrument_id)
+            if component_quote is not None:
+                evaluator.update_quote(component_quote)
+
             synthetics_for_feed = self._synthetic_quote_feeds.get(component_instrument_id)
 
             if synthetics_for_feed is None:
                 synthetics_for_feed = []
+                self._synthetic_quote_feeds[component_instrument_id] = synthetics_for_feed
 
-            if synthetic in synthetics_for_feed:
-                continue
-
-            synthetics_for_feed.append(synthetic)
-            self._synthetic_quote_feeds[component_instrument_id] = synthetics_for_feed
+            synthetics_for_feed.append((evaluator, slot))
 
         self._subscribed_synthetic_quotes.append(instrument_id)
 
@@ -1033,20 +1128,25 @@ cdef class DataEngine(Component):
         if instrument_id in self._subscribed_synthetic_trades:
             return  # Already setup
 
+        cdef SyntheticEvaluator evaluator = self._get_synthetic_evaluator(synthetic)
         cdef:
+            int slot
             InstrumentId component_instrument_id
+            TradeTick component_trade
             list synthetics_for_feed
-        for component_instrument_id in synthetic.components:
+        for slot, component_instrument_id in enumerate(evaluator.components):
+            # Seed the slot with any trade already received for the component
+            component_trade = self._cache.trade_tick(component_instrument_id)
+            if component_trade is not None:
+                evaluator.update_trade(component_trade)
+
             synthetics_for_feed = self._synthetic_trade_feeds.get(component_instrument_id)
 
             if synthetics_for_feed is None:
                 synthetics_for_feed = []
+                self._synthetic_trade_feeds[component_instrument_id] = synthetics_for_feed
 
-            if synthetic in synthetics_for_feed:
-                continue
-
-            synthetics_for_feed.append(synthetic)
-            self._synthetic_trade_feeds[component_instrument_id] = synthetics_for_feed
+            synthetics_for_feed.append((evaluator, slot))
 
         self._subscribed_synthetic_trades.append(instrument_id)
 
@@ -1161,6 +1261,9 @@ cdef class DataEngine(Component):
             self._log.error("Cannot unsubscribe from synthetic instrument `OrderBookDelta` data")
             return
 
+        if self._teardown_order_book_conflation(command.instrument_id):
+            return  # Feed still required by conflated deltas subscribers
+
         cdef str topic = f"data.book.deltas.{command.instrument_id.venue}.{command.instrument_id.symbol.topic()}"
         cdef int num_subscribers = len(self._msgbus.subscriptions(pattern=topic))
         cdef bint is_internal_book_subscriber = self._msgbus.is_subscribed(
@@ -1742,24 +1845,14 @@ cdef class DataEngine(Component):
                     instrument_id=delta.instrument_id,
                     deltas=buffer_deltas
                 )
-                self._msgbus.publish_c(
-                    topic=f"data.book.deltas"
-                        f".{deltas.instrument_id.venue}"
-                        f".{deltas.instrument_id.symbol}",
-                    msg=deltas,
-                )
+                self._publish_order_book_deltas(deltas)
                 buffer_deltas.clear()
         else:
             deltas = OrderBookDeltas(
                 instrument_id=delta.instrument_id,
                 deltas=[delta]
             )
-            self._msgbus.publish_c(
-                 topic=f"data.book.deltas"
-                    f".{deltas.instrument_id.venue}"
-                    f".{deltas.instrument_id.symbol}",
-                msg=deltas,
-            )
+            self._publish_order_book_deltas(deltas)
 
     cpdef void _handle_order_book_deltas(self, OrderBookDeltas deltas):
         cdef OrderBookDeltas deltas_to_publish = None
@@ -1782,20 +1875,25 @@ cdef class DataEngine(Component):
                         instrument_id=deltas.instrument_id,
                         deltas=buffer_deltas,
                     )
-                    self._msgbus.publish_c(
-                        topic=f"data.book.deltas"
-                            f".{deltas.instrument_id.venue}"
-                            f".{deltas.instrument_id.symbol}",
-                        msg=deltas_to_publish,
-                    )
+                    self._publish_order_book_deltas(deltas_to_publish)
                     buffer_deltas.clear()
         else:
-            self._msgbus.publish_c(
-                topic=f"data.book.deltas"
-                    f".{deltas.instrument_id.venue}"
-                    f".{deltas.instrument_id.symbol}",
-                msg=deltas,
-            )
+            self._publish_order_book_deltas(deltas)
+
+    cdef void _publish_order_book_deltas(self, OrderBookDeltas deltas):
+        # Conflators only see deltas here, the managed order book is updated from every delta
+        cdef list conflators = self._book_conflators.get(deltas.instrument_id)
+        cdef OrderBookDeltaConflator conflator
+        if conflators is not None:
+            for conflator in conflators:
+                conflator.update(deltas)
+
+        self._msgbus.publish_c(
+            topic=f"data.book.deltas"
+                f".{deltas.instrument_id.venue}"
+                f".{deltas.instrument_id.symbol}",
+            msg=deltas,
+        )
 
     cpdef void _handle_order_book_depth(self, OrderBookDepth10 depth):
         self._msgbus.publish_c(
@@ -2191,6 +2289,23 @@ cdef class DataEngine(Component):
         else:
             self._publish_order_book(snap_info.instrument_id, snap_info.topic)
 
+    cpdef void _publish_conflated_order_book_deltas(self, TimeEvent event):
+        cdef OrderBookDeltaConflator conflator = self._book_conflation_info.get(event.name)
+
+        if conflator is None:
+            self._log.error(f"No `OrderBookDeltaConflator` found for conflation event {event}")
+            return
+
+        cdef OrderBookDeltas deltas = conflator.flush()
+
+        if deltas is None:
+            return  # No updates within the interval
+
+        self._msgbus.publish_c(
+            topic=conflator.topic,
+            msg=deltas,
+        )
+
     cpdef void _publish_order_book(self, InstrumentId instrument_id, str topic):
         cdef OrderBook order_book = self._cache.order_book(instrument_id)
 
@@ -2222,6 +2337,8 @@ cdef class DataEngine(Component):
                 skip_first_non_full_bar=self._time_bars_skip_first_non_full_bar,
                 build_with_no_updates=self._time_bars_build_with_no_updates,
                 time_bars_origin=self._time_bars_origins.get(bar_type.spec.aggregation),
+                scheduler=self._cadence_scheduler,
+                calendar=self._time_bars_session_calendars.get(instrument.id.venue.value),
             )
         elif bar_type.spec.aggregation == BarAggregation.TICK:
             aggregator = TickBarAggregator(
@@ -2393,45 +2510,33 @@ cdef class DataEngine(Component):
         # Remove from aggregators
         del self._bar_aggregators[command.bar_type.standard()]
 
-    cpdef void _update_synthetics_with_quote(self, list synthetics, QuoteTick update):
-        cdef SyntheticInstrument synthetic
+    cpdef SyntheticEvaluator _get_synthetic_evaluator(self, SyntheticInstrument synthetic):
+        cdef SyntheticEvaluator evaluator = self._synthetic_evaluators.get(synthetic.id)
+        if evaluator is None:
+            evaluator = SyntheticEvaluator(synthetic)
+            self._synthetic_evaluators[synthetic.id] = evaluator
 
-        for synthetic in synthetics:
-            self._update_synthetic_with_quote(synthetic, update)
+        return evaluator
 
-    cpdef void _update_synthetic_with_quote(self, SyntheticInstrument synthetic, QuoteTick update):
-        cdef list components = synthetic.components
-        cdef list[double] inputs_bid = []
-        cdef list[double] inputs_ask = []
+    cpdef void _update_synthetics_with_quote(self, list synthetics, QuoteTick update):
         cdef:
-            InstrumentId instrument_id
-            QuoteTick component_quote
-            Price update_bid
-            Price update_ask
-        for instrument_id in components:
-            if instrument_id == update.instrument_id:
-                update_bid = update.bid_price
-                update_ask = update.ask_price
-                inputs_bid.append(update_bid.as_f64_c())
-                inputs_ask.append(update_ask.as_f64_c())
-                continue
-
-            component_quote = self._cache.quote_tick(instrument_id)
-
-            if component_quote is None:
-                self._log.warning(
-                    f"Cannot calculate synthetic instrument {synthetic.id} price, "
-                    f"no quotes for {instrument_id} yet",
-                )
-                return
-
-            update_bid = component_quote.bid_price
-            update_ask = component_quote.ask_price
-            inputs_bid.append(update_bid.as_f64_c())
-            inputs_ask.append(update_ask.as_f64_c())
+            SyntheticEvaluator evaluator
+            int slot
+        for evaluator, slot in synthetics:
+            evaluator.set_quote(slot, update._mem.bid_price.raw, update._mem.ask_price.raw)
+            self._update_synthetic_with_quote(evaluator, update)
+
+    cpdef void _update_synthetic_with_quote(self, SyntheticEvaluator evaluator, QuoteTick update):
+        cdef SyntheticInstrument synthetic = evaluator.synthetic
+        if evaluator.quotes_missing > 0:
+            self._log.warning(
+                f"Cannot calculate synthetic instrument {synthetic.id} price, "
+                f"no quotes for {evaluator.missing_quote()} yet",
+            )
+            return
 
-        cdef Price bid_price = synthetic.calculate(inputs_bid)
-        cdef Price ask_price = synthetic.calculate(inputs_ask)
+        cdef Price bid_price = evaluator.calculate_bid()
+        cdef Price ask_price = evaluator.calculate_ask()
         cdef Quantity size_one = Quantity(1, 0)  # Placeholder for now
         cdef InstrumentId synthetic_instrument_id = synthetic.id
         cdef QuoteTick synthetic_quote = QuoteTick(
@@ -2452,38 +2557,23 @@ cdef class DataEngine(Component):
         )
 
     cpdef void _update_synthetics_with_trade(self, list synthetics, TradeTick update):
-        cdef SyntheticInstrument synthetic
-
-        for synthetic in synthetics:
-            self._update_synthetic_with_trade(synthetic, update)
-
-    cpdef void _update_synthetic_with_trade(self, SyntheticInstrument synthetic, TradeTick update):
-        cdef list components = synthetic.components
-        cdef list[double] inputs = []
-
         cdef:
-            InstrumentId instrument_id
-            TradeTick component_quote
-            Price update_price
-        for instrument_id in components:
-            if instrument_id == update.instrument_id:
-                update_price = update.price
-                inputs.append(update_price.as_f64_c())
-                continue
-
-            component_trade = self._cache.trade_tick(instrument_id)
-
-            if component_trade is None:
-                self._log.warning(
-                    f"Cannot calculate synthetic instrument {synthetic.id} price, "
-                    f"no trades for {instrument_id} yet",
-                )
-                return
-
-            update_price = component_trade.price
-            inputs.append(update_price.as_f64_c())
+            SyntheticEvaluator evaluator
+            int slot
+        for evaluator, slot in synthetics:
+            evaluator.set_trade(slot, update._mem.price.raw)
+            self._update_synthetic_with_trade(evaluator, update)
+
+    cpdef void _update_synthetic_with_trade(self, SyntheticEvaluator evaluator, TradeTick update):
+        cdef SyntheticInstrument synthetic = evaluator.synthetic
+        if evaluator.trades_missing > 0:
+            self._log.warning(
+                f"Cannot calculate synthetic instrument {synthetic.id} price, "
+                f"no trades for {evaluator.missing_trade()} yet",
+            )
+            return
 
-        cdef Price price = synthetic.calculate(inputs)
+        cdef Price price = evaluator.calculate_last()
         cdef Quantity size_one = Quantity(1, 0)  # Placeholder for now
         cdef InstrumentId synthetic_instrument_id = synthetic.id
         cdef TradeTick synthetic_trade = TradeTick(
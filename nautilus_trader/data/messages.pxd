@@ -63,6 +63,8 @@ cdef class SubscribeOrderBook(SubscribeData):
     """The order book snapshot interval in milliseconds (must be positive)."""
     cdef readonly bint only_deltas
     """If the subscription is for OrderBookDeltas or OrderBook snapshots."""
+    cdef readonly int conflate_interval_ms
+    """The interval (milliseconds) over which deltas are conflated (0 for no conflation)."""
 
 
 cdef class SubscribeQuoteTicks(SubscribeData):
@@ -290,6 +290,9 @@ cdef class SubscribeOrderBook(SubscribeData):
         The interval (milliseconds) between snapshots.
     only_deltas : bool, optional, default True
         If the subscription is for OrderBookDeltas or OrderBook snapshots.
+    conflate_interval_ms : int, optional, default 0
+        The interval (milliseconds) over which deltas are conflated before being
+        published to the subscriber (0 for no conflation).
     params : dict[str, object], optional
         Additional parameters for the subscription.
 
@@ -299,6 +302,8 @@ cdef class SubscribeOrderBook(SubscribeData):
         If both `client_id` and `venue` are both ``None`` (not enough routing info).
     ValueError
         If `interval_ms` is not positive (> 0).
+    ValueError
+        If `conflate_interval_ms` is negative (< 0).
     """
 
     def __init__(
@@ -313,9 +318,11 @@ cdef class SubscribeOrderBook(SubscribeData):
         bint managed = True,
         int interval_ms = 1000,
         bint only_deltas = True,
+        int conflate_interval_ms = 0,
         dict[str, object] params: dict | None = None,
     ) -> None:
         Condition.positive_int(interval_ms, "interval_ms")
+        Condition.not_negative_int(conflate_interval_ms, "conflate_interval_ms")
         super().__init__(
             DataType(OrderBookDelta) if only_deltas else DataType(OrderBook),
             client_id,
@@ -330,6 +337,7 @@ cdef class SubscribeOrderBook(SubscribeData):
         self.managed = managed
         self.interval_ms = interval_ms
         self.only_deltas = only_deltas
+        self.conflate_interval_ms = conflate_interval_ms
 
     def __str__(self) -> str:
         return (
@@ -340,6 +348,7 @@ cdef class SubscribeOrderBook(SubscribeData):
             f"managed={self.managed}, "
             f"interval_ms={self.interval_ms}, "
             f"only_deltas={self.only_deltas}, "
+            f"conflate_interval_ms={self.conflate_interval_ms}, "
             f"client_id={self.client_id}, "
             f"venue={self.venue})"
         )
@@ -353,6 +362,7 @@ cdef class SubscribeOrderBook(SubscribeData):
             f"managed={self.managed}, "
             f"interval_ms={self.interval_ms}, "
             f"only_deltas={self.only_deltas}, "
+            f"conflate_interval_ms={self.conflate_interval_ms}, "
             f"client_id={self.client_id}, "
             f"venue={self.venue}, "
             f"id={self.id}{form_params_str(self.params)})"
@@ -0,0 +1,60 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint8_t
+
+from nautilus_trader.core.rust.core cimport CVec
+from nautilus_trader.core.rust.model cimport PriceRaw
+from nautilus_trader.model.data cimport QuoteTick
+from nautilus_trader.model.data cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.instruments.synthetic cimport SyntheticInstrument
+from nautilus_trader.model.objects cimport Price
+
+
+cdef class SyntheticEvaluator:
+    cdef dict _slots
+    cdef double* _bids
+    cdef double* _asks
+    cdef double* _lasts
+    cdef uint8_t* _has_quote
+    cdef uint8_t* _has_trade
+    cdef CVec _bid_inputs
+    cdef CVec _ask_inputs
+    cdef CVec _last_inputs
+
+    cdef readonly SyntheticInstrument synthetic
+    """The synthetic instrument for the evaluator.\n\n:returns: `SyntheticInstrument`"""
+    cdef readonly list components
+    """The component instrument IDs, in slot order.\n\n:returns: `list[InstrumentId]`"""
+    cdef readonly int size
+    """The count of component slots.\n\n:returns: `int`"""
+    cdef readonly int quotes_missing
+    """The count of components with no quote yet.\n\n:returns: `int`"""
+    cdef readonly int trades_missing
+    """The count of components with no trade yet.\n\n:returns: `int`"""
+
+    cpdef int slot(self, InstrumentId instrument_id)
+    cpdef InstrumentId missing_quote(self)
+    cpdef InstrumentId missing_trade(self)
+    cdef void set_quote(self, int slot, PriceRaw bid_raw, PriceRaw ask_raw)
+    cdef void set_trade(self, int slot, PriceRaw price_raw)
+    cpdef void update_quote(self, QuoteTick tick)
+    cpdef void update_trade(self, TradeTick tick)
+    cpdef Price calculate_bid(self)
+    cpdef Price calculate_ask(self)
+    cpdef Price calculate_last(self)
+    cdef Price _calculate(self, CVec* inputs)
+    cpdef void reset(self)
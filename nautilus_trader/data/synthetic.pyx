@@ -0,0 +1,297 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from cpython.mem cimport PyMem_Free
+from cpython.mem cimport PyMem_Malloc
+from libc.stdint cimport uint8_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.core cimport CVec
+from nautilus_trader.core.rust.model cimport ERROR_PRICE
+from nautilus_trader.core.rust.model cimport Price_t
+from nautilus_trader.core.rust.model cimport PriceRaw
+from nautilus_trader.core.rust.model cimport synthetic_instrument_calculate
+from nautilus_trader.model.data cimport QuoteTick
+from nautilus_trader.model.data cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.instruments.synthetic cimport SyntheticInstrument
+from nautilus_trader.model.objects cimport Price
+
+
+cdef class SyntheticEvaluator:
+    """
+    Provides a compiled evaluator for a synthetic instrument's derivation formula.
+
+    The components are resolved once into slots (in formula input order), each holding
+    the latest bid, ask and last price of its component instrument. Slots are updated in
+    place as component ticks arrive, and the formula is evaluated directly over the slot
+    buffers, so no lists, cache lookups or allocations are needed per tick.
+
+    Parameters
+    ----------
+    synthetic : SyntheticInstrument
+        The synthetic instrument to evaluate.
+
+    Raises
+    ------
+    MemoryError
+        If the slot buffers cannot be allocated.
+
+    Notes
+    -----
+    Slot values are held as `double` since the formula is evaluated over floating point
+    inputs. The values are converted from the fixed-point raw prices exactly as
+    `Price.as_double()` would, so results are identical to `SyntheticInstrument.calculate`.
+
+    """
+
+    def __init__(self, SyntheticInstrument synthetic not None) -> None:
+        cdef list components = synthetic.components  # Decodes the components once
+        Condition.not_empty(components, "components")
+
+        cdef int size = len(components)
+        self._bids = <double *>PyMem_Malloc(size * sizeof(double))
+        self._asks = <double *>PyMem_Malloc(size * sizeof(double))
+        self._lasts = <double *>PyMem_Malloc(size * sizeof(double))
+        self._has_quote = <uint8_t *>PyMem_Malloc(size * sizeof(uint8_t))
+        self._has_trade = <uint8_t *>PyMem_Malloc(size * sizeof(uint8_t))
+        if (
+            not self._bids
+            or not self._asks
+            or not self._lasts
+            or not self._has_quote
+            or not self._has_trade
+        ):
+            raise MemoryError()
+
+        self._bid_inputs.ptr = self._bids
+        self._bid_inputs.len = size
+        self._bid_inputs.cap = size
+        self._ask_inputs.ptr = self._asks
+        self._ask_inputs.len = size
+        self._ask_inputs.cap = size
+        self._last_inputs.ptr = self._lasts
+        self._last_inputs.len = size
+        self._last_inputs.cap = size
+
+        self.synthetic = synthetic
+        self.components = components
+        self.size = size
+        self._slots = {instrument_id: i for i, instrument_id in enumerate(components)}
+
+        self.reset()
+
+    def __dealloc__(self) -> None:
+        PyMem_Free(self._bids)
+        PyMem_Free(self._asks)
+        PyMem_Free(self._lasts)
+        PyMem_Free(self._has_quote)
+        PyMem_Free(self._has_trade)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"synthetic_id={self.synthetic.id}, "
+            f"size={self.size}, "
+            f"quotes_missing={self.quotes_missing}, "
+            f"trades_missing={self.trades_missing})"
+        )
+
+    cpdef int slot(self, InstrumentId instrument_id):
+        """
+        Return the slot index for the given component instrument ID.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The component instrument ID.
+
+        Returns
+        -------
+        int
+            The slot index, or -1 if `instrument_id` is not a component.
+
+        """
+        return self._slots.get(instrument_id, -1)
+
+    cpdef InstrumentId missing_quote(self):
+        """
+        Return the first component instrument ID with no quote yet.
+
+        Returns
+        -------
+        InstrumentId or ``None``
+
+        """
+        cdef int i
+        for i in range(self.size):
+            if not self._has_quote[i]:
+                return self.components[i]
+        return None
+
+    cpdef InstrumentId missing_trade(self):
+        """
+        Return the first component instrument ID with no trade yet.
+
+        Returns
+        -------
+        InstrumentId or ``None``
+
+        """
+        cdef int i
+        for i in range(self.size):
+            if not self._has_trade[i]:
+                return self.components[i]
+        return None
+
+    cdef void set_quote(self, int slot, PriceRaw bid_raw, PriceRaw ask_raw):
+        self._bids[slot] = Price.raw_to_f64_c(bid_raw)
+        self._asks[slot] = Price.raw_to_f64_c(ask_raw)
+        if not self._has_quote[slot]:
+            self._has_quote[slot] = True
+            self.quotes_missing -= 1
+
+    cdef void set_trade(self, int slot, PriceRaw price_raw):
+        self._lasts[slot] = Price.raw_to_f64_c(price_raw)
+        if not self._has_trade[slot]:
+            self._has_trade[slot] = True
+            self.trades_missing -= 1
+
+    cpdef void update_quote(self, QuoteTick tick):
+        """
+        Update the component slot for the given quote tick.
+
+        Ticks for instruments which are not components are ignored.
+
+        Parameters
+        ----------
+        tick : QuoteTick
+            The component quote tick.
+
+        """
+        Condition.not_none(tick, "tick")
+
+        cdef int slot = self._slots.get(tick.instrument_id, -1)
+        if slot == -1:
+            return
+
+        self.set_quote(slot, tick._mem.bid_price.raw, tick._mem.ask_price.raw)
+
+    cpdef void update_trade(self, TradeTick tick):
+        """
+        Update the component slot for the given trade tick.
+
+        Ticks for instruments which are not components are ignored.
+
+        Parameters
+        ----------
+        tick : TradeTick
+            The component trade tick.
+
+        """
+        Condition.not_none(tick, "tick")
+
+        cdef int slot = self._slots.get(tick.instrument_id, -1)
+        if slot == -1:
+            return
+
+        self.set_trade(slot, tick._mem.price.raw)
+
+    cpdef Price calculate_bid(self):
+        """
+        Calculate the synthetic bid price from the component bid prices.
+
+        Returns
+        -------
+        Price
+
+        Raises
+        ------
+        ValueError
+            If any component has no quote yet.
+        RuntimeError
+            If an internal error occurs when calculating the price.
+
+        """
+        Condition.is_true(self.quotes_missing == 0, "no quotes for all components yet")
+
+        return self._calculate(&self._bid_inputs)
+
+    cpdef Price calculate_ask(self):
+        """
+        Calculate the synthetic ask price from the component ask prices.
+
+        Returns
+        -------
+        Price
+
+        Raises
+        ------
+        ValueError
+            If any component has no quote yet.
+        RuntimeError
+            If an internal error occurs when calculating the price.
+
+        """
+        Condition.is_true(self.quotes_missing == 0, "no quotes for all components yet")
+
+        return self._calculate(&self._ask_inputs)
+
+    cpdef Price calculate_last(self):
+        """
+        Calculate the synthetic last price from the component last trade prices.
+
+        Returns
+        -------
+        Price
+
+        Raises
+        ------
+        ValueError
+            If any component has no trade yet.
+        RuntimeError
+            If an internal error occurs when calculating the price.
+
+        """
+        Condition.is_true(self.trades_missing == 0, "no trades for all components yet")
+
+        return self._calculate(&self._last_inputs)
+
+    cdef Price _calculate(self, CVec* inputs):
+        cdef Price_t mem = synthetic_instrument_calculate(&self.synthetic._mem, inputs)
+        if mem.precision == ERROR_PRICE.precision:
+            raise RuntimeError(
+                f"error calculating {self.synthetic.id} `SyntheticInstrument` price",
+            )
+
+        return Price.from_mem_c(mem)
+
+    cpdef void reset(self):
+        """
+        Reset the evaluator.
+
+        All slots are marked as having no quote or trade.
+
+        """
+        cdef int i
+        for i in range(self.size):
+            self._bids[i] = 0.0
+            self._asks[i] = 0.0
+            self._lasts[i] = 0.0
+            self._has_quote[i] = False
+            self._has_trade[i] = False
+
+        self.quotes_missing = self.size
+        self.trades_missing = self.size
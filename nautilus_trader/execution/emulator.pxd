@@ -22,6 +22,7 @@ from nautilus_trader.execution.messages cimport ModifyOrder
 from nautilus_trader.execution.messages cimport SubmitOrder
 from nautilus_trader.execution.messages cimport SubmitOrderList
 from nautilus_trader.execution.messages cimport TradingCommand
+from nautilus_trader.execution.trailing cimport TrailingStopTracker
 from nautilus_trader.model.events.order cimport OrderCanceled
 from nautilus_trader.model.events.order cimport OrderEvent
 from nautilus_trader.model.events.order cimport OrderExpired
@@ -41,6 +42,7 @@ from nautilus_trader.model.orders.base cimport Order
 cdef class OrderEmulator(Actor):
     cdef OrderManager _manager
     cdef dict[InstrumentId, MatchingCore] _matching_cores
+    cdef dict[InstrumentId, TrailingStopTracker] _trailing_trackers
 
     cdef set[InstrumentId] _subscribed_quotes
     cdef set[InstrumentId] _subscribed_trades
@@ -72,5 +74,8 @@ cdef class OrderEmulator(Actor):
     cpdef void _fill_market_order(self, Order order)
     cpdef void _fill_limit_order(self, Order order)
 
+    cdef void _delete_order(self, MatchingCore matching_core, Order order)
     cdef void _iterate_orders(self, MatchingCore matching_core)
     cdef void _update_trailing_stop_order(self, MatchingCore matching_core, Order order)
+    cdef tuple _trailing_stop_prices(self, MatchingCore matching_core)
+    cdef void _apply_trailing_stop(self, MatchingCore matching_core, Order order, Price bid, Price ask, Price last)
@@ -26,8 +26,8 @@ from nautilus_trader.common.component cimport RECV
 from nautilus_trader.common.component cimport SENT
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport LogColor
+from nautilus_trader.common.component cimport LogLevel
 from nautilus_trader.common.component cimport MessageBus
-from nautilus_trader.common.component cimport is_logging_initialized
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.message cimport Event
 from nautilus_trader.core.rust.model cimport ContingencyType
@@ -45,6 +45,7 @@ from nautilus_trader.execution.messages cimport ModifyOrder
 from nautilus_trader.execution.messages cimport SubmitOrder
 from nautilus_trader.execution.messages cimport TradingCommand
 from nautilus_trader.execution.trailing cimport TrailingStopCalculator
+from nautilus_trader.execution.trailing cimport TrailingStopTracker
 from nautilus_trader.model.book cimport OrderBook
 from nautilus_trader.model.data cimport OrderBookDeltas
 from nautilus_trader.model.data cimport QuoteTick
@@ -130,6 +131,7 @@ cdef class OrderEmulator(Actor):
         )
 
         self._matching_cores: dict[InstrumentId, MatchingCore]  = {}
+        self._trailing_trackers: dict[InstrumentId, TrailingStopTracker] = {}
 
         self._subscribed_quotes: set[InstrumentId] = set()
         self._subscribed_trades: set[InstrumentId] = set()
@@ -192,6 +194,17 @@ cdef class OrderEmulator(Actor):
         """
         return self._matching_cores.get(instrument_id)
 
+    def get_trailing_stop_tracker(self, InstrumentId instrument_id) -> TrailingStopTracker | None:
+        """
+        Return the emulators trailing stop tracker for the given trigger instrument ID.
+
+        Returns
+        -------
+        TrailingStopTracker or ``None``
+
+        """
+        return self._trailing_trackers.get(instrument_id)
+
 # -- ACTION IMPLEMENTATIONS -----------------------------------------------------------------------
 
     cpdef void on_start(self):
@@ -265,7 +278,7 @@ cdef class OrderEmulator(Actor):
         if order.is_closed_c():
             matching_core = self._matching_cores.get(order.instrument_id)
             if matching_core is not None:
-                matching_core.delete_order(order)
+                self._delete_order(matching_core, order)
 
     cpdef void on_stop(self):
         pass
@@ -273,6 +286,7 @@ cdef class OrderEmulator(Actor):
     cpdef void on_reset(self):
         self._manager.reset()
         self._matching_cores.clear()
+        self._trailing_trackers.clear()
 
         self.command_count = 0
         self.event_count = 0
@@ -347,6 +361,7 @@ cdef class OrderEmulator(Actor):
         )
 
         self._matching_cores[instrument_id] = matching_core
+        self._trailing_trackers[instrument_id] = TrailingStopTracker(price_increment)
 
         if self.debug:
             self._log.info(f"Created matching core for {instrument_id}", LogColor.MAGENTA)
@@ -427,6 +442,10 @@ cdef class OrderEmulator(Actor):
         # Hold in matching core
         matching_core.add_order(order)
 
+        # Track trailing stop
+        if order.order_type == OrderType.TRAILING_STOP_MARKET or order.order_type == OrderType.TRAILING_STOP_LIMIT:
+            self._trailing_trackers[matching_core._instrument_id].add_order(order)
+
         cdef OrderEmulated event
         if order.status_c() == OrderStatus.INITIALIZED:
             # Generate event
@@ -510,6 +529,12 @@ cdef class OrderEmulator(Actor):
             return
 
         matching_core.match_order(order)
+
+        # Reindex trailing stop from its modified prices
+        cdef TrailingStopTracker tracker = self._trailing_trackers[trigger_instrument_id]
+        if tracker.contains(order.client_order_id):
+            tracker.add_order(order)
+
         if order.side == OrderSide.BUY:
             matching_core.sort_bid_orders()
         elif order.side == OrderSide.SELL:
@@ -586,7 +611,7 @@ cdef class OrderEmulator(Actor):
         cdef InstrumentId trigger_instrument_id = order.instrument_id if order.trigger_instrument_id is None else order.trigger_instrument_id
         cdef MatchingCore matching_core = self._matching_cores.get(trigger_instrument_id)
         if matching_core is not None:
-            matching_core.delete_order(order)
+            self._delete_order(matching_core, order)
 
         self.cache.update_order_pending_cancel_local(order)
 
@@ -666,7 +691,7 @@ cdef class OrderEmulator(Actor):
         cdef InstrumentId trigger_instrument_id = order.instrument_id if order.trigger_instrument_id is None else order.trigger_instrument_id
         cdef MatchingCore matching_core = self._matching_cores.get(trigger_instrument_id)
         if matching_core is not None:
-            matching_core.delete_order(order)
+            self._delete_order(matching_core, order)
 
         order.emulation_trigger = TriggerType.NO_TRIGGER
         cdef MarketOrder transformed = MarketOrder.transform(order, self.clock.timestamp_ns())
@@ -738,7 +763,7 @@ cdef class OrderEmulator(Actor):
         cdef InstrumentId trigger_instrument_id = order.instrument_id if order.trigger_instrument_id is None else order.trigger_instrument_id
         cdef MatchingCore matching_core = self._matching_cores.get(trigger_instrument_id)
         if matching_core is not None:
-            matching_core.delete_order(order)
+            self._delete_order(matching_core, order)
 
         order.emulation_trigger = TriggerType.NO_TRIGGER
         cdef LimitOrder transformed = LimitOrder.transform(order, self.clock.timestamp_ns())
@@ -800,7 +825,7 @@ cdef class OrderEmulator(Actor):
     cpdef void on_order_book_deltas(self, deltas):
         cdef OrderBookDeltas _deltas = deltas  # C typing to optimize performance
 
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Processing {repr(_deltas)}", LogColor.CYAN)
 
 
@@ -826,7 +851,7 @@ cdef class OrderEmulator(Actor):
         self._iterate_orders(matching_core)
 
     cpdef void on_quote_tick(self, QuoteTick tick):
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Processing {repr(tick)}", LogColor.CYAN)
 
         cdef MatchingCore matching_core = self._matching_cores.get(tick.instrument_id)
@@ -840,7 +865,7 @@ cdef class OrderEmulator(Actor):
         self._iterate_orders(matching_core)
 
     cpdef void on_trade_tick(self, TradeTick tick):
-        if is_logging_initialized():
+        if self._log.is_enabled(LogLevel.DEBUG):
             self._log.debug(f"Processing {repr(tick)}...", LogColor.CYAN)
 
         cdef MatchingCore matching_core = self._matching_cores.get(tick.instrument_id)
@@ -855,45 +880,83 @@ cdef class OrderEmulator(Actor):
 
         self._iterate_orders(matching_core)
 
+    cdef void _delete_order(self, MatchingCore matching_core, Order order):
+        matching_core.delete_order(order)
+
+        cdef TrailingStopTracker tracker = self._trailing_trackers.get(matching_core._instrument_id)
+        if tracker is not None:
+            tracker.remove_order(order.client_order_id)
+
     cdef void _iterate_orders(self, MatchingCore matching_core):
         matching_core.iterate(self._clock.timestamp_ns())
 
-        cdef list orders = matching_core.get_orders()
+        # Manage trailing stops (only those whose trigger or limit price could move)
+        cdef TrailingStopTracker tracker = self._trailing_trackers.get(matching_core._instrument_id)
+        if tracker is None or len(tracker) == 0:
+            return
+
+        cdef list orders = tracker.pop_candidates(matching_core)
+        if not orders:
+            return
+
+        # Prices are only materialized once per update for all candidates
+        cdef tuple prices = self._trailing_stop_prices(matching_core)
+        cdef Price bid = prices[0]
+        cdef Price ask = prices[1]
+        cdef Price last = prices[2]
+
         cdef Order order
         for order in orders:
-            if order.is_closed_c():
-                continue
+            if order.is_closed_c() or not matching_core.order_exists(order.client_order_id):
+                continue  # No longer emulated
 
-            # Manage trailing stop
-            if order.order_type == OrderType.TRAILING_STOP_MARKET or order.order_type == OrderType.TRAILING_STOP_LIMIT:
-                self._update_trailing_stop_order(matching_core, order)
+            self._apply_trailing_stop(matching_core, order, bid, ask, last)
+            tracker.add_order(order)
 
     cdef void _update_trailing_stop_order(self, MatchingCore matching_core, Order order):
-        # TODO: Improve efficiency of this ---------------------------------
+        cdef tuple prices = self._trailing_stop_prices(matching_core)
+        self._apply_trailing_stop(matching_core, order, prices[0], prices[1], prices[2])
+
+    cdef tuple _trailing_stop_prices(self, MatchingCore matching_core):
         cdef Price bid = None
         cdef Price ask = None
         cdef Price last = None
         if matching_core.is_bid_initialized:
-            bid = Price.from_raw_c(matching_core.bid_raw, matching_core.price_precision)
+            bid = Price.from_raw_c(matching_core.bid_raw, matching_core._price_precision)
         if matching_core.is_ask_initialized:
-            ask = Price.from_raw_c(matching_core.ask_raw, matching_core.price_precision)
+            ask = Price.from_raw_c(matching_core.ask_raw, matching_core._price_precision)
         if matching_core.is_last_initialized:
-            last = Price.from_raw_c(matching_core.last_raw, matching_core.price_precision)
-
-        cdef QuoteTick quote_tick = self.cache.quote_tick(matching_core.instrument_id)
-        cdef TradeTick trade_tick = self.cache.trade_tick(matching_core.instrument_id)
-        if bid is None and quote_tick is not None:
-            bid = quote_tick.bid_price
-        if ask is None and quote_tick is not None:
-            ask = quote_tick.ask_price
-        if last is None and trade_tick is not None:
-            last = trade_tick.price
-        # TODO: ------------------------------------------------------------
-
+            last = Price.from_raw_c(matching_core.last_raw, matching_core._price_precision)
+
+        # Fall back to the cache for any prices not yet seen by the matching core
+        cdef QuoteTick quote_tick
+        cdef TradeTick trade_tick
+        if bid is None or ask is None:
+            quote_tick = self.cache.quote_tick(matching_core.instrument_id)
+            if quote_tick is not None:
+                if bid is None:
+                    bid = quote_tick.bid_price
+                if ask is None:
+                    ask = quote_tick.ask_price
+        if last is None:
+            trade_tick = self.cache.trade_tick(matching_core.instrument_id)
+            if trade_tick is not None:
+                last = trade_tick.price
+
+        return bid, ask, last
+
+    cdef void _apply_trailing_stop(
+        self,
+        MatchingCore matching_core,
+        Order order,
+        Price bid,
+        Price ask,
+        Price last,
+    ):
         cdef tuple output
         try:
             output = TrailingStopCalculator.calculate(
-                price_increment=matching_core.price_increment,
+                price_increment=matching_core._price_increment,
                 order=order,
                 bid=bid,
                 ask=ask,
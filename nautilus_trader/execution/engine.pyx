@@ -1203,6 +1203,8 @@ cdef class ExecutionEngine(Component):
                 self._create_position_state_snapshot(position, open_only=True)
         else:
             try:
+                # Reject a duplicate fill before snapshotting, so it leaves no snapshot behind
+                position._check_duplicate_trade_id(fill)
                 # Always snapshot opening positions to handle NETTING OMS
                 self._cache.snapshot_position(position)
                 position.apply(fill)
@@ -13,8 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.core.rust.model cimport TrailingOffsetType
+from nautilus_trader.execution.matching_core cimport MatchingCore
+from nautilus_trader.model.identifiers cimport ClientOrderId
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.orders.base cimport Order
 
@@ -48,3 +52,30 @@ cdef class TrailingStopCalculator:
         Price bid,
         Price ask,
     )
+
+
+cdef class TrailingStopTracker:
+    cdef Price _price_increment
+    cdef double _increment_f64
+    cdef object _margin_raw
+    cdef dict _entries
+    cdef list _heaps
+    cdef uint64_t _seq
+    cdef int _stale
+
+    cpdef bint contains(self, ClientOrderId client_order_id)
+    cpdef void add_order(self, Order order)
+    cpdef void remove_order(self, ClientOrderId client_order_id)
+    cpdef void clear(self)
+    cpdef list pop_candidates(self, MatchingCore matching_core)
+    cdef object _threshold(self, Order order)
+    cdef object _price_threshold(
+        self,
+        TrailingOffsetType trailing_offset_type,
+        OrderSide side,
+        double offset,
+        Price price,
+    )
+    cdef void _pop_heap(self, list heap, object ref, list candidates)
+    cdef void _pop_all(self, list heap, list candidates)
+    cdef void _compact(self)
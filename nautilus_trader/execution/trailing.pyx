@@ -13,13 +13,22 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.model cimport FIXED_SCALAR
 from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.core.rust.model cimport OrderType
 from nautilus_trader.core.rust.model cimport TrailingOffsetType
 from nautilus_trader.core.rust.model cimport TriggerType
+from nautilus_trader.execution.matching_core cimport MatchingCore
 from nautilus_trader.model.functions cimport trailing_offset_type_to_str
 from nautilus_trader.model.functions cimport trigger_type_to_str
+from nautilus_trader.model.identifiers cimport ClientOrderId
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.orders.base cimport Order
 
@@ -342,3 +351,298 @@ cdef class TrailingStopCalculator:
             return Price(bid_f64 - offset, precision=price_increment.precision)
         else:
             raise RuntimeError(f"invalid `OrderSide`, was {side}")  # pragma: no cover (design-time error)
+
+
+# Reference price kinds for tracked orders
+cdef int _REF_LAST = 0
+cdef int _REF_BID_ASK = 1
+cdef int _REF_LAST_OR_BID_ASK = 2
+
+# Threshold key for orders which must be recalculated on every update
+cdef object _ALWAYS = -(1 << 130)
+
+
+cdef class TrailingStopTracker:
+    """
+    Provides an index of emulated trailing stop orders, keyed by the raw reference price
+    beyond which each order's trigger (or limit) price could move.
+
+    A SELL trailing stop only moves when its reference price rises above its trigger
+    price plus the trailing offset, and a BUY trailing stop only moves when its reference
+    price falls below its trigger price minus the trailing offset. The tracker holds these
+    thresholds in raw fixed-point in a min-heap per side and reference price kind, so an
+    update only touches the orders whose thresholds have been crossed.
+
+    Thresholds are widened by one price increment to allow for rounding, so candidates
+    must still be confirmed with the `TrailingStopCalculator`.
+
+    Parameters
+    ----------
+    price_increment : Price
+        The minimum price increment (tick size) for the instrument.
+
+    """
+
+    def __init__(self, Price price_increment not None) -> None:
+        self._price_increment = price_increment
+        self._increment_f64 = price_increment.as_f64_c()
+        self._margin_raw = price_increment._mem.raw
+        self._entries: dict[ClientOrderId, tuple] = {}
+        self._heaps: list[list[tuple]] = [[] for _ in range(6)]
+        self._seq = 0
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(orders={len(self._entries)})"
+
+    cpdef bint contains(self, ClientOrderId client_order_id):
+        """
+        Return a value indicating whether the tracker holds an order with the given ID.
+
+        Parameters
+        ----------
+        client_order_id : ClientOrderId
+            The client order ID to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        return client_order_id in self._entries
+
+    cpdef void add_order(self, Order order):
+        """
+        Add the given trailing stop order to the tracker.
+
+        If the order is already tracked then its threshold is recalculated from the
+        current trigger (and limit) price.
+
+        Parameters
+        ----------
+        order : Order
+            The trailing stop order to add.
+
+        """
+        Condition.not_none(order, "order")
+
+        cdef int ref_kind
+        if (
+            order.trigger_type == TriggerType.DEFAULT
+            or order.trigger_type == TriggerType.LAST_PRICE
+            or order.trigger_type == TriggerType.MARK_PRICE
+        ):
+            ref_kind = _REF_LAST
+        elif order.trigger_type == TriggerType.BID_ASK:
+            ref_kind = _REF_BID_ASK
+        elif order.trigger_type == TriggerType.LAST_OR_BID_ASK:
+            ref_kind = _REF_LAST_OR_BID_ASK
+        else:
+            ref_kind = _REF_LAST  # Not supported by the calculator, surfaced on every update
+
+        cdef int heap_index = ref_kind * 2 + (0 if order.side == OrderSide.BUY else 1)
+        cdef object key = self._threshold(order)
+        if key is not _ALWAYS and order.side == OrderSide.BUY:
+            key = -key  # BUY orders are candidates when the reference falls below the threshold
+
+        if order.client_order_id in self._entries:
+            self._stale += 1
+
+        self._seq += 1
+        self._entries[order.client_order_id] = (self._seq, key, heap_index, order)
+        heappush(self._heaps[heap_index], (key, self._seq, order.client_order_id))
+
+    cpdef void remove_order(self, ClientOrderId client_order_id):
+        """
+        Remove the order with the given ID from the tracker (if found).
+
+        Parameters
+        ----------
+        client_order_id : ClientOrderId
+            The client order ID to remove.
+
+        """
+        if self._entries.pop(client_order_id, None) is None:
+            return
+
+        self._stale += 1
+        if self._stale > 64 and self._stale > 2 * len(self._entries):
+            self._compact()
+
+    cpdef void clear(self):
+        """
+        Clear all orders from the tracker.
+
+        """
+        self._entries.clear()
+        cdef list heap
+        for heap in self._heaps:
+            heap.clear()
+        self._stale = 0
+
+    cpdef list pop_candidates(self, MatchingCore matching_core):
+        """
+        Remove and return the orders whose trigger (or limit) price could move given
+        the current prices of the matching core.
+
+        Orders whose reference prices are not yet initialized in the matching core are
+        always returned. Orders which remain active should be added back to the tracker
+        once updated.
+
+        Parameters
+        ----------
+        matching_core : MatchingCore
+            The matching core holding the current prices.
+
+        Returns
+        -------
+        list[Order]
+
+        """
+        cdef list candidates = []
+        if not self._entries:
+            return candidates
+
+        cdef bint has_bid = matching_core.is_bid_initialized
+        cdef bint has_ask = matching_core.is_ask_initialized
+        cdef bint has_last = matching_core.is_last_initialized
+        cdef object bid = matching_core.bid_raw
+        cdef object ask = matching_core.ask_raw
+        cdef object last = matching_core.last_raw
+
+        # Last price
+        if has_last:
+            self._pop_heap(self._heaps[0], -last, candidates)
+            self._pop_heap(self._heaps[1], last, candidates)
+        else:
+            self._pop_all(self._heaps[0], candidates)
+            self._pop_all(self._heaps[1], candidates)
+
+        # Bid/ask prices
+        if has_ask:
+            self._pop_heap(self._heaps[2], -ask, candidates)
+        else:
+            self._pop_all(self._heaps[2], candidates)
+        if has_bid:
+            self._pop_heap(self._heaps[3], bid, candidates)
+        else:
+            self._pop_all(self._heaps[3], candidates)
+
+        # Last or bid/ask prices (the most favorable reference for each side)
+        if has_last and has_ask:
+            self._pop_heap(self._heaps[4], -min(last, ask), candidates)
+        else:
+            self._pop_all(self._heaps[4], candidates)
+        if has_last and has_bid:
+            self._pop_heap(self._heaps[5], max(last, bid), candidates)
+        else:
+            self._pop_all(self._heaps[5], candidates)
+
+        return candidates
+
+    cdef object _threshold(self, Order order):
+        cdef Price trigger_price = order.trigger_price
+        if trigger_price is None:
+            return _ALWAYS
+
+        cdef object threshold = self._price_threshold(
+            order.trailing_offset_type,
+            order.side,
+            float(order.trailing_offset),
+            trigger_price,
+        )
+        if threshold is _ALWAYS or order.order_type != OrderType.TRAILING_STOP_LIMIT:
+            return threshold
+
+        cdef Price price = order.price
+        if price is None:
+            return _ALWAYS
+
+        cdef object limit_threshold = self._price_threshold(
+            order.trailing_offset_type,
+            order.side,
+            float(order.limit_offset),
+            price,
+        )
+        if limit_threshold is _ALWAYS:
+            return _ALWAYS
+
+        # The order is a candidate once either price could move
+        if order.side == OrderSide.BUY:
+            return max(threshold, limit_threshold)
+        else:
+            return min(threshold, limit_threshold)
+
+    cdef object _price_threshold(
+        self,
+        TrailingOffsetType trailing_offset_type,
+        OrderSide side,
+        double offset,
+        Price price,
+    ):
+        cdef double price_f64 = price.as_f64_c()
+        cdef double boundary
+        if trailing_offset_type == TrailingOffsetType.PRICE:
+            boundary = price_f64 - offset if side == OrderSide.BUY else price_f64 + offset
+        elif trailing_offset_type == TrailingOffsetType.TICKS:
+            offset *= self._increment_f64
+            boundary = price_f64 - offset if side == OrderSide.BUY else price_f64 + offset
+        elif trailing_offset_type == TrailingOffsetType.BASIS_POINTS:
+            offset = offset / 10_000
+            if side == OrderSide.BUY:
+                boundary = price_f64 / (1.0 + offset)
+            elif offset < 1.0:
+                boundary = price_f64 / (1.0 - offset)
+            else:
+                return _ALWAYS
+        else:
+            return _ALWAYS  # Not supported by the calculator, surfaced on every update
+
+        cdef object boundary_raw = int(boundary * FIXED_SCALAR)
+        if side == OrderSide.BUY:
+            return boundary_raw + self._margin_raw
+        else:
+            return boundary_raw - self._margin_raw
+
+    cdef void _pop_heap(self, list heap, object ref, list candidates):
+        cdef tuple item
+        cdef tuple entry
+        while heap and heap[0][0] < ref:
+            item = heappop(heap)
+            entry = self._entries.get(item[2])
+            if entry is None or entry[0] != item[1]:
+                self._stale -= 1
+                continue  # Stale
+            del self._entries[item[2]]
+            candidates.append(entry[3])
+
+    cdef void _pop_all(self, list heap, list candidates):
+        cdef tuple item
+        cdef tuple entry
+        for item in heap:
+            entry = self._entries.get(item[2])
+            if entry is None or entry[0] != item[1]:
+                self._stale -= 1
+                continue  # Stale
+            del self._entries[item[2]]
+            candidates.append(entry[3])
+
+        heap.clear()
+
+    cdef void _compact(self):
+        cdef list heap
+        for heap in self._heaps:
+            heap.clear()
+
+        cdef ClientOrderId client_order_id
+        cdef tuple entry
+        for client_order_id, entry in self._entries.items():
+            self._heaps[entry[2]].append((entry[1], entry[0], client_order_id))
+
+        for heap in self._heaps:
+            heapify(heap)
+
+        self._stale = 0
@@ -43,10 +43,33 @@ class LiveDataEngineConfig(DataEngineConfig, frozen=True):
     ----------
     qsize : PositiveInt, default 100_000
         The queue size for the engines internal queue buffers.
+    drain_batch_size : PositiveInt, default 1
+        The maximum number of data messages processed per data queue wakeup.
+        Messages already buffered on the queue are drained without awaiting,
+        avoiding an event loop round trip per message. A value of 1 processes
+        one message per wakeup.
+    quote_conflation_hwm : PositiveInt, optional
+        The data queue size (high-water mark) above which quotes within a drained batch
+        are conflated to the latest quote per instrument. Only applies when
+        `drain_batch_size` is greater than 1. If ``None`` then quotes are never conflated.
+    track_queue_latency : bool, default False
+        If the enqueue to handle latency of data queue messages is recorded in a histogram.
+    trace_sample_rate : PositiveInt, optional
+        If data path tracing is enabled, one in every `trace_sample_rate` data messages
+        has its latency recorded at each stage from the adapter through to the
+        subscribed handlers. If ``None`` then tracing is disabled (with no overhead).
+    trace_log_interval_secs : PositiveFloat, optional
+        The interval (seconds) between logging data path tracing summaries.
+        Only applies when `trace_sample_rate` is set.
 
     """
 
     qsize: PositiveInt = 100_000
+    drain_batch_size: PositiveInt = 1
+    quote_conflation_hwm: PositiveInt | None = None
+    track_queue_latency: bool = False
+    trace_sample_rate: PositiveInt | None = None
+    trace_log_interval_secs: PositiveFloat | None = None
 
 
 class LiveRiskEngineConfig(RiskEngineConfig, frozen=True):
@@ -112,6 +135,20 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
         If True, the **check_open_orders** requests only currently open orders from the venue.
         If False, it requests the entire order history, which can be a heavy API call.
         This parameter only applies if the **check_open_orders** task is running.
+    order_query_batch_size : PositiveInt, optional
+        If set, the in-flight and open order checks query order status in batches
+        (grouped per client and instrument) of up to this many orders, through
+        `LiveExecutionClient.generate_order_status_reports_batch`, instead of issuing
+        one `QueryOrder` command per in-flight order or requesting all order status
+        reports when **open_check_open_only** is False. If ``None`` then batching is disabled.
+    order_query_max_concurrency : PositiveInt, default 10
+        The maximum number of concurrent order status requests per client for batched
+        order queries (for clients without a bulk query implementation).
+    order_query_max_backoff_intervals : NonNegativeInt, default 32
+        The maximum number of check intervals to skip after consecutive failed batched
+        order query rounds (where a query request errored, orders not found are not failures).
+        The backoff is tracked separately for the in-flight and open order checks, doubles
+        on each failed round and resets on success.
     purge_closed_orders_interval_mins : PositiveInt, optional
         The interval (minutes) between purging closed orders from the in-memory cache,
         **will not purge from the database**. If None, closed orders will **not** be automatically purged.
@@ -138,6 +175,13 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
         A recommended setting is 60 minutes for HFT.
     qsize : PositiveInt, default 100_000
         The queue size for the engines internal queue buffers.
+    drain_batch_size : PositiveInt, default 1
+        The maximum number of order events processed per event queue wakeup.
+        Events already buffered on the queue are drained without awaiting,
+        avoiding an event loop round trip per event. A value of 1 processes
+        one event per wakeup.
+    track_queue_latency : bool, default False
+        If the enqueue to handle latency of event queue messages is recorded in a histogram.
 
     """
 
@@ -152,6 +196,9 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
     own_books_audit_interval_secs: PositiveFloat | None = None
     open_check_interval_secs: PositiveFloat | None = None
     open_check_open_only: bool = True
+    order_query_batch_size: PositiveInt | None = None
+    order_query_max_concurrency: PositiveInt = 10
+    order_query_max_backoff_intervals: NonNegativeInt = 32
     purge_closed_orders_interval_mins: PositiveInt | None = None
     purge_closed_orders_buffer_mins: NonNegativeInt | None = None
     purge_closed_positions_interval_mins: PositiveInt | None = None
@@ -159,6 +206,8 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
     purge_account_events_interval_mins: PositiveInt | None = None
     purge_account_events_lookback_mins: NonNegativeInt | None = None
     qsize: PositiveInt = 100_000
+    drain_batch_size: PositiveInt = 1
+    track_queue_latency: bool = False
 
 
 class RoutingConfig(NautilusConfig, frozen=True):
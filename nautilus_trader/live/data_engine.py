@@ -20,6 +20,7 @@ from typing import Final
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.histogram import LatencyHistogram
 from nautilus_trader.config import LiveDataEngineConfig
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.data import Data
@@ -28,6 +29,9 @@ from nautilus_trader.data.messages import DataCommand
 from nautilus_trader.data.messages import DataResponse
 from nautilus_trader.data.messages import RequestData
 from nautilus_trader.live.enqueue import ThrottledEnqueuer
+from nautilus_trader.live.enqueue import drain_nowait
+from nautilus_trader.live.tracing import DataPathTracer
+from nautilus_trader.model.data import QuoteTick
 
 
 class LiveDataEngine(DataEngine):
@@ -107,8 +111,31 @@ class LiveDataEngine(DataEngine):
             loop=self._loop,
             clock=self._clock,
             logger=self._log,
+            timestamped=config.track_queue_latency,
         )
 
+        # Data queue batching
+        self._drain_limit: int = config.drain_batch_size - 1
+        self._quote_conflation_hwm: int | None = config.quote_conflation_hwm
+        self._conflated_quote_count: int = 0
+        self._data_queue_latency: LatencyHistogram | None = None
+        self._handle_queued_data = self._handle_data
+        if config.track_queue_latency:
+            self._data_queue_latency = LatencyHistogram()
+            self._handle_queued_data = self._handle_timestamped_data
+
+        # Data path tracing (swaps in traced handlers only when enabled)
+        self._tracer: DataPathTracer | None = None
+        self._trace_log_interval_secs: float | None = config.trace_log_interval_secs
+        self._trace_log_task: asyncio.Task | None = None
+        if config.trace_sample_rate is not None:
+            self._tracer = DataPathTracer(clock=self._clock, sample_rate=config.trace_sample_rate)
+            self._handle_untraced_data = self._handle_queued_data
+            self._handle_queued_data = self._handle_traced_data
+            self._msgbus.deregister(endpoint="DataEngine.process", handler=self.process)
+            self._msgbus.register(endpoint="DataEngine.process", handler=self._process_traced)
+            self._msgbus.subscribe(topic="data.*", handler=self._tracer.on_publish, priority=100)
+
         # Async tasks
         self._cmd_queue_task: asyncio.Task | None = None
         self._req_queue_task: asyncio.Task | None = None
@@ -230,6 +257,41 @@ class LiveDataEngine(DataEngine):
         """
         return self._data_queue.qsize()
 
+    def data_queue_latency(self) -> LatencyHistogram | None:
+        """
+        Return the enqueue to handle latency histogram (nanoseconds) for the data queue.
+
+        Returns
+        -------
+        LatencyHistogram or ``None``
+            ``None`` if `track_queue_latency` is not enabled in the config.
+
+        """
+        return self._data_queue_latency
+
+    def conflated_quote_count(self) -> int:
+        """
+        Return the total count of quotes dropped by data queue conflation.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._conflated_quote_count
+
+    def data_path_tracer(self) -> DataPathTracer | None:
+        """
+        Return the data path tracer for the engine.
+
+        Returns
+        -------
+        DataPathTracer or ``None``
+            ``None`` if `trace_sample_rate` is not set in the config.
+
+        """
+        return self._tracer
+
     def kill(self) -> None:
         """
         Kill the engine by abruptly canceling the queue tasks and calling stop.
@@ -253,6 +315,7 @@ class LiveDataEngine(DataEngine):
             self._log.debug(f"Canceling task '{self._data_queue_task.get_name()}'")
             self._data_queue_task.cancel()
             self._data_queue_task = None
+        self._cancel_trace_log_task()
 
     def execute(self, command: DataCommand) -> None:
         """
@@ -341,12 +404,21 @@ class LiveDataEngine(DataEngine):
         self._res_queue_task = self._loop.create_task(self._run_req_queue(), name="req_queue")
         self._data_queue_task = self._loop.create_task(self._run_data_queue(), name="data_queue")
 
+        if self._tracer is not None and self._trace_log_interval_secs:
+            self._trace_log_task = self._loop.create_task(
+                self._trace_log_loop(self._trace_log_interval_secs),
+                name="trace_log",
+            )
+            self._log.debug(f"Scheduled task '{self._trace_log_task.get_name()}'")
+
         self._log.debug(f"Scheduled task '{self._cmd_queue_task.get_name()}'")
         self._log.debug(f"Scheduled task '{self._req_queue_task.get_name()}'")
         self._log.debug(f"Scheduled task '{self._res_queue_task.get_name()}'")
         self._log.debug(f"Scheduled task '{self._data_queue_task.get_name()}'")
 
     def _on_stop(self) -> None:
+        self._cancel_trace_log_task()
+
         if self._kill:
             return  # Avoids queuing redundant sentinel messages
 
@@ -418,12 +490,30 @@ class LiveDataEngine(DataEngine):
 
     async def _run_data_queue(self) -> None:
         self._log.debug(f"Data queue processing starting (qsize={self.data_qsize()})")
+        queue = self._data_queue
+        drain_limit = self._drain_limit
+        handle = self._handle_queued_data
         try:
             while True:
-                data: Data | None = await self._data_queue.get()
+                data: Data | None = await queue.get()
                 if data is self._sentinel:
                     break
-                self._handle_data(data)
+                if drain_limit == 0:
+                    handle(data)
+                    continue
+
+                # Process everything already buffered (up to the limit) per wakeup
+                batch: list = [data]
+                stopped = drain_nowait(queue, batch, drain_limit)
+                if (
+                    self._quote_conflation_hwm is not None
+                    and queue.qsize() + len(batch) > self._quote_conflation_hwm
+                ):
+                    batch = self._conflate_quotes(batch)
+                for data in batch:
+                    handle(data)
+                if stopped:
+                    break
         except asyncio.CancelledError:
             self._log.warning("Data message queue canceled")
         except Exception as e:
@@ -434,3 +524,63 @@ class LiveDataEngine(DataEngine):
                 self._log.warning(f"{stopped_msg} with {self.data_qsize()} message(s) on queue")
             else:
                 self._log.debug(stopped_msg)
+
+    def _handle_timestamped_data(self, item: tuple[int, Data]) -> None:
+        ts_enqueued, data = item
+        if self._data_queue_latency is not None:
+            self._data_queue_latency.record(self._clock.timestamp_ns() - ts_enqueued)
+        self._handle_data(data)
+
+    def _conflate_quotes(self, batch: list) -> list:
+        # Keep only the latest quote per instrument, preserving the order of all
+        # other data and of each instrument's latest quote within the batch
+        timestamped = self._data_queue_latency is not None
+        seen: set = set()
+        conflated: list = []
+        for item in reversed(batch):
+            data = item[1] if timestamped else item
+            if isinstance(data, QuoteTick):
+                if data.instrument_id in seen:
+                    continue
+                seen.add(data.instrument_id)
+            conflated.append(item)
+
+        self._conflated_quote_count += len(batch) - len(conflated)
+        conflated.reverse()
+        return conflated
+
+    def _process_traced(self, data: Data) -> None:
+        if self._tracer is not None:
+            self._tracer.on_process(data)
+        self._data_enqueuer.enqueue(data)
+
+    def _handle_traced_data(self, item: Data | tuple[int, Data]) -> None:
+        tracer = self._tracer
+        if tracer is None:
+            self._handle_untraced_data(item)
+            return
+
+        data = item[1] if isinstance(item, tuple) else item
+        trace = tracer.on_dequeue(data)
+        self._handle_untraced_data(item)
+        if trace is not None:
+            tracer.on_handled(trace)
+
+    def _cancel_trace_log_task(self) -> None:
+        if self._trace_log_task:
+            self._log.debug(f"Canceling task '{self._trace_log_task.get_name()}'")
+            self._trace_log_task.cancel()
+            self._trace_log_task = None
+
+    async def _trace_log_loop(self, interval_secs: float) -> None:
+        tracer = self._tracer
+        if tracer is None:
+            return
+
+        try:
+            while True:
+                await asyncio.sleep(interval_secs)
+                for line in tracer.summary_lines():
+                    self._log.info(f"Data path latency: {line}")
+        except asyncio.CancelledError:
+            self._log.debug("Canceled task 'trace_log_loop'")
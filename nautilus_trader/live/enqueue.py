@@ -40,6 +40,9 @@ class ThrottledEnqueuer(Generic[T]):
         The clock for throttling log messages.
     logger : Logger
         The logger to use for capacity warning logs.
+    timestamped : bool, default False
+        If messages are enqueued as ``(ts_enqueued_ns, msg)`` tuples, allowing the
+        consumer to measure the enqueue to handle latency.
 
     """
 
@@ -50,12 +53,14 @@ class ThrottledEnqueuer(Generic[T]):
         loop: asyncio.AbstractEventLoop,
         clock: Clock,
         logger: Logger,
+        timestamped: bool = False,
     ) -> None:
         self._qname = qname
         self._queue = queue
         self._loop = loop
         self._clock = clock
         self._log = logger
+        self._timestamped = timestamped
         self._ts_last_logged: int = 0
 
     @property
@@ -94,6 +99,18 @@ class ThrottledEnqueuer(Generic[T]):
         """
         return self._queue.maxsize
 
+    @property
+    def timestamped(self) -> bool:
+        """
+        Return whether messages are enqueued with their enqueue timestamp.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._timestamped
+
     def enqueue(self, msg: T) -> None:
         """
         Enqueue a message and logs a throttled warning if the queue is at capacity.
@@ -110,11 +127,13 @@ class ThrottledEnqueuer(Generic[T]):
         # Do not allow None through (None is a sentinel value which stops the queue)
         assert msg is not None, "message was `None` when a value was expected"
 
+        item: T | tuple[int, T] = (self._clock.timestamp_ns(), msg) if self._timestamped else msg
+
         if self._queue.qsize() < self._queue.maxsize:
-            self._loop.call_soon_threadsafe(self._enqueue_nowait_safely, self._queue, msg)
+            self._loop.call_soon_threadsafe(self._enqueue_nowait_safely, self._queue, item)
             return
 
-        self._loop.create_task(self._queue.put(msg))
+        self._loop.create_task(self._queue.put(item))
 
         # Throttle logging to once per second
         now_ns = self._clock.timestamp_ns()
@@ -125,7 +144,7 @@ class ThrottledEnqueuer(Generic[T]):
             )
             self._ts_last_logged = now_ns
 
-    def _enqueue_nowait_safely(self, queue: asyncio.Queue, msg: T) -> None:
+    def _enqueue_nowait_safely(self, queue: asyncio.Queue, msg: T | tuple[int, T]) -> None:
         # Attempt put_nowait(msg) and if the queue is full,
         # schedule an async put() as a fallback.
         try:
@@ -139,3 +158,38 @@ class ThrottledEnqueuer(Generic[T]):
                     else None
                 ),
             )
+
+
+def drain_nowait(queue: asyncio.Queue, batch: list, limit: int) -> bool:
+    """
+    Drain up to `limit` messages already buffered on the `queue` into the `batch`.
+
+    Draining stops early when the queue is empty or the ``None`` sentinel is
+    received (the sentinel is not appended to the batch).
+
+    Parameters
+    ----------
+    queue : asyncio.Queue
+        The queue to drain.
+    batch : list
+        The list to append the drained messages to.
+    limit : int
+        The maximum number of messages to drain.
+
+    Returns
+    -------
+    bool
+        True if the sentinel was received, else False.
+
+    """
+    get_nowait = queue.get_nowait
+    append = batch.append
+    for _ in range(limit):
+        try:
+            msg = get_nowait()
+        except asyncio.QueueEmpty:
+            return False
+        if msg is None:
+            return True
+        append(msg)
+    return False
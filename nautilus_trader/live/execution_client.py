@@ -354,6 +354,63 @@ class LiveExecutionClient(ExecutionClient):
             "method `generate_order_status_reports` must be implemented in the subclass",
         )  # pragma: no cover
 
+    async def generate_order_status_reports_batch(
+        self,
+        commands: list[GenerateOrderStatusReport],
+        max_concurrency: int = 10,
+    ) -> list[OrderStatusReport]:
+        """
+        Generate `OrderStatusReport`s for a batch of orders.
+
+        All commands in a batch are for orders routed through this client and share the
+        same instrument. The default implementation calls `generate_order_status_report`
+        for each command, with at most `max_concurrency` requests in-flight at once.
+        Adapters for venues which support bulk order status queries should override this
+        method to query the whole batch with as few requests as possible.
+
+        Orders which are not found, or whose query fails, are omitted from the returned list.
+        If every query fails then the first error is raised, so that the caller can back off.
+
+        Parameters
+        ----------
+        commands : list[GenerateOrderStatusReport]
+            The commands for generating the reports.
+        max_concurrency : int, default 10
+            The maximum number of concurrent requests to the venue.
+
+        Returns
+        -------
+        list[OrderStatusReport]
+
+        """
+        PyCondition.positive_int(max_concurrency, "max_concurrency")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate(command: GenerateOrderStatusReport) -> OrderStatusReport | None:
+            async with semaphore:
+                return await self.generate_order_status_report(command)
+
+        results = await asyncio.gather(
+            *(generate(command) for command in commands),
+            return_exceptions=True,
+        )
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors and len(errors) == len(results):
+            raise errors[0]
+
+        reports: list[OrderStatusReport] = []
+        for command, result in zip(commands, results, strict=True):
+            if isinstance(result, OrderStatusReport):
+                reports.append(result)
+            elif isinstance(result, Exception):
+                self._log.warning(
+                    f"Failed to generate OrderStatusReport for {command.client_order_id!r}: {result}",
+                )
+
+        return reports
+
     async def generate_fill_reports(
         self,
         command: GenerateFillReports,
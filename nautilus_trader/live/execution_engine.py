@@ -26,6 +26,7 @@ from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.enums import LogColor
 from nautilus_trader.common.enums import LogLevel
+from nautilus_trader.common.histogram import LatencyHistogram
 from nautilus_trader.config import LiveExecEngineConfig
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.datetime import dt_to_unix_nanos
@@ -33,6 +34,7 @@ from nautilus_trader.core.datetime import millis_to_nanos
 from nautilus_trader.core.fsm import InvalidStateTrigger
 from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.execution.engine import ExecutionEngine
+from nautilus_trader.execution.messages import GenerateOrderStatusReport
 from nautilus_trader.execution.messages import GenerateOrderStatusReports
 from nautilus_trader.execution.messages import GeneratePositionStatusReports
 from nautilus_trader.execution.messages import QueryOrder
@@ -43,6 +45,8 @@ from nautilus_trader.execution.reports import FillReport
 from nautilus_trader.execution.reports import OrderStatusReport
 from nautilus_trader.execution.reports import PositionStatusReport
 from nautilus_trader.live.enqueue import ThrottledEnqueuer
+from nautilus_trader.live.enqueue import drain_nowait
+from nautilus_trader.live.execution_client import LiveExecutionClient
 from nautilus_trader.model.book import py_should_handle_own_book_order
 from nautilus_trader.model.enums import LiquiditySide
 from nautilus_trader.model.enums import OrderSide
@@ -77,6 +81,11 @@ from nautilus_trader.model.orders import OrderUnpacker
 from nautilus_trader.model.position import Position
 
 
+# The check loops for batched order queries, each with its own backoff
+_INFLIGHT_CHECK = "in-flight"
+_OPEN_CHECK = "open"
+
+
 class LiveExecutionEngine(ExecutionEngine):
     """
     Provides a high-performance asynchronous live execution engine.
@@ -139,8 +148,17 @@ class LiveExecutionEngine(ExecutionEngine):
             loop=self._loop,
             clock=self._clock,
             logger=self._log,
+            timestamped=config.track_queue_latency,
         )
 
+        # Event queue batching
+        self._drain_limit: int = config.drain_batch_size - 1
+        self._evt_queue_latency: LatencyHistogram | None = None
+        self._handle_queued_event = self._handle_event
+        if config.track_queue_latency:
+            self._evt_queue_latency = LatencyHistogram()
+            self._handle_queued_event = self._handle_timestamped_event
+
         # Async tasks
         self._cmd_queue_task: asyncio.Task | None = None
         self._evt_queue_task: asyncio.Task | None = None
@@ -170,8 +188,15 @@ class LiveExecutionEngine(ExecutionEngine):
         self.purge_closed_positions_buffer_mins = config.purge_closed_positions_buffer_mins
         self.purge_account_events_interval_mins = config.purge_account_events_interval_mins
         self.purge_account_events_lookback_mins = config.purge_account_events_lookback_mins
+        self.order_query_batch_size: int | None = config.order_query_batch_size
+        self.order_query_max_concurrency: int = config.order_query_max_concurrency
+        self.order_query_max_backoff_intervals: int = config.order_query_max_backoff_intervals
         self._inflight_check_threshold_ns: int = millis_to_nanos(self.inflight_check_threshold_ms)
 
+        # Adaptive backoff for batched order queries per check loop (number of check intervals to skip)
+        self._order_query_backoff: dict[str, int] = {_INFLIGHT_CHECK: 0, _OPEN_CHECK: 0}
+        self._order_query_skips: dict[str, int] = {_INFLIGHT_CHECK: 0, _OPEN_CHECK: 0}
+
         self._log.info(f"{config.reconciliation=}", LogColor.BLUE)
         self._log.info(f"{config.reconciliation_lookback_mins=}", LogColor.BLUE)
         self._log.info(f"{config.filter_unclaimed_external_orders=}", LogColor.BLUE)
@@ -182,6 +207,9 @@ class LiveExecutionEngine(ExecutionEngine):
         self._log.info(f"{config.own_books_audit_interval_secs=}", LogColor.BLUE)
         self._log.info(f"{config.open_check_interval_secs=}", LogColor.BLUE)
         self._log.info(f"{config.open_check_open_only=}", LogColor.BLUE)
+        self._log.info(f"{config.order_query_batch_size=}", LogColor.BLUE)
+        self._log.info(f"{config.order_query_max_concurrency=}", LogColor.BLUE)
+        self._log.info(f"{config.order_query_max_backoff_intervals=}", LogColor.BLUE)
         self._log.info(f"{config.purge_closed_orders_interval_mins=}", LogColor.BLUE)
         self._log.info(f"{config.purge_closed_orders_buffer_mins=}", LogColor.BLUE)
         self._log.info(f"{config.purge_closed_positions_interval_mins=}", LogColor.BLUE)
@@ -311,6 +339,18 @@ class LiveExecutionEngine(ExecutionEngine):
         """
         return self._evt_queue.qsize()
 
+    def evt_queue_latency(self) -> LatencyHistogram | None:
+        """
+        Return the enqueue to handle latency histogram (nanoseconds) for the event queue.
+
+        Returns
+        -------
+        LatencyHistogram or ``None``
+            ``None`` if `track_queue_latency` is not enabled in the config.
+
+        """
+        return self._evt_queue_latency
+
     # -- COMMANDS -------------------------------------------------------------------------------------
 
     def kill(self) -> None:
@@ -476,12 +516,25 @@ class LiveExecutionEngine(ExecutionEngine):
         self._log.debug(
             f"Event message queue processing starting (qsize={self.evt_qsize()})",
         )
+        queue = self._evt_queue
+        drain_limit = self._drain_limit
+        handle = self._handle_queued_event
         try:
             while True:
-                event: OrderEvent | None = await self._evt_queue.get()
+                event: OrderEvent | None = await queue.get()
                 if event is self._sentinel:
                     break
-                self._handle_event(event)
+                if drain_limit == 0:
+                    handle(event)
+                    continue
+
+                # Process everything already buffered (up to the limit) per wakeup
+                batch: list = [event]
+                stopped = drain_nowait(queue, batch, drain_limit)
+                for event in batch:
+                    handle(event)
+                if stopped:
+                    break
         except asyncio.CancelledError:
             self._log.warning("Canceled task 'run_evt_queue'")
         except Exception as e:
@@ -493,6 +546,12 @@ class LiveExecutionEngine(ExecutionEngine):
             else:
                 self._log.debug(stopped_msg)
 
+    def _handle_timestamped_event(self, item: tuple[int, OrderEvent]) -> None:
+        ts_enqueued, event = item
+        if self._evt_queue_latency is not None:
+            self._evt_queue_latency.record(self._clock.timestamp_ns() - ts_enqueued)
+        self._handle_event(event)
+
     async def _inflight_check_loop(self) -> None:
         try:
             while True:
@@ -512,6 +571,12 @@ class LiveExecutionEngine(ExecutionEngine):
         self._log.debug(
             f"Found {inflight_len} order{'' if inflight_len == 1 else 's'} in-flight",
         )
+        if self.order_query_batch_size is not None:
+            if self._skip_order_query(_INFLIGHT_CHECK):
+                return
+            await self._check_inflight_orders_batched(inflight_orders)
+            return
+
         for order in inflight_orders:
             retries = self._inflight_check_retries[order.client_order_id]
             if retries >= self.inflight_check_max_retries:
@@ -539,6 +604,129 @@ class LiveExecutionEngine(ExecutionEngine):
                 self._execute_command(query)
                 self._inflight_check_retries[order.client_order_id] += 1
 
+    async def _check_inflight_orders_batched(self, inflight_orders: list[Order]) -> None:
+        ts_now = self._clock.timestamp_ns()
+        query_orders: list[Order] = []
+        for order in inflight_orders:
+            retries = self._inflight_check_retries[order.client_order_id]
+            if retries >= self.inflight_check_max_retries:
+                self._inflight_check_retries.pop(order.client_order_id, None)
+                self._resolve_inflight_order(order)
+                continue
+
+            if ts_now > order.last_event.ts_event + self._inflight_check_threshold_ns:
+                query_orders.append(order)
+                self._inflight_check_retries[order.client_order_id] += 1
+
+        if not query_orders:
+            return
+
+        reports = await self._query_orders_batched(_INFLIGHT_CHECK, query_orders)
+        for report in reports:
+            order = self._cache.order(report.client_order_id) if report.client_order_id else None
+            if order is not None and not order.is_inflight:
+                continue  # Already resolved by a venue event while querying
+            self.reconcile_report(report)
+
+    def _skip_order_query(self, check: str) -> bool:
+        if self._order_query_skips[check] > 0:
+            self._order_query_skips[check] -= 1
+            self._log.debug(
+                f"Skipping batched {check} order query during backoff "
+                f"({self._order_query_skips[check]} remaining)",
+            )
+            return True
+        return False
+
+    def _update_order_query_backoff(self, check: str, success: bool) -> None:
+        if success:
+            self._order_query_backoff[check] = 0
+            return
+
+        backoff = min(
+            max(1, self._order_query_backoff[check] * 2),
+            self.order_query_max_backoff_intervals,
+        )
+        self._order_query_backoff[check] = backoff
+        self._order_query_skips[check] = backoff
+        self._log.warning(
+            f"Batched {check} order query failed, backing off for {backoff} interval(s)",
+        )
+
+    def _client_for_order(self, order: Order) -> LiveExecutionClient | None:
+        client_id = self._cache.client_id(order.client_order_id)
+        client = self._clients.get(client_id) if client_id is not None else None
+        if client is None:
+            client = self._routing_map.get(order.venue, self._default_client)
+        return client
+
+    async def _query_orders_batched(
+        self,
+        check: str,
+        orders: list[Order],
+    ) -> list[OrderStatusReport]:
+        # Group the orders per client and instrument
+        groups: dict[LiveExecutionClient, dict[InstrumentId, list[Order]]] = {}
+        for order in orders:
+            client = self._client_for_order(order)
+            if not isinstance(client, LiveExecutionClient):
+                self._log.error(f"Cannot query {order.client_order_id!r}: no live execution client")
+                continue
+            groups.setdefault(client, {}).setdefault(order.instrument_id, []).append(order)
+
+        results = await asyncio.gather(
+            *(
+                self._query_client_orders(client, by_instrument)
+                for client, by_instrument in groups.items()
+            ),
+        )
+
+        reports = [report for client_reports, _ in results for report in client_reports]
+
+        # A round is considered failed when a query request errored (orders which
+        # were simply not found do not count as a failure)
+        self._update_order_query_backoff(check, success=not any(failed for _, failed in results))
+
+        return reports
+
+    async def _query_client_orders(
+        self,
+        client: LiveExecutionClient,
+        by_instrument: dict[InstrumentId, list[Order]],
+    ) -> tuple[list[OrderStatusReport], bool]:
+        batch_size: int = self.order_query_batch_size or 1
+        reports: list[OrderStatusReport] = []
+        failed = False
+
+        # Batches for a single client are queried sequentially so the client concurrency bound holds
+        for instrument_id, orders in by_instrument.items():
+            for i in range(0, len(orders), batch_size):
+                commands = [
+                    GenerateOrderStatusReport(
+                        instrument_id=instrument_id,
+                        client_order_id=order.client_order_id,
+                        venue_order_id=order.venue_order_id,
+                        command_id=UUID4(),
+                        ts_init=self._clock.timestamp_ns(),
+                    )
+                    for order in orders[i : i + batch_size]
+                ]
+                self._log.debug(
+                    f"Querying {len(commands)} {instrument_id} order(s) with {client.id}...",
+                )
+                try:
+                    reports.extend(
+                        await client.generate_order_status_reports_batch(
+                            commands,
+                            self.order_query_max_concurrency,
+                        ),
+                    )
+                except Exception as e:
+                    self._log.exception(f"Error querying order status with {client.id}", e)
+                    failed = True
+
+        return reports, failed
+
     def _resolve_inflight_order(self, order: Order) -> None:
         ts_now = self._clock.timestamp_ns()
 
@@ -607,6 +795,15 @@ class LiveExecutionEngine(ExecutionEngine):
             if not open_orders and not self.open_check_open_only:
                 return  # Nothing further to check
 
+            if self.order_query_batch_size is not None and not self.open_check_open_only:
+                # Query the status of the cached open orders only, rather than the full history
+                if self._skip_order_query(_OPEN_CHECK):
+                    return
+                for report in await self._query_orders_batched(_OPEN_CHECK, open_orders):
+                    if not report.is_open:
+                        self._reconcile_order_report(report, trades=[])
+                return
+
             if self.open_check_open_only:
                 clients = self._clients.values()
             else:
@@ -0,0 +1,315 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import itertools
+import math
+import time
+from collections.abc import Callable
+from enum import IntEnum
+
+from nautilus_trader.core.correctness import PyCondition
+
+
+class RequestPriority(IntEnum):
+    """
+    Represents the priority of a venue HTTP request (lower values are served first).
+    """
+
+    ORDER = 0
+    ACCOUNT = 1
+    MARKET_DATA = 2
+
+
+class WeightedRateLimiter:
+    """
+    Provides an asynchronous request-weight rate limiter for venue HTTP clients.
+
+    The limiter tracks the weight consumed within fixed windows (aligned to the epoch, as
+    venues such as Binance reset their counters on interval boundaries). Requests wait in
+    priority order, and a share of each window is reserved for `RequestPriority.ORDER`
+    requests, so that bulk reporting and market data requests can never starve order
+    submission, modification and cancellation.
+
+    The local estimate is kept in line with the venue by applying the used weight reported
+    in response headers (see `update_used`), and requests can be paused following a rate
+    limit response (see `pause` and `block_endpoint`).
+
+    Parameters
+    ----------
+    limit : int
+        The maximum weight per window.
+    interval_secs : float, default 60.0
+        The window interval (seconds).
+    order_reserve : float, default 0.2
+        The fraction of each window's weight reserved for order requests.
+    endpoint_weights : dict[str, int], optional
+        The request weight per endpoint key (endpoints not present use `default_weight`).
+    default_weight : int, default 1
+        The default request weight.
+    time_func : Callable[[], float], optional
+        The function returning the current UNIX time (seconds), defaults to `time.time`.
+
+    Raises
+    ------
+    ValueError
+        If `limit` is not a positive integer.
+    ValueError
+        If `interval_secs` is not positive (> 0).
+    ValueError
+        If `order_reserve` is not in the range [0, 1).
+    ValueError
+        If `default_weight` is not a positive integer.
+
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        interval_secs: float = 60.0,
+        order_reserve: float = 0.2,
+        endpoint_weights: dict[str, int] | None = None,
+        default_weight: int = 1,
+        time_func: Callable[[], float] | None = None,
+    ) -> None:
+        PyCondition.positive_int(limit, "limit")
+        PyCondition.positive(interval_secs, "interval_secs")
+        PyCondition.is_true(0 <= order_reserve < 1, "`order_reserve` was not in range [0, 1)")
+        PyCondition.positive_int(default_weight, "default_weight")
+
+        self.limit = limit
+        self.interval_secs = interval_secs
+        self.order_reserve = order_reserve
+        self.endpoint_weights: dict[str, int] = endpoint_weights or {}
+        self.default_weight = default_weight
+
+        self._time = time_func or time.time
+        self._window_start: float = 0.0
+        self._used: int = 0
+        self._paused_until: float = 0.0
+        self._blocked: dict[str, float] = {}
+        self._waiters: list[tuple[int, int, str]] = []
+        self._seq = itertools.count()
+        self._changed: asyncio.Future | None = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(limit={self.limit}, interval_secs={self.interval_secs}, used={self.used})"
+
+    @property
+    def used(self) -> int:
+        """
+        Return the weight used within the current window.
+
+        Returns
+        -------
+        int
+
+        """
+        self._roll(self._time())
+        return self._used
+
+    @property
+    def waiting(self) -> int:
+        """
+        Return the count of requests waiting for capacity.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._waiters)
+
+    def capacity(self, priority: RequestPriority) -> int:
+        """
+        Return the weight available per window to requests of the given priority.
+
+        Parameters
+        ----------
+        priority : RequestPriority
+            The request priority.
+
+        Returns
+        -------
+        int
+
+        """
+        if priority == RequestPriority.ORDER:
+            return self.limit
+        return max(1, math.floor(self.limit * (1.0 - self.order_reserve)))
+
+    def weight(self, endpoint: str) -> int:
+        """
+        Return the request weight for the given endpoint key.
+
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint key.
+
+        Returns
+        -------
+        int
+
+        """
+        return self.endpoint_weights.get(endpoint, self.default_weight)
+
+    async def acquire(
+        self,
+        endpoint: str,
+        priority: RequestPriority,
+        weight: int | None = None,
+    ) -> None:
+        """
+        Wait until the request can be sent, then consume its weight.
+
+        Requests are admitted in priority order (then first-come-first-served within each
+        priority).
+
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint key for the request.
+        priority : RequestPriority
+            The request priority.
+        weight : int, optional
+            The request weight. If ``None`` then the weight for `endpoint` is used.
+
+        """
+        if weight is None:
+            weight = self.weight(endpoint)
+
+        # A request can never exceed the full capacity for its priority
+        weight = min(weight, self.capacity(priority))
+
+        entry = (priority, next(self._seq), endpoint)
+        self._waiters.append(entry)
+        try:
+            while True:
+                now = self._time()
+                self._roll(now)
+                delay = self._delay(entry, priority, weight, now)
+                if delay is None:
+                    self._waiters.remove(entry)
+                    self._used += weight
+                    self._notify()
+                    return
+                await self._wait(delay)
+        except asyncio.CancelledError:
+            self._waiters.remove(entry)
+            self._notify()
+            raise
+
+    def update_used(self, used: int) -> None:
+        """
+        Update the used weight for the current window from a venue response.
+
+        The local estimate is only ever raised, as other processes (or requests not made
+        through this limiter) may share the same venue limit.
+
+        Parameters
+        ----------
+        used : int
+            The used weight reported by the venue.
+
+        """
+        self._roll(self._time())
+        if used > self._used:
+            self._used = used
+
+    def pause(self, secs: float) -> None:
+        """
+        Pause all requests for the given duration (e.g. on a rate limit response).
+
+        Parameters
+        ----------
+        secs : float
+            The pause duration (seconds).
+
+        """
+        self._paused_until = max(self._paused_until, self._time() + secs)
+
+    def block_endpoint(self, endpoint: str, until: float) -> None:
+        """
+        Block requests for the given endpoint key until the given time.
+
+        Used for venues which report remaining request counts per endpoint.
+
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint key.
+        until : float
+            The UNIX time (seconds) until which requests are blocked.
+
+        """
+        self._blocked[endpoint] = max(self._blocked.get(endpoint, 0.0), until)
+
+    def _roll(self, now: float) -> None:
+        window_start = now - (now % self.interval_secs)
+        if window_start > self._window_start:
+            self._window_start = window_start
+            self._used = 0
+
+    def _blocked_for(self, endpoint: str, now: float) -> float:
+        blocked_until = self._blocked.get(endpoint)
+        if blocked_until is None:
+            return 0.0
+        if now >= blocked_until:
+            del self._blocked[endpoint]
+            return 0.0
+        return blocked_until - now
+
+    def _delay(
+        self,
+        entry: tuple[int, int, str],
+        priority: RequestPriority,
+        weight: int,
+        now: float,
+    ) -> float | None:
+        # Return the maximum delay (seconds) before admission can next be checked,
+        # or `None` if the request can be admitted now.
+        if now < self._paused_until:
+            return self._paused_until - now
+
+        blocked = self._blocked_for(entry[2], now)
+        if blocked:
+            return blocked
+
+        next_window = self._window_start + self.interval_secs - now
+
+        # Requests for blocked endpoints do not hold up requests for other endpoints
+        head = min(
+            (w for w in self._waiters if not self._blocked_for(w[2], now)),
+            default=entry,
+        )
+        if head != entry:
+            return next_window  # Wait for higher priority (or earlier) requests
+
+        if self._used + weight > self.capacity(priority):
+            return next_window
+
+        return None
+
+    def _notify(self) -> None:
+        # Wake all waiting requests to re-check admission
+        if self._changed is not None and not self._changed.done():
+            self._changed.set_result(None)
+        self._changed = None
+
+    async def _wait(self, delay: float) -> None:
+        if self._changed is None:
+            self._changed = asyncio.get_running_loop().create_future()
+        await asyncio.wait((self._changed,), timeout=max(delay, 0.001))
@@ -0,0 +1,234 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import Any, Final
+
+from nautilus_trader.common.component import Clock
+from nautilus_trader.common.histogram import LatencyHistogram
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.data import Data
+
+
+class DataPathTrace:
+    """
+    Represents the stage timestamps (UNIX nanoseconds) of a single sampled data message.
+
+    Parameters
+    ----------
+    data : Data
+        The traced data message.
+    ts_process : int
+        UNIX timestamp (nanoseconds) when the data was handed to the engine by a client.
+
+    """
+
+    __slots__ = ("data", "ts_dequeue", "ts_process", "ts_publish")
+
+    def __init__(self, data: Data, ts_process: int) -> None:
+        self.data = data
+        self.ts_process = ts_process
+        self.ts_dequeue = 0
+        self.ts_publish = 0
+
+
+class DataPathTracer:
+    """
+    Provides sampled latency tracing of data messages through the live data path.
+
+    Each sampled message has timestamps recorded at each stage of the path, which
+    are aggregated into histograms per data type and instrument. The stages are:
+
+     - ``client``: from `ts_init` (stamped by the adapter on decode) to the client
+       handing the data to the engine.
+     - ``queue``: from the client hand off to the engine dequeuing the data.
+     - ``engine``: from dequeuing to the message bus dispatching the published data.
+     - ``handlers``: from the message bus dispatch until all subscribed handlers
+       (e.g. `Actor.handle_quote_tick`) have returned.
+     - ``total``: from `ts_init` until all subscribed handlers have returned.
+
+    Parameters
+    ----------
+    clock : Clock
+        The clock for the tracer.
+    sample_rate : int
+        The sampling rate, one in every `sample_rate` messages is traced.
+    max_pending : int, default 10_000
+        The maximum number of sampled messages awaiting dequeue before the
+        pending traces are discarded (protects against unbounded growth when
+        messages are dropped by conflation).
+
+    Raises
+    ------
+    ValueError
+        If `sample_rate` is not positive (> 0).
+    ValueError
+        If `max_pending` is not positive (> 0).
+
+    """
+
+    STAGES: Final[tuple[str, ...]] = ("client", "queue", "engine", "handlers", "total")
+
+    def __init__(
+        self,
+        clock: Clock,
+        sample_rate: int,
+        max_pending: int = 10_000,
+    ) -> None:
+        PyCondition.positive_int(sample_rate, "sample_rate")
+        PyCondition.positive_int(max_pending, "max_pending")
+
+        self._clock = clock
+        self._sample_rate = sample_rate
+        self._max_pending = max_pending
+        self._countdown = 1  # Sample the first message
+        self._pending: dict[int, DataPathTrace] = {}
+        self._active: DataPathTrace | None = None
+        self._histograms: dict[tuple[str, Any], dict[str, LatencyHistogram]] = {}
+
+    @property
+    def sample_rate(self) -> int:
+        """
+        Return the sampling rate (one in every `sample_rate` messages is traced).
+
+        Returns
+        -------
+        int
+
+        """
+        return self._sample_rate
+
+    def on_process(self, data: Data) -> None:
+        """
+        Handle the given data being handed to the engine (samples the message).
+
+        Parameters
+        ----------
+        data : Data
+            The data being processed.
+
+        """
+        self._countdown -= 1
+        if self._countdown > 0:
+            return
+        self._countdown = self._sample_rate
+
+        if len(self._pending) >= self._max_pending:
+            self._pending.clear()
+        self._pending[id(data)] = DataPathTrace(data, self._clock.timestamp_ns())
+
+    def on_dequeue(self, data: Data) -> DataPathTrace | None:
+        """
+        Handle the given data being dequeued by the engine.
+
+        Parameters
+        ----------
+        data : Data
+            The data dequeued.
+
+        Returns
+        -------
+        DataPathTrace or ``None``
+            The active trace if the data was sampled, else ``None``.
+
+        """
+        trace = self._pending.pop(id(data), None)
+        if trace is None or trace.data is not data:
+            return None
+        trace.ts_dequeue = self._clock.timestamp_ns()
+        self._active = trace
+        return trace
+
+    def on_publish(self, msg: Any) -> None:
+        """
+        Handle the given message being dispatched by the message bus.
+
+        Parameters
+        ----------
+        msg : Any
+            The published message.
+
+        """
+        trace = self._active
+        if trace is not None and trace.ts_publish == 0 and msg is trace.data:
+            trace.ts_publish = self._clock.timestamp_ns()
+
+    def on_handled(self, trace: DataPathTrace) -> None:
+        """
+        Complete the given trace once the engine has finished handling its data.
+
+        Parameters
+        ----------
+        trace : DataPathTrace
+            The trace to complete.
+
+        """
+        self._active = None
+        ts_handled = self._clock.timestamp_ns()
+        data = trace.data
+
+        key = (type(data).__name__, getattr(data, "instrument_id", None))
+        histograms = self._histograms.get(key)
+        if histograms is None:
+            histograms = {stage: LatencyHistogram() for stage in self.STAGES}
+            self._histograms[key] = histograms
+
+        ts_publish = trace.ts_publish or ts_handled  # Data may not have been published
+        histograms["client"].record(trace.ts_process - data.ts_init)
+        histograms["queue"].record(trace.ts_dequeue - trace.ts_process)
+        histograms["engine"].record(ts_publish - trace.ts_dequeue)
+        histograms["handlers"].record(ts_handled - ts_publish)
+        histograms["total"].record(ts_handled - data.ts_init)
+
+    def histograms(self) -> dict[tuple[str, Any], dict[str, LatencyHistogram]]:
+        """
+        Return the stage latency histograms (nanoseconds).
+
+        Returns
+        -------
+        dict[tuple[str, InstrumentId | None], dict[str, LatencyHistogram]]
+            Keyed by (data type name, instrument ID), then by stage name.
+
+        """
+        return self._histograms.copy()
+
+    def summary_lines(self) -> list[str]:
+        """
+        Return a summary line for each traced data type and instrument.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        lines: list[str] = []
+        for (data_type, instrument_id), histograms in self._histograms.items():
+            stages = " ".join(
+                f"{stage}(p50={h.percentile(0.5):_}, p99={h.percentile(0.99):_})"
+                for stage, h in histograms.items()
+            )
+            name = data_type if instrument_id is None else f"{data_type} {instrument_id}"
+            lines.append(f"{name} [n={histograms['total'].count}] ns: {stages}")
+        return lines
+
+    def reset(self) -> None:
+        """
+        Reset the tracer by clearing all pending traces and recorded histograms.
+        """
+        self._countdown = 1
+        self._pending.clear()
+        self._active = None
+        self._histograms.clear()
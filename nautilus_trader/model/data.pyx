@@ -194,6 +194,23 @@ cdef inline Bar bar_from_mem_c(Bar_t mem):
     return bar
 
 
+cdef inline Data data_from_mem_c(Data_t* ptr):
+    if ptr.tag == Data_t_Tag.DELTA:
+        return delta_from_mem_c(ptr.delta)
+    elif ptr.tag == Data_t_Tag.DELTAS:
+        return deltas_from_mem_c(ptr.deltas)
+    elif ptr.tag == Data_t_Tag.DEPTH10:
+        return depth10_from_mem_c(orderbook_depth10_clone(ptr.depth10))
+    elif ptr.tag == Data_t_Tag.QUOTE:
+        return quote_from_mem_c(ptr.quote)
+    elif ptr.tag == Data_t_Tag.TRADE:
+        return trade_from_mem_c(ptr.trade)
+    elif ptr.tag == Data_t_Tag.BAR:
+        return bar_from_mem_c(ptr.bar)
+    else:
+        raise RuntimeError("Invalid data element to convert from `PyCapsule`")
+
+
 # SAFETY: Do NOT deallocate the capsule here
 cpdef list capsule_to_list(capsule):
     cdef CVec* data = <CVec*>PyCapsule_GetPointer(capsule, NULL)
@@ -218,24 +235,36 @@ cpdef list capsule_to_list(capsule):
     return objects
 
 
+# SAFETY: Do NOT deallocate the capsule here, and fully consume the generator before
+# the capsule is deallocated by its creator (e.g. when advancing a query result to its next chunk)
+def capsule_to_iter(capsule):
+    """
+    Return a generator of data objects decoded one at a time from the given capsule.
+
+    Unlike `capsule_to_list` no intermediate list is built, so data can be fed directly
+    from a `DataBackendSession` query result chunk into a consumer such as the backtest
+    engine's data stream.
+
+    Parameters
+    ----------
+    capsule : PyCapsule
+        The capsule holding a `CVec` of data.
+
+    Returns
+    -------
+    Generator[Data]
+
+    """
+    cdef uint64_t length = (<CVec*>PyCapsule_GetPointer(capsule, NULL)).len
+    cdef uint64_t i
+    for i in range(0, length):
+        # The pointer is re-read on each resume rather than held across yields
+        yield data_from_mem_c(&(<Data_t*>(<CVec*>PyCapsule_GetPointer(capsule, NULL)).ptr)[i])
+
+
 # SAFETY: Do NOT deallocate the capsule here
 cpdef Data capsule_to_data(capsule):
-    cdef Data_t* ptr = <Data_t*>PyCapsule_GetPointer(capsule, NULL)
-
-    if ptr.tag == Data_t_Tag.DELTA:
-        return delta_from_mem_c(ptr.delta)
-    elif ptr.tag == Data_t_Tag.DELTAS:
-        return deltas_from_mem_c(ptr.deltas)
-    elif ptr.tag == Data_t_Tag.DEPTH10:
-        return depth10_from_mem_c(orderbook_depth10_clone(ptr.depth10))
-    elif ptr.tag == Data_t_Tag.QUOTE:
-        return quote_from_mem_c(ptr.quote)
-    elif ptr.tag == Data_t_Tag.TRADE:
-        return trade_from_mem_c(ptr.trade)
-    elif ptr.tag == Data_t_Tag.BAR:
-        return bar_from_mem_c(ptr.bar)
-    else:
-        raise RuntimeError("Invalid data element to convert from `PyCapsule`")
+    return data_from_mem_c(<Data_t*>PyCapsule_GetPointer(capsule, NULL))
 
 
 cdef class BarSpecification:
@@ -15,10 +15,16 @@
 
 from typing import Callable
 
+import numpy as np
+
 from nautilus_trader.core.nautilus_pyo3 import black_scholes_greeks
 from nautilus_trader.core.nautilus_pyo3 import imply_vol_and_greeks
 from nautilus_trader.model.enums import InstrumentClass
 from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.greeks_batch import GreeksArrays
+from nautilus_trader.model.greeks_batch import PortfolioGreeksGrid
+from nautilus_trader.model.greeks_batch import black_scholes_greeks_batch
+from nautilus_trader.model.greeks_batch import imply_vol_batch
 from nautilus_trader.model.greeks_data import GreeksData
 from nautilus_trader.model.greeks_data import PortfolioGreeks
 
@@ -415,22 +421,9 @@ cdef class GreeksCalculator:
         """
         ts_event = self._clock.timestamp_ns()
         portfolio_greeks = PortfolioGreeks(ts_event, ts_event)
-        open_positions = self._cache.positions_open(venue, instrument_id, strategy_id, side)
 
-        for position in open_positions:
+        for position in self._filter_open_positions(underlyings, venue, instrument_id, strategy_id, side):
             position_instrument_id = position.instrument_id
-
-            if underlyings is not None:
-                skip_position = True
-
-                for underlying in underlyings:
-                    if position_instrument_id.value.startswith(underlying):
-                        skip_position = False
-                        break
-
-                if skip_position:
-                    continue
-
             quantity = position.signed_qty
             instrument_greeks = self.instrument_greeks(
                 position_instrument_id,
@@ -453,6 +446,364 @@ cdef class GreeksCalculator:
 
         return portfolio_greeks
 
+    def instrument_greeks_batch(
+        self,
+        list instrument_ids not None,
+        flat_interest_rate: float = 0.0425,
+        flat_dividend_yield: float | None = None,
+        spot_shock: float = 0.,
+        vol_shock: float = 0.,
+        time_to_expiry_shock: float = 0.,
+        ts_event: int = 0,
+        percent_greeks: bool = False,
+        index_instrument_id: InstrumentId | None = None,
+        beta_weights: dict[InstrumentId, float] | None = None,
+    ) -> GreeksArrays:
+        """
+        Calculate option or underlying greeks for many instruments (e.g. an entire option chain)
+        in one vectorized pass, for a quantity of 1.
+
+        Market data and yield curves are read from the cache once per instrument, currency and
+        underlying, then implied volatilities and greeks are solved for all options at once.
+        Results follow the same conventions as `instrument_greeks`.
+
+        Parameters
+        ----------
+        instrument_ids : list[InstrumentId]
+            The IDs of the instruments to calculate greeks for.
+        flat_interest_rate : float, default 0.0425
+            The interest rate to use when no interest rate curve is cached for an option's currency.
+        flat_dividend_yield : float, optional
+            The dividend yield to use when no dividend yield curve is cached for an underlying.
+        spot_shock : float, default 0.0
+            Shock to apply to spot prices.
+        vol_shock : float, default 0.0
+            Shock to apply to implied volatilities.
+        time_to_expiry_shock : float, default 0.0
+            Shock in years to apply to times to expiry.
+        ts_event : int, default 0
+            Timestamp of the event triggering the calculation.
+        percent_greeks : bool, default False
+            Whether to compute greeks as percentage of the underlying price.
+        index_instrument_id : InstrumentId, optional
+            The reference instrument id beta is computed with respect to.
+        beta_weights : dict[InstrumentId, float], optional
+            Dictionary of beta weights used to compute delta and gamma.
+
+        Returns
+        -------
+        GreeksArrays
+            The greeks with one element per instrument, in the order of `instrument_ids`.
+            The vol of non-option instruments is NaN.
+
+        """
+        inputs = self._batch_inputs(instrument_ids, flat_interest_rate, flat_dividend_yield, ts_event)
+        greeks = self._batch_greeks(
+            inputs,
+            spot_shock,
+            vol_shock,
+            time_to_expiry_shock,
+            percent_greeks,
+            index_instrument_id,
+            beta_weights,
+        )
+
+        return GreeksArrays(
+            vol=greeks["vol"],
+            price=greeks["price"],
+            delta=greeks["delta"],
+            gamma=greeks["gamma"],
+            vega=greeks["vega"],
+            theta=greeks["theta"],
+        )
+
+    def portfolio_greeks_grid(
+        self,
+        spot_shocks,
+        vol_shocks,
+        time_to_expiry_shocks,
+        underlyings : list[str] = None,
+        Venue venue = None,
+        InstrumentId instrument_id = None,
+        StrategyId strategy_id = None,
+        PositionSide side = PositionSide.NO_POSITION_SIDE,
+        flat_interest_rate: float = 0.0425,
+        flat_dividend_yield: float | None = None,
+        percent_greeks: bool = False,
+        index_instrument_id: InstrumentId | None = None,
+        beta_weights: dict[InstrumentId, float] | None = None,
+    ) -> PortfolioGreeksGrid:
+        """
+        Calculate the portfolio greeks over a spot x vol x time to expiry shock grid in one call.
+
+        Implied volatilities are solved once for all matching open positions, then every
+        scenario of the grid is evaluated in a single vectorized pass. Each scenario equals
+        the result of `portfolio_greeks` called with the corresponding shocks.
+
+        Parameters
+        ----------
+        spot_shocks : array_like
+            The shocks to apply to underlying prices.
+        vol_shocks : array_like
+            The shocks to apply to implied volatilities.
+        time_to_expiry_shocks : array_like
+            The shocks in years to apply to times to expiry.
+        underlyings : list, optional
+            A list of underlying asset symbol prefixes as strings to filter positions.
+        venue : Venue, optional
+            The venue to filter positions.
+        instrument_id : InstrumentId, optional
+            The instrument ID to filter positions.
+        strategy_id : StrategyId, optional
+            The strategy ID to filter positions.
+        side : PositionSide, default PositionSide.NO_POSITION_SIDE
+            The position side to filter.
+        flat_interest_rate : float, default 0.0425
+            The interest rate to use for calculations when no curve is available.
+        flat_dividend_yield : float, optional
+            The dividend yield to use for calculations when no dividend curve is available.
+        percent_greeks : bool, default False
+            Whether to compute greeks as percentage of the underlying price.
+        index_instrument_id : InstrumentId, optional
+            The reference instrument id beta is computed with respect to.
+        beta_weights : dict[InstrumentId, float], optional
+            Dictionary of beta weights used to compute portfolio delta and gamma.
+
+        Returns
+        -------
+        PortfolioGreeksGrid
+
+        """
+        spot_shocks = np.atleast_1d(np.asarray(spot_shocks, dtype=np.float64))
+        vol_shocks = np.atleast_1d(np.asarray(vol_shocks, dtype=np.float64))
+        time_to_expiry_shocks = np.atleast_1d(np.asarray(time_to_expiry_shocks, dtype=np.float64))
+        shape = (len(spot_shocks), len(vol_shocks), len(time_to_expiry_shocks))
+
+        positions = self._filter_open_positions(underlyings, venue, instrument_id, strategy_id, side)
+        if not positions:
+            return PortfolioGreeksGrid(
+                spot_shocks=spot_shocks,
+                vol_shocks=vol_shocks,
+                time_to_expiry_shocks=time_to_expiry_shocks,
+                pnl=np.zeros(shape),
+                price=np.zeros(shape),
+                delta=np.zeros(shape),
+                gamma=np.zeros(shape),
+                vega=np.zeros(shape),
+                theta=np.zeros(shape),
+            )
+
+        ts_event = self._clock.timestamp_ns()
+        inputs = self._batch_inputs(
+            [position.instrument_id for position in positions],
+            flat_interest_rate,
+            flat_dividend_yield,
+            ts_event,
+        )
+        greeks = self._batch_greeks(
+            inputs,
+            spot_shocks[:, None, None, None],
+            vol_shocks[None, :, None, None],
+            time_to_expiry_shocks[None, None, :, None],
+            percent_greeks,
+            index_instrument_id,
+            beta_weights,
+        )
+
+        quantity = np.array([position.signed_qty for position in positions], dtype=np.float64)
+        avg_px_open = np.array([position.avg_px_open for position in positions], dtype=np.float64)
+        pnl = np.where(
+            inputs["is_option"],
+            greeks["price"] - inputs["multiplier"] * avg_px_open,
+            inputs["multiplier"] * (greeks["underlying_price"] - avg_px_open),
+        )
+        price = np.where(inputs["is_option"], greeks["price"], pnl)
+
+        # Weight by position quantity and aggregate over positions for every scenario
+        full_shape = shape + (len(positions),)
+        return PortfolioGreeksGrid(
+            spot_shocks=spot_shocks,
+            vol_shocks=vol_shocks,
+            time_to_expiry_shocks=time_to_expiry_shocks,
+            pnl=np.broadcast_to(pnl * quantity, full_shape).sum(axis=-1),
+            price=np.broadcast_to(price * quantity, full_shape).sum(axis=-1),
+            delta=np.broadcast_to(greeks["delta"] * quantity, full_shape).sum(axis=-1),
+            gamma=np.broadcast_to(greeks["gamma"] * quantity, full_shape).sum(axis=-1),
+            vega=np.broadcast_to(greeks["vega"] * quantity, full_shape).sum(axis=-1),
+            theta=np.broadcast_to(greeks["theta"] * quantity, full_shape).sum(axis=-1),
+        )
+
+    def _filter_open_positions(
+        self,
+        underlyings: list[str] | None,
+        Venue venue,
+        InstrumentId instrument_id,
+        StrategyId strategy_id,
+        PositionSide side,
+    ) -> list[Position]:
+        cdef list positions = self._cache.positions_open(venue, instrument_id, strategy_id, side)
+        if underlyings is None:
+            return positions
+
+        return [
+            position
+            for position in positions
+            if any(position.instrument_id.value.startswith(underlying) for underlying in underlyings)
+        ]
+
+    def _batch_inputs(
+        self,
+        list instrument_ids,
+        flat_interest_rate: float,
+        flat_dividend_yield: float | None,
+        ts_event: int,
+    ) -> dict:
+        utc_now_ns = ts_event if ts_event is not None else self._clock.timestamp_ns()
+        utc_now = unix_nanos_to_dt(utc_now_ns)
+
+        cdef int count = len(instrument_ids)
+        is_option = np.zeros(count, dtype=np.bool_)
+        is_call = np.zeros(count, dtype=np.bool_)
+        strike = np.ones(count)
+        expiry_in_years = np.zeros(count)
+        multiplier = np.zeros(count)
+        underlying_price = np.zeros(count)
+        option_price = np.zeros(count)
+        interest_rate = np.zeros(count)
+        cost_of_carry = np.zeros(count)
+        underlying_ids = []
+
+        # Market data and curves are looked up once per key for the whole batch
+        underlying_prices = {}
+        yield_curves = {}
+
+        for i, instrument_id in enumerate(instrument_ids):
+            instrument = self._cache.instrument(instrument_id)
+            multiplier[i] = float(instrument.multiplier)
+
+            if instrument.instrument_class is not InstrumentClass.OPTION:
+                underlying_instrument_id = instrument.id
+            else:
+                underlying_instrument_id = InstrumentId.from_str(f"{instrument.underlying}.{instrument_id.venue}")
+
+            if underlying_instrument_id not in underlying_prices:
+                underlying_prices[underlying_instrument_id] = float(
+                    self._cache.price(underlying_instrument_id, PriceType.LAST),
+                )
+            underlying_price[i] = underlying_prices[underlying_instrument_id]
+            underlying_ids.append(underlying_instrument_id)
+
+            if instrument.instrument_class is not InstrumentClass.OPTION:
+                continue
+
+            is_option[i] = True
+            is_call[i] = instrument.option_kind is OptionKind.CALL
+            strike[i] = float(instrument.strike_price)
+            option_price[i] = float(self._cache.price(instrument_id, PriceType.MID))
+
+            expiry_utc = instrument.expiration_utc
+            expiry_in_years[i] = min((expiry_utc - utc_now).days, 1) / 365.25
+
+            currency = instrument.quote_currency.code
+            if currency not in yield_curves:
+                yield_curves[currency] = self._cache.yield_curve(currency)
+            if (yield_curve := yield_curves[currency]) is not None:
+                interest_rate[i] = yield_curve(expiry_in_years[i])
+            else:
+                interest_rate[i] = flat_interest_rate
+
+            dividend_key = str(underlying_instrument_id)
+            if dividend_key not in yield_curves:
+                yield_curves[dividend_key] = self._cache.yield_curve(dividend_key)
+            if (dividend_curve := yield_curves[dividend_key]) is not None:
+                cost_of_carry[i] = interest_rate[i] - dividend_curve(expiry_in_years[i])
+            elif flat_dividend_yield is not None:
+                cost_of_carry[i] = interest_rate[i] - flat_dividend_yield
+
+        # Implied volatilities are solved once for all options in the batch
+        vol = np.full(count, np.nan)
+        if is_option.any():
+            vol[is_option] = imply_vol_batch(
+                underlying_price[is_option],
+                interest_rate[is_option],
+                cost_of_carry[is_option],
+                is_call[is_option],
+                strike[is_option],
+                expiry_in_years[is_option],
+                option_price[is_option],
+            )
+
+        return {
+            "is_option": is_option,
+            "is_call": is_call,
+            "strike": strike,
+            "expiry_in_years": expiry_in_years,
+            "multiplier": multiplier,
+            "underlying_price": underlying_price,
+            "underlying_ids": underlying_ids,
+            "interest_rate": interest_rate,
+            "cost_of_carry": cost_of_carry,
+            "vol": vol,
+        }
+
+    def _batch_greeks(
+        self,
+        dict inputs,
+        spot_shock,
+        vol_shock,
+        time_to_expiry_shock,
+        percent_greeks: bool,
+        index_instrument_id: InstrumentId | None,
+        beta_weights: dict[InstrumentId, float] | None,
+    ) -> dict:
+        is_option = inputs["is_option"]
+        multiplier = inputs["multiplier"]
+        unshocked_underlying_price = inputs["underlying_price"]
+        shocked_underlying_price = unshocked_underlying_price + spot_shock
+        shocked_vol = inputs["vol"] + vol_shock
+
+        greeks = black_scholes_greeks_batch(
+            shocked_underlying_price,
+            inputs["interest_rate"],
+            inputs["cost_of_carry"],
+            shocked_vol,
+            inputs["is_call"],
+            inputs["strike"],
+            inputs["expiry_in_years"] - time_to_expiry_shock,
+            multiplier,
+        )
+
+        # Non-option instruments have a delta of their multiplier
+        delta = np.where(is_option, greeks.delta, multiplier)
+        gamma = np.where(is_option, greeks.gamma, 0.0)
+        index_price = None
+
+        if index_instrument_id is not None:
+            index_price = float(self._cache.price(index_instrument_id, PriceType.LAST))
+            beta = np.ones(len(multiplier))
+            if beta_weights is not None:
+                beta = np.array([beta_weights.get(uid, 1.0) for uid in inputs["underlying_ids"]])
+
+            index_price = index_price + 1. / beta * (index_price / unshocked_underlying_price) * (shocked_underlying_price - unshocked_underlying_price)
+            delta_multiplier = beta * shocked_underlying_price / index_price
+            delta = delta * delta_multiplier
+            gamma = gamma * delta_multiplier ** 2
+
+        if percent_greeks:
+            reference_price = shocked_underlying_price if index_price is None else index_price
+            delta = delta * reference_price / 100.
+            gamma = gamma * (reference_price / 100.) ** 2
+
+        return {
+            "underlying_price": shocked_underlying_price,
+            "vol": np.where(is_option, shocked_vol, np.nan),
+            "price": np.where(is_option, greeks.price, 0.0),
+            "delta": delta,
+            "gamma": gamma,
+            "vega": np.where(is_option, greeks.vega, 0.0),
+            "theta": np.where(is_option, greeks.theta, 0.0),
+        }
+
     def subscribe_greeks(self, underlying: str = "", handler: Callable[[GreeksData], None] = None) -> None:
         """
         Subscribe to Greeks data for a given underlying instrument.
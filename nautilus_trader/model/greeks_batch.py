@@ -0,0 +1,360 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+_SQRT_2PI = 2.5066282746310002
+_DAYS_PER_YEAR_INV = 0.0027378507871321013  # 1 / 365.25 in change per calendar day
+
+_MIN_VOL = 1e-6
+_MAX_VOL = 10.0
+
+
+@dataclass
+class GreeksArrays:
+    """
+    Represents vectorized Black-Scholes greeks, one element per option.
+
+    Follows the same conventions as `black_scholes_greeks`: values are scaled by the
+    multiplier, vega is per absolute percent change in volatility and theta is per
+    calendar day.
+
+    """
+
+    vol: np.ndarray
+    price: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    vega: np.ndarray
+    theta: np.ndarray
+
+
+def norm_cdf(x: np.ndarray) -> np.ndarray:
+    """
+    Return the standard normal cumulative distribution function evaluated at `x`.
+
+    Uses the double precision rational approximation of Hart (1968) as described
+    in West (2005) "Better approximations to cumulative normal functions".
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The values to evaluate.
+
+    Returns
+    -------
+    np.ndarray
+
+    """
+    x = np.asarray(x, dtype=np.float64)
+    xabs = np.abs(x)
+    e = np.exp(-0.5 * xabs * xabs)
+
+    # Rational approximation (|x| < 7.07106781186547)
+    n = 3.52624965998911e-02 * xabs + 0.700383064443688
+    n = n * xabs + 6.37396220353165
+    n = n * xabs + 33.912866078383
+    n = n * xabs + 112.079291497871
+    n = n * xabs + 221.213596169931
+    n = n * xabs + 220.206867912376
+    d = 8.83883476483184e-02 * xabs + 1.75566716318264
+    d = d * xabs + 16.064177579207
+    d = d * xabs + 86.7807322029461
+    d = d * xabs + 296.564248779674
+    d = d * xabs + 637.333633378831
+    d = d * xabs + 793.826512519948
+    d = d * xabs + 440.413735824752
+    tail_rational = e * n / d
+
+    # Continued fraction (|x| >= 7.07106781186547)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f = xabs + 0.65
+        f = xabs + 4.0 / f
+        f = xabs + 3.0 / f
+        f = xabs + 2.0 / f
+        f = xabs + 1.0 / f
+        tail_fraction = e / f / _SQRT_2PI
+
+    tail = np.where(xabs < 7.07106781186547, tail_rational, tail_fraction)
+    tail = np.where(xabs > 37.0, 0.0, tail)
+
+    return np.where(x > 0.0, 1.0 - tail, tail)
+
+
+def norm_pdf(x: np.ndarray) -> np.ndarray:
+    """
+    Return the standard normal probability density function evaluated at `x`.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The values to evaluate.
+
+    Returns
+    -------
+    np.ndarray
+
+    """
+    x = np.asarray(x, dtype=np.float64)
+    return np.exp(-0.5 * x * x) / _SQRT_2PI
+
+
+def black_scholes_greeks_batch(
+    s: np.ndarray,
+    r: np.ndarray,
+    b: np.ndarray,
+    vol: np.ndarray,
+    is_call: np.ndarray,
+    k: np.ndarray,
+    t: np.ndarray,
+    multiplier: np.ndarray,
+) -> GreeksArrays:
+    """
+    Return the Black-Scholes price and greeks for arrays of options in one vectorized pass.
+
+    All arguments broadcast against each other, so scalars and arrays of any
+    compatible shape may be mixed (e.g. for evaluating shock grids).
+
+    Parameters
+    ----------
+    s : np.ndarray
+        The underlying prices.
+    r : np.ndarray
+        The interest rates.
+    b : np.ndarray
+        The costs of carry.
+    vol : np.ndarray
+        The volatilities.
+    is_call : np.ndarray
+        The boolean call flags (False for puts).
+    k : np.ndarray
+        The strike prices.
+    t : np.ndarray
+        The times to expiry (years).
+    multiplier : np.ndarray
+        The contract multipliers.
+
+    Returns
+    -------
+    GreeksArrays
+
+    """
+    s = np.asarray(s, dtype=np.float64)
+    r = np.asarray(r, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    vol = np.asarray(vol, dtype=np.float64)
+    k = np.asarray(k, dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)
+    multiplier = np.asarray(multiplier, dtype=np.float64)
+    phi = np.where(np.asarray(is_call, dtype=np.bool_), 1.0, -1.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sqrt_t = np.sqrt(t)
+        scaled_vol = vol * sqrt_t
+        d1 = (np.log(s / k) + (b + 0.5 * vol * vol) * t) / scaled_vol
+        d2 = d1 - scaled_vol
+        cdf_phi_d1 = norm_cdf(phi * d1)
+        cdf_phi_d2 = norm_cdf(phi * d2)
+        dist_d1 = norm_pdf(d1)
+        df = np.exp((b - r) * t)
+        s_t = s * df
+        k_t = k * np.exp(-r * t)
+
+        price = multiplier * phi * (s_t * cdf_phi_d1 - k_t * cdf_phi_d2)
+        delta = multiplier * phi * df * cdf_phi_d1
+        gamma = multiplier * df * dist_d1 / (s * scaled_vol)
+        vega = multiplier * s_t * sqrt_t * dist_d1 * 0.01
+        theta = (
+            multiplier
+            * (
+                s_t * (-dist_d1 * vol / (2.0 * sqrt_t) - phi * (b - r) * cdf_phi_d1)
+                - phi * r * k_t * cdf_phi_d2
+            )
+            * _DAYS_PER_YEAR_INV
+        )
+
+    return GreeksArrays(
+        vol=np.broadcast_to(vol, price.shape),
+        price=price,
+        delta=delta,
+        gamma=gamma,
+        vega=vega,
+        theta=theta,
+    )
+
+
+def imply_vol_batch(
+    s: np.ndarray,
+    r: np.ndarray,
+    b: np.ndarray,
+    is_call: np.ndarray,
+    k: np.ndarray,
+    t: np.ndarray,
+    price: np.ndarray,
+    tolerance: float = 1e-10,
+    max_iterations: int = 100,
+) -> np.ndarray:
+    """
+    Return the Black-Scholes implied volatilities for arrays of option prices.
+
+    Solves all options simultaneously with a safeguarded Newton-Raphson iteration,
+    falling back to bisection within a shrinking bracket whenever a Newton step
+    leaves the bracket (e.g. for deep out-of-the-money options with negligible vega).
+
+    Parameters
+    ----------
+    s : np.ndarray
+        The underlying prices.
+    r : np.ndarray
+        The interest rates.
+    b : np.ndarray
+        The costs of carry.
+    is_call : np.ndarray
+        The boolean call flags (False for puts).
+    k : np.ndarray
+        The strike prices.
+    t : np.ndarray
+        The times to expiry (years).
+    price : np.ndarray
+        The option prices (per unit, excluding any multiplier).
+    tolerance : float, default 1e-10
+        The relative price tolerance for convergence.
+    max_iterations : int, default 100
+        The maximum number of iterations.
+
+    Returns
+    -------
+    np.ndarray
+        The implied volatilities, NaN where the price is outside its no-arbitrage bounds.
+
+    """
+    s, r, b, is_call, k, t, price = np.broadcast_arrays(
+        np.asarray(s, dtype=np.float64),
+        np.asarray(r, dtype=np.float64),
+        np.asarray(b, dtype=np.float64),
+        np.asarray(is_call, dtype=np.bool_),
+        np.asarray(k, dtype=np.float64),
+        np.asarray(t, dtype=np.float64),
+        np.asarray(price, dtype=np.float64),
+    )
+
+    # Solve on the out-of-the-money side using put-call parity, so that only the
+    # time value (which carries all the volatility information) is matched
+    s_t = s * np.exp((b - r) * t)
+    k_t = k * np.exp(-r * t)
+    intrinsic = np.where(is_call, np.maximum(s_t - k_t, 0.0), np.maximum(k_t - s_t, 0.0))
+    upper = np.where(is_call, s_t, k_t)
+    otm_is_call = s_t <= k_t
+    otm_price = price - intrinsic
+    valid = (otm_price > 0.0) & (price < upper) & (t > 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_target = np.log(otm_price)
+
+        # Brenner-Subrahmanyam initial guess
+        vol = np.sqrt(2.0 * np.pi / t) * price / s_t
+
+    vol = np.clip(np.nan_to_num(vol, nan=0.2), _MIN_VOL * 10, _MAX_VOL / 10)
+    lo = np.full(price.shape, _MIN_VOL)
+    hi = np.full(price.shape, _MAX_VOL)
+
+    active = valid.copy()
+    for _ in range(max_iterations):
+        if not active.any():
+            break
+
+        greeks = black_scholes_greeks_batch(s, r, b, vol, otm_is_call, k, t, np.ones_like(price))
+
+        # Newton-Raphson on the log price, which is far better conditioned than
+        # the price itself for out-of-the-money options
+        with np.errstate(divide="ignore", invalid="ignore"):
+            diff = np.log(greeks.price) - log_target
+            newton = vol - diff * greeks.price / (greeks.vega * 100.0)
+
+        converged = (np.abs(diff) <= tolerance) | (hi - lo <= tolerance * vol)
+        active &= ~converged
+
+        # Tighten the bracket (price is increasing in vol)
+        hi = np.where(active & (diff > 0.0), vol, hi)
+        lo = np.where(active & ~(diff > 0.0), vol, lo)
+
+        in_bracket = (newton > lo) & (newton < hi)
+        vol = np.where(active, np.where(in_bracket, newton, 0.5 * (lo + hi)), vol)
+
+    return np.where(valid, vol, np.nan)
+
+
+def imply_vol_and_greeks_batch(
+    s: np.ndarray,
+    r: np.ndarray,
+    b: np.ndarray,
+    is_call: np.ndarray,
+    k: np.ndarray,
+    t: np.ndarray,
+    price: np.ndarray,
+    multiplier: np.ndarray,
+) -> GreeksArrays:
+    """
+    Return the implied volatilities and greeks for arrays of option prices.
+
+    Parameters
+    ----------
+    s : np.ndarray
+        The underlying prices.
+    r : np.ndarray
+        The interest rates.
+    b : np.ndarray
+        The costs of carry.
+    is_call : np.ndarray
+        The boolean call flags (False for puts).
+    k : np.ndarray
+        The strike prices.
+    t : np.ndarray
+        The times to expiry (years).
+    price : np.ndarray
+        The option prices (per unit, excluding any multiplier).
+    multiplier : np.ndarray
+        The contract multipliers.
+
+    Returns
+    -------
+    GreeksArrays
+
+    """
+    vol = imply_vol_batch(s, r, b, is_call, k, t, price)
+    return black_scholes_greeks_batch(s, r, b, vol, is_call, k, t, multiplier)
+
+
+@dataclass
+class PortfolioGreeksGrid:
+    """
+    Represents aggregated portfolio greeks evaluated over a spot x vol x time shock grid.
+
+    Each greeks array has shape ``(len(spot_shocks), len(vol_shocks), len(time_to_expiry_shocks))``.
+
+    """
+
+    spot_shocks: np.ndarray
+    vol_shocks: np.ndarray
+    time_to_expiry_shocks: np.ndarray
+    pnl: np.ndarray
+    price: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    vega: np.ndarray
+    theta: np.ndarray
@@ -96,6 +96,30 @@ cdef class Position:
     cdef readonly Money realized_pnl
     """The current realized PnL for the position (including commissions).\n\n:returns: `Money` or ``None``"""
 
+    cdef void _initialize(
+        self,
+        OrderFilled fill,
+        uint8_t price_precision,
+        uint8_t size_precision,
+        Quantity multiplier,
+        bint is_inverse,
+        Currency quote_currency,
+        Currency base_currency,
+        Currency settlement_currency,
+    )
+
+    @staticmethod
+    cdef Position from_fills_c(
+        list fills,
+        uint8_t price_precision,
+        uint8_t size_precision,
+        Quantity multiplier,
+        bint is_inverse,
+        Currency quote_currency,
+        Currency base_currency,
+        Currency settlement_currency,
+    )
+
     cpdef str info(self)
     cpdef dict to_dict(self)
 
@@ -17,6 +17,7 @@ from decimal import Decimal
 
 from libc.math cimport fabs
 from libc.math cimport fmin
+from libc.stdint cimport uint8_t
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport OrderSide
@@ -26,6 +27,7 @@ from nautilus_trader.model.functions cimport order_side_to_str
 from nautilus_trader.model.functions cimport position_side_to_str
 from nautilus_trader.model.identifiers cimport TradeId
 from nautilus_trader.model.instruments.base cimport Instrument
+from nautilus_trader.model.objects cimport Currency
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
 
@@ -60,10 +62,32 @@ cdef class Position:
         Condition.equal(instrument.id, fill.instrument_id, "instrument.id", "fill.instrument_id")
         Condition.not_none(fill.position_id, "fill.position_id")
 
+        self._initialize(
+            fill=fill,
+            price_precision=instrument.price_precision,
+            size_precision=instrument.size_precision,
+            multiplier=instrument.multiplier,
+            is_inverse=instrument.is_inverse,
+            quote_currency=instrument.quote_currency,
+            base_currency=instrument.get_base_currency(),  # Can be None
+            settlement_currency=instrument.get_cost_currency(),  # TBD handling quanto
+        )
+
+    cdef void _initialize(
+        self,
+        OrderFilled fill,
+        uint8_t price_precision,
+        uint8_t size_precision,
+        Quantity multiplier,
+        bint is_inverse,
+        Currency quote_currency,
+        Currency base_currency,
+        Currency settlement_currency,
+    ):
         self._events: list[OrderFilled] = []
         self._trade_ids: list[TradeId] = []
-        self._buy_qty = Quantity.zero_c(precision=instrument.size_precision)
-        self._sell_qty = Quantity.zero_c(precision=instrument.size_precision)
+        self._buy_qty = Quantity.zero_c(precision=size_precision)
+        self._sell_qty = Quantity.zero_c(precision=size_precision)
         self._commissions = {}
 
         # Identifiers
@@ -79,8 +103,8 @@ cdef class Position:
         self.entry = fill.order_side
         self.side = Position.side_from_order_side(fill.order_side)
         self.signed_qty = 0.0
-        self.quantity = Quantity.zero_c(precision=instrument.size_precision)
-        self.peak_qty = Quantity.zero_c(precision=instrument.size_precision)
+        self.quantity = Quantity.zero_c(precision=size_precision)
+        self.peak_qty = Quantity.zero_c(precision=size_precision)
         self.ts_init = fill.ts_init
         self.ts_opened = fill.ts_event
         self.ts_last = fill.ts_event
@@ -88,19 +112,49 @@ cdef class Position:
         self.duration_ns = 0
         self.avg_px_open = fill.last_px.as_f64_c()
         self.avg_px_close = 0.0
-        self.price_precision = instrument.price_precision
-        self.size_precision = instrument.size_precision
-        self.multiplier = instrument.multiplier
-        self.is_inverse = instrument.is_inverse
-        self.quote_currency = instrument.quote_currency
-        self.base_currency = instrument.get_base_currency()  # Can be None
-        self.settlement_currency = instrument.get_cost_currency()  # TBD handling quanto
+        self.price_precision = price_precision
+        self.size_precision = size_precision
+        self.multiplier = multiplier
+        self.is_inverse = is_inverse
+        self.quote_currency = quote_currency
+        self.base_currency = base_currency  # Can be None
+        self.settlement_currency = settlement_currency
 
         self.realized_return = 0.0
         self.realized_pnl = None
 
         self.apply(fill)
 
+    @staticmethod
+    cdef Position from_fills_c(
+        list fills,
+        uint8_t price_precision,
+        uint8_t size_precision,
+        Quantity multiplier,
+        bint is_inverse,
+        Currency quote_currency,
+        Currency base_currency,
+        Currency settlement_currency,
+    ):
+        # Rebuild a position by replaying its fills, without requiring the instrument
+        cdef Position position = Position.__new__(Position)
+        position._initialize(
+            fill=fills[0],
+            price_precision=price_precision,
+            size_precision=size_precision,
+            multiplier=multiplier,
+            is_inverse=is_inverse,
+            quote_currency=quote_currency,
+            base_currency=base_currency,
+            settlement_currency=settlement_currency,
+        )
+
+        cdef OrderFilled fill
+        for fill in fills[1:]:
+            position.apply(fill)
+
+        return position
+
     def __eq__(self, Position other) -> bool:
         return self.id == other.id
 
@@ -54,6 +54,7 @@ from nautilus_trader.model.data import OrderBookDeltas
 from nautilus_trader.model.data import OrderBookDepth10
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.data import capsule_to_iter
 from nautilus_trader.model.data import capsule_to_list
 from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.persistence.catalog.base import BaseDataCatalog
@@ -61,6 +62,8 @@ from nautilus_trader.persistence.catalog.types import CatalogWriteMode
 from nautilus_trader.persistence.funcs import class_to_filename
 from nautilus_trader.persistence.funcs import combine_filters
 from nautilus_trader.persistence.funcs import urisafe_instrument_id
+from nautilus_trader.persistence.replay import REPLAY_DTYPES
+from nautilus_trader.persistence.replay import convert_to_replay
 from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
 from nautilus_trader.serialization.arrow.serializer import list_schemas
 
@@ -603,7 +606,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         # Gather data
         data = []
         for chunk in result:
-            data.extend(capsule_to_list(chunk))
+            data.extend(capsule_to_iter(chunk))
 
         if data_cls == OrderBookDeltas:
             # Batch process deltas into `OrderBookDeltas`, will warn
@@ -673,6 +676,58 @@ class ParquetDataCatalog(BaseDataCatalog):
 
         return session
 
+    def write_replay_file(
+        self,
+        path: str | Path,
+        data_cls: type,
+        identifier: str,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+        chunk_size: int = 100_000,
+    ) -> Path | None:
+        """
+        Write the catalog data for the given type and identifier to a binary replay file.
+
+        The data is streamed from the catalog in chunks, so only one chunk is held in
+        memory during the conversion. The replay file can then be memory-mapped with
+        `ReplayFile` for backtesting.
+
+        Parameters
+        ----------
+        path : str or Path
+            The path for the replay file.
+        data_cls : type
+            The data type ({``QuoteTick``, ``TradeTick``, ``Bar``, ``OrderBookDelta``,
+            ``OrderBookDepth10``}).
+        identifier : str
+            The instrument ID (or bar type for bars) to write.
+        start : TimestampLike, optional
+            The start time (UTC) for the data (inclusive).
+        end : TimestampLike, optional
+            The end time (UTC) for the data (inclusive).
+        chunk_size : int, default 100_000
+            The number of records per streamed chunk.
+
+        Returns
+        -------
+        Path or ``None``
+            ``None`` if there was no data to write.
+
+        """
+        PyCondition.is_in(data_cls, REPLAY_DTYPES, "data_cls", "REPLAY_DTYPES")
+
+        session = self.backend_session(
+            data_cls=data_cls,
+            instrument_ids=None if data_cls == Bar else [identifier],
+            bar_types=[identifier] if data_cls == Bar else None,
+            start=start,
+            end=end,
+            session=DataBackendSession(chunk_size=chunk_size),
+        )
+        chunks = (capsule_to_list(chunk) for chunk in session.to_query_result())
+
+        return convert_to_replay(chunks, path)
+
     @staticmethod
     def _nautilus_data_cls_to_data_type(data_cls: type) -> NautilusDataType:
         if data_cls in (OrderBookDelta, OrderBookDeltas):
@@ -0,0 +1,726 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+"""
+Provides a compact memory-mapped binary replay format for backtest data.
+
+A replay file holds the records of a single data type for a single instrument (or bar
+type) as fixed-width little-endian records, sorted by `ts_init`. Prices and sizes are
+stored as integer mantissas at the file precision (``value * 10**precision``), so the
+format is independent of the fixed-point precision mode of the build.
+
+Files are memory-mapped when read, so records stay on disk (and in the OS page cache)
+until the backtest loop reaches them, and are only then turned into data objects.
+
+"""
+
+import json
+import struct
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.data import Data
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.data import BookOrder
+from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.data import OrderBookDepth10
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.objects import FIXED_PRECISION
+
+
+REPLAY_MAGIC = b"NTREPLAY"
+REPLAY_VERSION = 1
+REPLAY_SUFFIX = ".replay"
+
+_PREAMBLE = struct.Struct("<8sHI")  # magic, version, header length
+_ALIGNMENT = 8
+
+_QUOTE_DTYPE = np.dtype(
+    [
+        ("ts_event", "<u8"),
+        ("ts_init", "<u8"),
+        ("bid_price", "<i8"),
+        ("ask_price", "<i8"),
+        ("bid_size", "<u8"),
+        ("ask_size", "<u8"),
+    ],
+)
+_TRADE_DTYPE = np.dtype(
+    [
+        ("ts_event", "<u8"),
+        ("ts_init", "<u8"),
+        ("price", "<i8"),
+        ("size", "<u8"),
+        ("aggressor_side", "u1"),
+        ("trade_id", "S36"),
+    ],
+)
+_BAR_DTYPE = np.dtype(
+    [
+        ("ts_event", "<u8"),
+        ("ts_init", "<u8"),
+        ("open", "<i8"),
+        ("high", "<i8"),
+        ("low", "<i8"),
+        ("close", "<i8"),
+        ("volume", "<u8"),
+    ],
+)
+_DELTA_DTYPE = np.dtype(
+    [
+        ("ts_event", "<u8"),
+        ("ts_init", "<u8"),
+        ("price", "<i8"),
+        ("size", "<u8"),
+        ("order_id", "<u8"),
+        ("sequence", "<u8"),
+        ("action", "u1"),
+        ("side", "u1"),
+        ("flags", "u1"),
+        ("price_prec", "u1"),
+        ("size_prec", "u1"),
+    ],
+)
+_DEPTH10_DTYPE = np.dtype(
+    [
+        ("ts_event", "<u8"),
+        ("ts_init", "<u8"),
+        ("sequence", "<u8"),
+        ("flags", "u1"),
+        ("bid_prices", "<i8", (10,)),
+        ("ask_prices", "<i8", (10,)),
+        ("bid_sizes", "<u8", (10,)),
+        ("ask_sizes", "<u8", (10,)),
+        ("bid_counts", "<u4", (10,)),
+        ("ask_counts", "<u4", (10,)),
+        ("bid_order_ids", "<u8", (10,)),
+        ("ask_order_ids", "<u8", (10,)),
+    ],
+)
+
+REPLAY_DTYPES: dict[type, np.dtype] = {
+    QuoteTick: _QUOTE_DTYPE,
+    TradeTick: _TRADE_DTYPE,
+    Bar: _BAR_DTYPE,
+    OrderBookDelta: _DELTA_DTYPE,
+    OrderBookDepth10: _DEPTH10_DTYPE,
+}
+_REPLAY_CLASSES: dict[str, type] = {cls.__name__: cls for cls in REPLAY_DTYPES}
+_CODEC_NAMES: dict[type, str] = {
+    QuoteTick: "quote",
+    TradeTick: "trade",
+    Bar: "bar",
+    OrderBookDelta: "delta",
+    OrderBookDepth10: "depth10",
+}
+
+
+def _mantissa(raw: int, precision: int) -> int:
+    # Convert a fixed-point raw value to its integer mantissa at the given precision
+    return raw // 10 ** (FIXED_PRECISION - precision)
+
+
+def _identifier(data: Data) -> str:
+    if isinstance(data, Bar):
+        return str(data.bar_type)
+    return data.instrument_id.value
+
+
+def _record_precisions(data: Data) -> tuple[set[int], set[int]]:
+    # Return the distinct price and size precisions of the values held by the record
+    if isinstance(data, QuoteTick):
+        return (
+            {data.bid_price.precision, data.ask_price.precision},
+            {data.bid_size.precision, data.ask_size.precision},
+        )
+    if isinstance(data, TradeTick):
+        return {data.price.precision}, {data.size.precision}
+    if isinstance(data, Bar):
+        return (
+            {data.open.precision, data.high.precision, data.low.precision, data.close.precision},
+            {data.volume.precision},
+        )
+    if isinstance(data, OrderBookDepth10):
+        # Empty (padding) levels carry no precision
+        levels = [o for o in (*data.bids, *data.asks) if o.price.raw != 0 or o.size.raw != 0]
+        return {o.price.precision for o in levels}, {o.size.precision for o in levels}
+    return set(), set()  # Order book deltas hold precisions per record
+
+
+def _precisions(data: Data) -> tuple[int, int]:
+    price_precisions, size_precisions = _record_precisions(data)
+    return max(price_precisions, default=0), max(size_precisions, default=0)
+
+
+class ReplayWriter:
+    """
+    Provides a writer for binary replay files.
+
+    Records are appended in chunks with `write`, each chunk (and the chunks in sequence)
+    sorted by `ts_init`.
+
+    Parameters
+    ----------
+    path : str or Path
+        The path for the replay file.
+    data_cls : type
+        The data type for the file ({``QuoteTick``, ``TradeTick``, ``Bar``,
+        ``OrderBookDelta``, ``OrderBookDepth10``}).
+    identifier : str
+        The instrument ID (or bar type for bars) for the file.
+    price_precision : int
+        The price precision for the file.
+    size_precision : int
+        The size precision for the file.
+
+    Raises
+    ------
+    ValueError
+        If `data_cls` is not a supported replay data type.
+
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        data_cls: type,
+        identifier: str,
+        price_precision: int,
+        size_precision: int,
+    ) -> None:
+        PyCondition.is_in(data_cls, REPLAY_DTYPES, "data_cls", "REPLAY_DTYPES")
+        PyCondition.valid_string(identifier, "identifier")
+
+        self.path = Path(path)
+        self.data_cls = data_cls
+        self.identifier = identifier
+        self.price_precision = price_precision
+        self.size_precision = size_precision
+        self.count = 0
+
+        self._dtype = REPLAY_DTYPES[data_cls]
+        self._encode = getattr(self, f"_encode_{_CODEC_NAMES[data_cls]}")
+        self._last_ts_init = 0
+        self._file = self.path.open("wb")
+        self._write_header()
+
+    def __enter__(self) -> "ReplayWriter":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _write_header(self, count: int = 0) -> None:
+        header = json.dumps(
+            {
+                "data_cls": self.data_cls.__name__,
+                "identifier": self.identifier,
+                "price_precision": self.price_precision,
+                "size_precision": self.size_precision,
+                "count": f"{count:020d}",  # Fixed width so the header can be rewritten in place
+            },
+        ).encode()
+        padding = -(_PREAMBLE.size + len(header)) % _ALIGNMENT
+        header += b" " * padding
+        self._file.write(_PREAMBLE.pack(REPLAY_MAGIC, REPLAY_VERSION, len(header)))
+        self._file.write(header)
+
+    def write(self, data: list[Data]) -> None:
+        """
+        Append the given data records to the file.
+
+        Parameters
+        ----------
+        data : list[Data]
+            The data to write (sorted by `ts_init`).
+
+        Raises
+        ------
+        TypeError
+            If any record is not of the writer's `data_cls`.
+        ValueError
+            If any record is not for the writer's `identifier`.
+        ValueError
+            If any record has a price or size precision other than the writer's precisions.
+        ValueError
+            If `data` is not sorted by `ts_init` (including with respect to previous writes).
+
+        """
+        if not data:
+            return
+
+        records = np.zeros(len(data), dtype=self._dtype)
+        encode = self._encode
+        for i, item in enumerate(data):
+            self._validate(item)
+            records[i] = encode(item)
+
+        ts_inits = records["ts_init"]
+        PyCondition.is_true(
+            ts_inits[0] >= self._last_ts_init and bool(np.all(ts_inits[1:] >= ts_inits[:-1])),
+            "data was not sorted by `ts_init`",
+        )
+        self._last_ts_init = int(ts_inits[-1])
+
+        self._file.write(records.tobytes())
+        self.count += len(records)
+
+    def close(self) -> None:
+        """
+        Close the writer, finalizing the record count in the file header.
+        """
+        if self._file.closed:
+            return
+        self._file.seek(0)
+        self._write_header(self.count)
+        self._file.close()
+
+    def _validate(self, item: Data) -> None:
+        if type(item) is not self.data_cls:
+            raise TypeError(f"Invalid record type, expected {self.data_cls.__name__}, was {type(item).__name__}")
+
+        identifier = _identifier(item)
+        if identifier != self.identifier:
+            raise ValueError(f"Invalid record identifier, expected {self.identifier}, was {identifier}")
+
+        price_precisions, size_precisions = _record_precisions(item)
+        if not price_precisions <= {self.price_precision} or not size_precisions <= {self.size_precision}:
+            raise ValueError(
+                f"Invalid record precisions, expected price {self.price_precision} and size {self.size_precision}, "
+                f"was price {sorted(price_precisions)} and size {sorted(size_precisions)}",
+            )
+
+    def _encode_quote(self, quote: QuoteTick) -> tuple:
+        p = self.price_precision
+        s = self.size_precision
+        return (
+            quote.ts_event,
+            quote.ts_init,
+            _mantissa(quote.bid_price.raw, p),
+            _mantissa(quote.ask_price.raw, p),
+            _mantissa(quote.bid_size.raw, s),
+            _mantissa(quote.ask_size.raw, s),
+        )
+
+    def _encode_trade(self, trade: TradeTick) -> tuple:
+        return (
+            trade.ts_event,
+            trade.ts_init,
+            _mantissa(trade.price.raw, self.price_precision),
+            _mantissa(trade.size.raw, self.size_precision),
+            int(trade.aggressor_side),
+            trade.trade_id.value.encode(),
+        )
+
+    def _encode_bar(self, bar: Bar) -> tuple:
+        p = self.price_precision
+        return (
+            bar.ts_event,
+            bar.ts_init,
+            _mantissa(bar.open.raw, p),
+            _mantissa(bar.high.raw, p),
+            _mantissa(bar.low.raw, p),
+            _mantissa(bar.close.raw, p),
+            _mantissa(bar.volume.raw, self.size_precision),
+        )
+
+    def _encode_delta(self, delta: OrderBookDelta) -> tuple:
+        order = delta.order
+        if order is None:
+            price_prec = size_prec = 0
+            price = size = order_id = side = 0
+        else:
+            price_prec = order.price.precision
+            size_prec = order.size.precision
+            price = _mantissa(order.price.raw, price_prec)
+            size = _mantissa(order.size.raw, size_prec)
+            order_id = order.order_id
+            side = int(order.side)
+        return (
+            delta.ts_event,
+            delta.ts_init,
+            price,
+            size,
+            order_id,
+            delta.sequence,
+            int(delta.action),
+            side,
+            delta.flags,
+            price_prec,
+            size_prec,
+        )
+
+    def _encode_depth10(self, depth: OrderBookDepth10) -> tuple:
+        p = self.price_precision
+        s = self.size_precision
+        return (
+            depth.ts_event,
+            depth.ts_init,
+            depth.sequence,
+            depth.flags,
+            [_mantissa(o.price.raw, p) for o in depth.bids],
+            [_mantissa(o.price.raw, p) for o in depth.asks],
+            [_mantissa(o.size.raw, s) for o in depth.bids],
+            [_mantissa(o.size.raw, s) for o in depth.asks],
+            depth.bid_counts,
+            depth.ask_counts,
+            [o.order_id for o in depth.bids],
+            [o.order_id for o in depth.asks],
+        )
+
+
+class ReplayFile:
+    """
+    Provides a memory-mapped reader for a binary replay file.
+
+    Parameters
+    ----------
+    path : str or Path
+        The path to the replay file.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a valid replay file (or has an unsupported version).
+
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+        with self.path.open("rb") as f:
+            magic, version, header_len = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+            PyCondition.is_true(magic == REPLAY_MAGIC, f"'{self.path}' was not a replay file")
+            PyCondition.is_true(version == REPLAY_VERSION, f"unsupported replay version, was {version}")
+            header = json.loads(f.read(header_len))
+
+        self.data_cls: type = _REPLAY_CLASSES[header["data_cls"]]
+        self.identifier: str = header["identifier"]
+        self.price_precision: int = header["price_precision"]
+        self.size_precision: int = header["size_precision"]
+
+        count = int(header["count"])
+        dtype = REPLAY_DTYPES[self.data_cls]
+        offset = _PREAMBLE.size + header_len
+        self._records: np.ndarray
+        if count > 0:
+            self._records = np.memmap(self.path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+        else:
+            self._records = np.zeros(0, dtype=dtype)
+
+        if self.data_cls is Bar:
+            self._bar_type = BarType.from_str(self.identifier)
+        else:
+            self._instrument_id = InstrumentId.from_str(self.identifier)
+
+        self._price_scale = 10 ** (FIXED_PRECISION - self.price_precision)
+        self._size_scale = 10 ** (FIXED_PRECISION - self.size_precision)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.data_cls.__name__}, {self.identifier}, count={len(self)})"
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Return the size (bytes) of the records in the file.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._records.nbytes
+
+    def ts_init_range(self) -> tuple[int, int] | None:
+        """
+        Return the first and last `ts_init` of the records (if any).
+
+        Returns
+        -------
+        tuple[int, int] or ``None``
+
+        """
+        if len(self._records) == 0:
+            return None
+        return int(self._records[0]["ts_init"]), int(self._records[-1]["ts_init"])
+
+    def iter_chunks(
+        self,
+        chunk_size: int = 10_000,
+        start: Any | None = None,
+        end: Any | None = None,
+    ) -> Iterator[list[Data]]:
+        """
+        Return an iterator of data chunks, decoding records only as each chunk is reached.
+
+        The iterator can be passed directly to `BacktestEngine.add_data_iterator`.
+
+        Parameters
+        ----------
+        chunk_size : int, default 10_000
+            The maximum number of records per chunk.
+        start : datetime or str or int, optional
+            The start time (UTC) to filter records by `ts_init` (inclusive).
+        end : datetime or str or int, optional
+            The end time (UTC) to filter records by `ts_init` (inclusive).
+
+        Returns
+        -------
+        Iterator[list[Data]]
+
+        """
+        PyCondition.positive_int(chunk_size, "chunk_size")
+
+        ts_inits = self._records["ts_init"]
+        first = 0 if start is None else int(np.searchsorted(ts_inits, _to_ns(start), side="left"))
+        last = len(ts_inits) if end is None else int(np.searchsorted(ts_inits, _to_ns(end), side="right"))
+
+        decode = getattr(self, f"_decode_{_CODEC_NAMES[self.data_cls]}")
+        for i in range(first, last, chunk_size):
+            yield decode(self._records[i : min(i + chunk_size, last)])
+
+    def to_list(self) -> list[Data]:
+        """
+        Return all records decoded as data objects.
+
+        Returns
+        -------
+        list[Data]
+
+        """
+        return [data for chunk in self.iter_chunks(chunk_size=max(len(self), 1)) for data in chunk]
+
+    def _decode_quote(self, records: np.ndarray) -> list[QuoteTick]:
+        instrument_id = self._instrument_id
+        p = self.price_precision
+        s = self.size_precision
+        ps = self._price_scale
+        ss = self._size_scale
+        return [
+            QuoteTick.from_raw(instrument_id, bp * ps, ap * ps, p, p, bs * ss, as_ * ss, s, s, ts_event, ts_init)
+            for ts_event, ts_init, bp, ap, bs, as_ in records.tolist()
+        ]
+
+    def _decode_trade(self, records: np.ndarray) -> list[TradeTick]:
+        instrument_id = self._instrument_id
+        p = self.price_precision
+        s = self.size_precision
+        ps = self._price_scale
+        ss = self._size_scale
+        return [
+            TradeTick.from_raw(
+                instrument_id,
+                price * ps,
+                p,
+                size * ss,
+                s,
+                aggressor_side,
+                TradeId(trade_id.decode()),
+                ts_event,
+                ts_init,
+            )
+            for ts_event, ts_init, price, size, aggressor_side, trade_id in records.tolist()
+        ]
+
+    def _decode_bar(self, records: np.ndarray) -> list[Bar]:
+        bar_type = self._bar_type
+        p = self.price_precision
+        s = self.size_precision
+        ps = self._price_scale
+        ss = self._size_scale
+        return [
+            Bar.from_raw(bar_type, o * ps, h * ps, lo * ps, c * ps, p, v * ss, s, ts_event, ts_init)
+            for ts_event, ts_init, o, h, lo, c, v in records.tolist()
+        ]
+
+    def _decode_delta(self, records: np.ndarray) -> list[OrderBookDelta]:
+        instrument_id = self._instrument_id
+        return [
+            OrderBookDelta.from_raw(
+                instrument_id,
+                action,
+                side,
+                price * 10 ** (FIXED_PRECISION - price_prec),
+                price_prec,
+                size * 10 ** (FIXED_PRECISION - size_prec),
+                size_prec,
+                order_id,
+                flags,
+                sequence,
+                ts_event,
+                ts_init,
+            )
+            for (
+                ts_event,
+                ts_init,
+                price,
+                size,
+                order_id,
+                sequence,
+                action,
+                side,
+                flags,
+                price_prec,
+                size_prec,
+            ) in records.tolist()
+        ]
+
+    def _decode_depth10(self, records: np.ndarray) -> list[OrderBookDepth10]:
+        instrument_id = self._instrument_id
+        p = self.price_precision
+        s = self.size_precision
+        ps = self._price_scale
+        ss = self._size_scale
+        # Sub-array fields are converted per column, as `tolist` on records leaves them as arrays
+        columns = [records[name].tolist() for name in records.dtype.names or ()]
+        depths: list[OrderBookDepth10] = []
+        for (
+            ts_event,
+            ts_init,
+            sequence,
+            flags,
+            bid_prices,
+            ask_prices,
+            bid_sizes,
+            ask_sizes,
+            bid_counts,
+            ask_counts,
+            bid_order_ids,
+            ask_order_ids,
+        ) in zip(*columns, strict=True):
+            bids = [
+                BookOrder.from_raw(OrderSide.BUY, price * ps, p, size * ss, s, order_id)
+                for price, size, order_id in zip(bid_prices, bid_sizes, bid_order_ids, strict=True)
+            ]
+            asks = [
+                BookOrder.from_raw(OrderSide.SELL, price * ps, p, size * ss, s, order_id)
+                for price, size, order_id in zip(ask_prices, ask_sizes, ask_order_ids, strict=True)
+            ]
+            depths.append(
+                OrderBookDepth10(
+                    instrument_id=instrument_id,
+                    bids=bids,
+                    asks=asks,
+                    bid_counts=bid_counts,
+                    ask_counts=ask_counts,
+                    flags=flags,
+                    sequence=sequence,
+                    ts_event=ts_event,
+                    ts_init=ts_init,
+                ),
+            )
+        return depths
+
+
+def _to_ns(value: Any) -> int:
+    if isinstance(value, int):
+        return value
+    return pd.to_datetime(value, utc=True).value
+
+
+def write_replay_file(path: str | Path, data: list[Data]) -> Path:
+    """
+    Write the given data to a replay file.
+
+    The data type, identifier and precisions are taken from the first element.
+
+    Parameters
+    ----------
+    path : str or Path
+        The path for the replay file.
+    data : list[Data]
+        The data to write (a single type and instrument or bar type, sorted by `ts_init`).
+
+    Returns
+    -------
+    Path
+
+    Raises
+    ------
+    ValueError
+        If `data` is empty.
+    ValueError
+        If any record differs from the first in identifier or precisions.
+
+    """
+    PyCondition.not_empty(data, "data")
+
+    first = data[0]
+    price_precision, size_precision = _precisions(first)
+    with ReplayWriter(
+        path=path,
+        data_cls=type(first),
+        identifier=_identifier(first),
+        price_precision=price_precision,
+        size_precision=size_precision,
+    ) as writer:
+        writer.write(data)
+
+    return writer.path
+
+
+def convert_to_replay(chunks: Iterator[list[Data]], path: str | Path) -> Path | None:
+    """
+    Convert the given iterator of data chunks into a replay file.
+
+    Only one chunk is held in memory at a time, so large catalog queries can be converted
+    (e.g. from a `DataBackendSession` via `ParquetDataCatalog.write_replay_file`).
+
+    Parameters
+    ----------
+    chunks : Iterator[list[Data]]
+        The data chunks (a single type and instrument or bar type, sorted by `ts_init`).
+    path : str or Path
+        The path for the replay file.
+
+    Returns
+    -------
+    Path or ``None``
+        ``None`` if there was no data to convert.
+
+    """
+    writer: ReplayWriter | None = None
+    try:
+        for chunk in chunks:
+            if not chunk:
+                continue
+            if writer is None:
+                first = chunk[0]
+                price_precision, size_precision = _precisions(first)
+                writer = ReplayWriter(
+                    path=path,
+                    data_cls=type(first),
+                    identifier=_identifier(first),
+                    price_precision=price_precision,
+                    size_precision=size_precision,
+                )
+            writer.write(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return writer.path if writer is not None else None
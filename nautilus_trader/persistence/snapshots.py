@@ -0,0 +1,220 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import hashlib
+import json
+import os
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+import pyarrow.parquet as pq
+
+import nautilus_trader
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.datetime import secs_to_nanos
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.persistence.funcs import class_to_filename
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+def snapshot_version(*components: Any) -> str:
+    """
+    Return a version hash for an instrument snapshot from the given components.
+
+    The hash always includes the `nautilus_trader` version, so that snapshots written by
+    a different release (with potentially different instrument schemas) are invalidated.
+
+    Parameters
+    ----------
+    *components : Any
+        The additional components identifying the snapshot contents (e.g. provider
+        type and loading filters), each converted with `repr`.
+
+    Returns
+    -------
+    str
+
+    """
+    hasher = hashlib.sha256(nautilus_trader.__version__.encode())
+    for component in components:
+        hasher.update(repr(component).encode())
+    return hasher.hexdigest()[:16]
+
+
+class InstrumentSnapshotStore:
+    """
+    Provides a local store for snapshots of instrument definitions.
+
+    Instruments are written as Parquet files (one per instrument class) using the
+    instrument Arrow schemas, alongside a JSON manifest holding the snapshot version
+    hash and creation time. A snapshot is only loaded when its version matches and it
+    is younger than the time-to-live.
+
+    Each snapshot is held in a subdirectory of `path` named by its version, so stores
+    with different versions (e.g. providers for different venues or environments) can
+    share a path without replacing each other's snapshots.
+
+    Parameters
+    ----------
+    path : str or Path
+        The root directory for snapshots.
+    version : str
+        The version hash the snapshot must match to be loaded (also the name of the
+        snapshot subdirectory).
+    ttl_secs : float
+        The time-to-live (seconds) for the snapshot.
+
+    Raises
+    ------
+    ValueError
+        If `version` is not a valid string.
+    ValueError
+        If `ttl_secs` is not positive (> 0).
+
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        version: str,
+        ttl_secs: float,
+    ) -> None:
+        PyCondition.valid_string(version, "version")
+        PyCondition.positive(ttl_secs, "ttl_secs")
+
+        self.path = Path(path)
+        self.version = version
+        self.ttl_ns = secs_to_nanos(ttl_secs)
+        self.directory = self.path / version
+
+    def _read_manifest(self) -> dict | None:
+        try:
+            return json.loads((self.directory / MANIFEST_FILENAME).read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _read_valid_manifest(self, ts_now: int | None) -> dict | None:
+        manifest = self._read_manifest()
+        if manifest is None or manifest.get("version") != self.version:
+            return None
+
+        if ts_now is None:
+            ts_now = time.time_ns()
+        if ts_now - manifest["ts_created"] >= self.ttl_ns:
+            return None  # Expired
+
+        return manifest
+
+    def is_valid(self, ts_now: int | None = None) -> bool:
+        """
+        Return whether a snapshot exists with a matching version within its time-to-live.
+
+        Parameters
+        ----------
+        ts_now : int, optional
+            UNIX timestamp (nanoseconds) to check expiry against. If ``None`` then uses
+            the current system time.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._read_valid_manifest(ts_now) is not None
+
+    def load(self, ts_now: int | None = None) -> list[Instrument] | None:
+        """
+        Load the instruments from the snapshot.
+
+        Parameters
+        ----------
+        ts_now : int, optional
+            UNIX timestamp (nanoseconds) to check expiry against. If ``None`` then uses
+            the current system time.
+
+        Returns
+        -------
+        list[Instrument] or ``None``
+            ``None`` if there is no valid snapshot.
+
+        """
+        manifest = self._read_valid_manifest(ts_now)
+        if manifest is None:
+            return None
+
+        classes = {cls.__name__: cls for cls in Instrument.__subclasses__()}
+
+        instruments: list[Instrument] = []
+        for cls_name, filename in manifest["files"].items():
+            cls = classes.get(cls_name)
+            if cls is None:
+                return None  # Unknown instrument class (snapshot is unusable)
+            table = pq.read_table(self.directory / filename)
+            instruments.extend(ArrowSerializer.deserialize(data_cls=cls, batch=table))
+
+        return instruments
+
+    def save(self, instruments: list[Instrument], ts_now: int | None = None) -> None:
+        """
+        Save the given instruments as the snapshot, replacing any existing snapshot.
+
+        Parameters
+        ----------
+        instruments : list[Instrument]
+            The instruments to save.
+        ts_now : int, optional
+            UNIX timestamp (nanoseconds) of the snapshot creation. If ``None`` then uses
+            the current system time.
+
+        """
+        PyCondition.not_none(instruments, "instruments")
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Invalidate any existing snapshot first, so a partial write is never loaded
+        (self.directory / MANIFEST_FILENAME).unlink(missing_ok=True)
+
+        by_class: dict[type, list[Instrument]] = defaultdict(list)
+        for instrument in instruments:
+            by_class[type(instrument)].append(instrument)
+
+        files: dict[str, str] = {}
+        for cls, cls_instruments in by_class.items():
+            filename = f"{class_to_filename(cls)}.parquet"
+            table = ArrowSerializer.serialize_batch(cls_instruments, data_cls=cls)
+            pq.write_table(table, self.directory / filename)
+            files[cls.__name__] = filename
+
+        manifest = {
+            "version": self.version,
+            "ts_created": ts_now if ts_now is not None else time.time_ns(),
+            "count": len(instruments),
+            "files": files,
+        }
+
+        tmp_path = self.directory / f"{MANIFEST_FILENAME}.tmp"
+        tmp_path.write_text(json.dumps(manifest))
+        os.replace(tmp_path, self.directory / MANIFEST_FILENAME)
+
+    def clear(self) -> None:
+        """
+        Clear the snapshot (the next load will return ``None``).
+        """
+        (self.directory / MANIFEST_FILENAME).unlink(missing_ok=True)
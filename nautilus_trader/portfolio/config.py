@@ -38,6 +38,11 @@ class PortfolioConfig(NautilusConfig, frozen=True):
     convert_to_account_base_currency : bool, default True
         If calculations should be converted into each account's base currency.
         This setting is only effective for accounts with a specified base currency.
+    incremental_account_updates : bool, default True
+        If account locked balances and margins are updated incrementally from each
+        changed order and position. If False then every order and position update
+        performs a full recompute over all open orders or positions for the instrument
+        (can be used to verify the incremental updates).
     debug : bool, default False
         If debug mode is active (will provide extra debug logging).
 
@@ -47,4 +52,5 @@ class PortfolioConfig(NautilusConfig, frozen=True):
     use_mark_xrates: bool = False
     bar_updates: bool = True
     convert_to_account_base_currency: bool = True
+    incremental_account_updates: bool = True
     debug: bool = False
@@ -51,8 +51,10 @@ from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.events.order cimport OrderAccepted
 from nautilus_trader.model.events.order cimport OrderCanceled
 from nautilus_trader.model.events.order cimport OrderEvent
+from nautilus_trader.model.events.order cimport OrderExpired
 from nautilus_trader.model.events.order cimport OrderFilled
 from nautilus_trader.model.events.order cimport OrderRejected
+from nautilus_trader.model.events.order cimport OrderTriggered
 from nautilus_trader.model.events.order cimport OrderUpdated
 from nautilus_trader.model.events.position cimport PositionEvent
 from nautilus_trader.model.functions cimport position_side_to_str
@@ -72,7 +74,9 @@ from nautilus_trader.portfolio.base cimport PortfolioFacade
 cdef tuple[OrderEvent] _UPDATE_ORDER_EVENTS = (
     OrderAccepted,
     OrderCanceled,
+    OrderExpired,
     OrderRejected,
+    OrderTriggered,
     OrderUpdated,
     OrderFilled,
 )
@@ -121,6 +125,7 @@ cdef class Portfolio(PortfolioFacade):
             cache=cache,
             clock=clock,
             logger=self._log,
+            incremental=config.incremental_account_updates,
         )
 
         # Configuration
@@ -512,17 +517,10 @@ cdef class Portfolio(PortfolioFacade):
                 instrument_id=event.instrument_id,
             )
 
-        cdef list orders_open = self._cache.orders_open(
-            venue=None,  # Faster query filtering
-            instrument_id=event.instrument_id,
-        )
-
-        cdef:
-            Order o
-        account_state = self._accounts.update_orders(
+        account_state = self._accounts.update_order(
             account=account,
             instrument=instrument,
-            orders_open=[o for o in orders_open if o.is_passive_c()],
+            order=order,
             ts_event=event.ts_event,
         )
 
@@ -584,10 +582,18 @@ cdef class Portfolio(PortfolioFacade):
             )
             return  # No instrument found
 
-        self._accounts.update_positions(
+        cdef Position position = self._cache.position(event.position_id)
+        if position is None:
+            self._log.error(
+                f"Cannot update position: "
+                f"{repr(event.position_id)} not found in the cache",
+            )
+            return  # No position found
+
+        self._accounts.update_position(
             account=account,
             instrument=instrument,
-            positions_open=positions_open,
+            position=position,
             ts_event=event.ts_event,
         )
 
@@ -1365,19 +1371,26 @@ cdef class Portfolio(PortfolioFacade):
 
         cdef:
             Position position
+            Money snapshots_pnl
             double pnl
             double xrate
         for position in positions:
             if position.instrument_id != instrument_id:
                 continue  # Nothing to calculate
 
-            if position.realized_pnl is None:
+            # Realized PnL of prior cycles of a NETTING position (read from the compact snapshots)
+            snapshots_pnl = self._cache.position_snapshots_realized_pnl(position.id)
+
+            if position.realized_pnl is None and snapshots_pnl is None:
                 continue  # Nothing to calculate
 
             if self._debug:
                 self._log.debug(f"Calculating realized PnL for {position}")
 
             if isinstance(instrument, BettingInstrument):
+                if position.realized_pnl is None:
+                    continue  # Nothing to calculate
+
                 bet_position = self._bet_positions.get(position.id)
                 if bet_position is None:
                     self._log.error(
@@ -1387,7 +1400,9 @@ cdef class Portfolio(PortfolioFacade):
 
                 pnl = float(bet_position.realized_pnl)
             else:
-                pnl = position.realized_pnl.as_f64_c()
+                pnl = position.realized_pnl.as_f64_c() if position.realized_pnl is not None else 0.0
+                if snapshots_pnl is not None:
+                    pnl += snapshots_pnl.as_f64_c()
 
             if self._convert_to_account_base_currency and account.base_currency is not None:
                 xrate_result = self._calculate_xrate_to_base(
@@ -28,8 +28,16 @@ class RiskEngineConfig(NautilusConfig, frozen=True):
         If True, then will bypass all pre-trade risk checks and rate limits (will still check for duplicate IDs).
     max_order_submit_rate : str, default 100/00:00:01
         The maximum rate of submit order commands per timedelta.
+        Several stacked rates can be comma separated, e.g. 10/00:00:01,100/00:01:00.
     max_order_modify_rate : str, default 100/00:00:01
         The maximum rate of modify order commands per timedelta.
+        Several stacked rates can be comma separated, e.g. 10/00:00:01,100/00:01:00.
+    max_order_submit_rate_per_instrument : str, optional
+        The maximum rate(s) of submit order commands per timedelta for each instrument.
+        If set then `max_order_submit_rate` may be empty to apply only these rates.
+    max_order_modify_rate_per_instrument : str, optional
+        The maximum rate(s) of modify order commands per timedelta for each instrument.
+        If set then `max_order_modify_rate` may be empty to apply only these rates.
     max_notional_per_order : dict[str, int], default empty dict
         The maximum notional value of an order per instrument ID.
         The value should be a valid decimal format.
@@ -41,5 +49,7 @@ class RiskEngineConfig(NautilusConfig, frozen=True):
     bypass: bool = False
     max_order_submit_rate: str = "100/00:00:01"
     max_order_modify_rate: str = "100/00:00:01"
+    max_order_submit_rate_per_instrument: str | None = None
+    max_order_modify_rate_per_instrument: str | None = None
     max_notional_per_order: dict[str, int] = {}
     debug: bool = False
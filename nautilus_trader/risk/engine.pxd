@@ -15,11 +15,12 @@
 
 from decimal import Decimal
 
+from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.component cimport Component
-from nautilus_trader.common.component cimport Throttler
 from nautilus_trader.core.message cimport Command
 from nautilus_trader.core.message cimport Event
+from nautilus_trader.core.rust.model cimport MoneyRaw
 from nautilus_trader.core.rust.model cimport TradingState
 from nautilus_trader.execution.messages cimport CancelAllOrders
 from nautilus_trader.execution.messages cimport CancelOrder
@@ -27,8 +28,11 @@ from nautilus_trader.execution.messages cimport ModifyOrder
 from nautilus_trader.execution.messages cimport SubmitOrder
 from nautilus_trader.execution.messages cimport SubmitOrderList
 from nautilus_trader.execution.messages cimport TradingCommand
+from nautilus_trader.model.data cimport QuoteTick
+from nautilus_trader.model.data cimport TradeTick
 from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.instruments.base cimport Instrument
+from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.orders.base cimport Order
@@ -36,12 +40,35 @@ from nautilus_trader.model.orders.list cimport OrderList
 from nautilus_trader.portfolio.base cimport PortfolioFacade
 
 
+cdef class InstrumentRiskProfile:
+    cdef readonly Instrument instrument
+    """The instrument for the profile.\n\n:returns: `Instrument`"""
+    cdef readonly Money max_notional
+    """The maximum notional value per order (in the instrument quote currency).\n\n:returns: `Money` or ``None``"""
+    cdef readonly Account account
+    """The cached account for the instrument venue.\n\n:returns: `Account` or ``None``"""
+    cdef readonly Price last_bid
+    """The last bid price received from the data path.\n\n:returns: `Price` or ``None``"""
+    cdef readonly Price last_ask
+    """The last ask price received from the data path.\n\n:returns: `Price` or ``None``"""
+    cdef readonly Price last_trade
+    """The last trade price received from the data path.\n\n:returns: `Price` or ``None``"""
+    cdef MoneyRaw _max_notional_raw
+
+    cpdef void set_max_notional(self, max_notional)
+    cdef void update_quote(self, QuoteTick tick)
+    cdef void update_trade(self, TradeTick tick)
+
+
 cdef class RiskEngine(Component):
     cdef readonly PortfolioFacade _portfolio
     cdef readonly Cache _cache
     cdef readonly dict _max_notional_per_order
-    cdef readonly Throttler _order_submit_throttler
-    cdef readonly Throttler _order_modify_throttler
+    cdef readonly dict _risk_profiles
+    cdef readonly list _order_submit_rates
+    cdef readonly list _order_modify_rates
+    cdef readonly object _order_submit_throttler
+    cdef readonly object _order_modify_throttler
 
     cdef readonly TradingState trading_state
     """The current trading state for the engine.\n\n:returns: `TradingState`"""
@@ -87,6 +114,8 @@ cdef class RiskEngine(Component):
     cpdef bint _check_order_price(self, Instrument instrument, Order order)
     cpdef bint _check_order_quantity(self, Instrument instrument, Order order)
     cpdef bint _check_orders_risk(self, Instrument instrument, list orders)
+    cdef InstrumentRiskProfile _get_risk_profile(self, Instrument instrument)
+    cdef Price _last_px(self, InstrumentRiskProfile profile, Order order)
     cpdef str _check_price(self, Instrument instrument, Price price)
     cpdef str _check_quantity(self, Instrument instrument, Quantity quantity)
 
@@ -107,3 +136,5 @@ cdef class RiskEngine(Component):
 # -- EVENT HANDLERS -------------------------------------------------------------------------------
 
     cpdef void _handle_event(self, Event event)
+    cpdef void _handle_quote_tick(self, QuoteTick tick)
+    cpdef void _handle_trade_tick(self, TradeTick tick)
@@ -22,6 +22,7 @@ from nautilus_trader.risk.config import RiskEngineConfig
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
+from nautilus_trader.accounting.accounts.margin cimport MarginAccount
 from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.component cimport CMD
 from nautilus_trader.common.component cimport EVT
@@ -30,6 +31,7 @@ from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.component cimport LogColor
 from nautilus_trader.common.component cimport MessageBus
+from nautilus_trader.common.component cimport MultiThrottler
 from nautilus_trader.common.component cimport Throttler
 from nautilus_trader.common.messages cimport TradingStateChanged
 from nautilus_trader.core.correctness cimport Condition
@@ -38,9 +40,11 @@ from nautilus_trader.core.message cimport Command
 from nautilus_trader.core.message cimport Event
 from nautilus_trader.core.rust.model cimport AccountType
 from nautilus_trader.core.rust.model cimport InstrumentClass
+from nautilus_trader.core.rust.model cimport MoneyRaw
 from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.core.rust.model cimport OrderStatus
 from nautilus_trader.core.rust.model cimport OrderType
+from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.core.rust.model cimport TimeInForce
 from nautilus_trader.core.rust.model cimport TradingState
 from nautilus_trader.core.rust.model cimport TriggerType
@@ -72,6 +76,67 @@ from nautilus_trader.model.position cimport Position
 from nautilus_trader.portfolio.base cimport PortfolioFacade
 
 
+cdef class InstrumentRiskProfile:
+    """
+    Provides a precompiled pre-trade risk profile for an instrument.
+
+    The profile holds the max notional per order limit in raw fixed-point, the account
+    for the instrument venue, and the last prices received from the data path, so that
+    the pre-trade risk checks for each order avoid rebuilding these from the settings
+    and cache.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument for the profile.
+    max_notional : Decimal, optional
+        The maximum notional value per order (in the instrument quote currency).
+
+    """
+
+    def __init__(self, Instrument instrument not None, max_notional = None) -> None:
+        self.instrument = instrument
+        self.account = None
+        self.last_bid = None
+        self.last_ask = None
+        self.last_trade = None
+        self.set_max_notional(max_notional)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"instrument_id={self.instrument.id}, "
+            f"max_notional={self.max_notional}, "
+            f"account_id={self.account.id if self.account is not None else None})"
+        )
+
+    cpdef void set_max_notional(self, max_notional):
+        """
+        Set the maximum notional value per order for the profile.
+
+        Parameters
+        ----------
+        max_notional : Decimal or ``None``
+            The maximum notional value (in the instrument quote currency).
+            If ``None`` or zero then the max notional check is disabled.
+
+        """
+        if not max_notional:
+            self.max_notional = None
+            self._max_notional_raw = 0
+            return
+
+        self.max_notional = Money(float(max_notional), self.instrument.quote_currency)
+        self._max_notional_raw = self.max_notional._mem.raw
+
+    cdef void update_quote(self, QuoteTick tick):
+        self.last_bid = tick.bid_price
+        self.last_ask = tick.ask_price
+
+    cdef void update_trade(self, TradeTick tick):
+        self.last_trade = tick.price
+
+
 cdef class RiskEngine(Component):
     """
     Provides a high-performance risk engine.
@@ -136,44 +201,51 @@ cdef class RiskEngine(Component):
         self.event_count = 0
 
         # Throttlers
-        pieces = config.max_order_submit_rate.split("/")
-        order_submit_rate_limit = int(pieces[0])
-        order_submit_rate_interval = pd.to_timedelta(pieces[1])
-        self._order_submit_throttler = Throttler(
+        self._order_submit_rates = _parse_rates(config.max_order_submit_rate)
+        cdef list order_submit_rates_per_instrument = _parse_rates(config.max_order_submit_rate_per_instrument)
+        self._order_submit_throttler = _create_throttler(
             name="ORDER_SUBMIT_THROTTLER",
-            limit=order_submit_rate_limit,
-            interval=order_submit_rate_interval,
+            rates=self._order_submit_rates,
+            rates_per_instrument=order_submit_rates_per_instrument,
+            clock=clock,
             output_send=self._send_to_execution,
             output_drop=self._deny_new_order,
-            clock=clock,
         )
 
         self._log.info(
-            f"Set MAX_ORDER_SUBMIT_RATE: "
-            f"{order_submit_rate_limit}/{str(order_submit_rate_interval).replace('0 days ', '')}",
+            f"Set MAX_ORDER_SUBMIT_RATE: {_format_rates(self._order_submit_rates)}",
             color=LogColor.BLUE,
         )
+        if order_submit_rates_per_instrument:
+            self._log.info(
+                f"Set MAX_ORDER_SUBMIT_RATE_PER_INSTRUMENT: {_format_rates(order_submit_rates_per_instrument)}",
+                color=LogColor.BLUE,
+            )
 
-        pieces = config.max_order_modify_rate.split("/")
-        order_modify_rate_limit = int(pieces[0])
-        order_modify_rate_interval = pd.to_timedelta(pieces[1])
-        self._order_modify_throttler = Throttler(
+        self._order_modify_rates = _parse_rates(config.max_order_modify_rate)
+        cdef list order_modify_rates_per_instrument = _parse_rates(config.max_order_modify_rate_per_instrument)
+        self._order_modify_throttler = _create_throttler(
             name="ORDER_MODIFY_THROTTLER",
-            limit=order_modify_rate_limit,
-            interval=order_modify_rate_interval,
+            rates=self._order_modify_rates,
+            rates_per_instrument=order_modify_rates_per_instrument,
+            clock=clock,
             output_send=self._send_to_execution,
             output_drop=self._deny_modify_order,
-            clock=clock,
         )
 
         self._log.info(
-            f"Set MAX_ORDER_MODIFY_RATE: "
-            f"{order_modify_rate_limit}/{str(order_modify_rate_interval).replace('0 days ', '')}",
+            f"Set MAX_ORDER_MODIFY_RATE: {_format_rates(self._order_modify_rates)}",
             color=LogColor.BLUE,
         )
+        if order_modify_rates_per_instrument:
+            self._log.info(
+                f"Set MAX_ORDER_MODIFY_RATE_PER_INSTRUMENT: {_format_rates(order_modify_rates_per_instrument)}",
+                color=LogColor.BLUE,
+            )
 
         # Risk settings
         self._max_notional_per_order: dict[InstrumentId, Decimal] = {}
+        self._risk_profiles: dict[InstrumentId, InstrumentRiskProfile] = {}
 
         # Configure
         self._initialize_risk_checks(config)
@@ -300,6 +372,10 @@ cdef class RiskEngine(Component):
         old_value: Decimal = self._max_notional_per_order.get(instrument_id)
         self._max_notional_per_order[instrument_id] = new_value
 
+        cdef InstrumentRiskProfile profile = self._risk_profiles.get(instrument_id)
+        if profile is not None:
+            profile.set_max_notional(new_value)
+
         cdef str new_value_str = f"{new_value:,}" if new_value is not None else str(None)
         self._log.info(
             f"Set MAX_NOTIONAL_PER_ORDER: {instrument_id} {new_value_str}",
@@ -312,31 +388,35 @@ cdef class RiskEngine(Component):
         """
         Return the current maximum order submit rate limit setting.
 
+        If several rates are stacked then returns the first.
+
         Returns
         -------
-        (int, timedelta)
-            The limit per timedelta interval.
+        (int, timedelta) or ``None``
+            The limit per timedelta interval, or ``None`` if only per instrument
+            rates are set.
 
         """
-        return (
-            self._order_submit_throttler.limit,
-            self._order_submit_throttler.interval,
-        )
+        if not self._order_submit_rates:
+            return None
+        return self._order_submit_rates[0]
 
     cpdef tuple max_order_modify_rate(self):
         """
         Return the current maximum order modify rate limit setting.
 
+        If several rates are stacked then returns the first.
+
         Returns
         -------
-        (int, timedelta)
-            The limit per timedelta interval.
+        (int, timedelta) or ``None``
+            The limit per timedelta interval, or ``None`` if only per instrument
+            rates are set.
 
         """
-        return (
-            self._order_modify_throttler.limit,
-            self._order_modify_throttler.interval,
-        )
+        if not self._order_modify_rates:
+            return None
+        return self._order_modify_rates[0]
 
     cpdef dict max_notionals_per_order(self):
         """
@@ -381,6 +461,19 @@ cdef class RiskEngine(Component):
     cpdef void _reset(self):
         self.command_count = 0
         self.event_count = 0
+
+        cdef InstrumentId instrument_id
+        for instrument_id in self._risk_profiles:
+            self._msgbus.unsubscribe(
+                topic=f"data.quotes.{instrument_id.venue}.{instrument_id.symbol}",
+                handler=self._handle_quote_tick,
+            )
+            self._msgbus.unsubscribe(
+                topic=f"data.trades.{instrument_id.venue}.{instrument_id.symbol}",
+                handler=self._handle_trade_tick,
+            )
+        self._risk_profiles.clear()
+
         self._order_submit_throttler.reset()
         self._order_modify_throttler.reset()
 
@@ -605,61 +698,37 @@ cdef class RiskEngine(Component):
         ########################################################################
         # RISK CHECKS
         ########################################################################
-        cdef QuoteTick last_quote = None
-        cdef TradeTick last_trade = None
-        cdef Price last_px = None
-        cdef Money free
-
-        # Determine max notional
-        cdef Money max_notional = None
-        max_notional_setting: Decimal | None = self._max_notional_per_order.get(instrument.id)
-        if max_notional_setting:
-            # TODO: Improve efficiency of this
-            max_notional = Money(float(max_notional_setting), instrument.quote_currency)
-
-        # Get account for risk checks
-        cdef Account account = self._cache.account_for_venue(instrument.id.venue)
+        cdef InstrumentRiskProfile profile = self._get_risk_profile(instrument)
+        cdef Account account = profile.account
         if account is None:
             self._log.debug(f"Cannot find account for venue {instrument.id.venue}")
             return True  # TODO: Temporary early return until handling routing/multiple venues
 
-        if account.is_margin_account:
-            return True  # TODO: Determine risk controls for margin
-
-        free = account.balance_free(instrument.quote_currency)
+        cdef Money free = account.balance_free(instrument.quote_currency)
         if self.debug:
             self._log.debug(f"Free: {free!r}", LogColor.MAGENTA)
 
         cdef:
             Order order
+            Price last_px = None
             Money notional
-            Money cum_notional_buy = None
-            Money cum_notional_sell = None
+            Money margin_init
+            Money margin_free = None
             Money order_balance_impact = None
             Money cash_value = None
             Currency base_currency = None
-            double xrate
+            MoneyRaw cum_notional_buy = 0
+            MoneyRaw cum_notional_sell = 0
+            MoneyRaw cum_margin_init = 0
+            object xrate
         for order in orders:
             if order.order_type == OrderType.MARKET or order.order_type == OrderType.MARKET_TO_LIMIT:
+                last_px = self._last_px(profile, order)
                 if last_px is None:
-                    # Determine entry price
-                    last_quote = self._cache.quote_tick(instrument.id)
-                    if last_quote is not None:
-                        if order.side == OrderSide.BUY:
-                            last_px = last_quote.ask_price
-                        elif order.side == OrderSide.SELL:
-                            last_px = last_quote.bid_price
-                        else:  # pragma: no cover (design-time error)
-                            raise RuntimeError(f"invalid `OrderSide`")
-                    else:
-                        last_trade = self._cache.trade_tick(instrument.id)
-                        if last_trade is not None:
-                            last_px = last_trade.price
-                        else:
-                            self._log.warning(
-                                f"Cannot check MARKET order risk: no prices for {instrument.id}",
-                            )
-                            continue  # Cannot check order risk
+                    self._log.warning(
+                        f"Cannot check MARKET order risk: no prices for {instrument.id}",
+                    )
+                    continue  # Cannot check order risk
             elif order.order_type == OrderType.STOP_MARKET or order.order_type == OrderType.MARKET_IF_TOUCHED:
                 last_px = order.trigger_price
             elif order.order_type == OrderType.TRAILING_STOP_MARKET or order.order_type == OrderType.TRAILING_STOP_LIMIT:
@@ -676,12 +745,12 @@ cdef class RiskEngine(Component):
 
             notional = instrument.notional_value(order.quantity, last_px, use_quote_for_inverse=True)
             if self.debug:
-                self._log.debug(f"Notional: {order_balance_impact!r}", LogColor.MAGENTA)
+                self._log.debug(f"Notional: {notional!r}", LogColor.MAGENTA)
 
-            if max_notional and notional._mem.raw > max_notional._mem.raw:
+            if profile.max_notional is not None and notional._mem.raw > profile._max_notional_raw:
                 self._deny_order(
                     order=order,
-                    reason=f"NOTIONAL_EXCEEDS_MAX_PER_ORDER: max_notional={max_notional}, notional={notional}",
+                    reason=f"NOTIONAL_EXCEEDS_MAX_PER_ORDER: max_notional={profile.max_notional}, notional={notional}",
                 )
                 return False  # Denied
 
@@ -709,6 +778,55 @@ cdef class RiskEngine(Component):
                 )
                 return False  # Denied
 
+            if account.is_margin_account:
+                if order.is_reduce_only:
+                    continue  # Reducing a position requires no further margin
+
+                margin_init = (<MarginAccount>account).calculate_margin_init(instrument, order.quantity, last_px)
+                if account.base_currency is not None and margin_init.currency != account.base_currency:
+                    xrate = self._cache.get_xrate(
+                        venue=instrument.id.venue,
+                        from_currency=margin_init.currency,
+                        to_currency=account.base_currency,
+                        price_type=PriceType.BID if order.side == OrderSide.SELL else PriceType.ASK,
+                    )
+                    if xrate is None:
+                        self._log.warning(
+                            f"Cannot check order margin: "
+                            f"insufficient data for {margin_init.currency}/{account.base_currency}",
+                        )
+                        continue  # Cannot assess margin
+                    margin_init = Money(
+                        round(margin_init.as_decimal() * Decimal(xrate), account.base_currency.get_precision()),
+                        account.base_currency,
+                    )
+
+                if margin_free is None or margin_free.currency != margin_init.currency:
+                    margin_free = account.balance_free(margin_init.currency)
+                if self.debug:
+                    self._log.debug(f"Margin init: {margin_init!r}", LogColor.MAGENTA)
+                if margin_free is None:
+                    continue  # No balance to check against
+
+                if margin_init._mem.raw > margin_free._mem.raw:
+                    self._deny_order(
+                        order=order,
+                        reason=f"MARGIN_INIT_EXCEEDS_FREE_BALANCE: free={margin_free}, margin_init={margin_init}",
+                    )
+                    return False  # Denied
+
+                cum_margin_init += margin_init._mem.raw
+                if cum_margin_init > margin_free._mem.raw:
+                    self._deny_order(
+                        order=order,
+                        reason=(
+                            f"CUM_MARGIN_INIT_EXCEEDS_FREE_BALANCE: free={margin_free}, "
+                            f"cum_margin_init={Money.from_raw_c(cum_margin_init, margin_free.currency)}"
+                        ),
+                    )
+                    return False  # Denied
+                continue
+
             order_balance_impact = account.balance_impact(instrument, order.quantity, last_px, order.side)
             if self.debug:
                 self._log.debug(f"Balance impact: {order_balance_impact!r}", LogColor.MAGENTA)
@@ -724,32 +842,34 @@ cdef class RiskEngine(Component):
                 base_currency = instrument.get_base_currency()
 
             if order.is_buy_c():
-                if cum_notional_buy is None:
-                    cum_notional_buy = Money(-order_balance_impact, order_balance_impact.currency)
-                else:
-                    cum_notional_buy._mem.raw += -order_balance_impact._mem.raw
-
+                cum_notional_buy += -order_balance_impact._mem.raw
                 if self.debug:
-                    self._log.debug(f"Cumulative notional BUY: {cum_notional_buy!r}")
-                if free is not None and cum_notional_buy._mem.raw > free._mem.raw:
+                    self._log.debug(
+                        f"Cumulative notional BUY: {Money.from_raw_c(cum_notional_buy, order_balance_impact.currency)!r}",
+                    )
+                if free is not None and cum_notional_buy > free._mem.raw:
                     self._deny_order(
                         order=order,
-                        reason=f"CUM_NOTIONAL_EXCEEDS_FREE_BALANCE: free={free}, cum_notional={cum_notional_buy}",
+                        reason=(
+                            f"CUM_NOTIONAL_EXCEEDS_FREE_BALANCE: free={free}, "
+                            f"cum_notional={Money.from_raw_c(cum_notional_buy, order_balance_impact.currency)}"
+                        ),
                     )
                     return False  # Denied
             elif order.is_sell_c():
                 if account.base_currency is not None:
-                    if cum_notional_sell is None:
-                        cum_notional_sell = Money(order_balance_impact, order_balance_impact.currency)
-                    else:
-                        cum_notional_sell._mem.raw += order_balance_impact._mem.raw
-
+                    cum_notional_sell += order_balance_impact._mem.raw
                     if self.debug:
-                        self._log.debug(f"Cumulative notional SELL: {cum_notional_sell!r}")
-                    if free is not None and cum_notional_sell._mem.raw > free._mem.raw:
+                        self._log.debug(
+                            f"Cumulative notional SELL: {Money.from_raw_c(cum_notional_sell, order_balance_impact.currency)!r}",
+                        )
+                    if free is not None and cum_notional_sell > free._mem.raw:
                         self._deny_order(
                             order=order,
-                            reason=f"CUM_NOTIONAL_EXCEEDS_FREE_BALANCE: free={free}, cum_notional={cum_notional_sell}",
+                            reason=(
+                                f"CUM_NOTIONAL_EXCEEDS_FREE_BALANCE: free={free}, "
+                                f"cum_notional={Money.from_raw_c(cum_notional_sell, order_balance_impact.currency)}"
+                            ),
                         )
                         return False  # Denied
                 elif base_currency is not None and account.type == AccountType.CASH:
@@ -763,23 +883,78 @@ cdef class RiskEngine(Component):
                         self._log.debug(f"Locked: {locked!r}", LogColor.MAGENTA)
                         self._log.debug(f"Free: {free!r}", LogColor.MAGENTA)
 
-                    if cum_notional_sell is None:
-                        cum_notional_sell = cash_value
-                    else:
-                        cum_notional_sell._mem.raw += cash_value._mem.raw
-
+                    cum_notional_sell += cash_value._mem.raw
                     if self.debug:
-                        self._log.debug(f"Cumulative notional SELL: {cum_notional_sell!r}")
-                    if free is not None and cum_notional_sell._mem.raw > free._mem.raw:
+                        self._log.debug(f"Cumulative notional SELL: {Money.from_raw_c(cum_notional_sell, base_currency)!r}")
+                    if free is not None and cum_notional_sell > free._mem.raw:
                         self._deny_order(
                             order=order,
-                            reason=f"CUM_NOTIONAL_EXCEEDS_FREE_BALANCE: free={free}, cum_notional={cum_notional_sell}",
+                            reason=(
+                                f"CUM_NOTIONAL_EXCEEDS_FREE_BALANCE: free={free}, "
+                                f"cum_notional={Money.from_raw_c(cum_notional_sell, base_currency)}"
+                            ),
                         )
                         return False  # Denied
 
         # Finally
         return True  # Passed
 
+    cdef InstrumentRiskProfile _get_risk_profile(self, Instrument instrument):
+        cdef InstrumentRiskProfile profile = self._risk_profiles.get(instrument.id)
+        if profile is None:
+            profile = InstrumentRiskProfile(instrument, self._max_notional_per_order.get(instrument.id))
+            self._risk_profiles[instrument.id] = profile
+
+            # Refresh last prices from the data path (ahead of strategies receiving the same data)
+            self._msgbus.subscribe(
+                topic=f"data.quotes.{instrument.id.venue}.{instrument.id.symbol}",
+                handler=self._handle_quote_tick,
+                priority=10,
+            )
+            self._msgbus.subscribe(
+                topic=f"data.trades.{instrument.id.venue}.{instrument.id.symbol}",
+                handler=self._handle_trade_tick,
+                priority=10,
+            )
+        elif profile.instrument is not instrument:
+            # Instrument was updated
+            profile.instrument = instrument
+            profile.set_max_notional(self._max_notional_per_order.get(instrument.id))
+
+        if profile.account is None:
+            profile.account = self._cache.account_for_venue(instrument.id.venue)
+
+        return profile
+
+    cdef Price _last_px(self, InstrumentRiskProfile profile, Order order):
+        # Determine entry price, falling back to the cache if no data has been received
+        # through the data path (e.g. prices added directly to the cache)
+        cdef QuoteTick last_quote
+        cdef TradeTick last_trade
+        if profile.last_bid is not None:
+            if order.side == OrderSide.BUY:
+                return profile.last_ask
+            elif order.side == OrderSide.SELL:
+                return profile.last_bid
+            else:  # pragma: no cover (design-time error)
+                raise RuntimeError(f"invalid `OrderSide`")
+
+        if profile.last_trade is None:
+            last_quote = self._cache.quote_tick(profile.instrument.id)
+            if last_quote is not None:
+                if order.side == OrderSide.BUY:
+                    return last_quote.ask_price
+                elif order.side == OrderSide.SELL:
+                    return last_quote.bid_price
+                else:  # pragma: no cover (design-time error)
+                    raise RuntimeError(f"invalid `OrderSide`")
+
+            last_trade = self._cache.trade_tick(profile.instrument.id)
+            if last_trade is not None:
+                return last_trade.price
+
+        return profile.last_trade
+
     cpdef str _check_price(self, Instrument instrument, Price price):
         if price is None:
             # Nothing to check
@@ -943,3 +1118,67 @@ cdef class RiskEngine(Component):
         if self.debug:
             self._log.debug(f"{RECV}{EVT} {event}", LogColor.MAGENTA)
         self.event_count += 1
+
+    cpdef void _handle_quote_tick(self, QuoteTick tick):
+        cdef InstrumentRiskProfile profile = self._risk_profiles.get(tick.instrument_id)
+        if profile is not None:
+            profile.update_quote(tick)
+
+    cpdef void _handle_trade_tick(self, TradeTick tick):
+        cdef InstrumentRiskProfile profile = self._risk_profiles.get(tick.instrument_id)
+        if profile is not None:
+            profile.update_trade(tick)
+
+
+cdef list _parse_rates(str value):
+    # Parse comma separated rates of the form 'limit/interval', e.g. '10/00:00:01,100/00:01:00'
+    if not value:
+        return []
+
+    cdef list rates = []
+    cdef str rate
+    for rate in value.split(","):
+        pieces = rate.strip().split("/")
+        rates.append((int(pieces[0]), pd.to_timedelta(pieces[1])))
+
+    return rates
+
+
+cdef str _format_rates(list rates):
+    return ",".join([f"{limit}/{str(interval).replace('0 days ', '')}" for limit, interval in rates])
+
+
+cdef object _create_throttler(
+    str name,
+    list rates,
+    list rates_per_instrument,
+    Clock clock,
+    output_send,
+    output_drop,
+):
+    # A single rate keeps the existing throttler, stacked or keyed rates use
+    # a sliding window for each rate
+    if len(rates) == 1 and not rates_per_instrument:
+        limit, interval = rates[0]
+        return Throttler(
+            name=name,
+            limit=limit,
+            interval=interval,
+            output_send=output_send,
+            output_drop=output_drop,
+            clock=clock,
+        )
+
+    return MultiThrottler(
+        name=name,
+        limits=rates,
+        clock=clock,
+        output_send=output_send,
+        output_drop=output_drop,
+        key_limits=rates_per_instrument,
+        key_func=_command_instrument_id,
+    )
+
+
+def _command_instrument_id(TradingCommand command):
+    return command.instrument_id
@@ -45,6 +45,7 @@ from nautilus_trader.common.component import log_header
 from nautilus_trader.common.component import register_component_clock
 from nautilus_trader.common.component import set_backtest_force_stop
 from nautilus_trader.common.component import set_logging_pyo3
+from nautilus_trader.common.component import stop_log_writer
 from nautilus_trader.common.config import InvalidConfiguration
 from nautilus_trader.common.config import msgspec_encoding_hook
 from nautilus_trader.common.enums import LogColor
@@ -244,6 +245,8 @@ class NautilusKernel:
                         print_config=logging.print_config,
                         max_file_size=logging.log_file_max_size or 0,
                         max_backup_count=logging.log_file_max_backup_count,
+                        component_rate_limits=logging.log_component_rate_limits,
+                        buffer_size=logging.log_buffer_size or 0,
                     )
                     log_header(
                         trader_id=self._trader_id,
@@ -1104,6 +1107,9 @@ class NautilusKernel:
         if self._writer:
             self._writer.close()
 
+        # Flush any buffered log records
+        stop_log_writer()
+
     def cancel_all_tasks(self) -> None:  # noqa: C901 (too complex)
         """
         Cancel all tasks currently running for the Nautilus kernel.
@@ -47,6 +47,7 @@ from betfair_parser.spec.streaming import MarketDefinition
 from betfair_parser.spec.streaming import stream_decode
 
 # fmt: off
+from nautilus_trader import TEST_DATA_DIR
 from nautilus_trader.adapters.betfair.common import BETFAIR_TICK_SCHEME
 from nautilus_trader.adapters.betfair.common import OrderSideParser
 from nautilus_trader.adapters.betfair.data_types import BetfairSequenceCompleted
@@ -58,6 +59,8 @@ from nautilus_trader.adapters.betfair.orderbook import betfair_float_to_quantity
 from nautilus_trader.adapters.betfair.orderbook import create_betfair_order_book
 from nautilus_trader.adapters.betfair.parsing.common import instrument_id_betfair_ids
 from nautilus_trader.adapters.betfair.parsing.core import BetfairParser
+from nautilus_trader.adapters.betfair.parsing.core import parse_betfair_file
+from nautilus_trader.adapters.betfair.parsing.core import parse_betfair_files
 from nautilus_trader.adapters.betfair.parsing.requests import betfair_account_to_account_state
 from nautilus_trader.adapters.betfair.parsing.requests import determine_order_status
 from nautilus_trader.adapters.betfair.parsing.requests import make_customer_order_ref
@@ -94,6 +97,7 @@ from nautilus_trader.model.identifiers import AccountId
 from nautilus_trader.model.identifiers import ClientOrderId
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import VenueOrderId
+from nautilus_trader.model.instruments import BettingInstrument
 from nautilus_trader.model.objects import AccountBalance
 from nautilus_trader.model.objects import Money
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
@@ -278,6 +282,49 @@ class TestBetfairParsingStreaming:
         )
         assert counts == expected
 
+    def test_market_definition_cached_instruments_not_rebuilt(self):
+        # Arrange
+        parser = BetfairParser(currency="GBP", cache_instruments=True)
+        raw = BetfairStreaming.mcm_market_definition_racing()
+        mcm = msgspec.json.decode(raw, type=MCM)
+
+        # Act
+        first = parser.parse(mcm)
+        second = parser.parse(mcm)
+
+        # Assert
+        assert len([x for x in first if isinstance(x, BettingInstrument)]) == 7
+        assert len([x for x in second if isinstance(x, BettingInstrument)]) == 0
+        assert len([x for x in second if isinstance(x, InstrumentStatus)]) == 7
+
+    def test_parsing_streaming_file_cached_instruments(self):
+        # Arrange
+        parser = BetfairParser(currency="GBP", cache_instruments=True)
+        mcms = BetfairDataProvider.read_mcm("1-206064380.bz2")
+
+        # Act
+        updates = [x for mcm in mcms for x in parser.parse(mcm)]
+
+        # Assert: runner order changes do not trigger a rebuild
+        instruments = [x for x in updates if isinstance(x, BettingInstrument)]
+        assert len(instruments) == 13
+        assert len({instrument.id for instrument in instruments}) == 13
+
+    def test_parse_betfair_files_matches_sequential_parsing(self):
+        # Arrange
+        filenames = ["1-166564490.bz2", "1-206064380.bz2"]
+        uris = [TEST_DATA_DIR / "betfair" / filename for filename in filenames]
+
+        # Act
+        results = list(parse_betfair_files(uris, currency="GBP", max_workers=2))
+
+        # Assert
+        assert [uri for uri, _ in results] == uris
+        for uri, data in results:
+            expected = list(parse_betfair_file(uri, currency="GBP"))
+            assert len(data) == len(expected)
+            assert [x.ts_init for x in data] == [x.ts_init for x in expected]
+
     @pytest.mark.parametrize(
         ("filename", "book_count"),
         [
@@ -0,0 +1,101 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import pytest
+
+from nautilus_trader.adapters.binance.common.constants import BINANCE_SPOT_REQUEST_WEIGHTS
+from nautilus_trader.adapters.binance.http.client import BinanceHttpClient
+from nautilus_trader.adapters.binance.http.error import BinanceClientError
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.core.nautilus_pyo3 import HttpMethod
+from nautilus_trader.live.ratelimit import WeightedRateLimiter
+
+
+def _response(status: int = 200, headers: dict[str, str] | None = None) -> MagicMock:
+    response = MagicMock()
+    response.status = status
+    response.headers = headers or {}
+    response.body = b"{}"
+    return response
+
+
+class TestBinanceHttpClientRateLimiter:
+    def setup(self):
+        # Fixture Setup
+        self.clock = LiveClock()
+        self.ratelimiter = WeightedRateLimiter(
+            limit=6000,
+            endpoint_weights=BINANCE_SPOT_REQUEST_WEIGHTS,
+        )
+        self.client = BinanceHttpClient(
+            clock=self.clock,
+            api_key="SOME_BINANCE_API_KEY",
+            api_secret="SOME_BINANCE_API_SECRET",
+            base_url="https://api.binance.com",
+            ratelimiter=self.ratelimiter,
+        )
+
+    @pytest.mark.asyncio()
+    async def test_request_consumes_endpoint_weight(self):
+        # Arrange
+        self.client._client = MagicMock()
+        self.client._client.request = AsyncMock(return_value=_response())
+
+        # Act
+        await self.client.sign_request(
+            HttpMethod.GET,
+            "/api/v3/openOrders",
+            payload={"timestamp": str(self.clock.timestamp_ms())},
+        )
+        await self.client.sign_request(
+            HttpMethod.GET,
+            "/api/v3/openOrders",
+            payload={"symbol": "ETHUSDT", "timestamp": str(self.clock.timestamp_ms())},
+        )
+
+        # Assert
+        assert self.ratelimiter.used == 86  # 80 (all symbols) + 6
+
+    @pytest.mark.asyncio()
+    async def test_used_weight_header_updates_limiter(self):
+        # Arrange
+        self.client._client = MagicMock()
+        self.client._client.request = AsyncMock(
+            return_value=_response(headers={"X-MBX-USED-WEIGHT-1M": "4500"}),
+        )
+
+        # Act
+        await self.client.send_request(HttpMethod.GET, "/api/v3/time")
+
+        # Assert
+        assert self.ratelimiter.used == 4500
+
+    @pytest.mark.asyncio()
+    async def test_rate_limit_response_pauses_limiter(self):
+        # Arrange
+        self.client._client = MagicMock()
+        self.client._client.request = AsyncMock(
+            return_value=_response(status=429, headers={"retry-after": "30"}),
+        )
+
+        # Act
+        with pytest.raises(BinanceClientError):
+            await self.client.send_request(HttpMethod.GET, "/api/v3/time")
+
+        # Assert
+        assert self.ratelimiter._paused_until > self.clock.timestamp()
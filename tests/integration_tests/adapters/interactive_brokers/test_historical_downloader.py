@@ -0,0 +1,261 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import time
+
+import pandas as pd
+import pytest
+
+from nautilus_trader.adapters.interactive_brokers.historical.downloader import DownloadCheckpoint
+from nautilus_trader.adapters.interactive_brokers.historical.downloader import HistoricalRequestPacer
+from nautilus_trader.adapters.interactive_brokers.historical.downloader import InteractiveBrokersHistoricalDownloader
+from nautilus_trader.adapters.interactive_brokers.historical.downloader import bar_segments
+from nautilus_trader.core.datetime import dt_to_unix_nanos
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from tests.integration_tests.adapters.interactive_brokers.test_kit import IBTestContractStubs
+
+
+START = pd.Timestamp("2024-01-01", tz="UTC")
+END = pd.Timestamp("2024-03-31", tz="UTC")
+
+
+class FakeHistoricalClient:
+    """
+    A local fake of the `InteractiveBrokersClient` historical data requests, returning
+    one bar per day of each duration, and batches of 100 trade ticks (one per second)
+    following the start time.
+    """
+
+    def __init__(self, fail_on_request: int | None = None) -> None:
+        self.requests: list[tuple] = []
+        self.fail_on_request = fail_on_request
+
+    def _record(self, request: tuple) -> None:
+        self.requests.append(request)
+        if len(self.requests) == self.fail_on_request:
+            raise ConnectionError("Connection lost")
+
+    async def get_historical_bars(
+        self,
+        bar_type,
+        contract,
+        use_rth,
+        end_date_time,
+        duration,
+        timeout=60,
+    ):
+        self._record((bar_type, end_date_time, duration))
+        await asyncio.sleep(0)
+        days = int(duration.split()[0])
+        bars = []
+        for i in range(days, 0, -1):  # Bars are stamped at their open, before the end
+            ts = dt_to_unix_nanos(end_date_time - pd.Timedelta(days=i))
+            bars.append(
+                Bar(
+                    bar_type=bar_type,
+                    open=Price.from_str("100.00"),
+                    high=Price.from_str("101.00"),
+                    low=Price.from_str("99.00"),
+                    close=Price.from_str("100.50"),
+                    volume=Quantity.from_int(1_000),
+                    ts_event=ts,
+                    ts_init=ts,
+                ),
+            )
+        return bars
+
+    async def get_historical_ticks(
+        self,
+        contract,
+        tick_type,
+        start_date_time="",
+        end_date_time="",
+        use_rth=True,
+        timeout=60,
+    ):
+        self._record((contract, tick_type, start_date_time))
+        await asyncio.sleep(0)
+        ticks = []
+        for i in range(1, 101):
+            ts = dt_to_unix_nanos(start_date_time + pd.Timedelta(seconds=i))
+            ticks.append(
+                TradeTick(
+                    instrument_id=IBTestContractStubs.aapl_instrument().id,
+                    price=Price.from_str("100.00"),
+                    size=Quantity.from_int(1),
+                    aggressor_side=AggressorSide.BUYER,
+                    trade_id=TradeId(str(ts)),
+                    ts_event=ts,
+                    ts_init=ts,
+                ),
+            )
+        return ticks
+
+
+def create_downloader(client, tmp_path, **kwargs) -> InteractiveBrokersHistoricalDownloader:
+    return InteractiveBrokersHistoricalDownloader(
+        client=client,
+        catalog=ParquetDataCatalog(tmp_path / "catalog"),
+        checkpoint_path=tmp_path / "checkpoint.json",
+        pacer=HistoricalRequestPacer(max_requests_per_key=100),
+        max_retries=0,
+        **kwargs,
+    )
+
+
+def test_bar_segments_splits_range_backwards():
+    # Arrange, Act
+    segments = bar_segments(START, START + pd.Timedelta(days=45), pd.Timedelta(days=30))
+
+    # Assert
+    assert segments == [
+        (START + pd.Timedelta(days=45), "30 D"),
+        (START + pd.Timedelta(days=15), "15 D"),
+    ]
+
+
+def test_bar_segments_rounds_partial_days_up():
+    # Arrange, Act
+    segments = bar_segments(START, START + pd.Timedelta(hours=30), pd.Timedelta(days=1))
+
+    # Assert
+    assert segments == [
+        (START + pd.Timedelta(hours=30), "1 D"),
+        (START + pd.Timedelta(hours=6), "21600 S"),
+    ]
+
+
+def test_checkpoint_persists_progress(tmp_path):
+    # Arrange
+    checkpoint = DownloadCheckpoint(tmp_path / "checkpoint.json")
+
+    # Act
+    checkpoint.set("bars:AAPL", ["1", "2"])
+
+    # Assert
+    assert DownloadCheckpoint(tmp_path / "checkpoint.json").get("bars:AAPL") == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_pacer_limits_requests_per_key():
+    # Arrange
+    pacer = HistoricalRequestPacer(max_requests_per_key=2, key_window_secs=0.2)
+
+    async def request(key):
+        async with pacer.request(key):
+            pass
+
+    # Act
+    start = time.monotonic()
+    await asyncio.gather(*(request("AAPL") for _ in range(3)), request("MSFT"))
+    elapsed = time.monotonic() - start
+
+    # Assert
+    assert elapsed >= 0.2
+    assert pacer.request_count == 4
+
+
+@pytest.mark.asyncio
+async def test_download_bars_writes_segments_to_catalog(tmp_path):
+    # Arrange
+    client = FakeHistoricalClient()
+    downloader = create_downloader(client, tmp_path)
+
+    # Act
+    count = await downloader.download_bars(
+        contracts=[IBTestContractStubs.aapl_equity_ib_contract()],
+        bar_specifications=["1-DAY-LAST", "1-DAY-MID"],
+        start_date_time=START,
+        end_date_time=END,
+    )
+
+    # Assert
+    bars = ParquetDataCatalog(tmp_path / "catalog").bars()
+    assert len(client.requests) == 6  # 2 bar types x 3 segments
+    assert count == len(bars) == 2 * 90
+
+
+@pytest.mark.asyncio
+async def test_download_bars_resumes_after_interruption(tmp_path):
+    # Arrange
+    contracts = [IBTestContractStubs.aapl_equity_ib_contract()]
+    interrupted = FakeHistoricalClient(fail_on_request=3)
+    await create_downloader(interrupted, tmp_path).download_bars(
+        contracts,
+        ["1-DAY-LAST"],
+        START,
+        END,
+    )
+    client = FakeHistoricalClient()
+
+    # Act
+    await create_downloader(client, tmp_path).download_bars(contracts, ["1-DAY-LAST"], START, END)
+
+    # Assert
+    bars = ParquetDataCatalog(tmp_path / "catalog").bars()
+    assert len(client.requests) == 1  # Only the remaining segment
+    assert len(bars) == 90
+    assert len({bar.ts_event for bar in bars}) == 90
+
+
+@pytest.mark.asyncio
+async def test_download_ticks_writes_batches_and_completes(tmp_path):
+    # Arrange
+    client = FakeHistoricalClient()
+    downloader = create_downloader(client, tmp_path)
+    end = START + pd.Timedelta(seconds=250)
+
+    # Act
+    count = await downloader.download_ticks(
+        contracts=[IBTestContractStubs.aapl_equity_ib_contract()],
+        tick_type="TRADES",
+        start_date_time=START,
+        end_date_time=end,
+    )
+
+    # Assert
+    ticks = ParquetDataCatalog(tmp_path / "catalog").trade_ticks()
+    assert len(client.requests) == 3
+    assert count == len(ticks) == 249  # The end is exclusive
+    await downloader.download_ticks(
+        [IBTestContractStubs.aapl_equity_ib_contract()],
+        "TRADES",
+        START,
+        end,
+    )
+    assert len(client.requests) == 3  # Already complete
+
+
+@pytest.mark.asyncio
+async def test_download_ticks_with_different_end_is_not_treated_as_complete(tmp_path):
+    # Arrange
+    client = FakeHistoricalClient()
+    downloader = create_downloader(client, tmp_path)
+    contract = IBTestContractStubs.aapl_equity_ib_contract()
+    await downloader.download_ticks([contract], "TRADES", START, START + pd.Timedelta(seconds=50))
+    request_count = len(client.requests)
+
+    # Act
+    await downloader.download_ticks([contract], "TRADES", START, START + pd.Timedelta(seconds=250))
+
+    # Assert
+    assert len(client.requests) > request_count
@@ -0,0 +1,123 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.accounting.accounts.cash import CashAccount
+from nautilus_trader.accounting.manager import AccountsManager
+from nautilus_trader.common.component import Logger
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.model.currencies import BTC
+from nautilus_trader.model.currencies import USDT
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.events import AccountState
+from nautilus_trader.model.identifiers import AccountId
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.objects import AccountBalance
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
+ACCOUNT_ID = AccountId("BINANCE-001")
+OPEN_ORDER_COUNT = 500
+
+
+def setup_resting_orders(incremental: bool):
+    cache = TestComponentStubs.cache()
+    cache.add_instrument(BTCUSDT_BINANCE)
+
+    account = CashAccount(
+        AccountState(
+            account_id=ACCOUNT_ID,
+            account_type=AccountType.CASH,
+            base_currency=None,
+            reported=False,
+            balances=[
+                AccountBalance(
+                    Money(1_000_000.00000000, BTC),
+                    Money(0.00000000, BTC),
+                    Money(1_000_000.00000000, BTC),
+                ),
+                AccountBalance(
+                    Money(100_000_000_000.00000000, USDT),
+                    Money(0.00000000, USDT),
+                    Money(100_000_000_000.00000000, USDT),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        ),
+        calculate_account_state=True,
+    )
+    cache.add_account(account)
+
+    manager = AccountsManager(
+        cache=cache,
+        clock=TestClock(),
+        logger=Logger("AccountsManager"),
+        incremental=incremental,
+    )
+    order_factory = OrderFactory(
+        trader_id=TestIdStubs.trader_id(),
+        strategy_id=StrategyId("S-001"),
+        clock=TestClock(),
+    )
+
+    # A market maker's resting orders on both sides of the book
+    orders = []
+    for i in range(OPEN_ORDER_COUNT):
+        side = OrderSide.BUY if i % 2 == 0 else OrderSide.SELL
+        offset = (i // 2 + 1) * (-1 if side == OrderSide.BUY else 1)
+        order = order_factory.limit(
+            BTCUSDT_BINANCE.id,
+            side,
+            Quantity.from_str("0.100000"),
+            Price.from_str(f"{50_000 + offset}.00"),
+        )
+        cache.add_order(order, position_id=None)
+        order.apply(TestEventStubs.order_submitted(order, account_id=ACCOUNT_ID))
+        order.apply(TestEventStubs.order_accepted(order, account_id=ACCOUNT_ID))
+        cache.update_order(order)
+        orders.append(order)
+
+    manager.update_orders(
+        account,
+        BTCUSDT_BINANCE,
+        cache.orders_open(instrument_id=BTCUSDT_BINANCE.id),
+        ts_event=0,
+    )
+
+    return manager, account, orders
+
+
+@pytest.mark.parametrize("incremental", [True, False], ids=["incremental", "full_recompute"])
+def test_update_order_with_many_open_orders(benchmark, incremental):
+    manager, account, orders = setup_resting_orders(incremental)
+    order = orders[0]
+
+    # Each order event only changes the single order
+    benchmark(manager.update_order, account, BTCUSDT_BINANCE, order, 0)
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import tracemalloc
 from datetime import datetime
 from decimal import Decimal
 
@@ -34,6 +35,8 @@ from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import OmsType
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Money
+from nautilus_trader.persistence.replay import ReplayFile
+from nautilus_trader.persistence.replay import write_replay_file
 from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from nautilus_trader.test_kit.providers import TestDataProvider
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
@@ -164,3 +167,79 @@ def test_run_with_ema_cross_strategy(benchmark):
     end = datetime(2013, 3, 1, 0, 0, 0, 0, tzinfo=pytz.utc)
 
     benchmark(engine.run, start, end)
+
+
+@pytest.mark.skip
+@pytest.mark.benchmark(min_rounds=1)
+def test_run_for_tick_processing_from_replay_file(benchmark, tmp_path):
+    config = BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True))
+    engine = BacktestEngine(config=config)
+
+    engine.add_venue(
+        venue=Venue("SIM"),
+        oms_type=OmsType.HEDGING,
+        account_type=AccountType.MARGIN,
+        base_currency=USD,
+        starting_balances=[Money(1_000_000, USD)],
+    )
+
+    engine.add_instrument(USDJPY_SIM)
+
+    # Set up data (written once, then memory-mapped and decoded per chunk)
+    wrangler = QuoteTickDataWrangler(USDJPY_SIM)
+    provider = TestDataProvider()
+    ticks = wrangler.process_bar_data(
+        bid_data=provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv"),
+        ask_data=provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv"),
+    )
+    replay = ReplayFile(write_replay_file(tmp_path / "usdjpy-quotes.replay", ticks))
+    del ticks
+
+    config = EMACrossConfig(
+        instrument_id=USDJPY_SIM.id,
+        bar_type=TestDataStubs.bartype_usdjpy_1min_bid(),
+        trade_size=Decimal(1_000_000),
+        fast_ema_period=10,
+        slow_ema_period=20,
+    )
+    strategy = EMACross(config=config)
+    engine.add_strategy(strategy)
+
+    start = datetime(2013, 2, 1, 0, 0, 0, 0, tzinfo=pytz.utc)
+    end = datetime(2013, 2, 10, 0, 0, 0, 0, tzinfo=pytz.utc)
+
+    engine.add_data_iterator("USD/JPY quotes", replay.iter_chunks(start=start, end=end))
+
+    # Single round, as the data iterator is consumed by the run
+    benchmark.pedantic(engine.run, args=(start, end), rounds=1, iterations=1)
+
+
+@pytest.mark.skip
+def test_replay_file_peak_memory_compared_to_data_objects(tmp_path):
+    wrangler = QuoteTickDataWrangler(USDJPY_SIM)
+    provider = TestDataProvider()
+    bid_data = provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")
+    ask_data = provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv")
+    path = write_replay_file(
+        tmp_path / "usdjpy-quotes.replay",
+        wrangler.process_bar_data(bid_data=bid_data, ask_data=ask_data),
+    )
+
+    # Materialize all data objects up front (as with `BacktestEngine.add_data`)
+    tracemalloc.start()
+    ticks = ReplayFile(path).to_list()
+    _, objects_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = len(ticks)
+    del ticks
+
+    # Decode data objects per chunk from the memory-mapped file
+    tracemalloc.start()
+    replayed = 0
+    for chunk in ReplayFile(path).iter_chunks(chunk_size=10_000):
+        replayed += len(chunk)
+    _, replay_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert replayed == count
+    assert replay_peak < objects_peak / 10
@@ -0,0 +1,101 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+
+from nautilus_trader.adapters.binance.config import BinanceDataClientConfig
+from nautilus_trader.adapters.binance.http.client import BinanceHttpClient
+from nautilus_trader.adapters.binance.spot.data import BinanceSpotDataClient
+from nautilus_trader.adapters.binance.spot.providers import BinanceSpotInstrumentProvider
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.data.engine import DataEngine
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+# Number of messages handled per benchmark round (rounds/sec * this = messages/sec)
+MESSAGES_PER_ROUND = 1_000
+
+RAW_BOOK_TICKER = (
+    b'{"stream":"ethusdt@bookTicker","data":{"u":12711621188,"s":"ETHUSDT",'
+    b'"b":"4507.24000000","B":"2.35950000","a":"4507.25000000","A":"2.84570000"}}'
+)
+
+RAW_DEPTH_DIFF = (
+    b'{"stream":"ethusdt@depth@100ms","data":{"e":"depthUpdate","E":1646199228123,'
+    b'"s":"ETHUSDT","U":157,"u":160,'
+    b'"b":[["4507.24000000","2.35950000"],["4507.23000000","1.00000000"]],'
+    b'"a":[["4507.25000000","2.84570000"],["4507.26000000","0.50000000"]]}}'
+)
+
+
+class TestBinanceWebSocketPerformance:
+    def setup(self):
+        # Fixture Setup
+        self.loop = asyncio.get_event_loop()
+        self.clock = LiveClock()
+
+        self.msgbus = MessageBus(
+            trader_id=TestIdStubs.trader_id(),
+            clock=self.clock,
+        )
+
+        self.cache = TestComponentStubs.cache()
+
+        self.data_engine = DataEngine(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        self.http_client = BinanceHttpClient(
+            clock=self.clock,
+            api_key="SOME_BINANCE_API_KEY",
+            api_secret="SOME_BINANCE_API_SECRET",
+            base_url="https://api.binance.com/",
+        )
+
+        self.data_client = BinanceSpotDataClient(
+            loop=self.loop,
+            client=self.http_client,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            instrument_provider=BinanceSpotInstrumentProvider(
+                client=self.http_client,
+                clock=self.clock,
+            ),
+            base_url_ws="wss://stream.binance.com:9443",
+            config=BinanceDataClientConfig(),
+        )
+
+    def test_handle_book_ticker_messages(self, benchmark):
+        handle = self.data_client._handle_ws_message
+
+        def run():
+            for _ in range(MESSAGES_PER_ROUND):
+                handle(RAW_BOOK_TICKER)
+
+        benchmark(run)
+
+    def test_handle_depth_diff_messages(self, benchmark):
+        handle = self.data_client._handle_ws_message
+
+        def run():
+            for _ in range(MESSAGES_PER_ROUND):
+                handle(RAW_DEPTH_DIFF)
+
+        benchmark(run)
@@ -13,7 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import json
 import random
+import subprocess
+import sys
 
 from nautilus_trader.common.component import Logger
 from nautilus_trader.common.component import init_logging
@@ -21,6 +24,41 @@ from nautilus_trader.common.component import is_logging_initialized
 from nautilus_trader.common.enums import LogLevel
 
 
+# Messages of varying lengths
+MESSAGES = [
+    "Initializing positronic matrix",
+    "Activating quantum singularity drive",
+    "Calibrating transdimensional phase array",
+    "Engaging hyperion particle accelerator",
+    "Deploying ionized plasma thrusters",
+    "Charging graviton emitter array",
+    "Initiating tachyon sensor sweep",
+    "Activating neural interface protocol",
+    "Initializing fusion reactor core",
+    "Engaging gravimetric distortion field",
+    "Deploying positron matrix containment",
+    "Initiating quantum entanglement protocol",
+    "Calibrating ion thruster array",
+    "Activating plasma conduit system",
+    "Charging phase inducer matrix",
+    "Engaging gravimetric warp drive",
+    "Deploying graviton beam array",
+    "Initializing graviton polarity array",
+    "Activating tachyon pulse generator",
+    "Initiating positron containment field",
+    "Initializing multi-phase quantum singularity containment field",
+    "Deploying ionized plasma thrusters for interstellar travel",
+    "Calibrating neural interface for optimal performance",
+    "Engaging gravimetric warp drive for faster-than-light travel",
+    "Activating tachyon pulse generator for temporal manipulation",
+    "Activating shields",
+    "Charging plasma cannon",
+    "Deploying tractor beam",
+    "Initializing warp drive",
+    "Engaging hyperdrive",
+]
+
+
 def test_logging(benchmark) -> None:
     random.seed(45362718)
     _guard = None
@@ -29,44 +67,91 @@ def test_logging(benchmark) -> None:
 
     logger = Logger(name="TEST_LOGGER")
 
-    # messages of varying lengths
-    messages = [
-        "Initializing positronic matrix",
-        "Activating quantum singularity drive",
-        "Calibrating transdimensional phase array",
-        "Engaging hyperion particle accelerator",
-        "Deploying ionized plasma thrusters",
-        "Charging graviton emitter array",
-        "Initiating tachyon sensor sweep",
-        "Activating neural interface protocol",
-        "Initializing fusion reactor core",
-        "Engaging gravimetric distortion field",
-        "Deploying positron matrix containment",
-        "Initiating quantum entanglement protocol",
-        "Calibrating ion thruster array",
-        "Activating plasma conduit system",
-        "Charging phase inducer matrix",
-        "Engaging gravimetric warp drive",
-        "Deploying graviton beam array",
-        "Initializing graviton polarity array",
-        "Activating tachyon pulse generator",
-        "Initiating positron containment field",
-        "Initializing multi-phase quantum singularity containment field",
-        "Deploying ionized plasma thrusters for interstellar travel",
-        "Calibrating neural interface for optimal performance",
-        "Engaging gravimetric warp drive for faster-than-light travel",
-        "Activating tachyon pulse generator for temporal manipulation",
-        "Activating shields",
-        "Charging plasma cannon",
-        "Deploying tractor beam",
-        "Initializing warp drive",
-        "Engaging hyperdrive",
-    ]
-
     def run():
         for i in range(100_000):
-            message = random.choice(messages)
+            message = random.choice(MESSAGES)
             # unique log messages to prevent caching during string conversion
             logger.info(f"{i}: {message}")
 
     benchmark(run)
+
+
+def test_logging_filtered_lazy(benchmark) -> None:
+    random.seed(45362718)
+    _guard = None
+    if not is_logging_initialized():
+        _guard = init_logging(level_stdout=LogLevel.ERROR, bypass=True)
+
+    logger = Logger(name="TEST_LOGGER")
+
+    def run():
+        for i in range(100_000):
+            # Records below the logger threshold are dropped before formatting
+            logger.log(LogLevel.DEBUG, "{}: {}", i, random.choice(MESSAGES))
+
+    benchmark(run)
+
+
+def test_logging_filtered_guarded(benchmark) -> None:
+    random.seed(45362718)
+    _guard = None
+    if not is_logging_initialized():
+        _guard = init_logging(level_stdout=LogLevel.ERROR, bypass=True)
+
+    logger = Logger(name="TEST_LOGGER")
+
+    def run():
+        for i in range(100_000):
+            message = random.choice(MESSAGES)
+            if logger.is_enabled(LogLevel.DEBUG):
+                logger.debug(f"{i}: {message}")
+
+    benchmark(run)
+
+
+# Logging is process global and can only be initialized once, so the buffered path
+# runs in a fresh interpreter with a real (non bypassed) threshold and file output
+BUFFERED_SCRIPT = """
+import json
+import random
+import sys
+
+from nautilus_trader.common.component import BufferedLogWriter
+from nautilus_trader.common.component import Logger
+from nautilus_trader.common.component import init_logging
+from nautilus_trader.common.component import start_log_writer
+from nautilus_trader.common.component import stop_log_writer
+from nautilus_trader.common.enums import LogLevel
+
+messages = json.loads(sys.argv[2])
+random.seed(45362718)
+guard = init_logging(level_stdout=LogLevel.OFF, level_file=LogLevel.INFO, directory=sys.argv[1])
+logger = Logger(name="TEST_LOGGER")
+writer = BufferedLogWriter(capacity=200_000)
+start_log_writer(writer)
+
+for i in range(100_000):
+    logger.log(LogLevel.INFO, "{}: {}", i, random.choice(messages))
+
+stop_log_writer()
+print(json.dumps({"queued": writer.queued, "dropped": writer.dropped}))
+del guard
+"""
+
+
+def test_logging_buffered(benchmark, tmp_path) -> None:
+    def run():
+        result = subprocess.run(
+            [sys.executable, "-c", BUFFERED_SCRIPT, str(tmp_path), json.dumps(MESSAGES)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+    stats = benchmark.pedantic(run, rounds=1, iterations=1)
+
+    # The writer flushed every record to the core logger before stopping
+    assert stats == {"queued": 0, "dropped": 0}
+    lines = [line for path in tmp_path.iterdir() for line in path.read_text().splitlines()]
+    assert sum("TEST_LOGGER" in line for line in lines) == 100_000
@@ -17,6 +17,8 @@ import pandas as pd
 import pytest
 
 from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import MultiThrottler
+from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.component import Throttler
 
 
@@ -36,3 +38,55 @@ def buffering_throttler(name: str, limit: int) -> Throttler:
 def test_send_unlimited(benchmark):
     throttler = buffering_throttler("buffer-1", 10_000)
     benchmark(throttler.send, "MESSAGE")
+
+
+def multi_throttler(name: str, clock, output_drop=None) -> MultiThrottler:
+    handler: list[str] = []
+    return MultiThrottler(
+        name=name,
+        limits=[(10_000, pd.Timedelta(seconds=1)), (100_000, pd.Timedelta(minutes=1))],
+        clock=clock,
+        output_send=handler.append,
+        output_drop=output_drop,
+        key_limits=[(1_000, pd.Timedelta(seconds=1))],
+        key_func=lambda msg: msg[:2],
+    )
+
+
+def test_multi_throttler_send_within_limits(benchmark):
+    clock = TestClock()
+    throttler = multi_throttler("multi-1", clock)
+    keys = [f"{i:02d}" for i in range(100)]
+
+    def send_all():
+        clock.advance_time(clock.timestamp_ns() + 1_000_000_000)
+        for key in keys:
+            throttler.send(key)
+
+    benchmark(send_all)
+
+
+def test_multi_throttler_send_when_dropping(benchmark):
+    dropped: list[str] = []
+    throttler = multi_throttler("multi-2", TestClock(), output_drop=dropped.append)
+    for _ in range(1_000):
+        throttler.send("AA")  # <-- Exhaust the key limit
+
+    benchmark(throttler.send, "AA")
+
+
+def test_multi_throttler_drain_buffered_by_key(benchmark):
+    def setup():
+        clock = TestClock()
+        throttler = multi_throttler("multi-3", clock)
+        for i in range(10_000):
+            throttler.send(f"{i % 100:02d}")  # <-- Exhaust the per second limit
+        for i in range(1_000):
+            throttler.send(f"{i % 100:02d}")
+        return (clock, throttler), {}
+
+    def drain(clock, throttler):
+        for event in clock.advance_time(clock.timestamp_ns() + 1_000_000_000):
+            event.handle()
+
+    benchmark.pedantic(drain, setup=setup, rounds=10)
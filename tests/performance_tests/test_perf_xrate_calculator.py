@@ -13,9 +13,63 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.cache.cache import Cache
 from nautilus_trader.core import nautilus_pyo3
 from nautilus_trader.model.currencies import ETH
+from nautilus_trader.model.currencies import NZD
 from nautilus_trader.model.currencies import USDT
+from nautilus_trader.model.currencies import ZAR
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+SIM = Venue("SIM")
+
+# Every currency is quoted against USD and EUR, giving a single connected graph
+CURRENCIES = [
+    "AUD",
+    "CAD",
+    "CHF",
+    "CNH",
+    "CZK",
+    "DKK",
+    "GBP",
+    "HKD",
+    "HUF",
+    "ILS",
+    "JPY",
+    "MXN",
+    "NOK",
+    "NZD",
+    "PLN",
+    "SEK",
+    "SGD",
+    "TRY",
+    "ZAR",
+]
+
+
+def _many_pair_quotes() -> tuple[dict[str, float], dict[str, float]]:
+    bid_quotes: dict[str, float] = {"EUR/USD": 1.10000}
+    ask_quotes: dict[str, float] = {"EUR/USD": 1.10010}
+    for i, code in enumerate(CURRENCIES):
+        bid_quotes[f"{code}/USD"] = 0.5 + i * 0.01
+        ask_quotes[f"{code}/USD"] = 0.5 + i * 0.01 + 0.0001
+        bid_quotes[f"{code}/EUR"] = 0.45 + i * 0.01
+        ask_quotes[f"{code}/EUR"] = 0.45 + i * 0.01 + 0.0001
+    return bid_quotes, ask_quotes
+
+
+def _many_pair_cache() -> tuple[Cache, list]:
+    cache = Cache()
+    instruments = []
+    for symbol in ["EUR/USD"] + [f"{code}/{quote}" for code in CURRENCIES for quote in ("USD", "EUR")]:
+        instrument = TestInstrumentProvider.default_fx_ccy(symbol, SIM)
+        cache.add_instrument(instrument)
+        cache.add_quote_tick(TestDataStubs.quote_tick(instrument, bid_price=1.0, ask_price=1.0001))
+        instruments.append(instrument)
+    return cache, instruments
 
 
 def test_get_rate(benchmark):
@@ -39,3 +93,41 @@ def test_get_rate(benchmark):
         bid_quotes,
         ask_quotes,
     )
+
+
+def test_get_rate_many_pairs(benchmark):
+    bid_quotes, ask_quotes = _many_pair_quotes()
+
+    benchmark(
+        nautilus_pyo3.get_exchange_rate,
+        NZD.code,
+        ZAR.code,
+        nautilus_pyo3.PriceType.MID,
+        bid_quotes,
+        ask_quotes,
+    )
+
+
+def test_cache_get_xrate_many_pairs(benchmark):
+    cache, _ = _many_pair_cache()
+
+    benchmark(cache.get_xrate, SIM, NZD, ZAR)
+
+
+def test_cache_get_xrate_many_pairs_with_quote_updates(benchmark):
+    cache, instruments = _many_pair_cache()
+
+    # Alternate between two price levels, so each update changes a contributing pair
+    quotes = [
+        [TestDataStubs.quote_tick(instrument, bid_price=price, ask_price=price + 0.0001) for instrument in instruments]
+        for price in (1.0, 1.1)
+    ]
+    rounds = [0]
+
+    def update_and_get_xrate():
+        rounds[0] += 1
+        for quote in quotes[rounds[0] % 2]:
+            cache.add_quote_tick(quote)
+            cache.get_xrate(SIM, NZD, ZAR)
+
+    benchmark(update_and_get_xrate)
@@ -0,0 +1,185 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from decimal import Decimal
+
+import pytest
+
+from nautilus_trader.accounting.accounts.cash import CashAccount
+from nautilus_trader.accounting.accounts.margin import MarginAccount
+from nautilus_trader.accounting.manager import AccountsManager
+from nautilus_trader.common.component import Logger
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.model.currencies import BTC
+from nautilus_trader.model.currencies import USDT
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.events import AccountState
+from nautilus_trader.model.identifiers import AccountId
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.objects import AccountBalance
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
+ACCOUNT_ID = AccountId("BINANCE-001")
+
+
+def account_state(account_type: AccountType) -> AccountState:
+    return AccountState(
+        account_id=ACCOUNT_ID,
+        account_type=account_type,
+        base_currency=None,  # Multi-currency account
+        reported=False,
+        balances=[
+            AccountBalance(
+                Money(1_000.00000000, BTC),
+                Money(0.00000000, BTC),
+                Money(1_000.00000000, BTC),
+            ),
+            AccountBalance(
+                Money(100_000_000.00000000, USDT),
+                Money(0.00000000, USDT),
+                Money(100_000_000.00000000, USDT),
+            ),
+        ],
+        margins=[],
+        info={},
+        event_id=UUID4(),
+        ts_event=0,
+        ts_init=0,
+    )
+
+
+class TestAccountsManager:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.cache = TestComponentStubs.cache()
+        self.cache.add_instrument(BTCUSDT_BINANCE)
+        self.order_factory = OrderFactory(
+            trader_id=TestIdStubs.trader_id(),
+            strategy_id=StrategyId("S-001"),
+            clock=TestClock(),
+        )
+
+    def create_manager(self, incremental: bool = True) -> AccountsManager:
+        return AccountsManager(
+            cache=self.cache,
+            clock=self.clock,
+            logger=Logger("AccountsManager"),
+            incremental=incremental,
+        )
+
+    def open_order(self, side: OrderSide, price: str, quantity: str = "0.5"):
+        order = self.order_factory.limit(
+            BTCUSDT_BINANCE.id,
+            side,
+            Quantity.from_str(quantity),
+            Price.from_str(price),
+        )
+        self.cache.add_order(order, position_id=None)
+        order.apply(TestEventStubs.order_submitted(order, account_id=ACCOUNT_ID))
+        order.apply(TestEventStubs.order_accepted(order, account_id=ACCOUNT_ID))
+        self.cache.update_order(order)
+        return order
+
+    def close_order(self, order) -> None:
+        order.apply(TestEventStubs.order_canceled(order))
+        self.cache.update_order(order)
+
+    def test_update_order_locked_balance_matches_full_recompute(self):
+        # Arrange
+        account = CashAccount(account_state(AccountType.CASH), calculate_account_state=True)
+        self.cache.add_account(account)
+        manager = self.create_manager()
+        orders = []
+
+        # Act
+        for i in range(100):
+            side = OrderSide.BUY if i % 2 == 0 else OrderSide.SELL
+            order = self.open_order(side, f"{50_000 + i}.{i:02d}")
+            orders.append(order)
+            manager.update_order(account, BTCUSDT_BINANCE, order, ts_event=0)
+
+        for order in orders[::3]:
+            self.close_order(order)
+            manager.update_order(account, BTCUSDT_BINANCE, order, ts_event=0)
+
+        incremental_usdt = account.balance(USDT).locked
+        incremental_btc = account.balance(BTC).locked
+
+        manager.update_orders(
+            account,
+            BTCUSDT_BINANCE,
+            self.cache.orders_open(instrument_id=BTCUSDT_BINANCE.id),
+            ts_event=0,
+        )
+
+        # Assert
+        assert incremental_usdt.as_decimal() > 0
+        assert account.balance(USDT).locked == incremental_usdt
+        assert account.balance(BTC).locked == incremental_btc
+
+    def test_update_order_when_all_orders_closed_clears_locked_balance(self):
+        # Arrange
+        account = CashAccount(account_state(AccountType.CASH), calculate_account_state=True)
+        self.cache.add_account(account)
+        manager = self.create_manager()
+        order1 = self.open_order(OrderSide.BUY, "50000.00")
+        order2 = self.open_order(OrderSide.BUY, "49000.00")
+        manager.update_order(account, BTCUSDT_BINANCE, order1, ts_event=0)
+        manager.update_order(account, BTCUSDT_BINANCE, order2, ts_event=0)
+
+        # Act
+        self.close_order(order1)
+        manager.update_order(account, BTCUSDT_BINANCE, order1, ts_event=0)
+        locked_after_first_close = account.balance(USDT).locked
+        order2.apply(TestEventStubs.order_expired(order2))
+        manager.update_order(account, BTCUSDT_BINANCE, order2, ts_event=0)
+
+        # Assert
+        assert locked_after_first_close.as_decimal() == Decimal("24549.00000000")
+        assert account.balance(USDT).locked == Money(0, USDT)
+
+    @pytest.mark.parametrize("incremental", [True, False])
+    def test_update_order_margin_init_for_both_modes(self, incremental):
+        # Arrange
+        account = MarginAccount(account_state(AccountType.MARGIN), calculate_account_state=True)
+        self.cache.add_account(account)
+        manager = self.create_manager(incremental=incremental)
+        orders = [self.open_order(OrderSide.BUY, f"{40_000 + i * 10}.00") for i in range(10)]
+
+        # Act
+        for order in orders:
+            manager.update_order(account, BTCUSDT_BINANCE, order, ts_event=0)
+
+        self.close_order(orders[0])
+        manager.update_order(account, BTCUSDT_BINANCE, orders[0], ts_event=0)
+
+        # Assert
+        expected = sum(
+            account.calculate_margin_init(BTCUSDT_BINANCE, o.quantity, o.price).as_decimal()
+            for o in orders[1:]
+        )
+        assert account.margin_init(BTCUSDT_BINANCE.id).as_decimal() == expected
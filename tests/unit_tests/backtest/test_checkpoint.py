@@ -0,0 +1,153 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import sys
+from decimal import Decimal
+
+import pytest
+
+from nautilus_trader.backtest.checkpoint import BacktestCheckpoint
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.examples.strategies.ema_cross import EMACross
+from nautilus_trader.examples.strategies.ema_cross import EMACrossConfig
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import AggregationSource
+from nautilus_trader.model.enums import OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.persistence.wranglers import BarDataWrangler
+from nautilus_trader.test_kit.providers import TestDataProvider
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
+
+
+def create_engine() -> BacktestEngine:
+    engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
+    engine.add_venue(
+        venue=Venue("SIM"),
+        oms_type=OmsType.HEDGING,
+        account_type=AccountType.MARGIN,
+        base_currency=USD,
+        starting_balances=[Money(1_000_000, USD)],
+    )
+
+    bar_type = BarType(
+        instrument_id=GBPUSD_SIM.id,
+        bar_spec=TestDataStubs.bar_spec_1min_bid(),
+        aggregation_source=AggregationSource.EXTERNAL,
+    )
+    wrangler = BarDataWrangler(bar_type=bar_type, instrument=GBPUSD_SIM)
+    provider = TestDataProvider()
+    bars = wrangler.process(provider.read_csv_bars("fxcm/gbpusd-m1-bid-2012.csv"))
+
+    engine.add_instrument(GBPUSD_SIM)
+    engine.add_data(bars)
+    engine.add_strategy(
+        EMACross(
+            config=EMACrossConfig(
+                instrument_id=GBPUSD_SIM.id,
+                bar_type=bar_type,
+                trade_size=Decimal(100_000),
+                fast_ema_period=10,
+                slow_ema_period=20,
+            ),
+        ),
+    )
+    return engine
+
+
+def stop_strategies(engine: BacktestEngine) -> None:
+    for strategy_id in engine.trader.strategy_ids():
+        engine.trader.stop_strategy(strategy_id)
+
+
+class TestBacktestCheckpoint:
+    def setup(self):
+        # Fixture Setup
+        self.engine = create_engine()
+        self.checkpoint_ns = self.engine.data[len(self.engine.data) // 2].ts_init
+
+    def teardown(self):
+        self.engine.dispose()
+
+    def test_create_runs_engine_to_checkpoint(self):
+        # Arrange, Act
+        checkpoint = BacktestCheckpoint.create(self.engine, checkpoint=self.checkpoint_ns)
+
+        # Assert
+        assert checkpoint.ts_checkpoint == self.checkpoint_ns
+        assert self.engine.kernel.clock.timestamp_ns() == self.checkpoint_ns
+        assert self.engine.trader.is_running
+        assert "EMACross-000" in checkpoint.strategy_states
+
+    def test_in_process_run_matches_uninterrupted_run(self):
+        # Arrange
+        baseline_engine = create_engine()
+        baseline_engine.run()
+        baseline = baseline_engine.get_result()
+        baseline_engine.dispose()
+
+        checkpoint = BacktestCheckpoint.create(self.engine, checkpoint=self.checkpoint_ns)
+
+        # Act
+        result = checkpoint.run()
+
+        # Assert
+        assert result.total_orders == baseline.total_orders
+        assert result.total_positions == baseline.total_positions
+        assert result.stats_pnls == baseline.stats_pnls
+
+    def test_in_process_run_when_consumed_raises_runtime_error(self):
+        # Arrange
+        checkpoint = BacktestCheckpoint.create(self.engine, checkpoint=self.checkpoint_ns)
+        checkpoint.run()
+
+        # Act, Assert
+        with pytest.raises(RuntimeError):
+            checkpoint.run()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Requires os.fork")
+    def test_fork_runs_continue_variants_from_checkpoint(self):
+        # Arrange
+        checkpoint = BacktestCheckpoint.create(self.engine, checkpoint=self.checkpoint_ns)
+        total_orders_at_checkpoint = self.engine.cache.orders_total_count()
+
+        # Act
+        results = checkpoint.fork_runs([lambda engine: None, stop_strategies], max_workers=2)
+
+        # Assert
+        assert len(results) == 2
+        assert results[0].total_orders > results[1].total_orders
+        assert results[1].total_orders >= total_orders_at_checkpoint
+        assert self.engine.cache.orders_total_count() == total_orders_at_checkpoint  # Parent unchanged
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Requires os.fork")
+    def test_fork_runs_when_variant_fails_raises_runtime_error(self):
+        # Arrange
+        checkpoint = BacktestCheckpoint.create(self.engine, checkpoint=self.checkpoint_ns)
+
+        def failing_variant(engine: BacktestEngine) -> None:
+            raise ValueError("invalid parameters")
+
+        # Act, Assert
+        with pytest.raises(RuntimeError, match="invalid parameters"):
+            checkpoint.fork_runs([failing_variant])
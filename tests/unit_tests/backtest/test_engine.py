@@ -29,6 +29,8 @@ from nautilus_trader.config import ImportableControllerConfig
 from nautilus_trader.config import InvalidConfiguration
 from nautilus_trader.config import LoggingConfig
 from nautilus_trader.config import StreamingConfig
+from nautilus_trader.core.nautilus_pyo3 import DataBackendSession
+from nautilus_trader.core.nautilus_pyo3 import NautilusDataType
 from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.examples.strategies.ema_cross import EMACross
 from nautilus_trader.examples.strategies.ema_cross import EMACrossConfig
@@ -57,6 +59,7 @@ from nautilus_trader.model.enums import PriceType
 from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import HIGH_PRECISION
 from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
@@ -677,6 +680,126 @@ class TestBacktestEngineData:
         assert len(self.engine.data) == 2
         assert self.engine.data == data
 
+    def test_add_data_iterator_pulls_chunks_lazily(self):
+        # Arrange
+        self.engine.add_instrument(AUDUSD_SIM)
+        wrangler = QuoteTickDataWrangler(AUDUSD_SIM)
+        provider = TestDataProvider()
+        ticks = wrangler.process(provider.read_csv_ticks("truefx/audusd-ticks.csv"))
+        chunks_pulled = []
+
+        def data_generator():
+            for i in range(0, len(ticks), 10_000):
+                chunks_pulled.append(i)
+                yield ticks[i : i + 10_000]
+
+        # Act
+        self.engine.add_data_iterator("AUD/USD quotes", data_generator())
+        chunks_pulled_before_run = len(chunks_pulled)
+        self.engine.run()
+
+        # Assert
+        assert chunks_pulled_before_run == 1  # Only the first chunk for validation
+        assert len(chunks_pulled) == 10
+        assert len(self.engine.data) == 0  # Nothing materialized in the engine
+        assert self.engine.iteration == 100_000
+
+    def test_add_data_iterator_merges_with_added_data(self):
+        # Arrange
+        self.engine.add_instrument(AUDUSD_SIM)
+        self.engine.add_instrument(USDJPY_SIM)
+        provider = TestDataProvider()
+        audusd_ticks = QuoteTickDataWrangler(AUDUSD_SIM).process(
+            provider.read_csv_ticks("truefx/audusd-ticks.csv"),
+        )
+        usdjpy_ticks = QuoteTickDataWrangler(USDJPY_SIM).process(
+            provider.read_csv_ticks("truefx/usdjpy-ticks.csv"),
+        )
+        self.engine.add_data(audusd_ticks)
+
+        # Act
+        self.engine.add_data_iterator(
+            "USD/JPY quotes",
+            (usdjpy_ticks[i : i + 5_000] for i in range(0, len(usdjpy_ticks), 5_000)),
+        )
+        self.engine.run()
+
+        # Assert
+        assert self.engine.iteration == len(audusd_ticks) + len(usdjpy_ticks)
+
+    def test_add_data_iterator_streaming_runs_resume_from_end(self):
+        # Arrange
+        self.engine.add_instrument(AUDUSD_SIM)
+        wrangler = QuoteTickDataWrangler(AUDUSD_SIM)
+        provider = TestDataProvider()
+        ticks = wrangler.process(provider.read_csv_ticks("truefx/audusd-ticks.csv"))
+        self.engine.add_data_iterator(
+            "AUD/USD quotes",
+            (ticks[i : i + 10_000] for i in range(0, len(ticks), 10_000)),
+        )
+        mid_ns = ticks[49_999].ts_init
+
+        # Act
+        self.engine.run(end=mid_ns, streaming=True)
+        iterations_first_run = self.engine.iteration
+        self.engine.run()
+
+        # Assert
+        assert iterations_first_run == len([t for t in ticks if t.ts_init <= mid_ns])
+        assert self.engine.iteration == 100_000
+
+    def test_add_data_between_streaming_runs_with_data_iterator_raises_value_error(self):
+        # Arrange
+        self.engine.add_instrument(AUDUSD_SIM)
+        wrangler = QuoteTickDataWrangler(AUDUSD_SIM)
+        provider = TestDataProvider()
+        ticks = wrangler.process(provider.read_csv_ticks("truefx/audusd-ticks.csv"))
+        self.engine.add_data_iterator(
+            "AUD/USD quotes",
+            (ticks[i : i + 10_000] for i in range(0, 50_000, 10_000)),
+        )
+        self.engine.run(end=ticks[9_999].ts_init, streaming=True)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.add_data(ticks[50_000:])
+
+        self.engine.run()
+        assert self.engine.iteration == 50_000
+
+    def test_add_data_iterator_with_backend_session_streams_without_materializing(self):
+        # Arrange
+        self.engine.add_instrument(TestInstrumentProvider.default_fx_ccy("EUR/USD"))
+        precision_dir = "128-bit" if HIGH_PRECISION else "64-bit"
+        data_path = TEST_DATA_DIR / "nautilus" / precision_dir / "quotes.parquet"
+        session = DataBackendSession(chunk_size=1_000)
+        session.add_file(NautilusDataType.QuoteTick, "quote_ticks", str(data_path))
+
+        # Act
+        self.engine.add_data_iterator("EUR/USD quotes", session)
+        self.engine.run()
+
+        # Assert
+        assert len(self.engine.data) == 0  # Nothing materialized in the engine
+        assert self.engine.iteration == 9_500
+
+    def test_add_data_iterator_with_duplicate_name_raises_key_error(self):
+        # Arrange
+        self.engine.add_instrument(AUDUSD_SIM)
+        wrangler = QuoteTickDataWrangler(AUDUSD_SIM)
+        provider = TestDataProvider()
+        ticks = wrangler.process(provider.read_csv_ticks("truefx/audusd-ticks.csv"))
+        self.engine.add_data_iterator("AUD/USD quotes", iter([ticks]))
+
+        # Act, Assert
+        with pytest.raises(KeyError):
+            self.engine.add_data_iterator("AUD/USD quotes", iter([ticks]))
+
+    def test_add_data_iterator_with_no_data_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.add_data_iterator("empty", iter([[], []]))
+
 
 class TestBacktestWithAddedBars:
     def setup(self):
@@ -0,0 +1,185 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.cache.arrays import BarArrayBuffer
+from nautilus_trader.cache.arrays import QuoteTickArrayBuffer
+from nautilus_trader.cache.arrays import TradeTickArrayBuffer
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.cache.config import CacheConfig
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestColumnarRingBuffers:
+    def test_instantiate_with_invalid_capacity_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            QuoteTickArrayBuffer(0)
+
+    def test_quote_buffer_when_empty_returns_empty_array(self):
+        # Arrange
+        buffer = QuoteTickArrayBuffer(3)
+
+        # Act
+        array = buffer.to_array()
+
+        # Assert
+        assert len(buffer) == 0
+        assert len(array) == 0
+
+    def test_quote_buffer_wraps_and_keeps_chronological_order(self):
+        # Arrange
+        buffer = QuoteTickArrayBuffer(3)
+
+        # Act
+        for i in range(5):
+            buffer.append(
+                TestDataStubs.quote_tick(
+                    bid_price=1.0 + i,
+                    ask_price=2.0 + i,
+                    ts_event=i,
+                    ts_init=i,
+                ),
+            )
+        array = buffer.to_array()
+
+        # Assert
+        assert buffer.count == 3
+        assert buffer.capacity == 3
+        assert array["ts_event"].tolist() == [2, 3, 4]
+        assert array["bid_price"].tolist() == [3.0, 4.0, 5.0]
+        assert array["ask_price"].tolist() == [4.0, 5.0, 6.0]
+        assert array["bid_size"].tolist() == [100_000.0, 100_000.0, 100_000.0]
+
+    def test_array_view_is_read_only(self):
+        # Arrange
+        buffer = QuoteTickArrayBuffer(3)
+        buffer.append(TestDataStubs.quote_tick())
+
+        # Act
+        array = buffer.to_array()
+
+        # Assert
+        with pytest.raises(ValueError):
+            array["bid_price"][0] = 0.0
+
+    def test_trade_buffer_append(self):
+        # Arrange
+        buffer = TradeTickArrayBuffer(3)
+
+        # Act
+        buffer.append(TestDataStubs.trade_tick(price=1.5, size=10, ts_event=1))
+        array = buffer.to_array()
+
+        # Assert
+        assert array["price"].tolist() == [1.5]
+        assert array["size"].tolist() == [10.0]
+        assert array["aggressor_side"].tolist() == [AggressorSide.BUYER.value]
+
+    def test_bar_buffer_append(self):
+        # Arrange
+        buffer = BarArrayBuffer(3)
+
+        # Act
+        buffer.append(TestDataStubs.bar_5decimal())
+        array = buffer.to_array()
+
+        # Assert
+        assert array["open"].tolist() == pytest.approx([1.00002])
+        assert array["high"].tolist() == pytest.approx([1.00004])
+        assert array["low"].tolist() == pytest.approx([1.00001])
+        assert array["close"].tolist() == pytest.approx([1.00003])
+        assert array["volume"].tolist() == [1_000_000.0]
+
+    def test_clear(self):
+        # Arrange
+        buffer = QuoteTickArrayBuffer(3)
+        buffer.append(TestDataStubs.quote_tick())
+
+        # Act
+        buffer.clear()
+
+        # Assert
+        assert len(buffer.to_array()) == 0
+
+
+class TestCacheColumnarStore:
+    def setup(self):
+        # Fixture Setup
+        self.cache = Cache(config=CacheConfig(tick_capacity=2, columnar_capacity=5))
+
+    def test_columnar_store_disabled_by_default(self):
+        # Arrange
+        cache = Cache()
+        cache.add_quote_tick(TestDataStubs.quote_tick())
+
+        # Act, Assert
+        assert cache.columnar_capacity == 0
+        assert cache.quote_ticks_array(AUDUSD_SIM.id) is None
+
+    def test_quote_ticks_array_is_independent_of_tick_capacity(self):
+        # Arrange
+        for i in range(4):
+            self.cache.add_quote_tick(TestDataStubs.quote_tick(bid_price=1.0 + i, ts_event=i))
+
+        # Act
+        array = self.cache.quote_ticks_array(AUDUSD_SIM.id)
+
+        # Assert
+        assert self.cache.quote_tick_count(AUDUSD_SIM.id) == 2
+        assert array["bid_price"].tolist() == [1.0, 2.0, 3.0, 4.0]
+
+    def test_add_trade_ticks_only_appends_more_recent_data(self):
+        # Arrange
+        self.cache.add_trade_tick(TestDataStubs.trade_tick(ts_event=2))
+
+        # Act
+        self.cache.add_trade_ticks(
+            [
+                TestDataStubs.trade_tick(ts_event=1),
+                TestDataStubs.trade_tick(ts_event=3),
+            ],
+        )
+
+        # Assert
+        array = self.cache.trade_ticks_array(AUDUSD_SIM.id)
+        assert array["ts_event"].tolist() == [2, 3]
+
+    def test_bars_array(self):
+        # Arrange
+        bar = TestDataStubs.bar_5decimal()
+        self.cache.add_bar(bar)
+
+        # Act
+        array = self.cache.bars_array(bar.bar_type)
+
+        # Assert
+        assert array["close"].tolist() == pytest.approx([1.00003])
+
+    def test_reset_clears_columnar_store(self):
+        # Arrange
+        self.cache.add_quote_tick(TestDataStubs.quote_tick())
+
+        # Act
+        self.cache.reset()
+
+        # Assert
+        assert self.cache.quote_ticks_array(AUDUSD_SIM.id) is None
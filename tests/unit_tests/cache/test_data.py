@@ -908,6 +908,47 @@ class TestCache:
         # Assert
         assert result == 0.80005
 
+    def test_get_xrate_after_quote_update_returns_updated_rate(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM, bid_price=0.80000, ask_price=0.80010))
+        first = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Act
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM, bid_price=0.90000, ask_price=0.90010))
+        result = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Assert
+        assert first == 0.80005
+        assert result == 0.90005
+
+    def test_get_xrate_cross_rate_updates_when_contributing_pair_changes(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_instrument(USDJPY_SIM)
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM, bid_price=0.80000, ask_price=0.80000))
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(USDJPY_SIM, bid_price=110.000, ask_price=110.000))
+        first = self.cache.get_xrate(SIM, AUD, JPY)
+
+        # Act
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(USDJPY_SIM, bid_price=120.000, ask_price=120.000))
+        result = self.cache.get_xrate(SIM, AUD, JPY)
+
+        # Assert
+        assert first == pytest.approx(88.0)
+        assert result == pytest.approx(96.0)
+
+    def test_get_xrate_when_quote_added_before_instrument_returns_rate(self):
+        # Arrange
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM, bid_price=0.80000, ask_price=0.80010))
+
+        # Act
+        self.cache.add_instrument(AUDUSD_SIM)
+        result = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Assert
+        assert result == 0.80005
+
     def test_get_mark_xrate_returns_none_when_not_set(self):
         """
         When no mark exchange rate is set for a currency pair, get_mark_xrate should
@@ -20,6 +20,7 @@ import pytest
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.cache.cache import Cache
+from nautilus_trader.cache.config import CacheConfig
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.config import LoggingConfig
@@ -613,6 +614,73 @@ class TestCache:
         assert position1.realized_pnl == Money(9995.80, USD)
         assert position2.realized_pnl == Money(19995.20, USD)
 
+    def test_snapshot_position_is_not_affected_by_reopening_position(self):
+        # Arrange
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order2 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+        order3 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        fill1 = TestEventStubs.order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.00000"),
+            trade_id=TradeId("1"),
+        )
+        fill2 = TestEventStubs.order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.10000"),
+            trade_id=TradeId("2"),
+        )
+        fill3 = TestEventStubs.order_filled(
+            order3,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.10000"),
+            trade_id=TradeId("3"),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill1)
+        position.apply(fill2)
+        closed_dict = position.to_dict()
+        closed_commissions = position.commissions()
+
+        # Act
+        self.cache.snapshot_position(position)
+        position.apply(fill3)  # Reopen (NETTING)
+        snapshots = self.cache.position_snapshots(position.id)
+
+        # Assert
+        assert position.is_open
+        assert len(snapshots) == 1
+        assert snapshots[0].is_closed
+        assert snapshots[0].id.value.startswith("P-1-")
+        assert snapshots[0].events == [fill1, fill2]
+        assert snapshots[0].commissions() == closed_commissions
+        snapshot_dict = snapshots[0].to_dict()
+        del snapshot_dict["position_id"]
+        del closed_dict["position_id"]
+        assert snapshot_dict == closed_dict
+        assert self.cache.position_snapshots_realized_pnl(position.id) == Money(9995.80, USD)
+
+    def test_position_snapshots_realized_pnl_when_no_snapshots_returns_none(self):
+        # Arrange, Act, Assert
+        assert self.cache.position_snapshots_realized_pnl(PositionId("P-1")) is None
+
     def test_load_position(self):
         # Arrange
         order = self.strategy.order_factory.market(
@@ -1428,6 +1496,150 @@ class TestCache:
         assert self.cache.positions_total_count() == 0
         assert self.cache.positions_closed_count() == 0
 
+    def _add_canceled_order(self, cache: Cache, ts_closed: int):
+        order = self.strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        cache.add_order(order)
+        order.apply(TestEventStubs.order_submitted(order))
+        cache.update_order(order)
+        order.apply(TestEventStubs.order_accepted(order, venue_order_id=VenueOrderId(order.client_order_id.value)))
+        cache.update_order(order)
+        order.apply(TestEventStubs.order_canceled(order, ts_event=ts_closed))
+        cache.update_order(order)
+        return order
+
+    def _add_closed_position(self, cache: Cache, position_id: PositionId, ts_closed: int):
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order2 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+        fill1 = TestEventStubs.order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=position_id,
+            last_px=Price.from_str("1.00000"),
+        )
+        fill2 = TestEventStubs.order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            position_id=position_id,
+            last_px=Price.from_str("1.00010"),
+            ts_event=ts_closed,
+        )
+        position = Position(instrument=AUDUSD_SIM, fill=fill1)
+        cache.add_position(position, OmsType.HEDGING)
+        position.apply(fill2)
+        cache.update_position(position)
+        return position
+
+    def test_purge_closed_orders_with_buffer_purges_only_expired_orders(self):
+        # Arrange
+        order1 = self._add_canceled_order(self.cache, ts_closed=3_000_000_000)
+        order2 = self._add_canceled_order(self.cache, ts_closed=1_000_000_000)
+        order3 = self._add_canceled_order(self.cache, ts_closed=2_000_000_000)
+
+        # Act
+        self.cache.purge_closed_orders(ts_now=4_500_000_000, buffer_secs=2)
+
+        # Assert
+        assert self.cache.order(order1.client_order_id) is order1
+        assert self.cache.order(order2.client_order_id) is None
+        assert self.cache.order(order3.client_order_id) is None
+        assert self.cache.orders_closed_count() == 1
+
+    def test_purge_closed_positions_after_reopen_uses_latest_close_time(self):
+        # Arrange
+        position = self._add_closed_position(self.cache, PositionId("P-1"), ts_closed=1_000_000_000)
+
+        # Reopen and close again (NETTING)
+        order3 = self.strategy.order_factory.market(AUDUSD_SIM.id, OrderSide.BUY, Quantity.from_int(100_000))
+        order4 = self.strategy.order_factory.market(AUDUSD_SIM.id, OrderSide.SELL, Quantity.from_int(100_000))
+        position.apply(TestEventStubs.order_filled(order3, AUDUSD_SIM, position_id=position.id, ts_event=2_000_000_000))
+        self.cache.update_position(position)
+        position.apply(TestEventStubs.order_filled(order4, AUDUSD_SIM, position_id=position.id, ts_event=5_000_000_000))
+        self.cache.update_position(position)
+
+        # Act
+        self.cache.purge_closed_positions(ts_now=4_000_000_000, buffer_secs=1)
+
+        # Assert
+        assert self.cache.position(position.id) is position
+        assert self.cache.positions_closed_count() == 1
+
+    def test_max_closed_orders_per_strategy_evicts_earliest_closed_orders(self):
+        # Arrange
+        cache = Cache(config=CacheConfig(max_closed_orders_per_strategy=2))
+        open_order = self.strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        cache.add_order(open_order)
+
+        # Act
+        order1 = self._add_canceled_order(cache, ts_closed=1_000_000_000)
+        order2 = self._add_canceled_order(cache, ts_closed=2_000_000_000)
+        order3 = self._add_canceled_order(cache, ts_closed=3_000_000_000)
+
+        # Assert
+        assert cache.order(order1.client_order_id) is None
+        assert cache.client_order_ids_closed() == {order2.client_order_id, order3.client_order_id}
+        assert cache.order(open_order.client_order_id) is open_order
+        assert cache.orders_total_count() == 3
+
+    def test_max_closed_orders_per_strategy_retains_orders_for_open_positions(self):
+        # Arrange
+        cache = Cache(config=CacheConfig(max_closed_orders_per_strategy=1))
+        position_id = PositionId("P-1")
+        order1 = self.strategy.order_factory.market(AUDUSD_SIM.id, OrderSide.BUY, Quantity.from_int(100_000))
+        cache.add_order(order1, position_id)
+        order1.apply(TestEventStubs.order_submitted(order1))
+        order1.apply(TestEventStubs.order_accepted(order1))
+        fill1 = TestEventStubs.order_filled(order1, instrument=AUDUSD_SIM, position_id=position_id)
+        order1.apply(fill1)
+        cache.update_order(order1)
+        position = Position(instrument=AUDUSD_SIM, fill=fill1)
+        cache.add_position(position, OmsType.HEDGING)
+
+        # Act
+        order2 = self._add_canceled_order(cache, ts_closed=1_000_000_000)
+        retained_while_open = cache.order(order1.client_order_id)
+
+        order3 = self.strategy.order_factory.market(AUDUSD_SIM.id, OrderSide.SELL, Quantity.from_int(100_000))
+        position.apply(TestEventStubs.order_filled(order3, instrument=AUDUSD_SIM, position_id=position_id))
+        cache.update_position(position)
+        order4 = self._add_canceled_order(cache, ts_closed=2_000_000_000)
+
+        # Assert: The filled order is only evicted once its position has closed
+        assert retained_while_open is order1
+        assert cache.order(order2.client_order_id) is None
+        assert cache.order(order1.client_order_id) is None
+        assert cache.client_order_ids_closed() == {order4.client_order_id}
+
+    def test_max_closed_positions_per_instrument_evicts_earliest_closed_positions(self):
+        # Arrange
+        cache = Cache(config=CacheConfig(max_closed_positions_per_instrument=1))
+
+        # Act
+        position1 = self._add_closed_position(cache, PositionId("P-1"), ts_closed=1_000_000_000)
+        position2 = self._add_closed_position(cache, PositionId("P-2"), ts_closed=2_000_000_000)
+
+        # Assert
+        assert cache.position(position1.id) is None
+        assert cache.position(position2.id) is position2
+        assert cache.positions_closed_count() == 1
+
 
 class TestExecutionCacheIntegrityCheck:
     def setup(self):
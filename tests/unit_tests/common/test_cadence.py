@@ -0,0 +1,229 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from datetime import date
+from datetime import time
+
+import pandas as pd
+
+from nautilus_trader.common.cadence import CadenceScheduler
+from nautilus_trader.common.cadence import TradingSessionCalendar
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.core.datetime import dt_to_unix_nanos
+
+
+ONE_MINUTE_NS = 60_000_000_000
+
+
+def _ns(value: str, tz: str = "America/New_York") -> int:
+    return dt_to_unix_nanos(pd.Timestamp(value, tz=tz))
+
+
+class TestTradingSessionCalendar:
+    def setup(self):
+        # Fixture Setup
+        self.calendar = TradingSessionCalendar(
+            name="XNYS",
+            sessions=[(weekday, time(9, 30), time(16, 0)) for weekday in range(5)],
+            tz="America/New_York",
+            holidays=[date(2024, 7, 4)],
+        )
+
+    def test_is_open_within_session(self):
+        # Arrange, Act, Assert
+        assert self.calendar.is_open(_ns("2024-07-03 09:31"))
+        assert self.calendar.is_open(_ns("2024-07-03 12:00"))
+
+    def test_is_open_at_session_boundaries(self):
+        # Arrange, Act, Assert
+        assert not self.calendar.is_open(_ns("2024-07-03 09:30"))
+        assert self.calendar.is_open(_ns("2024-07-03 16:00"))
+        assert not self.calendar.is_open(_ns("2024-07-03 16:01"))
+
+    def test_is_open_on_holiday_and_weekend_returns_false(self):
+        # Arrange, Act, Assert
+        assert not self.calendar.is_open(_ns("2024-07-04 12:00"))
+        assert not self.calendar.is_open(_ns("2024-07-06 12:00"))
+
+    def test_is_open_with_session_wrapping_midnight(self):
+        # Arrange
+        calendar = TradingSessionCalendar(
+            name="GLOBEX",
+            sessions=[(6, time(18, 0), time(17, 0))],
+            tz="America/Chicago",
+        )
+
+        # Act, Assert
+        assert calendar.is_open(_ns("2024-07-07 18:01", tz="America/Chicago"))  # Sunday
+        assert calendar.is_open(_ns("2024-07-08 00:00", tz="America/Chicago"))  # Monday
+        assert calendar.is_open(_ns("2024-07-08 17:00", tz="America/Chicago"))
+        assert not calendar.is_open(_ns("2024-07-08 17:01", tz="America/Chicago"))
+        assert not calendar.is_open(_ns("2024-07-07 17:59", tz="America/Chicago"))
+
+
+class TestCadenceScheduler:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.scheduler = CadenceScheduler(self.clock)
+
+    def test_subscribers_to_same_interval_share_one_timer(self):
+        # Arrange
+        received1 = []
+        received2 = []
+
+        # Act
+        name1 = self.scheduler.subscribe(ONE_MINUTE_NS, received1.append)
+        name2 = self.scheduler.subscribe(ONE_MINUTE_NS, received2.append)
+
+        # Assert
+        assert name1 == name2 == "CADENCE-60000000000-0"
+        assert self.clock.timer_names == [name1]
+        assert self.scheduler.cadence_names() == [name1]
+        assert self.scheduler.next_time_ns(name1) == ONE_MINUTE_NS
+        assert len(self.scheduler.cadence(name1).subscribers()) == 2
+
+    def test_subscribers_with_different_phase_have_separate_cadences(self):
+        # Arrange, Act
+        name1 = self.scheduler.subscribe(ONE_MINUTE_NS, print)
+        name2 = self.scheduler.subscribe(ONE_MINUTE_NS, print, start_time_ns=1_000_000_000)
+
+        # Assert
+        assert name1 != name2
+        assert sorted(self.clock.timer_names) == sorted([name1, name2])
+
+    def test_firing_fans_out_single_event_to_all_subscribers(self):
+        # Arrange
+        received1 = []
+        received2 = []
+        name = self.scheduler.subscribe(ONE_MINUTE_NS, received1.append)
+        self.scheduler.subscribe(ONE_MINUTE_NS, received2.append)
+
+        # Act
+        events = self.clock.advance_time(2 * ONE_MINUTE_NS)
+        for event in events:
+            event.handle()
+
+        # Assert
+        assert len(events) == 2
+        assert [e.ts_event for e in received1] == [ONE_MINUTE_NS, 2 * ONE_MINUTE_NS]
+        assert received1 == received2
+        assert self.scheduler.cadence(name).fire_count == 2
+
+    def test_unsubscribe_last_subscriber_cancels_timer(self):
+        # Arrange
+        received1 = []
+        received2 = []
+        name = self.scheduler.subscribe(ONE_MINUTE_NS, received1.append)
+        self.scheduler.subscribe(ONE_MINUTE_NS, received2.append)
+
+        # Act
+        self.scheduler.unsubscribe(name, received1.append)
+        timer_names_after_first = self.clock.timer_names
+        self.scheduler.unsubscribe(name, received2.append)
+
+        # Assert
+        assert timer_names_after_first == [name]
+        assert self.clock.timer_names == []
+        assert self.scheduler.cadence(name) is None
+
+    def test_cancel_all_cancels_all_timers(self):
+        # Arrange
+        self.scheduler.subscribe(ONE_MINUTE_NS, print)
+        self.scheduler.subscribe(5 * ONE_MINUTE_NS, print)
+
+        # Act
+        self.scheduler.cancel_all()
+
+        # Assert
+        assert self.clock.timer_names == []
+        assert self.scheduler.cadence_names() == []
+
+    def test_calendar_suppresses_firings_outside_sessions(self):
+        # Arrange
+        calendar = TradingSessionCalendar(
+            name="XNYS",
+            sessions=[(weekday, time(9, 30), time(16, 0)) for weekday in range(5)],
+            tz="America/New_York",
+        )
+        start_ns = _ns("2024-07-03 09:00")
+        self.clock.set_time(start_ns)
+        received = []
+        name = self.scheduler.subscribe(30 * ONE_MINUTE_NS, received.append, calendar=calendar)
+
+        # Act
+        events = self.clock.advance_time(_ns("2024-07-03 17:00"))
+        for event in events:
+            event.handle()
+
+        # Assert
+        cadence = self.scheduler.cadence(name)
+        assert name == f"CADENCE-{30 * ONE_MINUTE_NS}-{start_ns % (30 * ONE_MINUTE_NS)}-XNYS"
+        assert len(events) == 16
+        assert len(received) == 13  # 10:00 through 16:00 inclusive
+        assert received[0].ts_event == _ns("2024-07-03 10:00")
+        assert received[-1].ts_event == _ns("2024-07-03 16:00")
+        assert cadence.fire_count == 13
+        assert cadence.suppressed_count == 3
+
+    def test_calendars_with_same_name_use_separate_cadences(self):
+        # Arrange
+        regular = TradingSessionCalendar(
+            name="XNYS",
+            sessions=[(weekday, time(9, 30), time(16, 0)) for weekday in range(5)],
+            tz="America/New_York",
+        )
+        extended = TradingSessionCalendar(
+            name="XNYS",
+            sessions=[(weekday, time(4, 0), time(20, 0)) for weekday in range(5)],
+            tz="America/New_York",
+        )
+
+        # Act
+        name1 = self.scheduler.subscribe(ONE_MINUTE_NS, print, calendar=regular)
+        name2 = self.scheduler.subscribe(ONE_MINUTE_NS, print, calendar=extended)
+        name3 = self.scheduler.subscribe(ONE_MINUTE_NS, repr, calendar=regular)
+
+        # Assert
+        assert name1 == name3 == "CADENCE-60000000000-0-XNYS"
+        assert name2 == "CADENCE-60000000000-0-XNYS-2"
+        assert self.scheduler.cadence(name1).calendar is regular
+        assert self.scheduler.cadence(name2).calendar is extended
+
+    def test_suppressed_firings_notify_suppressed_callbacks(self):
+        # Arrange
+        calendar = TradingSessionCalendar(
+            name="XNYS",
+            sessions=[(weekday, time(9, 30), time(16, 0)) for weekday in range(5)],
+            tz="America/New_York",
+        )
+        self.clock.set_time(_ns("2024-07-03 09:00"))
+        received = []
+        suppressed = []
+        self.scheduler.subscribe(
+            30 * ONE_MINUTE_NS,
+            received.append,
+            calendar=calendar,
+            suppressed_callback=suppressed.append,
+        )
+
+        # Act
+        events = self.clock.advance_time(_ns("2024-07-03 10:00"))
+        for event in events:
+            event.handle()
+
+        # Assert
+        assert [event.ts_event for event in suppressed] == [_ns("2024-07-03 09:30")]
+        assert [event.ts_event for event in received] == [_ns("2024-07-03 10:00")]
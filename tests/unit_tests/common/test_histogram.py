@@ -0,0 +1,109 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.common.histogram import LatencyHistogram
+
+
+class TestLatencyHistogram:
+    def test_instantiate_with_invalid_precision_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            LatencyHistogram(precision_bits=0)
+
+    def test_empty_histogram(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act, Assert
+        assert histogram.count == 0
+        assert histogram.min == 0
+        assert histogram.max == 0
+        assert histogram.mean == 0.0
+        assert histogram.percentile(0.99) == 0
+
+    def test_record_small_values_are_exact(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        for value in range(1, 11):
+            histogram.record(value)
+
+        # Assert
+        assert histogram.count == 10
+        assert histogram.min == 1
+        assert histogram.max == 10
+        assert histogram.mean == 5.5
+        assert histogram.percentile(0.5) == 5
+        assert histogram.percentile(1.0) == 10
+
+    def test_record_negative_value_clamps_to_zero(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        histogram.record(-5)
+
+        # Assert
+        assert histogram.min == 0
+        assert histogram.max == 0
+
+    @pytest.mark.parametrize("precision_bits", [2, 4, 8])
+    def test_percentile_relative_error_is_bounded(self, precision_bits):
+        # Arrange
+        histogram = LatencyHistogram(precision_bits=precision_bits)
+        values = [i * 7_919 for i in range(1, 10_001)]
+
+        # Act
+        for value in values:
+            histogram.record(value)
+
+        # Assert
+        for quantile in (0.5, 0.9, 0.99):
+            expected = values[int(quantile * len(values)) - 1]
+            result = histogram.percentile(quantile)
+            assert abs(result - expected) / expected <= 2**-precision_bits
+
+    def test_merge(self):
+        # Arrange
+        histogram1 = LatencyHistogram()
+        histogram2 = LatencyHistogram()
+        histogram1.record(100)
+        histogram2.record(10)
+        histogram2.record(1_000)
+
+        # Act
+        histogram1.merge(histogram2)
+
+        # Assert
+        assert histogram1.count == 3
+        assert histogram1.min == 10
+        assert histogram1.max == 1_000
+
+    def test_summary_and_reset(self):
+        # Arrange
+        histogram = LatencyHistogram()
+        histogram.record(1_000)
+
+        # Act
+        summary = histogram.summary()
+        histogram.reset()
+
+        # Assert
+        assert summary["count"] == 1
+        assert summary["p99"] == 1_000
+        assert histogram.count == 0
@@ -15,7 +15,10 @@
 
 import pytest
 
+from nautilus_trader.common.component import BufferedLogWriter
 from nautilus_trader.common.component import Logger
+from nautilus_trader.common.component import start_log_writer
+from nautilus_trader.common.component import stop_log_writer
 from nautilus_trader.common.enums import LogColor
 from nautilus_trader.common.enums import LogLevel
 from nautilus_trader.common.enums import log_level_from_str
@@ -137,3 +140,84 @@ class TestLoggerTests:
 
         # Assert
         assert True  # No exceptions raised
+
+    def test_is_enabled_when_logging_bypassed_returns_false(self):
+        # Arrange (logging is initialized in bypass mode for tests)
+        logger = Logger(name="TEST_LOGGER")
+
+        # Act, Assert
+        assert not logger.is_enabled(LogLevel.DEBUG)
+        assert not logger.is_enabled(LogLevel.ERROR)
+
+    def test_log_lazy_message_when_not_enabled_does_not_format_args(self):
+        # Arrange
+        class Unformattable:
+            def __format__(self, format_spec: str) -> str:
+                raise RuntimeError("Should not be formatted")
+
+        logger = Logger(name="TEST_LOGGER")
+
+        # Act
+        logger.log(LogLevel.INFO, "Value {}", Unformattable())
+
+        # Assert
+        assert logger.suppressed == 0
+
+    def test_log_lazy_message_with_color(self):
+        # Arrange
+        logger = Logger(name="TEST_LOGGER")
+
+        # Act
+        logger.log(LogLevel.INFO, "{} is {:.2f}", "Price", 1.2345, color=LogColor.BLUE)
+
+        # Assert
+        assert True  # No exceptions raised
+
+
+class TestBufferedLogWriter:
+    def test_instantiate_with_invalid_capacity_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            BufferedLogWriter(capacity=0)
+
+    def test_instantiate(self):
+        # Arrange, Act
+        writer = BufferedLogWriter(capacity=100, batch_size=1_000, flush_interval_ms=50)
+
+        # Assert
+        assert writer.capacity == 100
+        assert writer.batch_size == 100  # Capped at capacity
+        assert writer.flush_interval_ms == 50
+        assert not writer.is_running
+        assert writer.queued == 0
+        assert writer.dropped == 0
+
+    def test_start_and_stop(self):
+        # Arrange
+        writer = BufferedLogWriter(capacity=100)
+
+        # Act
+        writer.start()
+        is_running = writer.is_running
+        writer.stop()
+
+        # Assert
+        assert is_running
+        assert not writer.is_running
+
+    def test_start_log_writer_stops_previous_writer(self):
+        # Arrange
+        writer1 = BufferedLogWriter(capacity=100)
+        writer2 = BufferedLogWriter(capacity=100)
+        logger = Logger(name="TEST_LOGGER")
+
+        # Act
+        start_log_writer(writer1)
+        start_log_writer(writer2)
+        logger.info("This is an INFO log message.")
+        stop_log_writer()
+
+        # Assert
+        assert not writer1.is_running
+        assert not writer2.is_running
+        assert writer2.queued == 0
@@ -13,13 +13,35 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import asyncio
+
+import pytest
+
 from nautilus_trader.common.providers import InstrumentProvider
+from nautilus_trader.config import InstrumentProviderConfig
+from nautilus_trader.model.objects import Price
+from nautilus_trader.test_kit.providers import TestInstrumentProvider as TestKitInstrumentProvider
 from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 
 
 AUDUSD = TestIdStubs.audusd_id()
 
 
+class VenueInstrumentProvider(InstrumentProvider):
+    def __init__(self, instruments, config=None, environment="live"):
+        super().__init__(config=config)
+        self.venue_instruments = instruments
+        self.environment = environment
+        self.load_count = 0
+
+    def _snapshot_context(self):
+        return {"environment": self.environment}
+
+    async def load_all_async(self, filters=None):
+        self.load_count += 1
+        self.add_bulk(self.venue_instruments)
+
+
 class TestInstrumentProvider:
     def setup(self):
         # Fixture Setup
@@ -38,3 +60,88 @@ class TestInstrumentProvider:
 
         # Assert
         assert result is None
+
+
+class TestInstrumentProviderSnapshot:
+    def setup(self):
+        # Fixture Setup
+        self.instruments = [
+            TestKitInstrumentProvider.default_fx_ccy("AUD/USD"),
+            TestKitInstrumentProvider.default_fx_ccy("GBP/USD"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_initialize_saves_snapshot_then_warm_start_loads_from_snapshot(self, tmp_path):
+        # Arrange
+        config = InstrumentProviderConfig(load_all=True, snapshot_path=str(tmp_path))
+        cold = VenueInstrumentProvider(self.instruments, config=config)
+        await cold.initialize()
+
+        warm = VenueInstrumentProvider([], config=config)
+
+        # Act
+        await warm.initialize()
+
+        # Assert
+        assert cold.load_count == 1
+        assert warm.count == 2
+        assert warm.find(AUDUSD) == self.instruments[0]
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_notifies_changed_instruments_only(self, tmp_path):
+        # Arrange
+        config = InstrumentProviderConfig(load_all=True, snapshot_path=str(tmp_path))
+        await VenueInstrumentProvider(self.instruments, config=config).initialize()
+
+        audusd = self.instruments[0]
+        changed = type(audusd).from_dict(
+            {**type(audusd).to_dict(audusd), "max_price": str(Price.from_str("2.00000"))},
+        )
+        provider = VenueInstrumentProvider([changed, self.instruments[1]], config=config)
+        updates = []
+        provider.register_update_handler(updates.extend)
+
+        # Act
+        await provider.initialize()
+        await asyncio.gather(*provider._tasks)
+
+        # Assert
+        assert provider.load_count == 1
+        assert updates == [changed]
+        assert provider.find(AUDUSD).max_price == Price.from_str("2.00000")
+
+    @pytest.mark.asyncio
+    async def test_warm_start_ignores_snapshot_from_other_environment(self, tmp_path):
+        # Arrange
+        config = InstrumentProviderConfig(load_all=True, snapshot_path=str(tmp_path))
+        await VenueInstrumentProvider(self.instruments, config=config, environment="testnet").initialize()
+
+        provider = VenueInstrumentProvider(self.instruments[1:], config=config, environment="live")
+
+        # Act
+        await provider.initialize()
+
+        # Assert
+        assert provider.load_count == 1
+        assert provider.count == 1
+        assert provider.find(AUDUSD) is None
+
+    @pytest.mark.asyncio
+    async def test_providers_sharing_snapshot_path_both_warm_start(self, tmp_path):
+        # Arrange
+        config = InstrumentProviderConfig(load_all=True, snapshot_path=str(tmp_path))
+        await VenueInstrumentProvider(self.instruments[:1], config=config, environment="testnet").initialize()
+        await VenueInstrumentProvider(self.instruments[1:], config=config, environment="live").initialize()
+
+        testnet = VenueInstrumentProvider([], config=config, environment="testnet")
+        live = VenueInstrumentProvider([], config=config, environment="live")
+
+        # Act
+        await testnet.initialize()
+        await live.initialize()
+
+        # Assert (no venue instruments, so these were loaded from each snapshot)
+        assert testnet.count == 1
+        assert testnet.find(AUDUSD) == self.instruments[0]
+        assert live.find(AUDUSD) is None
+        assert live.count == 1
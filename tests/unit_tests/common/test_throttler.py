@@ -15,6 +15,10 @@
 
 from datetime import timedelta
 
+import pytest
+
+from nautilus_trader.common.component import MultiThrottler
+from nautilus_trader.common.component import SlidingWindow
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.component import Throttler
 
@@ -305,3 +309,261 @@ class TestDroppingThrottler:
         assert self.throttler.used() == 0
         assert self.throttler.recv_count == 7
         assert self.throttler.sent_count == 6
+
+
+class TestSlidingWindow:
+    def test_window_starts_empty(self):
+        # Arrange
+        window = SlidingWindow(limit=2, interval_ns=1_000_000_000)
+
+        # Act, Assert
+        assert window.delay_ns(0) == 0
+        assert window.used(0) == 0
+
+    def test_consume_to_limit_returns_delay_until_oldest_leaves_window(self):
+        # Arrange
+        window = SlidingWindow(limit=2, interval_ns=1_000_000_000)
+
+        # Act
+        window.consume(0)
+        window.consume(200_000_000)
+
+        # Assert
+        assert window.used(200_000_000) == 1
+        assert window.delay_ns(200_000_000) == 800_000_000
+        assert window.delay_ns(1_000_000_000) == 0
+        assert window.used(1_000_000_000) == 0.5
+
+    def test_never_admits_more_than_limit_in_any_interval(self):
+        # Arrange
+        window = SlidingWindow(limit=2, interval_ns=1_000_000_000)
+        window.consume(0)
+        window.consume(0)
+
+        # Act: Take the next events as soon as they are admitted
+        now_ns = window.delay_ns(0)
+        window.consume(now_ns)
+        window.consume(now_ns)
+
+        # Assert: No burst allowance beyond the limit within the interval
+        assert now_ns == 1_000_000_000
+        assert window.delay_ns(now_ns) == 1_000_000_000
+        assert window.delay_ns(1_999_999_999) == 1
+
+    def test_reset_clears_window(self):
+        # Arrange
+        window = SlidingWindow(limit=1, interval_ns=1_000_000_000)
+        window.consume(0)
+
+        # Act
+        window.reset()
+
+        # Assert
+        assert window.delay_ns(0) == 0
+
+
+class TestBufferingMultiThrottler:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+
+        self.handler = []
+        self.throttler = MultiThrottler(
+            name="Buffer",
+            limits=[(4, timedelta(seconds=1)), (6, timedelta(seconds=10))],
+            clock=self.clock,
+            output_send=self.handler.append,
+            output_drop=None,  # <-- no dropping handler so will buffer
+            key_limits=[(2, timedelta(seconds=1))],
+            key_func=lambda msg: msg[0],
+        )
+
+    def test_throttler_instantiation(self):
+        # Arrange, Act, Assert
+        assert self.throttler.name == "Buffer"
+        assert self.throttler.limits == [(4, timedelta(seconds=1)), (6, timedelta(seconds=10))]
+        assert self.throttler.key_limits == [(2, timedelta(seconds=1))]
+        assert not self.throttler.is_limiting
+        assert self.throttler.qsize == 0
+        assert self.throttler.used() == 0
+        assert self.throttler.recv_count == 0
+        assert self.throttler.sent_count == 0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"limits": []},
+            {"limits": [(0, timedelta(seconds=1))]},
+            {"limits": [(1, timedelta(0))]},
+        ],
+    )
+    def test_instantiate_with_invalid_limits_raises_value_error(self, kwargs):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            MultiThrottler(
+                name="Invalid",
+                clock=self.clock,
+                output_send=self.handler.append,
+                **kwargs,
+            )
+
+    def test_instantiate_with_key_limits_and_no_key_func_raises_type_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(TypeError):
+            MultiThrottler(
+                name="Invalid",
+                limits=[],
+                clock=self.clock,
+                output_send=self.handler.append,
+                key_limits=[(1, timedelta(seconds=1))],
+            )
+
+    def test_send_to_key_limit_buffers_only_that_key(self):
+        # Act
+        self.throttler.send("A1")
+        self.throttler.send("A2")
+        self.throttler.send("A3")
+        self.throttler.send("B1")
+
+        # Assert
+        assert self.handler == ["A1", "A2", "B1"]
+        assert self.clock.timer_names == ["Buffer|WINDOWS"]
+        assert self.throttler.is_limiting
+        assert self.throttler.qsize == 1
+        assert self.throttler.recv_count == 4
+        assert self.throttler.sent_count == 3
+
+    def test_send_to_limit_buffers_all_keys(self):
+        # Act
+        self.throttler.send("A1")
+        self.throttler.send("B1")
+        self.throttler.send("C1")
+        self.throttler.send("D1")
+        self.throttler.send("E1")
+
+        # Assert
+        assert self.handler == ["A1", "B1", "C1", "D1"]
+        assert self.throttler.is_limiting
+        assert self.throttler.qsize == 1
+        assert self.throttler.used() == 1
+
+    def test_buffered_messages_drain_fairly_by_key(self):
+        # Arrange: Exhaust the per second limit, then buffer a burst for A behind one for B
+        self.throttler.send("X1")
+        self.throttler.send("X2")
+        self.throttler.send("Y1")
+        self.throttler.send("Y2")
+        self.throttler.send("A1")
+        self.throttler.send("A2")
+        self.throttler.send("A3")
+        self.throttler.send("B1")
+
+        # Act: The per second window admits messages again after one second
+        events = self.clock.advance_time(1_000_000_000)
+        for event in events:
+            event.handle()
+
+        # Assert: B1 is not starved behind the burst for A (then the 10 second window is full)
+        assert self.handler == ["X1", "X2", "Y1", "Y2", "A1", "B1"]
+        assert self.throttler.qsize == 2
+
+    def test_stacked_limit_buffers_when_shorter_window_has_capacity(self):
+        # Arrange: Send 6 messages across two seconds to exhaust the 10 second window
+        for msg in ["A1", "B1", "C1", "D1"]:
+            self.throttler.send(msg)
+        self.clock.set_time(1_000_000_000)
+        for msg in ["E1", "F1", "G1"]:
+            self.throttler.send(msg)
+
+        # Act
+        self.clock.set_time(2_000_000_000)
+        used = self.throttler.used()
+
+        # Assert: 10 second window holds all 6 messages until 10 seconds after the first
+        assert self.handler == ["A1", "B1", "C1", "D1", "E1", "F1"]
+        assert used == 1
+        assert self.throttler.qsize == 1
+
+    def test_advance_time_sends_remaining_messages(self):
+        # Arrange
+        self.throttler.send("A1")
+        self.throttler.send("A2")
+        self.throttler.send("A3")
+        self.throttler.send("A4")
+
+        # Act
+        events = self.clock.advance_time(1_000_000_000)
+        for event in events:
+            event.handle()
+
+        # Assert
+        assert self.handler == ["A1", "A2", "A3", "A4"]
+        assert self.clock.timer_count == 0  # No longer timing to process
+        assert not self.throttler.is_limiting
+        assert self.throttler.qsize == 0
+        assert self.throttler.sent_count == 4
+
+    def test_reset_clears_buffers_and_timer(self):
+        # Arrange
+        self.throttler.send("A1")
+        self.throttler.send("A2")
+        self.throttler.send("A3")
+
+        # Act
+        self.throttler.reset()
+
+        # Assert
+        assert self.clock.timer_count == 0
+        assert not self.throttler.is_limiting
+        assert self.throttler.qsize == 0
+        assert self.throttler.recv_count == 0
+        assert self.throttler.sent_count == 0
+
+
+class TestDroppingMultiThrottler:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+
+        self.handler = []
+        self.dropped = []
+        self.throttler = MultiThrottler(
+            name="Dropper",
+            limits=[(4, timedelta(seconds=1))],
+            clock=self.clock,
+            output_send=self.handler.append,
+            output_drop=self.dropped.append,  # <-- handler for dropping messages
+            key_limits=[(2, timedelta(seconds=1))],
+            key_func=lambda msg: msg[0],
+        )
+
+    def test_send_to_key_limit_drops_message(self):
+        # Act
+        self.throttler.send("A1")
+        self.throttler.send("A2")
+        self.throttler.send("A3")
+        self.throttler.send("B1")
+
+        # Assert
+        assert self.handler == ["A1", "A2", "B1"]
+        assert self.dropped == ["A3"]
+        assert self.clock.timer_count == 0
+        assert self.throttler.qsize == 0
+        assert self.throttler.recv_count == 4
+        assert self.throttler.sent_count == 3
+
+    def test_send_after_window_elapses_sends_message(self):
+        # Arrange
+        self.throttler.send("A1")
+        self.throttler.send("A2")
+        self.throttler.send("A3")
+        assert self.throttler.is_limiting
+
+        # Act
+        self.clock.advance_time(1_000_000_000)
+        self.throttler.send("A4")
+
+        # Assert
+        assert not self.throttler.is_limiting
+        assert self.handler == ["A1", "A2", "A4"]
+        assert self.dropped == ["A3"]
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from datetime import time
 from datetime import timedelta
 from decimal import ROUND_HALF_EVEN
 from decimal import Decimal
@@ -21,6 +22,8 @@ import pandas as pd
 import pytest
 
 from nautilus_trader import TEST_DATA_DIR
+from nautilus_trader.common.cadence import CadenceScheduler
+from nautilus_trader.common.cadence import TradingSessionCalendar
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.core.datetime import dt_to_unix_nanos
 from nautilus_trader.data.aggregation import BarBuilder
@@ -2501,3 +2504,110 @@ class TestTimeBarAggregator:
         assert len(handler) == 2
         assert handler[0].ts_event == ts_event1
         assert handler[1].ts_event == ts_event2
+
+    def test_aggregators_with_shared_scheduler_use_single_timer(self):
+        # Arrange
+        clock = TestClock()
+        scheduler = CadenceScheduler(clock)
+        handler = []
+        instrument_id = TestIdStubs.audusd_id()
+        bid_bar_type = BarType(instrument_id, BarSpecification(1, BarAggregation.MINUTE, PriceType.BID))
+        ask_bar_type = BarType(instrument_id, BarSpecification(1, BarAggregation.MINUTE, PriceType.ASK))
+
+        bid_aggregator = TimeBarAggregator(AUDUSD_SIM, bid_bar_type, handler.append, clock, scheduler=scheduler)
+        ask_aggregator = TimeBarAggregator(AUDUSD_SIM, ask_bar_type, handler.append, clock, scheduler=scheduler)
+
+        tick = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("1.00001"),
+            ask_price=Price.from_str("1.00004"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        # Act
+        bid_aggregator.handle_quote_tick(tick)
+        ask_aggregator.handle_quote_tick(tick)
+        events = clock.advance_time(60 * NANOSECONDS_IN_SECOND)
+        for event in events:
+            event.handle()
+
+        # Assert
+        assert len(events) == 1
+        assert clock.timer_names == ["CADENCE-60000000000-0"]
+        assert [bar.bar_type for bar in handler] == [bid_bar_type, ask_bar_type]
+        assert [bar.close for bar in handler] == [Price.from_str("1.00001"), Price.from_str("1.00004")]
+        assert bid_aggregator.next_close_ns == ask_aggregator.next_close_ns == 120 * NANOSECONDS_IN_SECOND
+
+    def test_stop_with_shared_scheduler_cancels_timer_after_last_aggregator(self):
+        # Arrange
+        clock = TestClock()
+        scheduler = CadenceScheduler(clock)
+        instrument_id = TestIdStubs.audusd_id()
+        bid_bar_type = BarType(instrument_id, BarSpecification(1, BarAggregation.MINUTE, PriceType.BID))
+        ask_bar_type = BarType(instrument_id, BarSpecification(1, BarAggregation.MINUTE, PriceType.ASK))
+
+        bid_aggregator = TimeBarAggregator(AUDUSD_SIM, bid_bar_type, print, clock, scheduler=scheduler)
+        ask_aggregator = TimeBarAggregator(AUDUSD_SIM, ask_bar_type, print, clock, scheduler=scheduler)
+
+        # Act
+        bid_aggregator.stop()
+        timer_names_after_first = clock.timer_names
+        ask_aggregator.stop()
+
+        # Assert
+        assert timer_names_after_first == ["CADENCE-60000000000-0"]
+        assert clock.timer_names == []
+
+    def test_calendar_suppressed_close_discards_updates_and_advances(self):
+        # Arrange
+        clock = TestClock()
+        clock.set_time(dt_to_unix_nanos(pd.Timestamp("2024-07-03 09:00", tz="America/New_York")))
+        scheduler = CadenceScheduler(clock)
+        calendar = TradingSessionCalendar(
+            name="XNYS",
+            sessions=[(weekday, time(9, 30), time(16, 0)) for weekday in range(5)],
+            tz="America/New_York",
+        )
+        handler = []
+        bar_type = BarType(TestIdStubs.audusd_id(), BarSpecification(30, BarAggregation.MINUTE, PriceType.BID))
+        aggregator = TimeBarAggregator(
+            AUDUSD_SIM,
+            bar_type,
+            handler.append,
+            clock,
+            scheduler=scheduler,
+            calendar=calendar,
+        )
+
+        def quote(bid: str, value: str) -> QuoteTick:
+            ts = dt_to_unix_nanos(pd.Timestamp(value, tz="America/New_York"))
+            return QuoteTick(
+                instrument_id=AUDUSD_SIM.id,
+                bid_price=Price.from_str(bid),
+                ask_price=Price.from_str("1.00100"),
+                bid_size=Quantity.from_int(1),
+                ask_size=Quantity.from_int(1),
+                ts_event=ts,
+                ts_init=ts,
+            )
+
+        # Act: Update before the session, then the 09:30 close is suppressed
+        aggregator.handle_quote_tick(quote("1.00010", "2024-07-03 09:10"))
+        for event in clock.advance_time(dt_to_unix_nanos(pd.Timestamp("2024-07-03 09:30", tz="America/New_York"))):
+            event.handle()
+        next_close_after_suppressed = aggregator.next_close_ns
+
+        aggregator.handle_quote_tick(quote("1.00020", "2024-07-03 09:45"))
+        for event in clock.advance_time(dt_to_unix_nanos(pd.Timestamp("2024-07-03 10:00", tz="America/New_York"))):
+            event.handle()
+
+        # Assert: The first bar in session only includes the in session update
+        assert next_close_after_suppressed == dt_to_unix_nanos(pd.Timestamp("2024-07-03 10:00", tz="America/New_York"))
+        assert len(handler) == 1
+        assert handler[0].open == Price.from_str("1.00020")
+        assert handler[0].low == Price.from_str("1.00020")
+        assert handler[0].volume == Quantity.from_int(1)
+        assert aggregator.next_close_ns == dt_to_unix_nanos(pd.Timestamp("2024-07-03 10:30", tz="America/New_York"))
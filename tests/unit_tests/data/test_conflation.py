@@ -0,0 +1,150 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.data.conflation import OrderBookDeltaConflator
+from nautilus_trader.model.data import BookOrder
+from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.enums import BookAction
+from nautilus_trader.model.enums import BookType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
+
+
+def _delta(
+    action: BookAction,
+    side: OrderSide = OrderSide.BUY,
+    price: float = 100.0,
+    size: float = 1.0,
+    order_id: int = 0,
+) -> OrderBookDelta:
+    return TestDataStubs.order_book_delta(
+        instrument_id=ETHUSDT_BINANCE.id,
+        action=action,
+        order=BookOrder(
+            side=side,
+            price=ETHUSDT_BINANCE.make_price(price),
+            size=ETHUSDT_BINANCE.make_qty(size),
+            order_id=order_id,
+        ),
+    )
+
+
+def _conflator(book_type: BookType = BookType.L2_MBP) -> OrderBookDeltaConflator:
+    return OrderBookDeltaConflator(
+        instrument_id=ETHUSDT_BINANCE.id,
+        book_type=book_type,
+        interval_ms=100,
+        topic="data.book.conflated.BINANCE.ETHUSDT.100",
+    )
+
+
+class TestOrderBookDeltaConflator:
+    def test_instantiate_with_invalid_interval_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            OrderBookDeltaConflator(
+                instrument_id=ETHUSDT_BINANCE.id,
+                book_type=BookType.L2_MBP,
+                interval_ms=0,
+                topic="data.book.conflated.BINANCE.ETHUSDT.0",
+            )
+
+    def test_flush_when_no_updates_returns_none(self):
+        # Arrange
+        conflator = _conflator()
+
+        # Act, Assert
+        assert conflator.flush() is None
+
+    def test_update_same_level_retains_latest_delta(self):
+        # Arrange
+        conflator = _conflator()
+
+        # Act
+        conflator.update_delta(_delta(BookAction.ADD, size=1.0))
+        conflator.update_delta(_delta(BookAction.UPDATE, size=2.0))
+        conflator.update_delta(_delta(BookAction.UPDATE, size=3.0))
+        deltas = conflator.flush()
+
+        # Assert
+        assert len(deltas.deltas) == 1
+        assert deltas.deltas[0].action == BookAction.UPDATE
+        assert deltas.deltas[0].order.size == ETHUSDT_BINANCE.make_qty(3.0)
+        assert conflator.count == 0
+        assert conflator.flush() is None
+
+    def test_update_different_levels_retains_each_level_in_order_of_last_update(self):
+        # Arrange
+        conflator = _conflator()
+
+        # Act
+        conflator.update_delta(_delta(BookAction.UPDATE, price=100.0))
+        conflator.update_delta(_delta(BookAction.UPDATE, side=OrderSide.SELL, price=101.0))
+        conflator.update_delta(_delta(BookAction.DELETE, price=100.0))
+        deltas = conflator.flush()
+
+        # Assert
+        assert [d.action for d in deltas.deltas] == [BookAction.UPDATE, BookAction.DELETE]
+        assert deltas.deltas[0].order.side == OrderSide.SELL
+
+    def test_clear_discards_earlier_deltas(self):
+        # Arrange
+        conflator = _conflator()
+
+        # Act
+        conflator.update_delta(_delta(BookAction.UPDATE, price=100.0))
+        conflator.update_delta(
+            OrderBookDelta.clear(ETHUSDT_BINANCE.id, sequence=0, ts_event=0, ts_init=0),
+        )
+        conflator.update_delta(_delta(BookAction.ADD, price=99.0))
+        deltas = conflator.flush()
+
+        # Assert
+        assert [d.action for d in deltas.deltas] == [BookAction.CLEAR, BookAction.ADD]
+
+    def test_mbo_order_added_then_deleted_within_window_is_dropped(self):
+        # Arrange
+        conflator = _conflator(BookType.L3_MBO)
+
+        # Act
+        conflator.update_delta(_delta(BookAction.ADD, order_id=1))
+        conflator.update_delta(_delta(BookAction.ADD, order_id=2))
+        conflator.update_delta(_delta(BookAction.DELETE, order_id=1))
+        deltas = conflator.flush()
+
+        # Assert
+        assert len(deltas.deltas) == 1
+        assert deltas.deltas[0].order.order_id == 2
+
+    def test_update_with_deltas_batch(self):
+        # Arrange
+        conflator = _conflator()
+        batch = TestDataStubs.order_book_deltas(
+            ETHUSDT_BINANCE.id,
+            deltas=[_delta(BookAction.ADD, size=1.0), _delta(BookAction.UPDATE, size=5.0)],
+        )
+
+        # Act
+        conflator.update(batch)
+
+        # Assert
+        assert conflator.count == 2
+        assert conflator.flush().deltas[0].order.size == ETHUSDT_BINANCE.make_qty(5.0)
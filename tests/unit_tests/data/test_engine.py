@@ -61,13 +61,16 @@ from nautilus_trader.model.book import OrderBook
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarSpecification
 from nautilus_trader.model.data import BarType
+from nautilus_trader.model.data import BookOrder
 from nautilus_trader.model.data import DataType
 from nautilus_trader.model.data import OrderBookDeltas
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.enums import BookAction
 from nautilus_trader.model.enums import BookType
+from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.model.enums import RecordFlag
 from nautilus_trader.model.identifiers import ClientId
@@ -1025,6 +1028,99 @@ class TestDataEngine:
         assert handler[0].instrument_id == ETHUSDT_BINANCE.id
         assert isinstance(handler[0], OrderBookDeltas)
 
+    def test_process_order_book_deltas_with_conflation_then_sends_coalesced_deltas(self):
+        # Arrange
+        self.data_engine.register_client(self.binance_client)
+        self.binance_client.start()
+
+        self.data_engine.process(ETHUSDT_BINANCE)  # <-- add necessary instrument for test
+
+        raw_handler = []
+        conflated_handler = []
+        self.msgbus.subscribe(topic="data.book.deltas.BINANCE.ETHUSDT", handler=raw_handler.append)
+        self.msgbus.subscribe(
+            topic="data.book.conflated.BINANCE.ETHUSDT.100",
+            handler=conflated_handler.append,
+        )
+
+        subscribe = SubscribeOrderBook(
+            client_id=None,  # Will route to the Binance venue
+            venue=BINANCE,
+            instrument_id=ETHUSDT_BINANCE.id,
+            book_type=BookType.L2_MBP,
+            managed=True,
+            only_deltas=True,
+            conflate_interval_ms=100,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        self.data_engine.execute(subscribe)
+
+        for action, size in [(BookAction.ADD, 10.0), (BookAction.UPDATE, 20.0), (BookAction.UPDATE, 30.0)]:
+            delta = TestDataStubs.order_book_delta(
+                instrument_id=ETHUSDT_BINANCE.id,
+                action=action,
+                order=BookOrder(
+                    side=OrderSide.BUY,
+                    price=ETHUSDT_BINANCE.make_price(100.0),
+                    size=ETHUSDT_BINANCE.make_qty(size),
+                    order_id=0,
+                ),
+            )
+            self.data_engine.process(
+                TestDataStubs.order_book_deltas(ETHUSDT_BINANCE.id, deltas=[delta]),
+            )
+
+        # Act
+        events = self.clock.advance_time(200_000_000)
+        for event in events:
+            event.handle()
+
+        # Assert
+        assert len(raw_handler) == 3
+        assert len(conflated_handler) == 1  # <-- second interval had no updates
+        assert len(conflated_handler[0].deltas) == 1
+        assert conflated_handler[0].deltas[0].order.size == ETHUSDT_BINANCE.make_qty(30.0)
+        assert self.cache.order_book(ETHUSDT_BINANCE.id).best_bid_size() == ETHUSDT_BINANCE.make_qty(30.0)
+
+    def test_unsubscribe_order_book_deltas_with_conflation_then_cancels_timer(self):
+        # Arrange
+        self.data_engine.register_client(self.binance_client)
+        self.binance_client.start()
+
+        self.data_engine.process(ETHUSDT_BINANCE)  # <-- add necessary instrument for test
+
+        subscribe = SubscribeOrderBook(
+            client_id=None,  # Will route to the Binance venue
+            venue=BINANCE,
+            instrument_id=ETHUSDT_BINANCE.id,
+            book_type=BookType.L2_MBP,
+            managed=True,
+            only_deltas=True,
+            conflate_interval_ms=100,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        self.data_engine.execute(subscribe)
+
+        unsubscribe = UnsubscribeOrderBook(
+            client_id=None,  # Will route to the Binance venue
+            venue=BINANCE,
+            instrument_id=ETHUSDT_BINANCE.id,
+            only_deltas=True,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        # Act
+        self.data_engine.execute(unsubscribe)
+
+        # Assert
+        assert self.clock.timer_names == []
+        assert self.data_engine._book_conflators == {}
+
     def test_process_order_book_deltas_then_sends_to_registered_handler(self):
         # Arrange
         self.data_engine.register_client(self.binance_client)
@@ -1805,6 +1901,50 @@ class TestDataEngine:
             "ts_init": 0,
         }
 
+    def test_subscribe_synthetic_quote_ticks_seeds_components_from_cache(self):
+        # Arrange
+        self.data_engine.register_client(self.binance_client)
+        self.binance_client.start()
+
+        synthetic = TestInstrumentProvider.synthetic_instrument()
+        self.cache.add_synthetic(synthetic)
+        self.cache.add_quote_tick(
+            TestDataStubs.quote_tick(
+                instrument=ETHUSDT_BINANCE,
+                bid_price=10_000.0,
+                ask_price=10_000.0,
+            ),
+        )
+
+        handler = []
+        self.msgbus.subscribe(topic="data.quotes.SYNTH.BTC-ETH", handler=handler.append)
+
+        subscribe = SubscribeQuoteTicks(
+            client_id=None,  # Will route to the Binance venue
+            venue=synthetic.id.venue,
+            instrument_id=synthetic.id,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        self.data_engine.execute(subscribe)
+
+        tick = TestDataStubs.quote_tick(
+            instrument=BTCUSDT_BINANCE,
+            bid_price=50_001.0,
+            ask_price=50_002.0,
+        )
+
+        # Act
+        self.data_engine.process(tick)
+
+        # Assert
+        evaluator = self.data_engine._synthetic_evaluators[synthetic.id]
+        assert evaluator.quotes_missing == 0
+        assert len(handler) == 1
+        assert handler[0].bid_price == Price.from_str("30000.50000000")
+        assert handler[0].ask_price == Price.from_str("30001.00000000")
+
     def test_subscribe_bar_type_then_subscribes(self):
         # Arrange
         self.data_engine.register_client(self.binance_client)
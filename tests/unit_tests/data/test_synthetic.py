@@ -0,0 +1,170 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.data.synthetic import SyntheticEvaluator
+from nautilus_trader.model.identifiers import Symbol
+from nautilus_trader.model.instruments import SyntheticInstrument
+from nautilus_trader.model.objects import Price
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
+ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestSyntheticEvaluator:
+    def setup(self):
+        # Fixture Setup
+        self.synthetic = TestInstrumentProvider.synthetic_instrument()
+        self.evaluator = SyntheticEvaluator(self.synthetic)
+
+    def test_instantiate_resolves_component_slots(self):
+        # Arrange, Act, Assert
+        assert self.evaluator.synthetic is self.synthetic
+        assert self.evaluator.components == [BTCUSDT_BINANCE.id, ETHUSDT_BINANCE.id]
+        assert self.evaluator.size == 2
+        assert self.evaluator.slot(BTCUSDT_BINANCE.id) == 0
+        assert self.evaluator.slot(ETHUSDT_BINANCE.id) == 1
+        assert self.evaluator.slot(AUDUSD_SIM.id) == -1
+        assert self.evaluator.quotes_missing == 2
+        assert self.evaluator.trades_missing == 2
+        assert self.evaluator.missing_quote() == BTCUSDT_BINANCE.id
+        assert self.evaluator.missing_trade() == BTCUSDT_BINANCE.id
+
+    def test_calculate_bid_when_quotes_missing_raises_value_error(self):
+        # Arrange
+        self.evaluator.update_quote(
+            TestDataStubs.quote_tick(instrument=BTCUSDT_BINANCE, bid_price=50_000.0, ask_price=50_001.0),
+        )
+
+        # Act, Assert
+        assert self.evaluator.quotes_missing == 1
+        assert self.evaluator.missing_quote() == ETHUSDT_BINANCE.id
+        with pytest.raises(ValueError):
+            self.evaluator.calculate_bid()
+
+    def test_calculate_last_when_trades_missing_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.evaluator.calculate_last()
+
+    def test_update_quote_for_non_component_is_ignored(self):
+        # Arrange
+        tick = TestDataStubs.quote_tick(instrument=AUDUSD_SIM)
+
+        # Act
+        self.evaluator.update_quote(tick)
+
+        # Assert
+        assert self.evaluator.quotes_missing == 2
+
+    def test_calculate_bid_and_ask_from_latest_quotes(self):
+        # Arrange
+        self.evaluator.update_quote(
+            TestDataStubs.quote_tick(instrument=BTCUSDT_BINANCE, bid_price=50_000.0, ask_price=50_001.0),
+        )
+        self.evaluator.update_quote(
+            TestDataStubs.quote_tick(instrument=ETHUSDT_BINANCE, bid_price=10_000.0, ask_price=10_000.0),
+        )
+        self.evaluator.update_quote(
+            TestDataStubs.quote_tick(instrument=BTCUSDT_BINANCE, bid_price=50_001.0, ask_price=50_002.0),
+        )
+
+        # Act
+        bid = self.evaluator.calculate_bid()
+        ask = self.evaluator.calculate_ask()
+
+        # Assert
+        assert self.evaluator.quotes_missing == 0
+        assert self.evaluator.missing_quote() is None
+        assert bid == Price.from_str("30000.50000000")
+        assert ask == Price.from_str("30001.00000000")
+
+    def test_calculate_last_from_latest_trades(self):
+        # Arrange
+        self.evaluator.update_trade(TestDataStubs.trade_tick(instrument=BTCUSDT_BINANCE, price=50_000.0))
+        self.evaluator.update_trade(TestDataStubs.trade_tick(instrument=ETHUSDT_BINANCE, price=10_000.0))
+        self.evaluator.update_trade(TestDataStubs.trade_tick(instrument=BTCUSDT_BINANCE, price=50_001.0))
+
+        # Act
+        last = self.evaluator.calculate_last()
+
+        # Assert
+        assert self.evaluator.trades_missing == 0
+        assert last == Price.from_str("30000.50000000")
+
+    def test_calculate_matches_synthetic_calculate(self):
+        # Arrange
+        self.evaluator.update_trade(TestDataStubs.trade_tick(instrument=BTCUSDT_BINANCE, price=50_000.1))
+        self.evaluator.update_trade(TestDataStubs.trade_tick(instrument=ETHUSDT_BINANCE, price=1_000.03))
+
+        # Act
+        last = self.evaluator.calculate_last()
+
+        # Assert
+        assert last == self.synthetic.calculate([50_000.1, 1_000.03])
+
+    def test_calculate_uses_changed_formula(self):
+        # Arrange
+        self.evaluator.update_trade(TestDataStubs.trade_tick(instrument=BTCUSDT_BINANCE, price=50_000.0))
+        self.evaluator.update_trade(TestDataStubs.trade_tick(instrument=ETHUSDT_BINANCE, price=10_000.0))
+
+        # Act
+        self.synthetic.change_formula("BTCUSDT.BINANCE - ETHUSDT.BINANCE")
+        last = self.evaluator.calculate_last()
+
+        # Assert
+        assert last == Price.from_str("40000.00000000")
+
+    def test_calculate_with_many_components(self):
+        # Arrange
+        instruments = [TestInstrumentProvider.equity(symbol) for symbol in ("AAPL", "AMZN", "MSFT", "NVDA")]
+        synthetic = SyntheticInstrument(
+            symbol=Symbol("BASKET"),
+            price_precision=2,
+            components=[instrument.id for instrument in instruments],
+            formula="(AAPL.XNAS + AMZN.XNAS + MSFT.XNAS + NVDA.XNAS) / 4",
+            ts_event=0,
+            ts_init=0,
+        )
+        evaluator = SyntheticEvaluator(synthetic)
+
+        # Act
+        for i, instrument in enumerate(instruments):
+            evaluator.update_quote(
+                TestDataStubs.quote_tick(instrument=instrument, bid_price=100.0 + i, ask_price=100.1 + i),
+            )
+
+        # Assert
+        assert evaluator.calculate_bid() == Price.from_str("101.50")
+        assert evaluator.calculate_ask() == Price.from_str("101.60")
+
+    def test_reset(self):
+        # Arrange
+        self.evaluator.update_trade(TestDataStubs.trade_tick(instrument=BTCUSDT_BINANCE, price=50_000.0))
+        self.evaluator.update_trade(TestDataStubs.trade_tick(instrument=ETHUSDT_BINANCE, price=10_000.0))
+
+        # Act
+        self.evaluator.reset()
+
+        # Assert
+        assert self.evaluator.trades_missing == 2
+        assert self.evaluator.quotes_missing == 2
+        with pytest.raises(ValueError):
+            self.evaluator.calculate_last()
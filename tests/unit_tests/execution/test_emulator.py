@@ -947,6 +947,85 @@ class TestOrderEmulatorWithSingleOrders:
         assert isinstance(order.events[3], OrderReleased)
         assert order not in self.cache.orders_emulated()
 
+    def test_trailing_stop_orders_only_updated_when_trigger_could_move(self) -> None:
+        # Arrange
+        tick = TestDataStubs.quote_tick(
+            instrument=ETHUSDT_PERP_BINANCE,
+            bid_price=5_060.0,
+            ask_price=5_070.0,
+        )
+        self.data_engine.process(tick)
+
+        orders = []
+        for offset in (5, 10, 20):
+            order = self.strategy.order_factory.trailing_stop_market(
+                instrument_id=ETHUSDT_PERP_BINANCE.id,
+                order_side=OrderSide.SELL,
+                quantity=Quantity.from_int(10),
+                trigger_type=TriggerType.BID_ASK,
+                trailing_offset=Decimal(offset),
+                trailing_offset_type=TrailingOffsetType.PRICE,
+                emulation_trigger=TriggerType.BID_ASK,
+            )
+            self.strategy.submit_order(order)
+            orders.append(order)
+
+        # Act
+        tick = TestDataStubs.quote_tick(
+            instrument=ETHUSDT_PERP_BINANCE,
+            bid_price=5_059.0,  # <-- Bid falls, no SELL trailing stop could move
+            ask_price=5_069.0,
+        )
+        self.data_engine.process(tick)
+
+        tick = TestDataStubs.quote_tick(
+            instrument=ETHUSDT_PERP_BINANCE,
+            bid_price=5_062.0,  # <-- Bid rises above the last high
+            ask_price=5_072.0,
+        )
+        self.data_engine.process(tick)
+
+        # Assert
+        tracker = self.emulator.get_trailing_stop_tracker(ETHUSDT_PERP_BINANCE.id)
+        assert len(tracker) == 3
+        assert [o.trigger_price for o in orders] == [
+            ETHUSDT_PERP_BINANCE.make_price(5_057.0),
+            ETHUSDT_PERP_BINANCE.make_price(5_052.0),
+            ETHUSDT_PERP_BINANCE.make_price(5_042.0),
+        ]
+        # Initialized, updated on submit, emulated, then updated once on the rising bid
+        assert [len(o.events) for o in orders] == [4, 4, 4]
+
+    def test_cancel_trailing_stop_order_removes_from_tracker(self) -> None:
+        # Arrange
+        tick = TestDataStubs.quote_tick(
+            instrument=ETHUSDT_PERP_BINANCE,
+            bid_price=5_060.0,
+            ask_price=5_070.0,
+        )
+        self.data_engine.process(tick)
+
+        order = self.strategy.order_factory.trailing_stop_market(
+            instrument_id=ETHUSDT_PERP_BINANCE.id,
+            order_side=OrderSide.BUY,
+            quantity=Quantity.from_int(10),
+            trigger_type=TriggerType.BID_ASK,
+            trailing_offset=Decimal(5),
+            trailing_offset_type=TrailingOffsetType.PRICE,
+            emulation_trigger=TriggerType.BID_ASK,
+        )
+        self.strategy.submit_order(order)
+
+        tracker = self.emulator.get_trailing_stop_tracker(ETHUSDT_PERP_BINANCE.id)
+        assert tracker.contains(order.client_order_id)
+
+        # Act
+        self.strategy.cancel_order(order)
+
+        # Assert
+        assert not tracker.contains(order.client_order_id)
+        assert len(tracker) == 0
+
     @pytest.mark.parametrize(
         ("order_side", "price", "expected_trigger_price"),
         [
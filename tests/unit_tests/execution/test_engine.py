@@ -38,6 +38,7 @@ from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.enums import OmsType
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import OrderStatus
 from nautilus_trader.model.enums import OrderType
@@ -1926,6 +1927,64 @@ class TestExecutionEngine:
         # Assert
         assert order3.status == OrderStatus.INITIALIZED
 
+    def test_duplicate_fill_on_closed_position_does_not_snapshot_position(self) -> None:
+        # Arrange
+        self.exec_engine.start()
+
+        strategy = Strategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        order1 = strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+
+        order2 = strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        position_id = PositionId("P-19700101-000000-000-001-1")
+
+        for order, venue_order_id in ((order1, VenueOrderId("1")), (order2, VenueOrderId("2"))):
+            self.risk_engine.execute(
+                SubmitOrder(
+                    trader_id=self.trader_id,
+                    strategy_id=strategy.id,
+                    position_id=position_id,
+                    order=order,
+                    command_id=UUID4(),
+                    ts_init=self.clock.timestamp_ns(),
+                ),
+            )
+            self.exec_engine.process(TestEventStubs.order_submitted(order))
+            self.exec_engine.process(TestEventStubs.order_accepted(order, venue_order_id=venue_order_id))
+
+        self.exec_engine.process(
+            TestEventStubs.order_filled(order1, AUDUSD_SIM, position_id=position_id),
+        )
+        fill2 = TestEventStubs.order_filled(order2, AUDUSD_SIM, position_id=position_id)
+        self.exec_engine.process(fill2)
+
+        position = self.cache.position(position_id)
+        assert position.is_closed
+
+        # Act
+        self.exec_engine._open_position(AUDUSD_SIM, position, fill2, OmsType.NETTING)
+
+        # Assert
+        assert position.is_closed
+        assert position.event_count == 2
+        assert self.cache.position_snapshots(position_id) == []
+
     def test_flip_position_when_netting_oms(self) -> None:
         # Arrange
         self.exec_engine.start()
@@ -26,6 +26,7 @@ from nautilus_trader.data.messages import DataResponse
 from nautilus_trader.data.messages import RequestQuoteTicks
 from nautilus_trader.data.messages import SubscribeData
 from nautilus_trader.live.data_engine import LiveDataEngine
+from nautilus_trader.live.tracing import DataPathTracer
 from nautilus_trader.model.data import DataType
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.identifiers import ClientId
@@ -44,6 +45,7 @@ from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 BITMEX = Venue("BITMEX")
 BINANCE = Venue("BINANCE")
 XBTUSD_BITMEX = TestInstrumentProvider.xbtusd_bitmex()
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
 BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
 ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
 
@@ -83,6 +85,20 @@ class TestLiveDataEngine:
         ensure_all_tasks_completed()
         self.engine.dispose()
 
+    def _recreate_engine(self, config: LiveDataEngineConfig) -> None:
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=config,
+        )
+
     @pytest.mark.asyncio
     async def test_start_when_loop_not_running_logs(self):
         # Arrange, Act
@@ -345,3 +361,71 @@ class TestLiveDataEngine:
 
         # Tear Down
         self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_data_with_batch_drain_processes_all_data(self):
+        # Arrange
+        self._recreate_engine(LiveDataEngineConfig(drain_batch_size=4, track_queue_latency=True))
+        self.engine.start()
+
+        # Act
+        for _ in range(10):
+            self.engine.process(TestDataStubs.trade_tick())
+
+        # Assert
+        await eventually(lambda: self.engine.data_count == 10)
+        assert self.engine.data_qsize() == 0
+        assert self.engine.data_queue_latency().count == 10
+        assert self.engine.conflated_quote_count() == 0
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_quotes_above_high_water_mark_conflates_per_instrument(self):
+        # Arrange
+        self._recreate_engine(LiveDataEngineConfig(drain_batch_size=100, quote_conflation_hwm=2))
+
+        # Act: buffer data before the queue task starts so it is drained in one batch
+        for i in range(5):
+            self.engine.process(TestDataStubs.quote_tick(bid_price=1.0 + i, ask_price=2.0 + i))
+        self.engine.process(TestDataStubs.trade_tick())
+        self.engine.start()
+
+        # Assert
+        await eventually(lambda: self.engine.data_count == 2)
+        assert self.engine.conflated_quote_count() == 4
+        assert self.engine.data_queue_latency() is None
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_data_with_tracing_records_stage_histograms(self):
+        # Arrange
+        self._recreate_engine(LiveDataEngineConfig(trace_sample_rate=1))
+        handler: list[QuoteTick] = []
+        self.msgbus.subscribe(topic="data.quotes.*", handler=handler.append)
+        self.engine.start()
+
+        tick = TestDataStubs.quote_tick(ts_init=self.clock.timestamp_ns())
+
+        # Act
+        self.msgbus.send(endpoint="DataEngine.process", msg=tick)
+
+        # Assert
+        await eventually(lambda: self.engine.data_count == 1)
+        tracer = self.engine.data_path_tracer()
+        histograms = tracer.histograms()[("QuoteTick", AUDUSD_SIM.id)]
+        assert tracer.sample_rate == 1
+        assert set(histograms) == set(DataPathTracer.STAGES)
+        assert all(h.count == 1 for h in histograms.values())
+        assert len(tracer.summary_lines()) == 1
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_data_when_tracing_disabled_has_no_tracer(self):
+        # Arrange, Act, Assert
+        assert self.engine.data_path_tracer() is None
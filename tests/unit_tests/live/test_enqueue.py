@@ -21,6 +21,7 @@ import pytest
 from nautilus_trader.common.component import Logger
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.live.enqueue import ThrottledEnqueuer
+from nautilus_trader.live.enqueue import drain_nowait
 
 
 @pytest.fixture
@@ -101,3 +102,59 @@ async def test_enqueue_when_queue_is_full(event_loop, clock, logger):
 
     # Assert: check queue is still size=1
     assert queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_enqueue_when_timestamped_wraps_message(event_loop, clock, logger):
+    # Arrange
+    clock.set_time(1_000)
+    queue = asyncio.Queue(maxsize=10)
+    enqueuer = ThrottledEnqueuer(
+        qname="test_queue",
+        queue=queue,
+        loop=event_loop,
+        clock=clock,
+        logger=logger,
+        timestamped=True,
+    )
+
+    # Act
+    enqueuer.enqueue("message1")
+    await asyncio.sleep(0)
+
+    # Assert
+    assert enqueuer.timestamped
+    assert queue.get_nowait() == (1_000, "message1")
+
+
+def test_drain_nowait_drains_up_to_limit():
+    # Arrange
+    queue = asyncio.Queue()
+    for i in range(5):
+        queue.put_nowait(i)
+    batch: list = []
+
+    # Act
+    stopped = drain_nowait(queue, batch, 3)
+
+    # Assert
+    assert not stopped
+    assert batch == [0, 1, 2]
+    assert queue.qsize() == 2
+
+
+def test_drain_nowait_stops_at_sentinel():
+    # Arrange
+    queue = asyncio.Queue()
+    queue.put_nowait(0)
+    queue.put_nowait(None)
+    queue.put_nowait(1)
+    batch: list = []
+
+    # Act
+    stopped = drain_nowait(queue, batch, 10)
+
+    # Assert
+    assert stopped
+    assert batch == [0]
+    assert queue.qsize() == 1
@@ -583,3 +583,112 @@ class TestLiveExecutionEngine:
 
         # Assert
         assert order.status == OrderStatus.CANCELED
+
+    @pytest.mark.asyncio
+    async def test_check_inflight_orders_batched_reconciles_reports(self):
+        # Arrange
+        self.exec_engine.order_query_batch_size = 10
+        self.exec_engine._inflight_check_threshold_ns = 0
+
+        order = self.strategy.order_factory.limit(
+            instrument_id=AUDUSD_SIM.id,
+            order_side=OrderSide.BUY,
+            quantity=Quantity.from_int(100_000),
+            price=AUDUSD_SIM.make_price(0.70000),
+        )
+
+        self.strategy.submit_order(order)
+        self.exec_engine.process(TestEventStubs.order_submitted(order))
+        self.exec_engine.process(TestEventStubs.order_accepted(order))
+        self.exec_engine.process(TestEventStubs.order_pending_cancel(order))
+
+        await eventually(lambda: order.status == OrderStatus.PENDING_CANCEL)
+
+        self.client.add_order_status_report(
+            OrderStatusReport(
+                account_id=AccountId("SIM-001"),
+                instrument_id=AUDUSD_SIM.id,
+                client_order_id=order.client_order_id,
+                venue_order_id=order.venue_order_id,
+                order_side=OrderSide.BUY,
+                order_type=OrderType.LIMIT,
+                time_in_force=TimeInForce.GTC,
+                order_status=OrderStatus.CANCELED,
+                price=Price.from_str("0.70000"),
+                quantity=Quantity.from_int(100_000),
+                filled_qty=Quantity.from_int(0),
+                report_id=UUID4(),
+                ts_accepted=0,
+                ts_last=0,
+                ts_init=0,
+            ),
+        )
+
+        # Act
+        await self.exec_engine._check_inflight_orders()
+
+        # Assert
+        assert order.status == OrderStatus.CANCELED
+        assert "generate_order_status_report" in self.client.calls
+        assert "query_order" not in self.client.calls
+
+    @pytest.mark.asyncio
+    async def test_check_inflight_orders_batched_does_not_back_off_when_orders_not_found(self):
+        # Arrange
+        self.exec_engine.order_query_batch_size = 10
+        self.exec_engine._inflight_check_threshold_ns = 0
+
+        order = self.strategy.order_factory.limit(
+            instrument_id=AUDUSD_SIM.id,
+            order_side=OrderSide.BUY,
+            quantity=Quantity.from_int(100_000),
+            price=AUDUSD_SIM.make_price(0.70000),
+        )
+
+        self.strategy.submit_order(order)
+        self.exec_engine.process(TestEventStubs.order_submitted(order))
+
+        await eventually(lambda: order.status == OrderStatus.SUBMITTED)
+
+        # Act
+        await self.exec_engine._check_inflight_orders()
+        await self.exec_engine._check_inflight_orders()
+
+        # Assert
+        assert self.client.calls.count("generate_order_status_report") == 2
+        assert self.exec_engine._order_query_backoff == {"in-flight": 0, "open": 0}
+
+    @pytest.mark.asyncio
+    async def test_check_inflight_orders_batched_backs_off_when_query_errors(self):
+        # Arrange
+        self.exec_engine.order_query_batch_size = 10
+        self.exec_engine._inflight_check_threshold_ns = 0
+
+        order = self.strategy.order_factory.limit(
+            instrument_id=AUDUSD_SIM.id,
+            order_side=OrderSide.BUY,
+            quantity=Quantity.from_int(100_000),
+            price=AUDUSD_SIM.make_price(0.70000),
+        )
+
+        self.strategy.submit_order(order)
+        self.exec_engine.process(TestEventStubs.order_submitted(order))
+
+        await eventually(lambda: order.status == OrderStatus.SUBMITTED)
+
+        query_count = 0
+
+        async def generate_order_status_reports_batch(commands, max_concurrency):
+            nonlocal query_count
+            query_count += 1
+            raise ConnectionError("venue unavailable")
+
+        self.client.generate_order_status_reports_batch = generate_order_status_reports_batch
+
+        # Act
+        await self.exec_engine._check_inflight_orders()
+        await self.exec_engine._check_inflight_orders()  # Skipped during backoff
+
+        # Assert: Only the in-flight check loop backs off
+        assert query_count == 1
+        assert self.exec_engine._order_query_backoff == {"in-flight": 1, "open": 0}
@@ -0,0 +1,184 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+
+import pytest
+
+from nautilus_trader.live.ratelimit import RequestPriority
+from nautilus_trader.live.ratelimit import WeightedRateLimiter
+
+
+class FakeTime:
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_weight_and_capacity() -> None:
+    # Arrange
+    limiter = WeightedRateLimiter(
+        limit=100,
+        order_reserve=0.2,
+        endpoint_weights={"allOrders": 20},
+    )
+
+    # Act, Assert
+    assert limiter.weight("allOrders") == 20
+    assert limiter.weight("order") == 1
+    assert limiter.capacity(RequestPriority.ORDER) == 100
+    assert limiter.capacity(RequestPriority.ACCOUNT) == 80
+    assert limiter.capacity(RequestPriority.MARKET_DATA) == 80
+
+
+@pytest.mark.parametrize(
+    ("kwargs"),
+    [
+        {"limit": 0},
+        {"limit": 10, "interval_secs": 0.0},
+        {"limit": 10, "order_reserve": 1.0},
+        {"limit": 10, "default_weight": 0},
+    ],
+)
+def test_invalid_parameters_raise_value_error(kwargs) -> None:
+    # Arrange, Act, Assert
+    with pytest.raises(ValueError):
+        WeightedRateLimiter(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_acquire_consumes_weight_and_resets_each_window() -> None:
+    # Arrange
+    time_func = FakeTime()
+    limiter = WeightedRateLimiter(
+        limit=100,
+        interval_secs=60.0,
+        endpoint_weights={"allOrders": 20},
+        time_func=time_func,
+    )
+
+    # Act
+    await limiter.acquire("allOrders", RequestPriority.ACCOUNT)
+    await limiter.acquire("order", RequestPriority.ORDER)
+    used_in_window = limiter.used
+    time_func.now += 60.0
+
+    # Assert
+    assert used_in_window == 21
+    assert limiter.used == 0
+
+
+@pytest.mark.asyncio
+async def test_update_used_only_raises_estimate() -> None:
+    # Arrange
+    limiter = WeightedRateLimiter(limit=100, time_func=FakeTime())
+    await limiter.acquire("order", RequestPriority.ORDER, weight=10)
+
+    # Act
+    limiter.update_used(5)
+    used_after_lower = limiter.used
+    limiter.update_used(50)
+
+    # Assert
+    assert used_after_lower == 10
+    assert limiter.used == 50
+
+
+@pytest.mark.asyncio
+async def test_order_requests_use_reserve_while_lower_priority_waits() -> None:
+    # Arrange
+    limiter = WeightedRateLimiter(limit=10, interval_secs=0.2, order_reserve=0.2)
+    await limiter.acquire("klines", RequestPriority.MARKET_DATA, weight=8)
+    admitted: list[str] = []
+
+    async def request(name: str, priority: RequestPriority) -> None:
+        await limiter.acquire(name, priority)
+        admitted.append(name)
+
+    # Act
+    await asyncio.wait_for(
+        asyncio.gather(
+            request("depth", RequestPriority.MARKET_DATA),
+            request("order", RequestPriority.ORDER),
+        ),
+        timeout=2.0,
+    )
+
+    # Assert
+    assert admitted == ["order", "depth"]
+    assert limiter.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_waiting_requests_are_admitted_in_priority_order() -> None:
+    # Arrange
+    limiter = WeightedRateLimiter(limit=2, interval_secs=0.2, order_reserve=0.0)
+    await limiter.acquire("order", RequestPriority.ORDER, weight=2)
+    admitted: list[str] = []
+
+    async def request(name: str, priority: RequestPriority) -> None:
+        await limiter.acquire(name, priority, weight=2)
+        admitted.append(name)
+
+    # Act
+    await asyncio.wait_for(
+        asyncio.gather(
+            request("klines", RequestPriority.MARKET_DATA),
+            request("allOrders", RequestPriority.ACCOUNT),
+            request("order", RequestPriority.ORDER),
+        ),
+        timeout=5.0,
+    )
+
+    # Assert
+    assert admitted == ["order", "allOrders", "klines"]
+
+
+@pytest.mark.asyncio
+async def test_pause_delays_all_requests() -> None:
+    # Arrange
+    loop = asyncio.get_running_loop()
+    limiter = WeightedRateLimiter(limit=100)
+    limiter.pause(0.1)
+    start = loop.time()
+
+    # Act
+    await limiter.acquire("order", RequestPriority.ORDER)
+
+    # Assert
+    assert loop.time() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_blocked_endpoint_does_not_hold_up_other_endpoints() -> None:
+    # Arrange
+    time_func = FakeTime()
+    limiter = WeightedRateLimiter(limit=100, time_func=time_func)
+    limiter.block_endpoint("/v5/order/create", until=time_func.now + 5.0)
+    blocked = asyncio.create_task(limiter.acquire("/v5/order/create", RequestPriority.ORDER))
+    await asyncio.sleep(0)
+
+    # Act
+    await asyncio.wait_for(limiter.acquire("/v5/market/tickers", RequestPriority.MARKET_DATA), timeout=1.0)
+
+    # Assert
+    assert not blocked.done()
+    assert limiter.used == 1
+    blocked.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await blocked
+    assert limiter.waiting == 0
@@ -0,0 +1,109 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.live.tracing import DataPathTracer
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestDataPathTracer:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.tracer = DataPathTracer(clock=self.clock, sample_rate=2)
+
+    def _trace(self, data, ts_publish: bool = True) -> None:
+        self.clock.set_time(self.clock.timestamp_ns() + 10)
+        self.tracer.on_process(data)
+        self.clock.set_time(self.clock.timestamp_ns() + 20)
+        trace = self.tracer.on_dequeue(data)
+        if trace is None:
+            return
+        if ts_publish:
+            self.clock.set_time(self.clock.timestamp_ns() + 30)
+            self.tracer.on_publish(data)
+        self.clock.set_time(self.clock.timestamp_ns() + 40)
+        self.tracer.on_handled(trace)
+
+    def test_instantiate_with_invalid_sample_rate_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            DataPathTracer(clock=self.clock, sample_rate=0)
+
+    def test_trace_records_each_stage(self):
+        # Arrange
+        tick = TestDataStubs.quote_tick(ts_init=0)
+
+        # Act
+        self._trace(tick)
+
+        # Assert
+        histograms = self.tracer.histograms()[("QuoteTick", AUDUSD_SIM.id)]
+        assert histograms["client"].max == 10
+        assert histograms["queue"].max == 20
+        assert histograms["engine"].max == 30
+        assert histograms["handlers"].max == 40
+        assert histograms["total"].max == 100
+
+    def test_trace_samples_one_in_sample_rate_messages(self):
+        # Arrange
+        ticks = [TestDataStubs.quote_tick() for _ in range(6)]
+
+        # Act
+        for tick in ticks:
+            self._trace(tick)
+
+        # Assert
+        histograms = self.tracer.histograms()[("QuoteTick", AUDUSD_SIM.id)]
+        assert histograms["total"].count == 3
+
+    def test_trace_when_not_published_attributes_time_to_engine(self):
+        # Arrange
+        trade = TestDataStubs.trade_tick(ts_init=0)
+
+        # Act
+        self._trace(trade, ts_publish=False)
+
+        # Assert
+        histograms = self.tracer.histograms()[("TradeTick", trade.instrument_id)]
+        assert histograms["engine"].max == 40
+        assert histograms["handlers"].max == 0
+
+    def test_dequeue_unsampled_data_returns_none(self):
+        # Arrange
+        tick = TestDataStubs.quote_tick()
+
+        # Act
+        trace = self.tracer.on_dequeue(tick)
+
+        # Assert
+        assert trace is None
+
+    def test_reset(self):
+        # Arrange
+        self._trace(TestDataStubs.quote_tick())
+
+        # Act
+        self.tracer.reset()
+
+        # Assert
+        assert self.tracer.histograms() == {}
+        assert self.tracer.summary_lines() == []
@@ -18,6 +18,7 @@ import pandas as pd
 from nautilus_trader import TEST_DATA_DIR
 from nautilus_trader.core.nautilus_pyo3 import DataBackendSession
 from nautilus_trader.core.nautilus_pyo3 import NautilusDataType
+from nautilus_trader.model.data import capsule_to_iter
 from nautilus_trader.model.data import capsule_to_list
 from nautilus_trader.model.objects import HIGH_PRECISION
 
@@ -141,3 +142,32 @@ def test_backend_session_multiple_types() -> None:
     assert len(ticks) == 9_600
     is_ascending = all(ticks[i].ts_init <= ticks[i].ts_init for i in range(len(ticks) - 1))
     assert is_ascending
+
+
+def test_backend_session_capsule_to_iter_matches_capsule_to_list() -> None:
+    # Arrange
+    if HIGH_PRECISION:
+        trades_path = TEST_DATA_DIR / "nautilus" / "128-bit" / "trades.parquet"
+        quotes_path = TEST_DATA_DIR / "nautilus" / "128-bit" / "quotes.parquet"
+    else:
+        trades_path = TEST_DATA_DIR / "nautilus" / "64-bit" / "trades.parquet"
+        quotes_path = TEST_DATA_DIR / "nautilus" / "64-bit" / "quotes.parquet"
+
+    def create_session() -> DataBackendSession:
+        session = DataBackendSession(chunk_size=1_000)
+        session.add_file(NautilusDataType.TradeTick, "trades_01", str(trades_path))
+        session.add_file(NautilusDataType.QuoteTick, "quotes_01", str(quotes_path))
+        return session
+
+    expected = []
+    for chunk in create_session().to_query_result():
+        expected.extend(capsule_to_list(chunk))
+
+    # Act
+    ticks = []
+    for chunk in create_session().to_query_result():
+        ticks.extend(capsule_to_iter(chunk))
+
+    # Assert
+    assert len(ticks) == 9_600
+    assert ticks == expected
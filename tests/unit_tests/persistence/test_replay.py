@@ -0,0 +1,240 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.enums import OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.replay import ReplayFile
+from nautilus_trader.persistence.replay import ReplayWriter
+from nautilus_trader.persistence.replay import convert_to_replay
+from nautilus_trader.persistence.replay import write_replay_file
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+
+
+def test_quote_ticks_round_trip(tmp_path):
+    # Arrange
+    ticks = TestDataStubs.quote_ticks_usdjpy()
+
+    # Act
+    path = write_replay_file(tmp_path / "quotes.replay", ticks)
+    replay = ReplayFile(path)
+
+    # Assert
+    assert len(replay) == len(ticks)
+    assert replay.data_cls is QuoteTick
+    assert replay.identifier == "USD/JPY.SIM"
+    assert replay.to_list() == ticks
+    assert replay.ts_init_range() == (ticks[0].ts_init, ticks[-1].ts_init)
+
+
+def test_trade_ticks_round_trip(tmp_path):
+    # Arrange
+    trades = [
+        TestDataStubs.trade_tick(
+            price=1.00001 + i * 0.00001,
+            size=100_000 + i,
+            aggressor_side=AggressorSide.SELLER if i % 2 else AggressorSide.BUYER,
+            trade_id=f"T-{i}",
+            ts_event=i,
+            ts_init=i,
+        )
+        for i in range(100)
+    ]
+
+    # Act
+    replay = ReplayFile(write_replay_file(tmp_path / "trades.replay", trades))
+    result = replay.to_list()
+
+    # Assert
+    assert result == trades
+    assert [t.trade_id for t in result] == [t.trade_id for t in trades]
+    assert [t.aggressor_side for t in result] == [t.aggressor_side for t in trades]
+
+
+def test_bars_round_trip(tmp_path):
+    # Arrange
+    bars = [TestDataStubs.bar_5decimal(ts_event=i, ts_init=i) for i in range(10)]
+
+    # Act
+    replay = ReplayFile(write_replay_file(tmp_path / "bars.replay", bars))
+
+    # Assert
+    assert replay.identifier == str(bars[0].bar_type)
+    assert replay.to_list() == bars
+
+
+def test_order_book_deltas_round_trip(tmp_path):
+    # Arrange
+    deltas = [
+        TestDataStubs.order_book_delta_clear(),
+        TestDataStubs.order_book_delta(sequence=1, ts_event=1, ts_init=1),
+        TestDataStubs.order_book_delta(flags=128, sequence=2, ts_event=2, ts_init=2),
+    ]
+
+    # Act
+    result = ReplayFile(write_replay_file(tmp_path / "deltas.replay", deltas)).to_list()
+
+    # Assert
+    assert result == deltas
+    assert [d.flags for d in result] == [0, 0, 128]
+    assert [d.sequence for d in result] == [0, 1, 2]
+
+
+def test_order_book_depth10_round_trip(tmp_path):
+    # Arrange
+    depths = [TestDataStubs.order_book_depth10(sequence=i, ts_event=i, ts_init=i) for i in range(5)]
+
+    # Act
+    result = ReplayFile(write_replay_file(tmp_path / "depth10.replay", depths)).to_list()
+
+    # Assert
+    assert result == depths
+    assert result[0].bids == depths[0].bids
+    assert result[0].asks == depths[0].asks
+
+
+def test_iter_chunks_filters_by_time_range(tmp_path):
+    # Arrange
+    ticks = TestDataStubs.quote_ticks_usdjpy()
+    replay = ReplayFile(write_replay_file(tmp_path / "quotes.replay", ticks))
+    start = ticks[100].ts_init
+    end = ticks[1_099].ts_init
+
+    # Act
+    chunks = list(replay.iter_chunks(chunk_size=300, start=start, end=end))
+
+    # Assert
+    expected = [t for t in ticks if start <= t.ts_init <= end]
+    assert [len(c) for c in chunks] == [300, 300, 300, len(expected) - 900]
+    assert [t for c in chunks for t in c] == expected
+
+
+def test_writer_appends_chunks_and_rejects_unsorted_data(tmp_path):
+    # Arrange
+    ticks = TestDataStubs.quote_ticks_usdjpy()
+
+    # Act
+    with ReplayWriter(tmp_path / "quotes.replay", QuoteTick, "USD/JPY.SIM", 3, 0) as writer:
+        writer.write(ticks[:1_000])
+        writer.write(ticks[1_000:])
+
+        # Assert
+        with pytest.raises(ValueError):
+            writer.write(ticks[:1])
+
+    assert ReplayFile(writer.path).to_list() == ticks
+
+
+def test_writer_rejects_records_for_another_instrument(tmp_path):
+    # Arrange
+    tick = TestDataStubs.quote_tick()  # AUD/USD.SIM
+
+    # Act, Assert
+    with ReplayWriter(tmp_path / "quotes.replay", QuoteTick, "USD/JPY.SIM", 5, 0) as writer:
+        with pytest.raises(ValueError):
+            writer.write([tick])
+
+
+def test_write_replay_file_rejects_quotes_with_mixed_precisions(tmp_path):
+    # Arrange
+    tick = QuoteTick(
+        instrument_id=USDJPY_SIM.id,
+        bid_price=Price.from_str("90.001"),
+        ask_price=Price.from_str("90.01"),
+        bid_size=Quantity.from_int(1_000_000),
+        ask_size=Quantity.from_int(1_000_000),
+        ts_event=0,
+        ts_init=0,
+    )
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        write_replay_file(tmp_path / "quotes.replay", [tick])
+
+
+def test_convert_to_replay_with_no_data_returns_none(tmp_path):
+    # Arrange, Act
+    result = convert_to_replay(iter([[], []]), tmp_path / "empty.replay")
+
+    # Assert
+    assert result is None
+    assert not (tmp_path / "empty.replay").exists()
+
+
+def test_open_invalid_file_raises_value_error(tmp_path):
+    # Arrange
+    path = tmp_path / "invalid.replay"
+    path.write_bytes(b"NOTREPLAY" * 4)
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        ReplayFile(path)
+
+
+def test_catalog_write_replay_file(catalog: ParquetDataCatalog, tmp_path):
+    # Arrange
+    ticks = TestDataStubs.quote_ticks_usdjpy()
+    catalog.write_data(ticks)
+
+    # Act
+    path = catalog.write_replay_file(
+        tmp_path / "quotes.replay",
+        data_cls=QuoteTick,
+        identifier=USDJPY_SIM.id.value,
+        chunk_size=500,
+    )
+
+    # Assert
+    assert ReplayFile(path).to_list() == ticks
+
+
+def test_backtest_engine_runs_replay_file_chunks(tmp_path):
+    # Arrange
+    ticks = TestDataStubs.quote_ticks_usdjpy()
+    replay = ReplayFile(write_replay_file(tmp_path / "quotes.replay", ticks))
+
+    engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
+    engine.add_venue(
+        venue=Venue("SIM"),
+        oms_type=OmsType.HEDGING,
+        account_type=AccountType.MARGIN,
+        base_currency=USD,
+        starting_balances=[Money(1_000_000, USD)],
+    )
+    engine.add_instrument(USDJPY_SIM)
+
+    # Act
+    engine.add_data_iterator("USD/JPY quotes", replay.iter_chunks(chunk_size=1_000))
+    engine.run()
+
+    # Assert
+    assert engine.iteration == len(ticks)
+    assert engine.cache.quote_tick(USDJPY_SIM.id) == ticks[-1]
@@ -0,0 +1,108 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.persistence.snapshots import InstrumentSnapshotStore
+from nautilus_trader.persistence.snapshots import snapshot_version
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+
+INSTRUMENTS = [
+    TestInstrumentProvider.default_fx_ccy("AUD/USD"),
+    TestInstrumentProvider.default_fx_ccy("GBP/USD"),
+    TestInstrumentProvider.ethusdt_perp_binance(),
+    TestInstrumentProvider.btcusdt_future_binance(),
+]
+
+
+def test_snapshot_version_depends_on_components():
+    # Arrange, Act, Assert
+    assert snapshot_version("A", True) == snapshot_version("A", True)
+    assert snapshot_version("A", True) != snapshot_version("A", False)
+
+
+def test_load_when_no_snapshot_returns_none(tmp_path):
+    # Arrange
+    store = InstrumentSnapshotStore(tmp_path, version="v1", ttl_secs=60)
+
+    # Act, Assert
+    assert not store.is_valid()
+    assert store.load() is None
+
+
+def test_save_then_load_round_trips_instruments(tmp_path):
+    # Arrange
+    store = InstrumentSnapshotStore(tmp_path, version="v1", ttl_secs=60)
+
+    # Act
+    store.save(INSTRUMENTS)
+    result = store.load()
+
+    # Assert
+    assert store.is_valid()
+    assert sorted(result, key=lambda i: i.id.value) == sorted(INSTRUMENTS, key=lambda i: i.id.value)
+    for instrument in result:
+        original = next(i for i in INSTRUMENTS if i.id == instrument.id)
+        assert type(instrument).to_dict(instrument) == type(original).to_dict(original)
+
+
+def test_load_when_expired_returns_none(tmp_path):
+    # Arrange
+    store = InstrumentSnapshotStore(tmp_path, version="v1", ttl_secs=60)
+    store.save(INSTRUMENTS, ts_now=0)
+
+    # Act
+    result = store.load(ts_now=61_000_000_000)
+
+    # Assert
+    assert result is None
+
+
+def test_load_when_version_changed_returns_none(tmp_path):
+    # Arrange
+    InstrumentSnapshotStore(tmp_path, version="v1", ttl_secs=60).save(INSTRUMENTS)
+    store = InstrumentSnapshotStore(tmp_path, version="v2", ttl_secs=60)
+
+    # Act
+    result = store.load()
+
+    # Assert
+    assert result is None
+
+
+def test_clear_invalidates_snapshot(tmp_path):
+    # Arrange
+    store = InstrumentSnapshotStore(tmp_path, version="v1", ttl_secs=60)
+    store.save(INSTRUMENTS)
+
+    # Act
+    store.clear()
+
+    # Assert
+    assert store.load() is None
+
+
+def test_stores_with_different_versions_sharing_path_keep_own_snapshots(tmp_path):
+    # Arrange
+    store1 = InstrumentSnapshotStore(tmp_path, version="v1", ttl_secs=60)
+    store2 = InstrumentSnapshotStore(tmp_path, version="v2", ttl_secs=60)
+
+    # Act
+    store1.save(INSTRUMENTS[:2])
+    store2.save(INSTRUMENTS[2:])
+
+    # Assert
+    assert store1.directory != store2.directory
+    assert sorted(i.id.value for i in store1.load()) == sorted(i.id.value for i in INSTRUMENTS[:2])
+    assert sorted(i.id.value for i in store2.load()) == sorted(i.id.value for i in INSTRUMENTS[2:])
@@ -1539,6 +1539,89 @@ class TestPortfolio:
         assert self.portfolio.is_flat(AUDUSD_SIM.id)
         assert self.portfolio.is_completely_flat()
 
+    def test_reopened_netting_position_realized_pnl_includes_snapshots(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order2 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+        order3 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        fill1 = TestEventStubs.order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-123456"),
+            last_px=Price.from_str("1.00000"),
+        )
+        fill2 = TestEventStubs.order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-123456"),
+            last_px=Price.from_str("1.00010"),
+        )
+        fill3 = TestEventStubs.order_filled(
+            order3,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-123456"),
+            last_px=Price.from_str("1.00010"),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill1)
+        self.cache.add_position(position, OmsType.NETTING)
+        position.apply(fill2)
+        self.cache.update_position(position)
+
+        # Act: Reopen the closed NETTING position (as the execution engine does)
+        self.cache.snapshot_position(position)
+        position.apply(fill3)
+        self.cache.update_position(position)
+        self.portfolio.update_position(TestEventStubs.position_opened(position))
+
+        # Assert: 6 USD from the closed cycle less 2 USD commission for the reopening fill
+        assert self.cache.position_snapshots_realized_pnl(position.id) == Money(6, USD)
+        assert position.realized_pnl == Money(-2, USD)
+        assert self.portfolio.realized_pnl(AUDUSD_SIM.id) == Money(4, USD)
+
     def test_several_positions_with_different_instruments_updates_portfolio(self):
         # Arrange
         account_id = AccountId("SIM-01234")
@@ -61,6 +61,7 @@ from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.orders.list import OrderList
 from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.risk.engine import InstrumentRiskProfile
 from nautilus_trader.risk.engine import RiskEngine
 from nautilus_trader.test_kit.mocks.exec_clients import MockExecutionClient
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
@@ -164,6 +165,31 @@ class TestRiskEngineWithCashAccount:
         assert risk_engine.max_notionals_per_order() == {_GBPUSD_SIM.id: Decimal("2000000")}
         assert risk_engine.max_notional_per_order(_GBPUSD_SIM.id) == 2_000_000
 
+    def test_config_risk_engine_with_only_per_instrument_rates(self):
+        # Arrange
+        self.msgbus.deregister("RiskEngine.execute", self.risk_engine.execute)
+        self.msgbus.deregister("RiskEngine.process", self.risk_engine.process)
+
+        config = RiskEngineConfig(
+            max_order_submit_rate="",
+            max_order_submit_rate_per_instrument="2/00:00:01",
+            max_order_modify_rate="",
+            max_order_modify_rate_per_instrument="2/00:00:01",
+        )
+
+        # Act
+        risk_engine = RiskEngine(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=config,
+        )
+
+        # Assert
+        assert risk_engine.max_order_submit_rate() is None
+        assert risk_engine.max_order_modify_rate() is None
+
     def test_risk_engine_on_stop(self):
         # Arrange, Act
         self.risk_engine.start()
@@ -1431,6 +1457,61 @@ class TestRiskEngineWithCashAccount:
         assert self.risk_engine.command_count == 101
         assert self.exec_engine.command_count == 100  # <-- Does not send last submit event
 
+    def test_submit_order_beyond_rate_limit_per_instrument_then_denies_order(self):
+        # Arrange
+        self.msgbus.deregister("RiskEngine.execute", self.risk_engine.execute)
+        self.msgbus.deregister("RiskEngine.process", self.risk_engine.process)
+
+        config = RiskEngineConfig(
+            max_order_submit_rate="100/00:00:01,1000/00:01:00",
+            max_order_submit_rate_per_instrument="2/00:00:01",
+        )
+        risk_engine = RiskEngine(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=config,
+        )
+        self.exec_engine.start()
+
+        strategy = Strategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        # Act
+        order = None
+        for _ in range(3):
+            order = strategy.order_factory.market(
+                _AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100_000),
+            )
+
+            submit_order = SubmitOrder(
+                trader_id=self.trader_id,
+                strategy_id=strategy.id,
+                position_id=None,
+                order=order,
+                command_id=UUID4(),
+                ts_init=self.clock.timestamp_ns(),
+            )
+
+            risk_engine.execute(submit_order)
+
+        # Assert
+        assert risk_engine.max_order_submit_rate() == (100, timedelta(seconds=1))
+        assert order
+        assert order.status == OrderStatus.DENIED
+        assert isinstance(order.last_event, OrderDenied)
+        assert risk_engine.command_count == 3
+        assert self.exec_engine.command_count == 2  # <-- Does not send last submit event
+
     def test_submit_order_list_when_trading_halted_then_denies_orders(self):
         # Arrange
         self.exec_engine.start()
@@ -1995,6 +2076,144 @@ class TestRiskEngineWithCashAccount:
         # Assert
         assert order.status == OrderStatus.DENIED
 
+    def test_set_max_notional_per_order_updates_existing_risk_profile(self):
+        # Arrange
+        self.exec_engine.start()
+
+        strategy = Strategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        order = strategy.order_factory.limit(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        submit_order = SubmitOrder(
+            trader_id=self.trader_id,
+            strategy_id=strategy.id,
+            position_id=None,
+            order=order,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+        self.risk_engine.execute(submit_order)
+
+        # Act
+        self.risk_engine.set_max_notional_per_order(_AUDUSD_SIM.id, 50_000)
+
+        # Assert
+        profile = self.risk_engine._risk_profiles[_AUDUSD_SIM.id]
+        assert profile.max_notional == Money(50_000, USD)
+        assert profile.account == self.cache.account_for_venue(self.venue)
+
+    @pytest.mark.parametrize("max_notional", [None, 0, Decimal(0)])
+    def test_risk_profile_with_no_or_zero_max_notional_disables_check(self, max_notional):
+        # Arrange, Act
+        profile = InstrumentRiskProfile(_AUDUSD_SIM, max_notional)
+
+        # Assert
+        assert profile.max_notional is None
+
+    def test_submit_market_order_uses_last_quote_from_data_path(self):
+        # Arrange
+        self.risk_engine.set_max_notional_per_order(_AUDUSD_SIM.id, 1_000_000)
+        self.exec_engine.start()
+
+        strategy = Strategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        order1 = strategy.order_factory.market(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(800_000),
+        )
+        submit_order1 = SubmitOrder(
+            trader_id=self.trader_id,
+            strategy_id=strategy.id,
+            position_id=None,
+            order=order1,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+        self.risk_engine.execute(submit_order1)  # <-- No prices, risk not checked
+
+        quote = TestDataStubs.quote_tick(_AUDUSD_SIM, bid_price=1.50000, ask_price=1.50010)
+        self.msgbus.publish(topic=f"data.quotes.{_AUDUSD_SIM.id.venue}.{_AUDUSD_SIM.id.symbol}", msg=quote)
+
+        order2 = strategy.order_factory.market(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(800_000),
+        )
+        submit_order2 = SubmitOrder(
+            trader_id=self.trader_id,
+            strategy_id=strategy.id,
+            position_id=None,
+            order=order2,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        # Act
+        self.risk_engine.execute(submit_order2)
+
+        # Assert
+        profile = self.risk_engine._risk_profiles[_AUDUSD_SIM.id]
+        assert profile.last_bid == Price.from_str("1.50000")
+        assert profile.last_ask == Price.from_str("1.50010")
+        assert order1.status == OrderStatus.INITIALIZED
+        assert order2.status == OrderStatus.DENIED  # <-- 800_000 x 1.50010 over max notional
+        assert self.exec_engine.command_count == 1
+
+    def test_reset_clears_risk_profiles(self):
+        # Arrange
+        self.exec_engine.start()
+
+        strategy = Strategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        order = strategy.order_factory.limit(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        submit_order = SubmitOrder(
+            trader_id=self.trader_id,
+            strategy_id=strategy.id,
+            position_id=None,
+            order=order,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+        self.risk_engine.execute(submit_order)
+
+        # Act
+        self.risk_engine.reset()
+
+        # Assert
+        assert self.risk_engine._risk_profiles == {}
+        assert not self.msgbus.has_subscribers(f"data.quotes.{_AUDUSD_SIM.id.venue}.{_AUDUSD_SIM.id.symbol}")
+
 
 class TestRiskEngineWithBettingAccount:
     def setup(self):
@@ -2342,3 +2561,195 @@ class TestRiskEngineWithCryptoCashAccount:
         account = self.cache.account(self.account_id)
         assert account.balance(_ETHUSDT_BINANCE.base_currency).total == Money(0.00000000, ETH)
         assert self.portfolio.net_position(_ETHUSDT_BINANCE.id) == Decimal("0.02050")
+
+
+class TestRiskEngineWithMarginAccount:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.trader_id = TestIdStubs.trader_id()
+        self.account_id = TestIdStubs.account_id()
+        self.venue = Venue("SIM")
+
+        self.msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+        )
+
+        self.cache = TestComponentStubs.cache()
+
+        self.portfolio = Portfolio(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        self.exec_engine = ExecutionEngine(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=ExecEngineConfig(debug=True),
+        )
+
+        self.risk_engine = RiskEngine(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=RiskEngineConfig(debug=True),
+        )
+
+        self.exec_client = MockExecutionClient(
+            client_id=ClientId(self.venue.value),
+            venue=self.venue,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        self.portfolio.update_account(TestEventStubs.margin_account_state())
+        self.exec_engine.register_client(self.exec_client)
+
+        # Prepare data
+        self.cache.add_instrument(_AUDUSD_SIM)
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(_AUDUSD_SIM))
+
+        self.strategy = Strategy()
+        self.strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        self.exec_engine.start()
+
+    def _submit_order(self, order) -> None:
+        submit_order = SubmitOrder(
+            trader_id=self.trader_id,
+            strategy_id=self.strategy.id,
+            position_id=None,
+            order=order,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+        self.risk_engine.execute(submit_order)
+
+    def test_submit_order_when_margin_init_within_free_balance_then_sends_to_engine(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(20_000_000),  # <-- Margin init 600_800 USD at 1x leverage
+        )
+
+        # Act
+        self._submit_order(order)
+
+        # Assert
+        assert order.status == OrderStatus.INITIALIZED
+        assert self.exec_engine.command_count == 1
+
+    def test_submit_order_when_margin_init_over_free_balance_then_denies(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(40_000_000),  # <-- Margin init 1_201_600 USD at 1x leverage
+        )
+
+        # Act
+        self._submit_order(order)
+
+        # Assert
+        assert order.status == OrderStatus.DENIED
+        assert order.last_event.reason.startswith("MARGIN_INIT_EXCEEDS_FREE_BALANCE")
+        assert self.exec_engine.command_count == 0  # <-- Command never reaches engine
+
+    def test_submit_order_when_leveraged_margin_init_within_free_balance_then_sends_to_engine(self):
+        # Arrange
+        account = self.cache.account_for_venue(self.venue)
+        account.set_default_leverage(Decimal(50))
+
+        order = self.strategy.order_factory.market(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(40_000_000),
+        )
+
+        # Act
+        self._submit_order(order)
+
+        # Assert
+        assert order.status == OrderStatus.INITIALIZED
+        assert self.exec_engine.command_count == 1
+
+    def test_submit_order_when_reduce_only_then_skips_margin_check(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            _AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(40_000_000),
+            reduce_only=True,
+        )
+
+        # Act
+        self._submit_order(order)
+
+        # Assert
+        assert order.status == OrderStatus.INITIALIZED
+        assert self.exec_engine.command_count == 1
+
+    def test_submit_order_when_over_max_notional_then_denies(self):
+        # Arrange
+        self.risk_engine.set_max_notional_per_order(_AUDUSD_SIM.id, 1_000_000)
+
+        order = self.strategy.order_factory.market(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(2_000_000),
+        )
+
+        # Act
+        self._submit_order(order)
+
+        # Assert
+        assert order.status == OrderStatus.DENIED
+        assert order.last_event.reason.startswith("NOTIONAL_EXCEEDS_MAX_PER_ORDER")
+        assert self.exec_engine.command_count == 0  # <-- Command never reaches engine
+
+    def test_submit_order_list_when_cum_margin_init_over_free_balance_then_denies(self):
+        # Arrange
+        order1 = self.strategy.order_factory.market(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(20_000_000),
+        )
+        order2 = self.strategy.order_factory.market(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(20_000_000),  # <-- Cumulative margin init over free balance
+        )
+
+        order_list = OrderList(
+            order_list_id=OrderListId("1"),
+            orders=[order1, order2],
+        )
+
+        submit_order = SubmitOrderList(
+            self.trader_id,
+            self.strategy.id,
+            order_list,
+            UUID4(),
+            self.clock.timestamp_ns(),
+        )
+
+        # Act
+        self.risk_engine.execute(submit_order)
+
+        # Assert
+        assert order1.status == OrderStatus.DENIED
+        assert order2.status == OrderStatus.DENIED
+        assert self.exec_engine.command_count == 0  # <-- Command never reaches engine
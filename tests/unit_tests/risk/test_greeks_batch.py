@@ -0,0 +1,253 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from nautilus_trader.common.component import Logger
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.core.nautilus_pyo3 import black_scholes_greeks
+from nautilus_trader.core.nautilus_pyo3 import imply_vol_and_greeks
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.enums import AssetClass
+from nautilus_trader.model.enums import OptionKind
+from nautilus_trader.model.greeks import GreeksCalculator
+from nautilus_trader.model.greeks_batch import black_scholes_greeks_batch
+from nautilus_trader.model.greeks_batch import imply_vol_and_greeks_batch
+from nautilus_trader.model.greeks_batch import imply_vol_batch
+from nautilus_trader.model.greeks_batch import norm_cdf
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.identifiers import Symbol
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instruments import OptionContract
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+def test_norm_cdf_matches_erfc():
+    # Arrange
+    xs = np.linspace(-30.0, 30.0, 10_001)
+
+    # Act
+    result = norm_cdf(xs)
+
+    # Assert
+    expected = np.array([0.5 * math.erfc(-x / math.sqrt(2.0)) for x in xs])
+    assert np.max(np.abs(result - expected)) < 1e-15
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+def test_black_scholes_greeks_batch_matches_scalar(is_call):
+    # Arrange
+    strikes = np.linspace(80.0, 120.0, 41)
+    s, r, b, sigma, t, multiplier = 100.0, 0.01, 0.005, 0.2, 0.75, 100.0
+
+    # Act
+    result = black_scholes_greeks_batch(s, r, b, sigma, is_call, strikes, t, multiplier)
+
+    # Assert
+    for i, k in enumerate(strikes):
+        expected = black_scholes_greeks(s, r, b, sigma, is_call, k, t, multiplier)
+        assert result.price[i] == pytest.approx(expected.price, abs=1e-9)
+        assert result.delta[i] == pytest.approx(expected.delta, abs=1e-9)
+        assert result.gamma[i] == pytest.approx(expected.gamma, abs=1e-9)
+        assert result.vega[i] == pytest.approx(expected.vega, abs=1e-9)
+        assert result.theta[i] == pytest.approx(expected.theta, abs=1e-9)
+
+
+def test_imply_vol_batch_recovers_vols_for_option_chain():
+    # Arrange
+    strikes = np.linspace(50.0, 150.0, 2_000)
+    is_call = strikes > 100.0  # Out-of-the-money wings
+    vols = 0.2 + 0.5 * ((strikes - 100.0) / 100.0) ** 2  # Smile
+    prices = black_scholes_greeks_batch(100.0, 0.03, 0.01, vols, is_call, strikes, 0.5, 1.0).price
+
+    # Act
+    result = imply_vol_batch(100.0, 0.03, 0.01, is_call, strikes, 0.5, prices)
+
+    # Assert
+    assert np.max(np.abs(result - vols)) < 1e-8
+
+
+def test_imply_vol_batch_when_price_outside_bounds_returns_nan():
+    # Arrange, Act
+    result = imply_vol_batch(
+        s=100.0,
+        r=0.0,
+        b=0.0,
+        is_call=[True, True],
+        k=[90.0, 100.0],
+        t=1.0,
+        price=[5.0, 150.0],  # Below intrinsic, above underlying
+    )
+
+    # Assert
+    assert np.isnan(result).all()
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+def test_imply_vol_and_greeks_batch_matches_scalar(is_call):
+    # Arrange
+    s, k, t, r, b = 100.0, 100.1, 1.0, 0.01, 0.005
+    price = black_scholes_greeks(s, r, b, 0.2, is_call, k, t, 1.0).price
+
+    # Act
+    result = imply_vol_and_greeks_batch(s, r, b, is_call, [k], t, price, 1.0)
+
+    # Assert
+    expected = imply_vol_and_greeks(s, r, b, is_call, k, t, price, 1.0)
+    assert result.vol[0] == pytest.approx(expected.vol, abs=1e-5)
+    assert result.delta[0] == pytest.approx(expected.delta, abs=1e-5)
+    assert result.gamma[0] == pytest.approx(expected.gamma, abs=1e-5)
+    assert result.vega[0] == pytest.approx(expected.vega, abs=1e-5)
+    assert result.theta[0] == pytest.approx(expected.theta, abs=1e-5)
+
+
+def test_black_scholes_greeks_batch_broadcasts_shock_grid():
+    # Arrange
+    spot_shocks = np.array([-5.0, 0.0, 5.0])[:, None, None, None]
+    vol_shocks = np.array([-0.05, 0.05])[None, :, None, None]
+    time_shocks = np.array([0.0, 0.1])[None, None, :, None]
+    strikes = np.array([95.0, 100.0, 105.0, 110.0])
+
+    # Act
+    result = black_scholes_greeks_batch(
+        100.0 + spot_shocks,
+        0.01,
+        0.0,
+        0.2 + vol_shocks,
+        True,
+        strikes,
+        0.5 - time_shocks,
+        1.0,
+    )
+
+    # Assert
+    assert result.price.shape == (3, 2, 2, 4)
+    expected = black_scholes_greeks(105.0, 0.01, 0.0, 0.25, True, 110.0, 0.4, 1.0)
+    assert result.price[2, 1, 1, 3] == pytest.approx(expected.price, abs=1e-9)
+
+
+class TestGreeksCalculatorBatch:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.msgbus = MessageBus(trader_id=TestIdStubs.trader_id(), clock=self.clock)
+        self.cache = TestComponentStubs.cache()
+        self.calculator = GreeksCalculator(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=Logger("GreeksCalculator"),
+        )
+
+        underlying_id = InstrumentId.from_str("AAPL.OPRA")
+        self.cache.add_trade_tick(
+            TradeTick(
+                instrument_id=underlying_id,
+                price=Price.from_str("150.00"),
+                size=Quantity.from_int(100),
+                aggressor_side=AggressorSide.BUYER,
+                trade_id=TradeId("1"),
+                ts_event=0,
+                ts_init=0,
+            ),
+        )
+
+        self.option_ids = []
+        for strike, kind, mid in [("149.00", OptionKind.CALL, "1.55"), ("151.00", OptionKind.PUT, "1.60")]:
+            option = self._option(strike, kind)
+            self.cache.add_instrument(option)
+            self.cache.add_quote_tick(
+                QuoteTick(
+                    instrument_id=option.id,
+                    bid_price=Price.from_str(mid),
+                    ask_price=Price.from_str(mid),
+                    bid_size=Quantity.from_int(1),
+                    ask_size=Quantity.from_int(1),
+                    ts_event=0,
+                    ts_init=0,
+                ),
+            )
+            self.option_ids.append(option.id)
+
+    @staticmethod
+    def _option(strike: str, kind: OptionKind) -> OptionContract:
+        symbol = f"AAPL211217{'C' if kind == OptionKind.CALL else 'P'}{strike}"
+        return OptionContract(
+            instrument_id=InstrumentId(symbol=Symbol(symbol), venue=Venue("OPRA")),
+            raw_symbol=Symbol(symbol),
+            asset_class=AssetClass.EQUITY,
+            exchange="GMNI",
+            currency=USD,
+            price_precision=2,
+            price_increment=Price.from_str("0.01"),
+            multiplier=Quantity.from_int(100),
+            lot_size=Quantity.from_int(1),
+            underlying="AAPL",
+            option_kind=kind,
+            strike_price=Price.from_str(strike),
+            activation_ns=pd.Timestamp("2021-9-17", tz=pytz.utc).value,
+            expiration_ns=pd.Timestamp("2021-12-17", tz=pytz.utc).value,
+            ts_event=0,
+            ts_init=0,
+        )
+
+    def test_instrument_greeks_batch_matches_instrument_greeks(self):
+        # Arrange, Act
+        result = self.calculator.instrument_greeks_batch(self.option_ids)
+
+        # Assert
+        for i, option_id in enumerate(self.option_ids):
+            expected = self.calculator.instrument_greeks(option_id)
+            assert result.vol[i] == pytest.approx(expected.vol, abs=1e-5)
+            assert result.price[i] == pytest.approx(expected.price, abs=1e-4)
+            assert result.delta[i] == pytest.approx(expected.delta, abs=1e-4)
+            assert result.gamma[i] == pytest.approx(expected.gamma, abs=1e-4)
+            assert result.vega[i] == pytest.approx(expected.vega, abs=1e-4)
+            assert result.theta[i] == pytest.approx(expected.theta, abs=1e-4)
+
+    def test_instrument_greeks_batch_applies_spot_shock(self):
+        # Arrange, Act
+        base = self.calculator.instrument_greeks_batch(self.option_ids)
+        shocked = self.calculator.instrument_greeks_batch(self.option_ids, spot_shock=1.0)
+
+        # Assert
+        assert shocked.price[0] > base.price[0]  # Call gains
+        assert shocked.price[1] < base.price[1]  # Put loses
+        np.testing.assert_allclose(shocked.vol, base.vol)
+
+    def test_portfolio_greeks_grid_with_no_positions_returns_zeros(self):
+        # Arrange, Act
+        grid = self.calculator.portfolio_greeks_grid(
+            spot_shocks=[-1.0, 0.0, 1.0],
+            vol_shocks=[0.0, 0.01],
+            time_to_expiry_shocks=[0.0],
+        )
+
+        # Assert
+        assert grid.pnl.shape == (3, 2, 1)
+        assert not grid.delta.any()